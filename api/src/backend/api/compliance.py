@@ -7,6 +7,7 @@ from prowler.lib.check.models import CheckMetadata
 
 PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE = {}
 PROWLER_CHECKS = {}
+PROWLER_CHECKS_REQUIREMENTS = {}
 AVAILABLE_COMPLIANCE_FRAMEWORKS = {}
 
 
@@ -76,11 +77,12 @@ def load_prowler_compliance():
 
     This function retrieves compliance data for all supported provider types,
     generates a compliance overview template, and populates the global variables
-    `PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE` and `PROWLER_CHECKS` with read-only mappings
-    of the compliance templates and checks, respectively.
+    `PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE`, `PROWLER_CHECKS` and `PROWLER_CHECKS_REQUIREMENTS`
+    with read-only mappings of the compliance templates, checks and checks requirements, respectively.
     """
     global PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE
     global PROWLER_CHECKS
+    global PROWLER_CHECKS_REQUIREMENTS
 
     prowler_compliance = {
         provider_type: get_prowler_provider_compliance(provider_type)
@@ -89,6 +91,9 @@ def load_prowler_compliance():
     template = generate_compliance_overview_template(prowler_compliance)
     PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE = MappingProxyType(template)
     PROWLER_CHECKS = MappingProxyType(load_prowler_checks(prowler_compliance))
+    PROWLER_CHECKS_REQUIREMENTS = MappingProxyType(
+        load_prowler_checks_requirements(prowler_compliance)
+    )
 
 
 def load_prowler_checks(prowler_compliance):
@@ -124,6 +129,40 @@ def load_prowler_checks(prowler_compliance):
     return checks
 
 
+def load_prowler_checks_requirements(prowler_compliance):
+    """
+    Generate the inverted index from each check to the compliance requirements that include it.
+
+    The index is built once per provider type when the compliance data is loaded, so the
+    status of each check is applied to its requirements without going through all the
+    requirements of the compliance frameworks.
+
+    Args:
+        prowler_compliance (dict): The compliance data for all provider types,
+            as returned by `get_prowler_provider_compliance`.
+
+    Returns:
+        dict: A nested dictionary where the first-level keys are provider types,
+            and the values are dictionaries mapping check IDs to lists of
+            (compliance name, requirement ID) tuples.
+    """
+    checks_requirements = {}
+    for provider_type in Provider.ProviderChoices.values:
+        provider_checks_requirements = checks_requirements.setdefault(provider_type, {})
+        for compliance_name, compliance_data in prowler_compliance[
+            provider_type
+        ].items():
+            for requirement in compliance_data.Requirements:
+                for check in requirement.Checks:
+                    # A check is only included once in each requirement, as in the overview template
+                    provider_checks_requirements.setdefault(check, {})[
+                        (compliance_name, requirement.Id)
+                    ] = None
+        for check, requirements in provider_checks_requirements.items():
+            provider_checks_requirements[check] = list(requirements)
+    return checks_requirements
+
+
 def generate_scan_compliance(
     compliance_overview, provider_type: str, check_id: str, status: str
 ):
@@ -144,18 +183,19 @@ def generate_scan_compliance(
     Returns:
         None: This function modifies the compliance_overview in place.
     """
-    for compliance_id in PROWLER_CHECKS[provider_type][check_id]:
-        for requirement in compliance_overview[compliance_id]["requirements"].values():
-            if check_id in requirement["checks"]:
-                requirement["checks"][check_id] = status
-                requirement["checks_status"][status.lower()] += 1
-
-            if requirement["status"] != "FAIL" and any(
-                value == "FAIL" for value in requirement["checks"].values()
-            ):
-                requirement["status"] = "FAIL"
-                compliance_overview[compliance_id]["requirements_status"]["passed"] -= 1
-                compliance_overview[compliance_id]["requirements_status"]["failed"] += 1
+    for compliance_id, requirement_id in PROWLER_CHECKS_REQUIREMENTS[provider_type].get(
+        check_id, []
+    ):
+        requirement = compliance_overview[compliance_id]["requirements"][requirement_id]
+        if check_id not in requirement["checks"]:
+            continue
+        requirement["checks"][check_id] = status
+        requirement["checks_status"][status.lower()] += 1
+
+        if requirement["status"] != "FAIL" and status == "FAIL":
+            requirement["status"] = "FAIL"
+            compliance_overview[compliance_id]["requirements_status"]["passed"] -= 1
+            compliance_overview[compliance_id]["requirements_status"]["failed"] += 1
 
 
 def generate_compliance_overview_template(prowler_compliance: dict):
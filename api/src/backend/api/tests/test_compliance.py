@@ -6,6 +6,7 @@ from api.compliance import (
     get_prowler_provider_checks,
     get_prowler_provider_compliance,
     load_prowler_checks,
+    load_prowler_checks_requirements,
     load_prowler_compliance,
 )
 from api.models import Provider
@@ -38,10 +39,12 @@ class TestCompliance:
     @patch("api.models.Provider.ProviderChoices")
     @patch("api.compliance.get_prowler_provider_compliance")
     @patch("api.compliance.generate_compliance_overview_template")
+    @patch("api.compliance.load_prowler_checks_requirements")
     @patch("api.compliance.load_prowler_checks")
     def test_load_prowler_compliance(
         self,
         mock_load_prowler_checks,
+        mock_load_prowler_checks_requirements,
         mock_generate_compliance_overview_template,
         mock_get_prowler_provider_compliance,
         mock_provider_choices,
@@ -66,15 +69,23 @@ class TestCompliance:
         }
 
         mock_load_prowler_checks.return_value = {"checks_key": "checks_value"}
+        mock_load_prowler_checks_requirements.return_value = {
+            "requirements_key": "requirements_value"
+        }
 
         load_prowler_compliance()
 
-        from api.compliance import PROWLER_CHECKS, PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE
+        from api.compliance import (
+            PROWLER_CHECKS,
+            PROWLER_CHECKS_REQUIREMENTS,
+            PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE,
+        )
 
         assert PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE == {
             "template_key": "template_value"
         }
         assert PROWLER_CHECKS == {"checks_key": "checks_value"}
+        assert PROWLER_CHECKS_REQUIREMENTS == {"requirements_key": "requirements_value"}
 
         expected_prowler_compliance = compliance_data_dict
         mock_get_prowler_provider_compliance.assert_any_call("aws")
@@ -83,6 +94,9 @@ class TestCompliance:
             expected_prowler_compliance
         )
         mock_load_prowler_checks.assert_called_once_with(expected_prowler_compliance)
+        mock_load_prowler_checks_requirements.assert_called_once_with(
+            expected_prowler_compliance
+        )
 
     @patch("api.compliance.get_prowler_provider_checks")
     @patch("api.models.Provider.ProviderChoices")
@@ -117,11 +131,45 @@ class TestCompliance:
         assert checks == expected_checks
         mock_get_prowler_provider_checks.assert_called_once_with("aws")
 
-    @patch("api.compliance.PROWLER_CHECKS", new_callable=dict)
-    def test_generate_scan_compliance(self, mock_prowler_checks):
-        mock_prowler_checks["aws"] = {
-            "check1": {"compliance1"},
-            "check2": {"compliance1", "compliance2"},
+    @patch("api.models.Provider.ProviderChoices")
+    def test_load_prowler_checks_requirements(self, mock_provider_choices):
+        mock_provider_choices.values = ["aws"]
+
+        prowler_compliance = {
+            "aws": {
+                "compliance1": MagicMock(
+                    Requirements=[
+                        MagicMock(Id="requirement1", Checks=["check1", "check2"]),
+                        MagicMock(Id="requirement2", Checks=["check2", "check2"]),
+                    ],
+                ),
+                "compliance2": MagicMock(
+                    Requirements=[
+                        MagicMock(Id="requirement1", Checks=["check2"]),
+                    ],
+                ),
+            },
+        }
+
+        assert load_prowler_checks_requirements(prowler_compliance) == {
+            "aws": {
+                "check1": [("compliance1", "requirement1")],
+                "check2": [
+                    ("compliance1", "requirement1"),
+                    ("compliance1", "requirement2"),
+                    ("compliance2", "requirement1"),
+                ],
+            }
+        }
+
+    @patch("api.compliance.PROWLER_CHECKS_REQUIREMENTS", new_callable=dict)
+    def test_generate_scan_compliance(self, mock_prowler_checks_requirements):
+        mock_prowler_checks_requirements["aws"] = {
+            "check1": [("compliance1", "requirement1")],
+            "check2": [
+                ("compliance1", "requirement1"),
+                ("compliance2", "requirement2"),
+            ],
         }
 
         compliance_overview = {
@@ -36,13 +36,16 @@ class TestPerformScan:
                 new_callable=dict,
             ) as mock_prowler_compliance_overview_template,
             patch(
-                "api.compliance.PROWLER_CHECKS", new_callable=dict
-            ) as mock_prowler_checks,
+                "api.compliance.PROWLER_CHECKS_REQUIREMENTS", new_callable=dict
+            ) as mock_prowler_checks_requirements,
         ):
-            # Set up the mock PROWLER_CHECKS
-            mock_prowler_checks["aws"] = {
-                "check1": {"compliance1"},
-                "check2": {"compliance1", "compliance2"},
+            # Set up the mock PROWLER_CHECKS_REQUIREMENTS
+            mock_prowler_checks_requirements["aws"] = {
+                "check1": [("compliance1", "requirement1")],
+                "check2": [
+                    ("compliance1", "requirement1"),
+                    ("compliance2", "requirement2"),
+                ],
             }
 
             # Set up the mock PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE
@@ -398,7 +401,7 @@ class TestPerformScan:
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE",
                 new_callable=dict,
             ),
-            patch("api.compliance.PROWLER_CHECKS", new_callable=dict),
+            patch("api.compliance.PROWLER_CHECKS_REQUIREMENTS", new_callable=dict),
         ):
             # Ensure the database is empty
             assert Finding.objects.count() == 0
@@ -476,7 +479,7 @@ class TestPerformScan:
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE",
                 new_callable=dict,
             ),
-            patch("api.compliance.PROWLER_CHECKS", new_callable=dict),
+            patch("api.compliance.PROWLER_CHECKS_REQUIREMENTS", new_callable=dict),
         ):
             tenant = tenants_fixture[0]
             scan = scans_fixture[0]
@@ -593,7 +596,7 @@ class TestPerformScan:
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE",
                 new_callable=dict,
             ),
-            patch("api.compliance.PROWLER_CHECKS", new_callable=dict),
+            patch("api.compliance.PROWLER_CHECKS_REQUIREMENTS", new_callable=dict),
         ):
             tenant = tenants_fixture[0]
             scan = scans_fixture[0]
@@ -683,7 +686,7 @@ class TestPerformScan:
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE",
                 new_callable=dict,
             ),
-            patch("api.compliance.PROWLER_CHECKS", new_callable=dict),
+            patch("api.compliance.PROWLER_CHECKS_REQUIREMENTS", new_callable=dict),
         ):
             provider.provider = Provider.ProviderChoices.AWS
             provider.save()
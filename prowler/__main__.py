@@ -13,6 +13,7 @@ from prowler.config.config import (
     html_file_suffix,
     json_asff_file_suffix,
     json_ocsf_file_suffix,
+    load_and_validate_config_file,
 )
 from prowler.lib.banner import print_banner
 from prowler.lib.check.check import (
@@ -43,66 +44,15 @@ from prowler.lib.check.custom_checks_metadata import (
 from prowler.lib.check.models import CheckMetadata
 from prowler.lib.cli.parser import ProwlerArgumentParser
 from prowler.lib.logger import logger, set_logging_config
-from prowler.lib.outputs.asff.asff import ASFF
-from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
-    AWSWellArchitected,
+from prowler.lib.outputs.compliance.compliance import (
+    display_compliance_table,
+    get_compliance_output_class,
 )
-from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
-from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
-from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
-from prowler.lib.outputs.compliance.cis.cis_github import GithubCIS
-from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
-from prowler.lib.outputs.compliance.cis.cis_m365 import M365CIS
-from prowler.lib.outputs.compliance.compliance import display_compliance_table
-from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
-from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
-from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
-from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
-from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
-    KubernetesISO27001,
-)
-from prowler.lib.outputs.compliance.iso27001.iso27001_m365 import M365ISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
-from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
-    AzureMitreAttack,
-)
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_aws import (
-    ProwlerThreatScoreAWS,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_azure import (
-    ProwlerThreatScoreAzure,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_gcp import (
-    ProwlerThreatScoreGCP,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365 import (
-    ProwlerThreatScoreM365,
-)
-from prowler.lib.outputs.csv.csv import CSV
 from prowler.lib.outputs.finding import Finding
-from prowler.lib.outputs.html.html import HTML
-from prowler.lib.outputs.ocsf.ocsf import OCSF
 from prowler.lib.outputs.outputs import extract_findings_statistics
-from prowler.lib.outputs.slack.slack import Slack
 from prowler.lib.outputs.summary_table import display_summary_table
-from prowler.providers.aws.lib.s3.s3 import S3
-from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
-from prowler.providers.aws.models import AWSOutputOptions
-from prowler.providers.azure.models import AzureOutputOptions
 from prowler.providers.common.provider import Provider
 from prowler.providers.common.quick_inventory import run_provider_quick_inventory
-from prowler.providers.gcp.models import GCPOutputOptions
-from prowler.providers.github.models import GithubOutputOptions
-from prowler.providers.iac.models import IACOutputOptions
-from prowler.providers.kubernetes.models import KubernetesOutputOptions
-from prowler.providers.m365.models import M365OutputOptions
-from prowler.providers.nhn.models import NHNOutputOptions
 
 
 def prowler():
@@ -227,10 +177,43 @@ def prowler():
         print_checks(provider, sorted(checks_to_execute), bulk_checks_metadata)
         sys.exit()
 
-    # Provider to scan
-    Provider.init_global_provider(args)
+    # Multi-account scan, each account is scanned by another Prowler process with --multi-account-id
+    if provider == "aws" and getattr(args, "multi_account_id", None):
+        from prowler.providers.aws.lib.multi_account.multi_account import (
+            set_account_arguments,
+        )
+
+        set_account_arguments(args, args.multi_account_id)
+    elif provider == "aws" and (args.accounts or args.organizational_units):
+        from prowler.providers.aws.lib.multi_account.multi_account import scan_accounts
+
+        scan_accounts(args)
+
+    # Provider to scan, restored from a snapshot without connecting to it if --from-snapshot
+    snapshot = None
+    if getattr(args, "from_snapshot", None) and provider != "iac":
+        from prowler.lib.scan.exceptions.exceptions import ScanInvalidSnapshotError
+        from prowler.lib.scan.snapshot import load_snapshot, restore_snapshot
+
+        try:
+            snapshot = load_snapshot(args.from_snapshot, provider)
+        except ScanInvalidSnapshotError as error:
+            logger.critical(error)
+            sys.exit(1)
+        restore_snapshot(
+            snapshot,
+            audit_config=load_and_validate_config_file(provider, args.config_file),
+            fixer_config=load_and_validate_config_file(provider, args.fixer_config),
+            mutelist_path=args.mutelist_file,
+        )
+    else:
+        Provider.init_global_provider(args)
     global_provider = Provider.get_global_provider()
 
+    # The AWS services scanned in parallel share the boto3 clients
+    if provider == "aws" and getattr(args, "parallel_checks", 1) > 1:
+        global_provider.set_parallel_services(args.parallel_checks)
+
     # Print Provider Credentials
     if not args.only_logs:
         global_provider.print_credentials()
@@ -275,36 +258,60 @@ def prowler():
         # Sort final check list
         checks_to_execute = sorted(checks_to_execute)
 
+        # Execute only the checks of the services in the snapshot
+        if snapshot:
+            from prowler.lib.scan.snapshot import get_snapshot_checks
+
+            checks_to_execute = get_snapshot_checks(
+                snapshot, checks_to_execute, provider
+            )
+
     # Setup Output Options
     if provider == "aws":
+        from prowler.providers.aws.models import AWSOutputOptions
+
         output_options = AWSOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "azure":
+        from prowler.providers.azure.models import AzureOutputOptions
+
         output_options = AzureOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "gcp":
+        from prowler.providers.gcp.models import GCPOutputOptions
+
         output_options = GCPOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "kubernetes":
+        from prowler.providers.kubernetes.models import KubernetesOutputOptions
+
         output_options = KubernetesOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "github":
+        from prowler.providers.github.models import GithubOutputOptions
+
         output_options = GithubOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "m365":
+        from prowler.providers.m365.models import M365OutputOptions
+
         output_options = M365OutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "nhn":
+        from prowler.providers.nhn.models import NHNOutputOptions
+
         output_options = NHNOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "iac":
+        from prowler.providers.iac.models import IACOutputOptions
+
         output_options = IACOutputOptions(args, bulk_checks_metadata)
 
     # Run the quick inventory for the provider if available
@@ -312,12 +319,56 @@ def prowler():
         run_provider_quick_inventory(global_provider, args)
         sys.exit()
 
+    # Stream the findings of each check to the outputs as soon as it finishes
+    # The fixer needs all the findings, so they are kept in memory in that case
+    streaming_outputs = None
+    if getattr(args, "streaming_outputs", False) and not output_options.fixer:
+        from prowler.lib.outputs.streaming import StreamingOutputs
+
+        streaming_outputs = StreamingOutputs(
+            provider=global_provider,
+            output_options=output_options,
+            bulk_compliance_frameworks=bulk_compliance_frameworks,
+            keep_asff_findings=getattr(args, "security_hub", False),
+        )
+
+    # Checkpoint the completed checks to be able to resume the scan if it is interrupted
+    checkpoint = None
+    checkpoint_directory = getattr(args, "resume", None) or getattr(
+        args, "checkpoint_directory", None
+    )
+    if checkpoint_directory and provider != "iac":
+        from prowler.lib.scan.checkpoint import ScanCheckpoint
+        from prowler.lib.scan.exceptions.exceptions import ScanInvalidCheckpointError
+
+        try:
+            checkpoint = ScanCheckpoint(
+                checkpoint_directory,
+                provider,
+                resume=bool(getattr(args, "resume", None)),
+            )
+        except ScanInvalidCheckpointError as error:
+            logger.critical(error)
+            sys.exit(1)
+
+    # Profile the checks and service initialisations of the scan
+    profiler = None
+    if getattr(args, "profile_scan", False) and provider != "iac":
+        from prowler.lib.scan.profiler import ScanProfiler
+
+        # The peak memory is process-wide, so it is only measured for the checks executed one at a time
+        profiler = ScanProfiler(measure_memory=getattr(args, "parallel_checks", 1) <= 1)
+        if provider == "aws" and not snapshot:
+            profiler.register_aws_session(global_provider.session.current_session)
+
     # Execute checks
     findings = []
 
     if provider == "iac":
         # For IAC provider, run the scan directly
         findings = global_provider.run()
+        if streaming_outputs:
+            streaming_outputs.write(findings)
     elif len(checks_to_execute):
         findings = execute_checks(
             checks_to_execute,
@@ -325,12 +376,37 @@ def prowler():
             custom_checks_metadata,
             args.config_file,
             output_options,
+            args.parallel_checks,
+            findings_callback=streaming_outputs.write if streaming_outputs else None,
+            checkpoint=checkpoint,
+            profiler=profiler,
         )
     else:
         logger.error(
             "There are no checks to execute. Please, check your input arguments"
         )
 
+    # Export the resources collected by the services of the scan
+    if getattr(args, "export_snapshot", None) and provider != "iac":
+        from prowler.lib.scan.snapshot import export_snapshot
+
+        export_snapshot(global_provider, args.export_snapshot)
+
+    # Report the AWS API calls throttled during the scan
+    if provider == "aws":
+        global_provider.api_scheduler.log_throttling_summary()
+        # Write the recorded AWS API responses, or report the ones missing in the replayed scan
+        if global_provider.api_cache:
+            global_provider.api_cache.save()
+            global_provider.api_cache.log_replay_summary()
+
+    # Write the scan profile report
+    if profiler:
+        profiler.stop()
+        profile_reports = profiler.write_report(
+            output_options.output_directory, output_options.output_filename
+        )
+
     # Prowler Fixer
     if output_options.fixer:
         print(f"{Style.BRIGHT}\nRunning Prowler Fixer, please wait...{Style.RESET_ALL}")
@@ -349,26 +425,35 @@ def prowler():
             print(f"{Style.BRIGHT}{Fore.GREEN}\nNo findings to fix!{Style.RESET_ALL}\n")
         sys.exit()
 
-    # Outputs
-    # TODO: this part is needed since the checks generates a Check_Report_XXX and the output uses Finding
-    # This will be refactored for the outputs generate directly the Finding
-    finding_outputs = []
-    for finding in findings:
-        try:
-            finding_outputs.append(
-                Finding.generate_output(global_provider, finding, output_options)
-            )
-        except Exception:
-            continue
+    if streaming_outputs:
+        # Write the last findings and close the output files
+        streaming_outputs.close()
+        stats = streaming_outputs.stats
+        # The summary and compliance tables only need the findings summaries
+        findings = streaming_outputs.findings
+    else:
+        # Outputs
+        # TODO: this part is needed since the checks generates a Check_Report_XXX and the output uses Finding
+        # This will be refactored for the outputs generate directly the Finding
+        finding_outputs = []
+        for finding in findings:
+            try:
+                finding_outputs.append(
+                    Finding.generate_output(global_provider, finding, output_options)
+                )
+            except Exception:
+                continue
 
-    # Extract findings stats
-    stats = extract_findings_statistics(finding_outputs)
+        # Extract findings stats
+        stats = extract_findings_statistics(finding_outputs)
 
     if args.slack:
         # TODO: this should be also in a config file
         if "SLACK_API_TOKEN" in environ and (
             "SLACK_CHANNEL_NAME" in environ or "SLACK_CHANNEL_ID" in environ
         ):
+            from prowler.lib.outputs.slack.slack import Slack
+
             token = environ["SLACK_API_TOKEN"]
             channel = (
                 environ["SLACK_CHANNEL_NAME"]
@@ -385,469 +470,85 @@ def prowler():
             )
             sys.exit(1)
 
-    generated_outputs = {"regular": [], "compliance": []}
-
-    if args.output_formats:
-        for mode in args.output_formats:
-            filename = (
-                f"{output_options.output_directory}/{output_options.output_filename}"
-            )
-            if mode == "csv":
-                csv_output = CSV(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{csv_file_suffix}",
-                )
-                generated_outputs["regular"].append(csv_output)
-                # Write CSV Finding Object to file
-                csv_output.batch_write_data_to_file()
-
-            if mode == "json-asff":
-                asff_output = ASFF(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{json_asff_file_suffix}",
-                )
-                generated_outputs["regular"].append(asff_output)
-                # Write ASFF Finding Object to file
-                asff_output.batch_write_data_to_file()
-
-            if mode == "json-ocsf":
-                json_output = OCSF(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{json_ocsf_file_suffix}",
-                )
-                generated_outputs["regular"].append(json_output)
-                json_output.batch_write_data_to_file()
-            if mode == "html":
-                html_output = HTML(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{html_file_suffix}",
-                )
-                generated_outputs["regular"].append(html_output)
-                html_output.batch_write_data_to_file(
-                    provider=global_provider, stats=stats
-                )
-
-    # Compliance Frameworks
-    input_compliance_frameworks = set(output_options.output_modes).intersection(
-        get_available_compliance_frameworks(provider)
-    )
-    if provider == "aws":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = AWSCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_aws":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = AWSMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = AWSENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("aws_well_architected_framework"):
-                # Generate AWS Well-Architected Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                aws_well_architected = AWSWellArchitected(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(aws_well_architected)
-                aws_well_architected.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = AWSISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            elif compliance_name.startswith("kisa"):
-                # Generate KISA-ISMS-P Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                kisa_ismsp = AWSKISAISMSP(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(kisa_ismsp)
-                kisa_ismsp.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_aws":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                prowler_threatscore = ProwlerThreatScoreAWS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "azure":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = AzureCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_azure":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = AzureMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = AzureENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = AzureISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_azure":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                prowler_threatscore = ProwlerThreatScoreAzure(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "gcp":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = GCPCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_gcp":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = GCPMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = GCPENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = GCPISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_gcp":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                prowler_threatscore = ProwlerThreatScoreGCP(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "kubernetes":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = KubernetesCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = KubernetesISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "m365":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = M365CIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_m365":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                prowler_threatscore = ProwlerThreatScoreM365(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = M365ISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "nhn":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = NHNISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "github":
+    if streaming_outputs:
+        generated_outputs = streaming_outputs.generated_outputs
+        security_hub_findings = streaming_outputs.asff_findings
+    else:
+        generated_outputs = {"regular": [], "compliance": []}
+        security_hub_findings = []
+
+        if args.output_formats:
+            for mode in args.output_formats:
+                filename = f"{output_options.output_directory}/{output_options.output_filename}"
+                if mode == "csv":
+                    from prowler.lib.outputs.csv.csv import CSV
+
+                    csv_output = CSV(
+                        findings=finding_outputs,
+                        file_path=f"{filename}{csv_file_suffix}",
+                    )
+                    generated_outputs["regular"].append(csv_output)
+                    # Write CSV Finding Object to file
+                    csv_output.batch_write_data_to_file()
+
+                if mode == "json-asff":
+                    from prowler.lib.outputs.asff.asff import ASFF
+
+                    asff_output = ASFF(
+                        findings=finding_outputs,
+                        file_path=f"{filename}{json_asff_file_suffix}",
+                    )
+                    generated_outputs["regular"].append(asff_output)
+                    security_hub_findings = asff_output.data
+                    # Write ASFF Finding Object to file
+                    asff_output.batch_write_data_to_file()
+
+                if mode == "json-ocsf":
+                    from prowler.lib.outputs.ocsf.ocsf import OCSF
+
+                    json_output = OCSF(
+                        findings=finding_outputs,
+                        file_path=f"{filename}{json_ocsf_file_suffix}",
+                    )
+                    generated_outputs["regular"].append(json_output)
+                    json_output.batch_write_data_to_file()
+                if mode == "html":
+                    from prowler.lib.outputs.html.html import HTML
+
+                    html_output = HTML(
+                        findings=finding_outputs,
+                        file_path=f"{filename}{html_file_suffix}",
+                    )
+                    generated_outputs["regular"].append(html_output)
+                    html_output.batch_write_data_to_file(
+                        provider=global_provider, stats=stats
+                    )
+
+        # Compliance Frameworks
+        input_compliance_frameworks = set(output_options.output_modes).intersection(
+            get_available_compliance_frameworks(provider)
+        )
         for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = GithubCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            else:
-                filename = (
+            compliance_output_class = get_compliance_output_class(
+                provider, compliance_name
+            )
+            compliance_output = compliance_output_class(
+                findings=finding_outputs,
+                compliance=bulk_compliance_frameworks[compliance_name],
+                file_path=(
                     f"{output_options.output_directory}/compliance/"
                     f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
+                ),
+            )
+            generated_outputs["compliance"].append(compliance_output)
+            compliance_output.batch_write_data_to_file()
 
     # AWS Security Hub Integration
     if provider == "aws":
         # Send output to S3 if needed (-B / -D) for all the output formats
+        from prowler.providers.aws.lib.s3.s3 import S3
+        from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
+
         if args.output_bucket or args.output_bucket_no_assume:
             output_bucket = args.output_bucket
             bucket_session = global_provider.session.current_session
@@ -880,7 +581,7 @@ def prowler():
                 aws_account_id=global_provider.identity.account,
                 aws_partition=global_provider.identity.partition,
                 aws_session=global_provider.session.current_session,
-                findings=asff_output.data,
+                findings=security_hub_findings,
                 send_only_fails=output_options.send_sh_only_fails,
                 aws_security_hub_available_regions=security_hub_regions,
             )
@@ -909,6 +610,10 @@ def prowler():
             global_provider,
             output_options,
         )
+        if profiler:
+            from prowler.lib.scan.profiler import display_profile_summary_table
+
+            display_profile_summary_table(profiler.get_records(), profile_reports)
         # Only display compliance table if there are findings (not all MANUAL) and it is a default execution
         if (
             findings and not all(finding.status == "MANUAL" for finding in findings)
@@ -0,0 +1,226 @@
+import hashlib
+import os
+import pickle
+import stat
+import tempfile
+from functools import lru_cache
+from typing import Any, Callable
+
+import prowler
+from prowler.config.config import prowler_version
+from prowler.lib.logger import logger
+
+# Set PROWLER_CATALOG_CACHE=false to always read the checks and compliance files
+CATALOG_CACHE_ENABLED_VARIABLE = "PROWLER_CATALOG_CACHE"
+CATALOG_CACHE_DIRECTORY_VARIABLE = "PROWLER_CATALOG_CACHE_DIRECTORY"
+default_catalog_cache_directory = os.path.join(
+    os.path.expanduser("~"), ".cache", "prowler", "catalog"
+)
+catalog_cache_file_suffix = ".pickle"
+
+
+def is_catalog_cache_enabled() -> bool:
+    """Returns whether the checks and compliance catalog cache is enabled."""
+    return os.getenv(CATALOG_CACHE_ENABLED_VARIABLE, "true").lower() not in (
+        "false",
+        "0",
+        "no",
+    )
+
+
+def get_catalog_cache_directory() -> str:
+    """Returns the directory where the catalog cache files are stored."""
+    return os.getenv(CATALOG_CACHE_DIRECTORY_VARIABLE, default_catalog_cache_directory)
+
+
+def is_catalog_cache_trusted(path: str, path_stat: os.stat_result) -> bool:
+    """
+    Returns whether a catalog cache path can be loaded, i.e. it is owned by the current user and
+    it is not writable by the group or others, since the cache files are unpickled.
+
+    Args:
+        path (str): The cache directory or file path.
+        path_stat (os.stat_result): The status of the path.
+
+    Returns:
+        bool: True if the path is trusted, False otherwise.
+    """
+    # Windows does not expose the file owner through os.stat
+    if hasattr(os, "getuid") and path_stat.st_uid != os.getuid():
+        logger.debug(f"Catalog cache path {path} is not owned by the current user")
+        return False
+    if path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        logger.debug(f"Catalog cache path {path} is writable by other users")
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def get_catalog_fingerprint(provider: str) -> str:
+    """
+    Compute a fingerprint of the installed checks and compliance frameworks of a provider.
+
+    The fingerprint covers the Prowler version, the installation path, the check folders and the
+    metadata and compliance files modification times and sizes, so any check added with
+    --checks-folder, removed or modified invalidates the cached catalog.
+
+    The fingerprint is computed once per process, so get_catalog_fingerprint.cache_clear() must
+    be called when the checks are changed during the execution, e.g. with --checks-folder.
+
+    Args:
+        provider (str): The name of the provider.
+
+    Returns:
+        str: The SHA-256 fingerprint.
+    """
+    prowler_path = prowler.__path__[0]
+    fingerprint = hashlib.sha256(f"{prowler_version}:{prowler_path}".encode())
+
+    services_path = os.path.join(prowler_path, "providers", provider, "services")
+    if os.path.isdir(services_path):
+        with os.scandir(services_path) as services:
+            for service in sorted(services, key=lambda entry: entry.name):
+                if not service.is_dir():
+                    continue
+                with os.scandir(service.path) as checks:
+                    for check in sorted(checks, key=lambda entry: entry.name):
+                        if not check.is_dir():
+                            continue
+                        fingerprint.update(f"{service.name}/{check.name}".encode())
+                        metadata_file = os.path.join(
+                            check.path, f"{check.name}.metadata.json"
+                        )
+                        if os.path.isfile(metadata_file):
+                            metadata_stat = os.stat(metadata_file)
+                            fingerprint.update(
+                                f":{metadata_stat.st_mtime_ns}:{metadata_stat.st_size}".encode()
+                            )
+
+    compliance_path = os.path.join(prowler_path, "compliance", provider)
+    if os.path.isdir(compliance_path):
+        with os.scandir(compliance_path) as frameworks:
+            for framework in sorted(frameworks, key=lambda entry: entry.name):
+                if framework.is_file():
+                    framework_stat = framework.stat()
+                    fingerprint.update(
+                        f"{framework.name}:{framework_stat.st_mtime_ns}:{framework_stat.st_size}".encode()
+                    )
+
+    return fingerprint.hexdigest()
+
+
+def get_catalog_cache_file(provider: str, section: str, fingerprint: str) -> str:
+    """Returns the cache file path of a catalog section for the given fingerprint."""
+    return os.path.join(
+        get_catalog_cache_directory(),
+        f"{provider}_{section}_{fingerprint}{catalog_cache_file_suffix}",
+    )
+
+
+def load_catalog_section(provider: str, section: str, fingerprint: str) -> Any:
+    """
+    Load a catalog section from the cache.
+
+    Args:
+        provider (str): The name of the provider.
+        section (str): The catalog section, e.g. "checks_metadata".
+        fingerprint (str): The current catalog fingerprint of the provider.
+
+    Returns:
+        Any: The cached section or None if it is not cached, it is not trusted or it could not be read.
+    """
+    cache_directory = get_catalog_cache_directory()
+    cache_file = get_catalog_cache_file(provider, section, fingerprint)
+    try:
+        if not is_catalog_cache_trusted(cache_directory, os.stat(cache_directory)):
+            return None
+        with open(cache_file, "rb") as f:
+            if not is_catalog_cache_trusted(cache_file, os.fstat(f.fileno())):
+                return None
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        logger.debug(
+            f"Catalog cache file {cache_file} could not be read -- {error.__class__.__name__}: {error}"
+        )
+        return None
+
+
+def save_catalog_section(provider: str, section: str, fingerprint: str, value: Any):
+    """
+    Save a catalog section into the cache, removing the outdated files of the same section.
+
+    Args:
+        provider (str): The name of the provider.
+        section (str): The catalog section, e.g. "checks_metadata".
+        fingerprint (str): The current catalog fingerprint of the provider.
+        value (Any): The section to cache.
+    """
+    cache_directory = get_catalog_cache_directory()
+    cache_file = get_catalog_cache_file(provider, section, fingerprint)
+    try:
+        # Only the current user can write the cache since it is unpickled when loaded
+        os.makedirs(cache_directory, mode=0o700, exist_ok=True)
+        # Write to a temporary file first so concurrent runs never read a partial file
+        file_descriptor, temporary_file = tempfile.mkstemp(dir=cache_directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_file, cache_file)
+        except Exception:
+            os.remove(temporary_file)
+            raise
+
+        section_prefix = f"{provider}_{section}_"
+        with os.scandir(cache_directory) as cache_files:
+            for outdated_file in cache_files:
+                if (
+                    outdated_file.name.startswith(section_prefix)
+                    and outdated_file.name.endswith(catalog_cache_file_suffix)
+                    and outdated_file.path != cache_file
+                ):
+                    os.remove(outdated_file.path)
+    except Exception as error:
+        logger.debug(
+            f"Catalog cache file {cache_file} could not be written -- {error.__class__.__name__}: {error}"
+        )
+
+
+def get_cached_catalog_section(
+    provider: str, section: str, builder: Callable[[], Any]
+) -> Any:
+    """
+    Returns a section of the provider's checks and compliance catalog, building and caching it
+    with the given builder when the cache is missing or outdated. If the cache is disabled the
+    builder is always called.
+
+    Args:
+        provider (str): The name of the provider.
+        section (str): The catalog section, e.g. "checks_metadata".
+        builder (Callable[[], Any]): The function that builds the section from the installed files.
+
+    Returns:
+        Any: The catalog section.
+
+    Examples:
+        >>> get_cached_catalog_section("aws", "compliance", lambda: load_frameworks("aws"))
+    """
+    if not is_catalog_cache_enabled():
+        return builder()
+
+    try:
+        fingerprint = get_catalog_fingerprint(provider)
+    except Exception as error:
+        logger.debug(
+            f"Catalog fingerprint for {provider} could not be computed -- {error.__class__.__name__}: {error}"
+        )
+        return builder()
+
+    value = load_catalog_section(provider, section, fingerprint)
+    if value is None:
+        value = builder()
+        # Empty sections are not cached since they are returned when loading fails
+        if value:
+            save_catalog_section(provider, section, fingerprint, value)
+    return value
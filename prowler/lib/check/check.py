@@ -1,3 +1,4 @@
+import ast
 import importlib
 import json
 import os
@@ -5,19 +6,25 @@ import re
 import shutil
 import sys
 import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from functools import partial
 from types import ModuleType
-from typing import Any
+from typing import Any, Callable, Generator, Optional
 
 from alive_progress import alive_bar
 from colorama import Fore, Style
 
 import prowler
 from prowler.config.config import orange_color
+from prowler.lib.check.catalog import get_catalog_fingerprint
 from prowler.lib.check.custom_checks_metadata import update_check_metadata
-from prowler.lib.check.models import Check
+from prowler.lib.check.models import Check, load_required_service_attributes
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import report
+from prowler.lib.scan.checkpoint import ScanCheckpoint
+from prowler.lib.scan.profiler import ScanProfiler
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.common.models import Audit_Metadata
 
@@ -102,6 +109,8 @@ def parse_checks_from_folder(provider, input_folder: str) -> set:
                         shutil.rmtree(prowler_module)
                     shutil.copytree(check_module, prowler_module)
                     custom_checks.add(check.name)
+        # The custom checks change the catalog fingerprint computed before copying them
+        get_catalog_fingerprint.cache_clear()
         return custom_checks
     except Exception as error:
         logger.critical(
@@ -134,6 +143,7 @@ def remove_custom_checks_module(input_folder: str, provider: str):
                 # If S3 URI, remove the downloaded folders
                 if s3_uri and os.path.exists(input_folder):
                     shutil.rmtree(input_folder)
+    get_catalog_fingerprint.cache_clear()
 
 
 def list_services(provider: str) -> set:
@@ -298,6 +308,157 @@ def import_check(check_path: str) -> ModuleType:
     return lib
 
 
+# Modules of the service clients, e.g. prowler.providers.aws.services.ec2.ec2_client
+service_client_module_pattern = re.compile(
+    r"^prowler\.providers\.\w+\.services\.\w+\.\w+_client$"
+)
+
+
+def get_module_imports(module_name: str) -> set:
+    """
+    get_module_imports returns the modules imported by a Prowler module, reading its source code without importing it.
+
+    Args:
+        module_name (str): module name, e.g. prowler.providers.aws.services.ec2.ec2_client
+
+    Returns:
+        set: the names of the modules imported with "from <module> import ...", empty if the module is not found
+    """
+    module_path = (
+        os.path.join(os.path.dirname(prowler.__file__), *module_name.split(".")[1:])
+        + ".py"
+    )
+    try:
+        with open(module_path) as module_file:
+            module_tree = ast.parse(module_file.read())
+    except (OSError, SyntaxError, ValueError):
+        return set()
+    return {
+        node.module
+        for node in ast.walk(module_tree)
+        if isinstance(node, ast.ImportFrom) and node.module
+    }
+
+
+def get_service_clients_dependencies(
+    checks_to_execute: list, provider_type: str
+) -> dict[str, set]:
+    """
+    get_service_clients_dependencies returns the service client modules used by the given checks, with the
+    service client modules each of them needs, like the monitor_client used by the keyvault service.
+
+    Args:
+        checks_to_execute (list): checks to execute
+        provider_type (str): provider type
+
+    Returns:
+        dict[str, set]: the service client modules and the service client modules they depend on
+    """
+    client_modules = []
+    for check_name in checks_to_execute:
+        service = check_name.split("_")[0]
+        client_modules.extend(
+            module
+            for module in get_module_imports(
+                f"prowler.providers.{provider_type}.services.{service}.{check_name}.{check_name}"
+            )
+            if service_client_module_pattern.match(module)
+        )
+    dependencies = {}
+    while client_modules:
+        client_module = client_modules.pop()
+        if client_module in dependencies:
+            continue
+        # The service client module instantiates the service, which may use other service clients
+        client_dependencies = set()
+        for module in get_module_imports(client_module):
+            if module.endswith("_service"):
+                client_dependencies.update(
+                    service_module
+                    for service_module in get_module_imports(module)
+                    if service_client_module_pattern.match(service_module)
+                    and service_module != client_module
+                )
+        dependencies[client_module] = client_dependencies
+        client_modules.extend(client_dependencies)
+    return dependencies
+
+
+def initialize_service_clients(
+    checks_to_execute: list,
+    provider_type: str,
+    parallel_services: int,
+    profiler: ScanProfiler = None,
+) -> None:
+    """
+    initialize_service_clients initialises concurrently the service clients used by the given checks, so the
+    resources of the services are collected before executing the checks instead of one service at a time.
+
+    A service client is initialised once all the service clients it depends on are initialised. If a service
+    client fails to be initialised the error is logged, and the checks of the service will try it again.
+
+    Args:
+        checks_to_execute (list): checks to execute
+        provider_type (str): provider type
+        parallel_services (int): number of service clients to initialise concurrently
+        profiler (ScanProfiler): profiler of the scan, the initialisation of each service client is profiled as the initialisation of its service
+    """
+    try:
+        pending_clients = {
+            client_module: client_dependencies
+            for client_module, client_dependencies in get_service_clients_dependencies(
+                checks_to_execute, provider_type
+            ).items()
+            if client_module not in sys.modules
+        }
+        for client_dependencies in pending_clients.values():
+            client_dependencies.intersection_update(pending_clients)
+        if not pending_clients:
+            return
+        logger.info(
+            f"Initialising {len(pending_clients)} service clients with {parallel_services} workers"
+        )
+
+        def initialize_service_client(client_module: str):
+            service = client_module.split(".")[-2]
+            with (
+                profiler.profile("service", service, service)
+                if profiler
+                else nullcontext()
+            ):
+                importlib.import_module(client_module)
+
+        with ThreadPoolExecutor(max_workers=max(parallel_services, 1)) as executor:
+            running_clients = {}
+
+            def submit_ready_clients():
+                for client_module, client_dependencies in list(pending_clients.items()):
+                    if not client_dependencies:
+                        del pending_clients[client_module]
+                        running_clients[
+                            executor.submit(initialize_service_client, client_module)
+                        ] = client_module
+
+            submit_ready_clients()
+            while running_clients:
+                done, _ = wait(running_clients, return_when=FIRST_COMPLETED)
+                for future in done:
+                    client_module = running_clients.pop(future)
+                    if future.exception():
+                        error = future.exception()
+                        logger.error(
+                            f"{client_module} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+                    for client_dependencies in pending_clients.values():
+                        client_dependencies.discard(client_module)
+                submit_ready_clients()
+        # The service clients left, if any, have circular dependencies and are initialised by their checks
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+
 def run_fixer(check_findings: list) -> int:
     """
     Run the fixer for the check if it exists and there are any FAIL findings
@@ -383,14 +544,207 @@ def run_fixer(check_findings: list) -> int:
         )
 
 
+def import_and_execute_check(
+    check_name: str,
+    global_provider: Any,
+    custom_checks_metadata: Any,
+    output_options: Any = None,
+    profiler: ScanProfiler = None,
+) -> Optional[tuple[Check, list]]:
+    """
+    Import the check module, instantiate the check and execute it
+
+    Args:
+        check_name (str): check name
+        global_provider (Any): provider object
+        custom_checks_metadata (Any): custom checks metadata
+        output_options (Any): output options, depending on the provider
+        profiler (ScanProfiler): profiler of the scan, the import of the check module is profiled as the initialisation of its service
+
+    Returns:
+        tuple[Check, list] | None: the check instance and its findings, or None if the check could not be loaded or executed
+    """
+    # Recover service from check name
+    service = check_name.split("_")[0]
+    try:
+        try:
+            # Import check module
+            check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
+            # The service client is initialised when the first check module of the service is imported
+            with (
+                profiler.profile("service", service, service)
+                if profiler
+                else nullcontext()
+            ):
+                lib = import_check(check_module_path)
+            # Recover functions from check
+            check_to_execute = getattr(lib, check_name)
+            check = check_to_execute()
+        except ModuleNotFoundError:
+            logger.error(
+                f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
+            )
+            return None
+        with (
+            profiler.profile("check", check_name, service)
+            if profiler
+            else nullcontext()
+        ) as profile_record:
+            check_findings = execute(
+                check,
+                global_provider,
+                custom_checks_metadata,
+                output_options,
+            )
+            if profile_record:
+                profile_record.findings = len(check_findings)
+        return check, check_findings
+    # If check does not exists in the provider or is from another provider
+    except ModuleNotFoundError:
+        logger.error(
+            f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
+        )
+    except Exception as error:
+        logger.error(
+            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return None
+
+
+def group_checks_by_service(checks_to_execute: list) -> dict[str, list[str]]:
+    """
+    group_checks_by_service returns the checks to execute grouped by service, keeping the input order.
+
+    Example:
+        group_checks_by_service(["ec2_ami_public", "s3_bucket_public_access", "ec2_instance_public_ip"])
+        -> {"ec2": ["ec2_ami_public", "ec2_instance_public_ip"], "s3": ["s3_bucket_public_access"]}
+    """
+    service_checks = {}
+    for check_name in checks_to_execute:
+        service_checks.setdefault(check_name.split("_")[0], []).append(check_name)
+    return service_checks
+
+
+def run_checks(
+    checks_to_execute: list,
+    execute_check: Callable[[str], Any],
+    parallel_checks: int = 1,
+) -> Generator[tuple[str, Any], None, None]:
+    """
+    Execute the given checks and yield the result of each one of them in the same order as checks_to_execute.
+
+    When parallel_checks is greater than 1 the checks are grouped by service and each service is
+    executed by a worker of a thread pool with parallel_checks workers. The checks of a service run
+    sequentially within the same worker, so the service client is initialised just once, while
+    different services are scanned concurrently.
+
+    Args:
+        checks_to_execute (list): checks to execute
+        execute_check (Callable[[str], Any]): function that executes a check given its name
+        parallel_checks (int): number of services to scan concurrently
+
+    Yields:
+        tuple[str, Any]: the check name and the value returned by execute_check, None if it raised an exception
+    """
+
+    def safe_execute_check(check_name: str) -> Any:
+        try:
+            return execute_check(check_name)
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
+    if parallel_checks <= 1:
+        for check_name in checks_to_execute:
+            yield check_name, safe_execute_check(check_name)
+        return
+
+    check_results = {check_name: Future() for check_name in checks_to_execute}
+
+    def execute_service_checks(service_checks: list):
+        for check_name in service_checks:
+            check_results[check_name].set_result(safe_execute_check(check_name))
+
+    def propagate_failure(service_checks: list, service_future: Future):
+        # If a worker dies (e.g. SystemExit) the pending checks of its service must not block the scan
+        if service_future.cancelled() or service_future.exception() is None:
+            return
+        for check_name in service_checks:
+            if not check_results[check_name].done():
+                check_results[check_name].set_exception(service_future.exception())
+
+    executor = ThreadPoolExecutor(max_workers=parallel_checks)
+    try:
+        for service_checks in group_checks_by_service(checks_to_execute).values():
+            service_future = executor.submit(execute_service_checks, service_checks)
+            service_future.add_done_callback(partial(propagate_failure, service_checks))
+        # Results are returned following the input order to keep the outputs deterministic
+        for check_name in checks_to_execute:
+            yield check_name, check_results[check_name].result()
+    finally:
+        # Cancel the queued services if the scan is interrupted, only the running checks are awaited
+        executor.shutdown(cancel_futures=True)
+
+
+def run_checks_from_checkpoint(
+    checks_to_execute: list,
+    execute_check: Callable[[str], Any],
+    parallel_checks: int = 1,
+    checkpoint: ScanCheckpoint = None,
+    initialize_services: Callable[[list], Any] = None,
+) -> Generator[tuple[str, Any, bool], None, None]:
+    """
+    Execute the given checks like run_checks, skipping the checks completed in the checkpointed scan.
+
+    The findings of the completed checks are loaded from the checkpoint instead, and the findings of the
+    executed checks must be saved into the checkpoint by the caller once they are processed.
+
+    Args:
+        checks_to_execute (list): checks to execute
+        execute_check (Callable[[str], Any]): function that executes a check given its name
+        parallel_checks (int): number of services to scan concurrently
+        checkpoint (ScanCheckpoint): the checkpoint of the scan, if any
+        initialize_services (Callable[[list], Any]): function that initialises the services of the checks to execute before executing them, if any
+
+    Yields:
+        tuple[str, Any, bool]: the check name, the value returned by execute_check or the findings loaded from
+            the checkpoint, None if it failed, and whether the check was resumed from the checkpoint
+    """
+    resumed_checks = set()
+    if checkpoint:
+        resumed_checks = checkpoint.get_completed_checks().intersection(
+            checks_to_execute
+        )
+    pending_checks = [
+        check_name
+        for check_name in checks_to_execute
+        if check_name not in resumed_checks
+    ]
+    if initialize_services and pending_checks:
+        initialize_services(pending_checks)
+    check_results = run_checks(pending_checks, execute_check, parallel_checks)
+    for check_name in checks_to_execute:
+        if check_name in resumed_checks:
+            yield check_name, checkpoint.load_findings(check_name), True
+        else:
+            _, check_result = next(check_results)
+            yield check_name, check_result, False
+
+
 def execute_checks(
     checks_to_execute: list,
     global_provider: Any,
     custom_checks_metadata: Any,
     config_file: str,
     output_options: Any,
+    parallel_checks: int = 1,
+    findings_callback: Callable[[list], Any] = None,
+    checkpoint: ScanCheckpoint = None,
+    profiler: ScanProfiler = None,
 ) -> list:
-    # List to store all the check's findings
+    # List to store all the check's findings, unless they are handed over to the findings_callback
     all_findings = []
     # Services and checks executed for the Audit Status
     services_executed = set()
@@ -431,53 +785,67 @@ def execute_checks(
     elif hasattr(output_options, "fixer"):
         verbose = output_options.fixer
 
-    # Execution with the --only-logs flag
-    if output_options.only_logs:
-        for check_name in checks_to_execute:
-            # Recover service from check name
-            service = check_name.split("_")[0]
-            try:
-                try:
-                    # Import check module
-                    check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                    lib = import_check(check_module_path)
-                    # Recover functions from check
-                    check_to_execute = getattr(lib, check_name)
-                    check = check_to_execute()
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                    continue
-                if verbose:
-                    print(
-                        f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
-                    )
-                check_findings = execute(
-                    check,
-                    global_provider,
-                    custom_checks_metadata,
-                    output_options,
-                )
+    def process_check_result(check_name: str, check_result: Any, resumed: bool):
+        # The result of a resumed check is the list of findings loaded from the checkpoint
+        if resumed:
+            check, check_findings = None, check_result
+        else:
+            check, check_findings = check_result
+        if verbose and not resumed:
+            print(
+                f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
+            )
+        try:
+            # The findings of the resumed checks were already reported and checkpointed
+            if not resumed:
                 report(check_findings, global_provider, output_options)
+                if checkpoint:
+                    checkpoint.save_findings(check_name, check_findings)
+            if findings_callback:
+                findings_callback(check_findings)
+            else:
                 all_findings.extend(check_findings)
 
-                # Update Audit Status
-                services_executed.add(service)
-                checks_executed.add(check_name)
-                global_provider.audit_metadata = update_audit_metadata(
-                    global_provider.audit_metadata, services_executed, checks_executed
-                )
+            # Update Audit Status
+            services_executed.add(check_name.split("_")[0])
+            checks_executed.add(check_name)
+            global_provider.audit_metadata = update_audit_metadata(
+                global_provider.audit_metadata, services_executed, checks_executed
+            )
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
-            # If check does not exists in the provider or is from another provider
-            except ModuleNotFoundError:
-                logger.error(
-                    f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                )
-            except Exception as error:
-                logger.error(
-                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+    check_results = run_checks_from_checkpoint(
+        checks_to_execute,
+        partial(
+            import_and_execute_check,
+            global_provider=global_provider,
+            custom_checks_metadata=custom_checks_metadata,
+            output_options=output_options,
+            profiler=profiler,
+        ),
+        parallel_checks,
+        checkpoint,
+        # The service clients are initialised concurrently before executing the checks
+        (
+            partial(
+                initialize_service_clients,
+                provider_type=global_provider.type,
+                parallel_services=parallel_checks,
+                profiler=profiler,
+            )
+            if parallel_checks > 1
+            else None
+        ),
+    )
+
+    # Execution with the --only-logs flag
+    if output_options.only_logs:
+        for check_name, check_result, resumed in check_results:
+            if check_result is not None:
+                process_check_result(check_name, check_result, resumed)
     else:
         # Prepare your messages
         messages = [f"Config File: {Fore.YELLOW}{config_file}{Style.RESET_ALL}"]
@@ -489,6 +857,16 @@ def execute_checks(
             messages.append(
                 f"Scanning unused services and resources: {Fore.YELLOW}{global_provider.scan_unused_services}{Style.RESET_ALL}"
             )
+        if parallel_checks > 1:
+            messages.append(
+                f"Services scanned in parallel: {Fore.YELLOW}{parallel_checks}{Style.RESET_ALL}"
+            )
+        if checkpoint:
+            messages.append(
+                f"Scan Checkpoint: {Fore.YELLOW}{checkpoint.directory}{Style.RESET_ALL}"
+            )
+        if profiler:
+            messages.append(f"Scan Profile: {Fore.YELLOW}enabled{Style.RESET_ALL}")
         report_title = (
             f"{Style.BRIGHT}Using the following configuration:{Style.RESET_ALL}"
         )
@@ -516,52 +894,10 @@ def execute_checks(
                 bar.title = (
                     f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
                 )
-                try:
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                        )
-                        continue
-                    if verbose:
-                        print(
-                            f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
-                        )
-                    check_findings = execute(
-                        check,
-                        global_provider,
-                        custom_checks_metadata,
-                        output_options,
-                    )
-
-                    report(check_findings, global_provider, output_options)
-
-                    all_findings.extend(check_findings)
-                    services_executed.add(service)
-                    checks_executed.add(check_name)
-                    global_provider.audit_metadata = update_audit_metadata(
-                        global_provider.audit_metadata,
-                        services_executed,
-                        checks_executed,
-                    )
-
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                except Exception as error:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+                # The check results follow the checks_to_execute order
+                _, check_result, resumed = next(check_results)
+                if check_result is not None:
+                    process_check_result(check_name, check_result, resumed)
                 bar()
             bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
 
@@ -604,6 +940,8 @@ def execute(
         check_findings = []
         logger.debug(f"Executing check: {check.CheckID}")
         try:
+            # Collect the service data the check consumes before executing it
+            load_required_service_attributes(check)
             check_findings = check.execute()
         except Exception as error:
             if not only_logs:
@@ -3,6 +3,39 @@ import sys
 from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.logger import logger
 
+# Compliance requirements of each check by provider and check, with the check's compliance they were indexed from.
+# It is cleared when the checks metadata is updated with new compliance frameworks, see get_check_compliance.
+check_compliance_index = {}
+
+
+def build_compliance_index(bulk_compliance_frameworks: dict) -> dict[str, list]:
+    """
+    Build the inverted index from each check to the compliance requirements that include it.
+    Each entry is a Compliance with the requirement as its only requirement, shared between
+    all the checks of that requirement.
+    Args:
+        bulk_compliance_frameworks (dict): The compliance frameworks
+
+    Returns:
+        dict: The list of Compliance for each check, following the frameworks and requirements order
+    """
+    compliance_index = {}
+    for framework in bulk_compliance_frameworks.values():
+        for requirement in framework.Requirements:
+            requirement_compliance = None
+            # A check listed twice in the same requirement is only included once
+            for check in dict.fromkeys(requirement.Checks):
+                if requirement_compliance is None:
+                    requirement_compliance = Compliance(
+                        Framework=framework.Framework,
+                        Provider=framework.Provider,
+                        Version=framework.Version,
+                        Description=framework.Description,
+                        Requirements=[requirement],
+                    )
+                compliance_index.setdefault(check, []).append(requirement_compliance)
+    return compliance_index
+
 
 def update_checks_metadata_with_compliance(
     bulk_compliance_frameworks: dict, bulk_checks_metadata: dict
@@ -17,27 +50,15 @@ def update_checks_metadata_with_compliance(
         dict: The checks metadata with the compliance frameworks
     """
     try:
+        # The index is built once for the loaded frameworks
+        compliance_index = build_compliance_index(bulk_compliance_frameworks)
+        # The requirements indexed from the previously loaded frameworks are outdated
+        check_compliance_index.clear()
         for check in bulk_checks_metadata:
-            check_compliance = []
-            for framework in bulk_compliance_frameworks.values():
-                for requirement in framework.Requirements:
-                    compliance_requirements = []
-                    # Verify if check is in the requirement
-                    if check in requirement.Checks:
-                        # Include the requirement into the check's framework requirements
-                        compliance_requirements.append(requirement)
-                        # Create the Compliance
-                        compliance = Compliance(
-                            Framework=framework.Framework,
-                            Provider=framework.Provider,
-                            Version=framework.Version,
-                            Description=framework.Description,
-                            Requirements=compliance_requirements,
-                        )
-                        # Include the compliance framework for the check
-                        check_compliance.append(compliance)
             # Save it into the check's metadata
-            bulk_checks_metadata[check].Compliance = check_compliance
+            bulk_checks_metadata[check].Compliance = list(
+                compliance_index.get(check, [])
+            )
         return bulk_checks_metadata
     except Exception as e:
         logger.critical(f"{e.__class__.__name__}[{e.__traceback__.tb_lineno}] -- {e}")
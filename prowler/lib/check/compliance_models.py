@@ -5,6 +5,7 @@ from typing import Optional, Union
 
 from pydantic.v1 import BaseModel, ValidationError, root_validator
 
+from prowler.lib.check.catalog import get_cached_catalog_section
 from prowler.lib.check.utils import list_compliance_modules
 from prowler.lib.logger import logger
 
@@ -343,7 +344,14 @@ class Compliance(BaseModel):
 
     @staticmethod
     def get_bulk(provider: str) -> dict:
-        """Bulk load all compliance frameworks specification into a dict"""
+        """Bulk load all compliance frameworks specification into a dict, using the catalog cache if it is up to date"""
+        return get_cached_catalog_section(
+            provider, "compliance", lambda: Compliance._load_bulk(provider)
+        )
+
+    @staticmethod
+    def _load_bulk(provider: str) -> dict:
+        """Bulk load all compliance frameworks specification files into a dict"""
         try:
             bulk_compliance_frameworks = {}
             available_compliance_framework_modules = list_compliance_modules()
@@ -1,9 +1,8 @@
 import sys
 
 import yaml
-from jsonschema import validate
 
-from prowler.lib.check.models import Severity
+from prowler.lib.check.models import Check, Severity
 from prowler.lib.logger import logger
 
 custom_checks_metadata_schema = {
@@ -80,6 +79,9 @@ custom_checks_metadata_schema = {
 
 def parse_custom_checks_metadata_file(provider: str, parse_custom_checks_metadata_file):
     """parse_custom_checks_metadata_file returns the custom_checks_metadata object if it is valid, otherwise aborts the execution returning the ValidationError."""
+    # jsonschema is imported on demand since it is slow to import
+    from jsonschema import validate
+
     try:
         with open(parse_custom_checks_metadata_file) as f:
             custom_checks_metadata = yaml.safe_load(f)["CustomChecksMetadata"][provider]
@@ -128,6 +130,9 @@ def update_check_metadata(check_metadata, custom_metadata):
                         setattr(check_metadata, attribute, custom_metadata[attribute])
                     except ValueError:
                         pass
+            # The findings must share the updated metadata
+            if isinstance(check_metadata, Check):
+                check_metadata.reset_metadata()
     finally:
         return check_metadata
 
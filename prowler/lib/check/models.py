@@ -5,16 +5,20 @@ import sys
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass, is_dataclass
 from enum import Enum
-from typing import Any, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Union
 
-from checkov.common.output.record import Record
-from pydantic.v1 import BaseModel, ValidationError, validator
+from pydantic.v1 import BaseModel, PrivateAttr, ValidationError, validator
 
 from prowler.config.config import Provider
+from prowler.lib.check.catalog import get_cached_catalog_section
 from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 
+if TYPE_CHECKING:
+    # Only used for type hints, Checkov is slow to import
+    from checkov.common.output.record import Record
+
 
 class Code(BaseModel):
     """
@@ -182,13 +186,23 @@ class CheckMetadata(BaseModel):
     @staticmethod
     def get_bulk(provider: str) -> dict[str, "CheckMetadata"]:
         """
-        Load the metadata of all checks for a given provider reading the check's metadata files.
+        Load the metadata of all checks for a given provider, from the catalog cache if it is up to date
+        or reading the check's metadata files otherwise.
         Args:
             provider (str): The name of the provider.
         Returns:
             dict[str, CheckMetadata]: A dictionary containing the metadata of all checks, with the CheckID as the key.
         """
 
+        return get_cached_catalog_section(
+            provider,
+            "checks_metadata",
+            lambda: CheckMetadata._load_bulk(provider),
+        )
+
+    @staticmethod
+    def _load_bulk(provider: str) -> dict[str, "CheckMetadata"]:
+        """Load the metadata of all checks for a given provider parsing the check's metadata files."""
         bulk_check_metadata = {}
         checks = recover_checks_from_provider(provider)
         # Build list of check's metadata files
@@ -416,9 +430,22 @@ class CheckMetadata(BaseModel):
         return checks
 
 
+class SharedCheckMetadata(CheckMetadata):
+    """
+    Read-only check's metadata shared by all the check's findings, see Check.metadata().
+    A finding changing its metadata fields, e.g. the Severity, replaces it with a copy.
+    """
+
+    class Config:
+        allow_mutation = False
+
+
 class Check(ABC, CheckMetadata):
     """Prowler Check"""
 
+    # Metadata shared by all the check's findings, see metadata()
+    _shared_metadata: Optional[SharedCheckMetadata] = PrivateAttr(default=None)
+
     def __init__(self, **data):
         """Check's init function. Calls the CheckMetadataModel init."""
         # Parse the Check's metadata file
@@ -433,15 +460,60 @@ class Check(ABC, CheckMetadata):
         # TODO: verify that the CheckID is the same as the filename and classname
         # to mimic the test done at test_<provider>_checks_metadata_is_valid
 
-    def metadata(self) -> dict:
-        """Return the JSON representation of the check's metadata"""
-        return self.json()
+    def metadata(self) -> SharedCheckMetadata:
+        """
+        Return the check's metadata, a single read-only instance shared by all the check's findings.
+        It is built on the first call, so it includes the custom metadata applied before.
+        """
+        if self._shared_metadata is None:
+            self._shared_metadata = SharedCheckMetadata(**self.dict())
+        return self._shared_metadata
+
+    def reset_metadata(self) -> None:
+        """Discard the shared metadata so the next findings include the check's metadata changes"""
+        self._shared_metadata = None
 
     @abstractmethod
     def execute(self) -> list:
         """Execute the check's logic"""
 
 
+def requires_service_attributes(*attributes: str):
+    """
+    Class decorator to declare the service client attributes a check consumes, using the
+    name of the client within the check's module, e.g. "ec2_client.snapshots".
+
+    Services only collect their lazy attributes when they are needed, so the declared
+    attributes are loaded right before the check is executed.
+
+    Example:
+        @requires_service_attributes("ec2_client.snapshots")
+        class ec2_ebs_public_snapshot(Check):
+            ...
+    """
+
+    def decorator(check_class):
+        check_class._required_service_attributes = attributes
+        return check_class
+
+    return decorator
+
+
+def load_required_service_attributes(check: Check):
+    """
+    Load the service client attributes declared with requires_service_attributes for the given check.
+
+    Args:
+        check (Check): The check to load the service attributes for.
+    """
+    check_module = sys.modules.get(type(check).__module__)
+    for required_attribute in getattr(type(check), "_required_service_attributes", ()):
+        client_name, attribute = required_attribute.split(".", 1)
+        client = getattr(check_module, client_name, None)
+        if hasattr(client, "load_attributes"):
+            client.load_attributes(attribute)
+
+
 @dataclass
 class Check_Report:
     """Contains the Check's finding information."""
@@ -454,16 +526,19 @@ class Check_Report:
     resource_tags: list
     muted: bool
 
-    def __init__(self, metadata: Dict, resource: Any) -> None:
+    def __init__(self, metadata: Union[str, CheckMetadata], resource: Any) -> None:
         """Initialize the Check's finding information.
 
         Args:
-            metadata: The metadata of the check.
+            metadata: The metadata of the check, the shared instance returned by Check.metadata() or its JSON representation.
             resource: Basic information about the resource. Defaults to None.
                       Only accepted dict, list, BaseModels (dict attribute), custom models (with to_dict attribute) and dataclasses.
         """
         self.status = ""
-        self.check_metadata = CheckMetadata.parse_raw(metadata)
+        if isinstance(metadata, CheckMetadata):
+            self.check_metadata = metadata
+        else:
+            self.check_metadata = CheckMetadata.parse_raw(metadata)
         if isinstance(resource, dict):
             self.resource = resource
         elif hasattr(resource, "dict"):
@@ -659,7 +734,7 @@ class CheckReportIAC(Check_Report):
     resource_path: str
     resource_line_range: str
 
-    def __init__(self, metadata: dict = {}, resource: Record = None) -> None:
+    def __init__(self, metadata: dict = {}, resource: "Record" = None) -> None:
         """
         Initialize the IAC Check's finding information from a Checkov failed_check dict.
 
@@ -2,6 +2,10 @@ import importlib
 import sys
 from pkgutil import walk_packages
 
+from prowler.lib.check.catalog import (
+    get_cached_catalog_section,
+    is_catalog_cache_enabled,
+)
 from prowler.lib.logger import logger
 
 
@@ -18,22 +22,25 @@ def recover_checks_from_provider(
         if provider == "iac":
             return []
 
-        checks = []
-        modules = list_modules(provider, service)
-        for module_name in modules:
-            # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
-            check_module_name = module_name.name
-            # We need to exclude common shared libraries in services
-            if (
-                check_module_name.count(".") == 6
-                and "lib" not in check_module_name
-                and (not check_module_name.endswith("_fixer") or include_fixers)
-            ):
-                check_path = module_name.module_finder.path
-                # Check name is the last part of the check_module_name
-                check_name = check_module_name.split(".")[-1]
-                check_info = (check_name, check_path)
-                checks.append(check_info)
+        if is_catalog_cache_enabled():
+            checks = [
+                (check_name, check_path)
+                for check_name, check_path, check_service in get_cached_catalog_section(
+                    provider, "checks", lambda: walk_checks_from_provider(provider)
+                )
+                if (not service or check_service == service)
+                and (not check_name.endswith("_fixer") or include_fixers)
+            ]
+            # Unknown services are walked to report them as not found
+            if checks or not service:
+                return checks
+
+        checks = [
+            (check_name, check_path)
+            for check_name, check_path, _ in walk_checks_from_provider(
+                provider, service, include_fixers
+            )
+        ]
     except ModuleNotFoundError:
         logger.critical(f"Service {service} was not found for the {provider} provider.")
         sys.exit(1)
@@ -44,6 +51,33 @@ def recover_checks_from_provider(
         return checks
 
 
+def walk_checks_from_provider(
+    provider: str, service: str = None, include_fixers: bool = True
+) -> list[tuple]:
+    """
+    Walk the provider's service packages to find its checks
+
+    Returns a list of tuples with the following format (check_name, check_path, service)
+    """
+    checks = []
+    modules = list_modules(provider, service)
+    for module_name in modules:
+        # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+        check_module_name = module_name.name
+        # We need to exclude common shared libraries in services
+        if (
+            check_module_name.count(".") == 6
+            and "lib" not in check_module_name
+            and (not check_module_name.endswith("_fixer") or include_fixers)
+        ):
+            check_path = module_name.module_finder.path
+            # Check name is the last part of the check_module_name
+            check_name = check_module_name.split(".")[-1]
+            check_service = check_module_name.split(".")[4]
+            checks.append((check_name, check_path, check_service))
+    return checks
+
+
 # List all available modules in the selected provider and service
 def list_modules(provider: str, service: str):
     # This module path requires the full path including "prowler."
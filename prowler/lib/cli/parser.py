@@ -72,6 +72,7 @@ Detailed documentation at https://docs.prowler.com
         self.__init_config_parser__()
         self.__init_custom_checks_metadata_parser__()
         self.__init_third_party_integrations_parser__()
+        self.__init_scan_execution_parser__()
 
         # Init Providers Arguments
         init_providers_parser(self)
@@ -198,6 +199,12 @@ Detailed documentation at https://docs.prowler.com
             default=False,
             help="Set the output timestamp format as unix timestamps instead of iso format timestamps (default mode).",
         )
+        common_outputs_parser.add_argument(
+            "--streaming-outputs",
+            action="store_true",
+            default=False,
+            help="Write the findings of each check to the output files as soon as it finishes instead of keeping all the findings in memory until the end of the scan.",
+        )
 
     def __init_logging_parser__(self):
         # Logging Options
@@ -393,3 +400,56 @@ Detailed documentation at https://docs.prowler.com
             action="store_true",
             help="Send a summary of the execution with a Slack APP in your channel. Environment variables SLACK_API_TOKEN and SLACK_CHANNEL_NAME are required (see more in https://docs.prowler.cloud/en/latest/tutorials/integrations/#slack).",
         )
+
+    def __init_scan_execution_parser__(self):
+        scan_execution_subparser = self.common_providers_parser.add_argument_group(
+            "Scan Execution"
+        )
+        scan_execution_subparser.add_argument(
+            "--parallel-checks",
+            default=1,
+            type=validate_parallel_checks,
+            metavar="N",
+            help="Number of services scanned in parallel. The checks of each service are executed sequentially within the same worker. Each AWS service also runs up to 10 API calls concurrently, so N services means about N×10 concurrent API calls (Default: 1, sequential execution).",
+        )
+        scan_checkpoint_parser = scan_execution_subparser.add_mutually_exclusive_group()
+        scan_checkpoint_parser.add_argument(
+            "--checkpoint-directory",
+            default=None,
+            metavar="DIRECTORY",
+            help="Directory to store a checkpoint journal with the completed checks and their findings, so the scan can be resumed with --resume if it is interrupted.",
+        )
+        scan_checkpoint_parser.add_argument(
+            "--resume",
+            default=None,
+            metavar="DIRECTORY",
+            help="Resume the scan checkpointed in the given directory, the completed checks are not executed again and their findings are included in the outputs. Use the same arguments as the interrupted scan.",
+        )
+        scan_execution_subparser.add_argument(
+            "--profile-scan",
+            action="store_true",
+            help="Profile the wall time, CPU time, peak memory, findings and API calls of each check and service initialisation, and write them to a JSON and a CSV report in the output directory.",
+        )
+        scan_execution_subparser.add_argument(
+            "--export-snapshot",
+            default=None,
+            metavar="FILE",
+            help="Export the resources collected by the services of the scan to a snapshot file, to execute the checks again with --from-snapshot without connecting to the provider.",
+        )
+        scan_execution_subparser.add_argument(
+            "--from-snapshot",
+            default=None,
+            metavar="FILE",
+            help="Execute the checks against the resources of a snapshot exported with --export-snapshot instead of connecting to the provider. The checks of the services not included in the snapshot are skipped.",
+        )
+
+
+def validate_parallel_checks(parallel_checks: str) -> int:
+    """validate_parallel_checks validates that the input number of parallel workers is a positive integer"""
+    try:
+        workers = int(parallel_checks)
+    except ValueError:
+        raise argparse.ArgumentTypeError("--parallel-checks must be an integer")
+    if workers < 1:
+        raise argparse.ArgumentTypeError("--parallel-checks must be greater than 0")
+    return workers
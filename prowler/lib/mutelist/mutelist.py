@@ -105,6 +105,7 @@ class Mutelist(ABC):
 
     _mutelist: dict = {}
     _mutelist_file_path: str = None
+    _compiled_mutelist: "CompiledMutelist" = None
 
     MUTELIST_KEY = "Mutelist"
 
@@ -119,6 +120,7 @@ class Mutelist(ABC):
 
         if self._mutelist:
             self._mutelist = Mutelist.validate_mutelist(self._mutelist)
+        self.compile_mutelist()
 
     @property
     def mutelist(self) -> dict:
@@ -132,6 +134,20 @@ class Mutelist(ABC):
     def is_finding_muted(self) -> bool:
         raise NotImplementedError
 
+    def compile_mutelist(self) -> "CompiledMutelist":
+        """
+        Compile the mutelist to evaluate the findings with it, it is compiled again if the mutelist was replaced.
+
+        Returns:
+            CompiledMutelist: The compiled mutelist.
+        """
+        if (
+            self._compiled_mutelist is None
+            or self._compiled_mutelist.mutelist is not self._mutelist
+        ):
+            self._compiled_mutelist = CompiledMutelist(self._mutelist)
+        return self._compiled_mutelist
+
     def get_mutelist_file_from_local_file(self, mutelist_path: str):
         try:
             with open(mutelist_path) as f:
@@ -178,31 +194,20 @@ class Mutelist(ABC):
             check (str): The check to be evaluated for muting.
             finding_region (str): The region where the finding occurred.
             finding_resource (str): The resource related to the finding.
-            finding_tags: The tags associated with the finding.
+            finding_tags: The tags associated with the finding, unrolled to a string or as they are in the finding,
+                they are only unrolled if the check is muted for the account.
 
         Returns:
             bool: True if the finding is muted for the audited account, check, region, resource and tags., otherwise False.
         """
         try:
-            # By default is not muted
-            is_finding_muted = False
-
-            # We always check all the accounts present in the mutelist
-            # if one mutes the finding we set the finding as muted
-            for account in self._mutelist.get("Accounts", []):
-                if account == audited_account or account == "*":
-                    if self.is_muted_in_check(
-                        self._mutelist["Accounts"][account]["Checks"],
-                        audited_account,
-                        check,
-                        finding_region,
-                        finding_resource,
-                        finding_tags,
-                    ):
-                        is_finding_muted = True
-                        break
-
-            return is_finding_muted
+            return self.compile_mutelist().is_muted(
+                audited_account,
+                check,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
@@ -319,7 +324,7 @@ class Mutelist(ABC):
                 finding.metadata.CheckID,
                 finding.region,
                 finding.resource_uid,
-                unroll_dict(unroll_tags(finding.resource_tags)),
+                finding.resource_tags,
             ):
                 finding.raw["status"] = finding.status
                 finding.status = Status.MUTED
@@ -461,3 +466,222 @@ class Mutelist(ABC):
                     f"{error.__class__.__name__} -- Mutelist YAML is malformed - {error}[{error.__traceback__.tb_lineno}]"
                 )
             return {}
+
+
+class MutelistItemsMatcher:
+    """
+    MutelistItemsMatcher matches a field of the findings with the items of a Mutelist field, e.g. its Regions, with
+    the same logic as Mutelist.is_item_matched but with their regular expressions compiled once.
+
+    Attributes:
+        items (list): The items of the Mutelist field.
+        tag (bool): Whether the items are tags, which must all be present in the finding.
+        match_all (bool): Whether the items match any finding value, e.g. "*".
+    """
+
+    def __init__(self, items, tag: bool = False):
+        self.items = items
+        self.tag = tag
+        self.match_all = False
+        self._regexes = []
+        self._compiled = True
+        if not items:
+            return
+        try:
+            patterns = [
+                item.replace("*", ".*") if "*" in item else item for item in items
+            ]
+            # Each item is compiled on its own first, an invalid one never matches as in is_item_matched
+            regexes = [re.compile(pattern) for pattern in patterns]
+            if tag:
+                # All the tags must be present, so the ones matching any value are skipped
+                self._regexes = [
+                    regex
+                    for regex, pattern in zip(regexes, patterns)
+                    if pattern != ".*"
+                ]
+                self.match_all = not self._regexes
+            elif ".*" in patterns:
+                self.match_all = True
+            else:
+                try:
+                    # Any of the items is present, so they are searched at once
+                    self._regexes = [
+                        re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+                    ]
+                except re.error:
+                    self._regexes = regexes
+        except Exception:
+            # The items are evaluated as they are, e.g. an invalid regular expression
+            self._compiled = False
+
+    def is_matched(self, finding_items) -> bool:
+        """Returns whether the finding value matches the items, see Mutelist.is_item_matched."""
+        if not self._compiled:
+            return Mutelist.is_item_matched(self.items, finding_items, tag=self.tag)
+        if not self.items or not (finding_items or finding_items == ""):
+            return False
+        try:
+            if self.match_all:
+                return True
+            if self.tag:
+                return all(regex.search(finding_items) for regex in self._regexes)
+            return any(regex.search(finding_items) for regex in self._regexes)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+            )
+            return False
+
+
+class MutelistCheckEntry:
+    """
+    MutelistCheckEntry is a check of an account of the Mutelist, with its fields compiled.
+
+    Attributes:
+        index (int): The position of the check in the checks of the account, as they are evaluated in order.
+        check (str): The muted check, a check name or a regular expression.
+    """
+
+    def __init__(self, index: int, check: str, check_info: dict):
+        self.index = index
+        # map lambda to awslambda
+        self.check = re.sub("^lambda", "awslambda", check)
+        self._check_matcher = MutelistItemsMatcher([self.check])
+        self._regions = MutelistItemsMatcher(check_info.get("Regions"))
+        self._resources = MutelistItemsMatcher(check_info.get("Resources"))
+        # We need to set the muted tags if None, "" or [], so the falsy helps
+        self._tags = MutelistItemsMatcher(check_info.get("Tags") or "*", tag=True)
+        self._exceptions = check_info.get("Exceptions")
+        if self._exceptions:
+            self._excepted_accounts = MutelistItemsMatcher(
+                self._exceptions.get("Accounts", [])
+            )
+            self._excepted_regions = MutelistItemsMatcher(
+                self._exceptions.get("Regions", [])
+            )
+            self._excepted_resources = MutelistItemsMatcher(
+                self._exceptions.get("Resources", [])
+            )
+            self._excepted_tags = MutelistItemsMatcher(
+                self._exceptions.get("Tags", []), tag=True
+            )
+
+    def is_check_matched(self, check: str) -> bool:
+        """Returns whether the entry applies to the check."""
+        return (
+            "*" == self.check
+            or check == self.check
+            or self._check_matcher.is_matched(check)
+        )
+
+    def is_excepted(
+        self, audited_account, finding_region, finding_resource, finding_tags
+    ) -> bool:
+        """Returns whether the finding is excepted, see Mutelist.is_excepted."""
+        if not self._exceptions:
+            return False
+        is_account_excepted = self._excepted_accounts.is_matched(audited_account)
+        is_region_excepted = self._excepted_regions.is_matched(finding_region)
+        is_resource_excepted = self._excepted_resources.is_matched(finding_resource)
+        is_tag_excepted = self._excepted_tags.is_matched(finding_tags)
+        if not (
+            is_account_excepted
+            or is_region_excepted
+            or is_resource_excepted
+            or is_tag_excepted
+        ):
+            return False
+        return (
+            (is_account_excepted or not self._excepted_accounts.items)
+            and (is_region_excepted or not self._excepted_regions.items)
+            and (is_resource_excepted or not self._excepted_resources.items)
+            and (is_tag_excepted or not self._excepted_tags.items)
+        )
+
+    def is_muted(self, finding_region, finding_resource, finding_tags) -> bool:
+        """Returns whether the finding is muted by the regions, resources and tags of the entry."""
+        return (
+            self._regions.is_matched(finding_region)
+            and self._resources.is_matched(finding_resource)
+            and self._tags.is_matched(finding_tags)
+        )
+
+
+class CompiledMutelist:
+    """
+    CompiledMutelist evaluates the findings with a Mutelist compiled once, instead of going through all its
+    accounts and checks and compiling their regular expressions for every finding.
+
+    The entries of each account that apply to a check are found once per check and kept by account and check, the
+    ones with the check name directly and the ones with a regular expression matching it, e.g. "ec2_*".
+
+    Attributes:
+        mutelist (dict): The compiled Mutelist.
+
+    Examples:
+        >>> compiled_mutelist = CompiledMutelist(mutelist)
+        >>> compiled_mutelist.is_muted("123456789012", "s3_bucket_public_access", "eu-west-1", "bucket", "")
+        True
+    """
+
+    def __init__(self, mutelist: dict):
+        self.mutelist = mutelist
+        # The entries of each account, by check name and the ones with regular expressions
+        self._accounts = {}
+        self._check_entries = {}
+        for account, account_info in (mutelist or {}).get("Accounts", {}).items():
+            exact_entries, pattern_entries = {}, []
+            for index, (check, check_info) in enumerate(account_info["Checks"].items()):
+                entry = MutelistCheckEntry(index, check, check_info)
+                if re.fullmatch(r"\w+", entry.check):
+                    exact_entries.setdefault(entry.check, []).append(entry)
+                # The check names are searched within the checks too, e.g. "ec2" mutes all the EC2 checks
+                pattern_entries.append(entry)
+            self._accounts[account] = (exact_entries, pattern_entries)
+
+    def get_check_entries(self, account: str, check: str) -> list:
+        """Returns the entries of the account that apply to the check, in the order of the Mutelist."""
+        check_entries = self._check_entries.get((account, check))
+        if check_entries is None:
+            exact_entries, pattern_entries = self._accounts[account]
+            check_entries = list(exact_entries.get(check, []))
+            check_entries.extend(
+                entry
+                for entry in pattern_entries
+                if entry.check != check and entry.is_check_matched(check)
+            )
+            check_entries.sort(key=lambda entry: entry.index)
+            self._check_entries[(account, check)] = check_entries
+        return check_entries
+
+    def is_muted(
+        self,
+        audited_account: str,
+        check: str,
+        finding_region: str,
+        finding_resource: str,
+        finding_tags,
+    ) -> bool:
+        """Returns whether the finding is muted, see Mutelist.is_muted."""
+        accounts = (
+            (audited_account,) if audited_account == "*" else (audited_account, "*")
+        )
+        for account in accounts:
+            if account not in self._accounts:
+                continue
+            check_entries = self.get_check_entries(account, check)
+            if not check_entries:
+                continue
+            # The tags are unrolled as is_muted_in_check did, None being unrolled to ""
+            if not isinstance(finding_tags, str):
+                finding_tags = unroll_dict(unroll_tags(finding_tags))
+            for entry in check_entries:
+                # The entries after an exception of the finding are not evaluated
+                if entry.is_excepted(
+                    audited_account, finding_region, finding_resource, finding_tags
+                ):
+                    break
+                if entry.is_muted(finding_region, finding_resource, finding_tags):
+                    return True
+        return False
@@ -126,7 +126,7 @@ class ASFF(Output):
         """
         Writes the findings data to a file in JSON ASFF format.
 
-        This method iterates over the findings data stored in the '_data' attribute and writes it to the file descriptor '_file_descriptor' in JSON format. It starts by writing the JSON opening/header '[', then iterates over each finding, dumping it to the file with an indent of 4 spaces. After writing all findings, it writes the closing ']' to complete the JSON array structure. Finally, it closes the file descriptor.
+        This method iterates over the findings data stored in the '_data' attribute and writes it to the file descriptor '_file_descriptor' in JSON format. It starts by writing the JSON opening/header '[' if the file is empty, then iterates over each finding, dumping it to the file with an indent of 4 spaces. When it is the last batch, or the output is generated from the CLI, it writes the closing ']' to complete the JSON array structure and closes the file descriptor.
 
         Returns:
             None
@@ -137,8 +137,9 @@ class ASFF(Output):
                 and not self._file_descriptor.closed
                 and self._data
             ):
-                # Write JSON opening/header [
-                self._file_descriptor.write("[")
+                # Write JSON opening/header [ only at the beginning of the file
+                if self._file_descriptor.tell() == 0:
+                    self._file_descriptor.write("[")
 
                 # Write findings
                 for finding in self._data:
@@ -149,8 +150,8 @@ class ASFF(Output):
                     )
                     self._file_descriptor.write(",")
 
-                # Write footer/closing ]
-                if self._file_descriptor.tell() > 0:
+                if self.close_file or self._from_cli:
+                    # Write footer/closing ]
                     if self._file_descriptor.tell() != 1:
                         self._file_descriptor.seek(
                             self._file_descriptor.tell() - 1, SEEK_SET
@@ -158,8 +159,8 @@ class ASFF(Output):
                     self._file_descriptor.truncate()
                     self._file_descriptor.write("]")
 
-                # Close file descriptor
-                self._file_descriptor.close()
+                    # Close file descriptor
+                    self._file_descriptor.close()
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
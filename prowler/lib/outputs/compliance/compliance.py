@@ -1,5 +1,6 @@
 import sys
 
+from prowler.lib.check.compliance import check_compliance_index
 from prowler.lib.check.models import Check_Report
 from prowler.lib.logger import logger
 from prowler.lib.outputs.compliance.cis.cis import get_cis_table
@@ -122,12 +123,18 @@ def get_check_compliance(
         dict: The compliance framework as key and the requirements where the finding's check is present.
     """
     try:
-        check_compliance = {}
-        # We have to retrieve all the check's compliance requirements
-        if finding.check_metadata.CheckID in bulk_checks_metadata:
-            for compliance in bulk_checks_metadata[
-                finding.check_metadata.CheckID
-            ].Compliance:
+        check_id = finding.check_metadata.CheckID
+        if check_id not in bulk_checks_metadata:
+            return {}
+        check_compliance_list = bulk_checks_metadata[check_id].Compliance
+        # The requirements are indexed once per check, while its compliance is the same
+        cached_compliance_list, check_compliance = check_compliance_index.get(
+            (provider_type, check_id), (None, None)
+        )
+        if cached_compliance_list is not check_compliance_list:
+            check_compliance = {}
+            # We have to retrieve all the check's compliance requirements
+            for compliance in check_compliance_list:
                 compliance_fw = compliance.Framework
                 if compliance.Version:
                     compliance_fw = f"{compliance_fw}-{compliance.Version}"
@@ -138,9 +145,142 @@ def get_check_compliance(
                         check_compliance[compliance_fw] = []
                     for requirement in compliance.Requirements:
                         check_compliance[compliance_fw].append(requirement.Id)
-        return check_compliance
+            check_compliance_index[(provider_type, check_id)] = (
+                check_compliance_list,
+                check_compliance,
+            )
+        # Each finding gets its own copy of the requirements
+        return {
+            compliance_fw: list(requirements)
+            for compliance_fw, requirements in check_compliance.items()
+        }
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
         )
         return {}
+
+
+def get_compliance_output_class(provider_type: str, compliance_name: str) -> type:
+    """
+    get_compliance_output_class returns the output class used to write the given compliance framework of a provider.
+
+    The output classes are imported on demand, so only the ones of the scanned provider are loaded.
+
+    Args:
+        provider_type (str): The provider type
+        compliance_name (str): The compliance framework name, e.g. cis_2.0_aws
+
+    Returns:
+        type: The ComplianceOutput subclass, GenericCompliance if there is no specific one.
+    """
+    from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+
+    if provider_type == "aws":
+        from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
+            AWSWellArchitected,
+        )
+        from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+        from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
+        from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
+        from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import (
+            AWSKISAISMSP,
+        )
+        from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import (
+            AWSMitreAttack,
+        )
+        from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_aws import (
+            ProwlerThreatScoreAWS,
+        )
+
+        if compliance_name.startswith("cis_"):
+            return AWSCIS
+        elif compliance_name == "mitre_attack_aws":
+            return AWSMitreAttack
+        elif compliance_name.startswith("ens_"):
+            return AWSENS
+        elif compliance_name.startswith("aws_well_architected_framework"):
+            return AWSWellArchitected
+        elif compliance_name.startswith("iso27001_"):
+            return AWSISO27001
+        elif compliance_name.startswith("kisa"):
+            return AWSKISAISMSP
+        elif compliance_name == "prowler_threatscore_aws":
+            return ProwlerThreatScoreAWS
+    elif provider_type == "azure":
+        from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
+        from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
+        from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
+        from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
+            AzureMitreAttack,
+        )
+        from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_azure import (
+            ProwlerThreatScoreAzure,
+        )
+
+        if compliance_name.startswith("cis_"):
+            return AzureCIS
+        elif compliance_name == "mitre_attack_azure":
+            return AzureMitreAttack
+        elif compliance_name.startswith("ens_"):
+            return AzureENS
+        elif compliance_name.startswith("iso27001_"):
+            return AzureISO27001
+        elif compliance_name == "prowler_threatscore_azure":
+            return ProwlerThreatScoreAzure
+    elif provider_type == "gcp":
+        from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
+        from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
+        from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
+        from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import (
+            GCPMitreAttack,
+        )
+        from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_gcp import (
+            ProwlerThreatScoreGCP,
+        )
+
+        if compliance_name.startswith("cis_"):
+            return GCPCIS
+        elif compliance_name == "mitre_attack_gcp":
+            return GCPMitreAttack
+        elif compliance_name.startswith("ens_"):
+            return GCPENS
+        elif compliance_name.startswith("iso27001_"):
+            return GCPISO27001
+        elif compliance_name == "prowler_threatscore_gcp":
+            return ProwlerThreatScoreGCP
+    elif provider_type == "kubernetes":
+        from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
+        from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
+            KubernetesISO27001,
+        )
+
+        if compliance_name.startswith("cis_"):
+            return KubernetesCIS
+        elif compliance_name.startswith("iso27001_"):
+            return KubernetesISO27001
+    elif provider_type == "m365":
+        from prowler.lib.outputs.compliance.cis.cis_m365 import M365CIS
+        from prowler.lib.outputs.compliance.iso27001.iso27001_m365 import M365ISO27001
+        from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365 import (
+            ProwlerThreatScoreM365,
+        )
+
+        if compliance_name.startswith("cis_"):
+            return M365CIS
+        elif compliance_name == "prowler_threatscore_m365":
+            return ProwlerThreatScoreM365
+        elif compliance_name.startswith("iso27001_"):
+            return M365ISO27001
+    elif provider_type == "nhn":
+        from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
+
+        if compliance_name.startswith("iso27001_"):
+            return NHNISO27001
+    elif provider_type == "github":
+        from prowler.lib.outputs.compliance.cis.cis_github import GithubCIS
+
+        if compliance_name.startswith("cis_"):
+            return GithubCIS
+
+    return GenericCompliance
@@ -23,9 +23,9 @@ def get_ens_table(
         "Opcional": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    pass_count = set()
+    fail_count = set()
+    muted_count = set()
     for index, finding in enumerate(findings):
         check = bulk_checks_metadata[finding.check_metadata.CheckID]
         check_compliances = check.Compliance
@@ -46,7 +46,7 @@ def get_ens_table(
                             }
                         if finding.muted:
                             if index not in muted_count:
-                                muted_count.append(index)
+                                muted_count.add(index)
                                 marcos[marco_categoria]["Muted"] += 1
                         else:
                             if finding.status == "FAIL":
@@ -54,12 +54,12 @@ def get_ens_table(
                                     attribute.Tipo != "recomendacion"
                                     and index not in fail_count
                                 ):
-                                    fail_count.append(index)
+                                    fail_count.add(index)
                                     marcos[marco_categoria][
                                         "Estado"
                                     ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
                             elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
+                                pass_count.add(index)
                         if attribute.Nivel == "opcional":
                             marcos[marco_categoria]["Opcional"] += 1
                         elif attribute.Nivel == "alto":
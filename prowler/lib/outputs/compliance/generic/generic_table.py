@@ -12,27 +12,29 @@ def get_generic_compliance_table(
     output_directory: str,
     compliance_overview: bool,
 ):
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    pass_count = set()
+    fail_count = set()
+    muted_count = set()
+    # Whether each check belongs to the framework, computed once per check
+    checks_in_framework = {}
     for index, finding in enumerate(findings):
-        check = bulk_checks_metadata[finding.check_metadata.CheckID]
-        check_compliances = check.Compliance
-        for compliance in check_compliances:
-            if (
+        check_id = finding.check_metadata.CheckID
+        if check_id not in checks_in_framework:
+            checks_in_framework[check_id] = any(
                 compliance.Framework.upper()
                 in compliance_framework.upper().replace("_", "-")
                 and compliance.Version in compliance_framework.upper()
                 and compliance.Provider.upper() in compliance_framework.upper()
-            ):
-                if finding.muted:
-                    if index not in muted_count:
-                        muted_count.append(index)
-                else:
-                    if finding.status == "FAIL" and index not in fail_count:
-                        fail_count.append(index)
-                    elif finding.status == "PASS" and index not in pass_count:
-                        pass_count.append(index)
+                for compliance in bulk_checks_metadata[check_id].Compliance
+            )
+        if checks_in_framework[check_id]:
+            if finding.muted:
+                muted_count.add(index)
+            else:
+                if finding.status == "FAIL":
+                    fail_count.add(index)
+                elif finding.status == "PASS":
+                    pass_count.add(index)
     if (
         len(fail_count) + len(pass_count) + len(muted_count) > 1
     ):  # If there are no resources, don't print the compliance table
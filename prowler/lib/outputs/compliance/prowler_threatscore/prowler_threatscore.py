@@ -19,9 +19,9 @@ def get_prowler_threatscore_table(
         "Score": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    pass_count = set()
+    fail_count = set()
+    muted_count = set()
     pillars = {}
     score_per_pillar = {}
     max_score_per_pillar = {}
@@ -59,14 +59,14 @@ def get_prowler_threatscore_table(
 
                         if finding.muted:
                             if index not in muted_count:
-                                muted_count.append(index)
+                                muted_count.add(index)
                                 pillars[pillar]["Muted"] += 1
                         else:
                             if finding.status == "FAIL" and index not in fail_count:
-                                fail_count.append(index)
+                                fail_count.add(index)
                                 pillars[pillar]["FAIL"] += 1
                             elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
+                                pass_count.add(index)
                                 pillars[pillar]["PASS"] += 1
 
     pillars = dict(sorted(pillars.items()))
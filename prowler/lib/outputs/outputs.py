@@ -96,6 +96,72 @@ def set_report_color(status: str, muted: bool = False) -> str:
     return color
 
 
+class FindingsStatistics:
+    """
+    FindingsStatistics aggregates the findings statistics incrementally, so they can be computed
+    while the findings are being generated instead of from the complete list of findings.
+
+    Examples:
+        >>> statistics = FindingsStatistics()
+        >>> statistics.update(check_findings)
+        >>> stats = statistics.get_stats()
+    """
+
+    def __init__(self) -> None:
+        self._resources = set()
+        self._counters = {
+            "total_pass": 0,
+            "total_muted_pass": 0,
+            "total_fail": 0,
+            "total_muted_fail": 0,
+            "findings_count": 0,
+        }
+        for severity in Severity:
+            self._counters[f"total_{severity.value}_severity_pass"] = 0
+            self._counters[f"total_{severity.value}_severity_fail"] = 0
+        self._all_fails_are_muted = True
+
+    def update(self, findings: list[Finding]) -> None:
+        """
+        Adds the given findings to the statistics.
+
+        Args:
+            findings (list[Finding]): the findings to aggregate
+        """
+        for finding in findings:
+            self._resources.add(finding.resource_uid)
+
+            if finding.status == Status.PASS:
+                status = "pass"
+            elif finding.status == Status.FAIL:
+                status = "fail"
+                if not finding.muted and self._all_fails_are_muted:
+                    self._all_fails_are_muted = False
+            else:
+                continue
+
+            self._counters["findings_count"] += 1
+            self._counters[f"total_{status}"] += 1
+            for severity in Severity:
+                if finding.metadata.Severity == severity:
+                    self._counters[f"total_{severity.value}_severity_{status}"] += 1
+                    break
+            if finding.muted is True:
+                self._counters[f"total_muted_{status}"] += 1
+
+    def get_stats(self) -> dict:
+        """
+        Returns the aggregated statistics with the same format as extract_findings_statistics.
+
+        Returns:
+            dict: the aggregated statistics
+        """
+        stats = dict(self._counters)
+        stats["resources_count"] = len(self._resources)
+        stats["all_fails_are_muted"] = self._all_fails_are_muted
+        return stats
+
+
 def extract_findings_statistics(findings: list[Finding]) -> dict:
     """
     extract_findings_statistics takes a list of findings and returns the following dict with the aggregated statistics
@@ -112,81 +178,6 @@ def extract_findings_statistics(findings: list[Finding]) -> dict:
     }
     """
     logger.info("Extracting audit statistics...")
-    stats = {}
-    total_pass = 0
-    total_fail = 0
-    muted_pass = 0
-    muted_fail = 0
-    resources = set()
-    findings_count = 0
-    all_fails_are_muted = True
-    critical_severity_pass = 0
-    critical_severity_fail = 0
-    high_severity_pass = 0
-    high_severity_fail = 0
-    medium_severity_pass = 0
-    medium_severity_fail = 0
-    low_severity_pass = 0
-    low_severity_fail = 0
-    informational_severity_pass = 0
-    informational_severity_fail = 0
-
-    for finding in findings:
-        resources.add(finding.resource_uid)
-
-        if finding.status == Status.PASS:
-            findings_count += 1
-            total_pass += 1
-            if finding.metadata.Severity == Severity.critical:
-                critical_severity_pass += 1
-            if finding.metadata.Severity == Severity.high:
-                high_severity_pass += 1
-            if finding.metadata.Severity == Severity.medium:
-                medium_severity_pass += 1
-            if finding.metadata.Severity == Severity.low:
-                low_severity_pass += 1
-            if finding.metadata.Severity == Severity.informational:
-                informational_severity_pass += 1
-
-            if finding.muted is True:
-                muted_pass += 1
-
-        if finding.status == Status.FAIL:
-            findings_count += 1
-            total_fail += 1
-            if finding.metadata.Severity == Severity.critical:
-                critical_severity_fail += 1
-            if finding.metadata.Severity == Severity.high:
-                high_severity_fail += 1
-            if finding.metadata.Severity == Severity.medium:
-                medium_severity_fail += 1
-            if finding.metadata.Severity == Severity.low:
-                low_severity_fail += 1
-            if finding.metadata.Severity == Severity.informational:
-                informational_severity_fail += 1
-
-            if finding.muted is True:
-                muted_fail += 1
-
-            if not finding.muted and all_fails_are_muted:
-                all_fails_are_muted = False
-
-    stats["total_pass"] = total_pass
-    stats["total_muted_pass"] = muted_pass
-    stats["total_fail"] = total_fail
-    stats["total_muted_fail"] = muted_fail
-    stats["resources_count"] = len(resources)
-    stats["findings_count"] = findings_count
-    stats["total_critical_severity_fail"] = critical_severity_fail
-    stats["total_critical_severity_pass"] = critical_severity_pass
-    stats["total_high_severity_fail"] = high_severity_fail
-    stats["total_high_severity_pass"] = high_severity_pass
-    stats["total_medium_severity_fail"] = medium_severity_fail
-    stats["total_medium_severity_pass"] = medium_severity_pass
-    stats["total_low_severity_fail"] = low_severity_fail
-    stats["total_low_severity_pass"] = low_severity_pass
-    stats["total_informational_severity_pass"] = informational_severity_pass
-    stats["total_informational_severity_fail"] = informational_severity_fail
-    stats["all_fails_are_muted"] = all_fails_are_muted
-
-    return stats
+    statistics = FindingsStatistics()
+    statistics.update(findings)
+    return statistics.get_stats()
@@ -0,0 +1,247 @@
+from shutil import copyfileobj
+from tempfile import TemporaryFile
+from typing import Any, NamedTuple
+
+from prowler.config.config import (
+    csv_file_suffix,
+    get_available_compliance_frameworks,
+    html_file_suffix,
+    json_asff_file_suffix,
+    json_ocsf_file_suffix,
+)
+from prowler.lib.check.models import CheckMetadata
+from prowler.lib.logger import logger
+from prowler.lib.outputs.compliance.compliance import get_compliance_output_class
+from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.output import Output
+from prowler.lib.outputs.outputs import FindingsStatistics
+
+
+class FindingSummary(NamedTuple):
+    """
+    FindingSummary keeps the fields of a Check_Report used by the summary and compliance tables,
+    so the findings can be discarded once they are written to the outputs.
+    """
+
+    check_metadata: CheckMetadata
+    status: str
+    muted: bool
+
+
+class StreamingOutputs:
+    """
+    StreamingOutputs writes the findings of each check to all the enabled output formats and
+    compliance frameworks as soon as the check finishes, instead of keeping every finding in memory
+    until the end of the scan.
+
+    The output writers are created with the first findings and reused for the following ones using
+    the `close_file`/`batch_write_data_to_file` mechanics. The last batch of each writer is kept
+    until the next one arrives so it can be written with `close_file` set when the scan finishes.
+    The HTML findings are spooled to a temporary file since its header needs the final statistics.
+
+    Attributes:
+        stats (dict): The findings statistics, complete once the outputs are closed.
+        findings (list[FindingSummary]): The summaries of the written findings for the summary and compliance tables.
+        generated_outputs (dict): The regular and compliance output writers.
+        asff_findings (list): The ASFF findings, only kept to send them to AWS Security Hub.
+
+    Examples:
+        >>> streaming_outputs = StreamingOutputs(provider, output_options, bulk_compliance_frameworks)
+        >>> streaming_outputs.write(check_findings)
+        >>> streaming_outputs.close()
+    """
+
+    def __init__(
+        self,
+        provider: Any,
+        output_options: Any,
+        bulk_compliance_frameworks: dict,
+        keep_asff_findings: bool = False,
+    ) -> None:
+        self._provider = provider
+        self._output_options = output_options
+        self._bulk_compliance_frameworks = bulk_compliance_frameworks
+        self._keep_asff_findings = keep_asff_findings
+        self._output_modes = output_options.output_modes or []
+        self._compliance_frameworks = sorted(
+            set(self._output_modes).intersection(
+                get_available_compliance_frameworks(provider.type)
+            )
+        )
+        self._statistics = FindingsStatistics()
+        self._summaries = {}
+        self._writers = {}
+        self._pending_data = {}
+        self._html_spool = None
+        self.stats = {}
+        self.findings = []
+        self.generated_outputs = {"regular": [], "compliance": []}
+        self.asff_findings = []
+
+    def write(self, check_findings: list) -> None:
+        """
+        Converts the findings of a check and appends them to all the enabled outputs.
+
+        Args:
+            check_findings (list): The Check_Report findings of a check.
+        """
+        finding_outputs = []
+        for finding in check_findings:
+            self.findings.append(self._get_finding_summary(finding))
+            try:
+                finding_outputs.append(
+                    Finding.generate_output(
+                        self._provider, finding, self._output_options
+                    )
+                )
+            except Exception:
+                continue
+
+        if not finding_outputs:
+            return
+
+        self._statistics.update(finding_outputs)
+
+        filename = f"{self._output_options.output_directory}/{self._output_options.output_filename}"
+        for mode, file_suffix in (
+            ("csv", csv_file_suffix),
+            ("json-asff", json_asff_file_suffix),
+            ("json-ocsf", json_ocsf_file_suffix),
+            ("html", html_file_suffix),
+        ):
+            if mode in self._output_modes:
+                self._write_regular_output(
+                    mode, f"{filename}{file_suffix}", finding_outputs
+                )
+
+        for compliance_name in self._compliance_frameworks:
+            self._write_compliance_output(compliance_name, finding_outputs)
+
+    def close(self) -> None:
+        """Writes the last batch of every output, closing the files, and completes the statistics."""
+        self.stats = self._statistics.get_stats()
+        for name, writer in self._writers.items():
+            try:
+                if name == "html":
+                    self._close_html_output(writer)
+                elif self._pending_data.get(name):
+                    self._flush(name, writer, close_file=True)
+                elif writer.file_descriptor and not writer.file_descriptor.closed:
+                    writer.file_descriptor.close()
+            except Exception as error:
+                logger.error(
+                    f"{name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+    def _get_finding_summary(self, finding: Any) -> FindingSummary:
+        # The summaries are shared between the findings with the same values to keep them small
+        key = (
+            finding.check_metadata.CheckID,
+            finding.check_metadata.Severity,
+            finding.status,
+            finding.muted,
+        )
+        summary = self._summaries.get(key)
+        if not summary:
+            summary = FindingSummary(
+                check_metadata=finding.check_metadata,
+                status=finding.status,
+                muted=finding.muted,
+            )
+            self._summaries[key] = summary
+        return summary
+
+    def _write_regular_output(
+        self, mode: str, file_path: str, finding_outputs: list[Finding]
+    ) -> None:
+        writer = self._writers.get(mode)
+        if not writer:
+            if mode == "csv":
+                from prowler.lib.outputs.csv.csv import CSV as output_class
+            elif mode == "json-asff":
+                from prowler.lib.outputs.asff.asff import ASFF as output_class
+            elif mode == "json-ocsf":
+                from prowler.lib.outputs.ocsf.ocsf import OCSF as output_class
+            else:
+                from prowler.lib.outputs.html.html import HTML as output_class
+
+                self._html_spool = TemporaryFile(mode="w+")
+
+            writer = output_class(
+                findings=finding_outputs, file_path=file_path, from_cli=False
+            )
+            self._writers[mode] = writer
+            self.generated_outputs["regular"].append(writer)
+        else:
+            writer.transform(finding_outputs)
+
+        if mode == "json-asff" and self._keep_asff_findings:
+            self.asff_findings.extend(writer.data)
+
+        if mode == "html":
+            # The HTML rows are written once the header can be generated with the final stats
+            for row in writer.data:
+                self._html_spool.write(row)
+            writer.data.clear()
+        else:
+            self._defer(mode, writer)
+
+    def _write_compliance_output(
+        self, compliance_name: str, finding_outputs: list[Finding]
+    ) -> None:
+        compliance = self._bulk_compliance_frameworks[compliance_name]
+        writer = self._writers.get(compliance_name)
+        if not writer:
+            output_class = get_compliance_output_class(
+                self._provider.type, compliance_name
+            )
+            writer = output_class(
+                findings=finding_outputs,
+                compliance=compliance,
+                file_path=(
+                    f"{self._output_options.output_directory}/compliance/"
+                    f"{self._output_options.output_filename}_{compliance_name}.csv"
+                ),
+                from_cli=False,
+            )
+            self._writers[compliance_name] = writer
+            self.generated_outputs["compliance"].append(writer)
+        else:
+            writer.transform(
+                finding_outputs,
+                compliance,
+                (
+                    f"{compliance.Framework}-{compliance.Version}"
+                    if compliance.Version
+                    else compliance.Framework
+                ),
+            )
+        self._defer(compliance_name, writer)
+
+    def _defer(self, name: str, writer: Output) -> None:
+        # Write the previous batch and keep the new one, so the last batch is written closing the file
+        new_data = list(writer.data)
+        writer.data.clear()
+        if new_data:
+            if self._pending_data.get(name):
+                self._flush(name, writer, close_file=False)
+            self._pending_data[name] = new_data
+
+    def _flush(self, name: str, writer: Output, close_file: bool) -> None:
+        writer.data.extend(self._pending_data.pop(name))
+        writer.close_file = close_file
+        writer.batch_write_data_to_file()
+        writer.data.clear()
+
+    def _close_html_output(self, writer: Output) -> None:
+        from prowler.lib.outputs.html.html import HTML
+
+        file_descriptor = writer.file_descriptor
+        if not file_descriptor or file_descriptor.closed:
+            return
+        HTML.write_header(file_descriptor, self._provider, self.stats)
+        self._html_spool.seek(0)
+        copyfileobj(self._html_spool, file_descriptor)
+        self._html_spool.close()
+        HTML.write_footer(file_descriptor)
+        file_descriptor.close()
@@ -0,0 +1,182 @@
+import json
+import os
+import pickle
+import tempfile
+from typing import Optional
+
+from prowler.config.config import prowler_version
+from prowler.lib.logger import logger
+from prowler.lib.scan.exceptions.exceptions import ScanInvalidCheckpointError
+
+checkpoint_manifest_file = "checkpoint.json"
+checkpoint_journal_file = "journal.jsonl"
+checkpoint_findings_directory = "findings"
+
+
+class ScanCheckpoint:
+    """
+    ScanCheckpoint keeps an on-disk journal of the completed checks of a scan and their findings,
+    so an interrupted scan can be resumed skipping the checks that were already completed.
+
+    The checkpoint directory contains:
+        - checkpoint.json: the provider and Prowler version of the scan.
+        - findings/<check>.pickle: the serialized findings of each completed check.
+        - journal.jsonl: one line per completed check, appended once its findings are stored, so a
+          scan killed while storing a check never marks it as completed.
+
+    Attributes:
+        directory (str): The checkpoint directory.
+        provider (str): The provider type of the scan.
+
+    Examples:
+        >>> checkpoint = ScanCheckpoint("output/checkpoint", "aws")
+        >>> checkpoint.save_findings("s3_bucket_public_access", findings)
+        >>> checkpoint = ScanCheckpoint("output/checkpoint", "aws", resume=True)
+        >>> checkpoint.get_completed_checks()
+        {'s3_bucket_public_access'}
+    """
+
+    def __init__(self, directory: str, provider: str, resume: bool = False) -> None:
+        """
+        Initialize the checkpoint, creating a new one or loading the journal of a previous scan.
+
+        Args:
+            directory (str): The checkpoint directory.
+            provider (str): The provider type of the scan.
+            resume (bool): Whether to resume the scan of an existing checkpoint.
+
+        Raises:
+            ScanInvalidCheckpointError: If the checkpoint to resume does not exist or is from another provider, or if
+                a new checkpoint is created in the directory of an existing one.
+        """
+        self.directory = directory
+        self.provider = provider
+        self._completed_checks = {}
+
+        manifest_path = os.path.join(directory, checkpoint_manifest_file)
+        if resume:
+            try:
+                with open(manifest_path) as manifest_file:
+                    manifest = json.load(manifest_file)
+            except Exception as error:
+                raise ScanInvalidCheckpointError(
+                    file=manifest_path,
+                    original_exception=error,
+                    message=f"There is no scan checkpoint to resume in {directory}.",
+                )
+            if manifest.get("provider") != provider:
+                raise ScanInvalidCheckpointError(
+                    file=manifest_path,
+                    message=f"The scan checkpoint in {directory} is from the {manifest.get('provider')} provider, not {provider}.",
+                )
+            if manifest.get("prowler_version") != prowler_version:
+                logger.warning(
+                    f"The scan checkpoint in {directory} was created with Prowler {manifest.get('prowler_version')}, the findings are resumed with Prowler {prowler_version}."
+                )
+            self._load_journal()
+        else:
+            if os.path.exists(manifest_path):
+                raise ScanInvalidCheckpointError(
+                    file=manifest_path,
+                    message=f"There is already a scan checkpoint in {directory}, use --resume to continue it.",
+                )
+            os.makedirs(
+                os.path.join(directory, checkpoint_findings_directory), exist_ok=True
+            )
+            with open(manifest_path, "w") as manifest_file:
+                json.dump(
+                    {"provider": provider, "prowler_version": prowler_version},
+                    manifest_file,
+                )
+
+    def _load_journal(self) -> None:
+        journal_path = os.path.join(self.directory, checkpoint_journal_file)
+        if not os.path.exists(journal_path):
+            return
+        with open(journal_path) as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                    self._completed_checks[entry["check"]] = entry["findings_file"]
+                except (ValueError, KeyError):
+                    # The last line can be incomplete if the scan was killed while writing it
+                    logger.warning(
+                        f"Skipping invalid scan checkpoint journal entry: {line.strip()}"
+                    )
+
+    def get_completed_checks(self) -> set[str]:
+        """Returns the checks completed in the checkpointed scan."""
+        return set(self._completed_checks)
+
+    def save_findings(self, check_name: str, findings: list) -> bool:
+        """
+        Store the findings of a completed check and record the check in the journal.
+
+        Args:
+            check_name (str): The completed check.
+            findings (list): The Check_Report findings of the check.
+
+        Returns:
+            bool: Whether the check was checkpointed. If the findings cannot be serialized the check is not
+                recorded, so it is executed again when the scan is resumed.
+        """
+        findings_file = os.path.join(
+            checkpoint_findings_directory, f"{check_name}.pickle"
+        )
+        findings_path = os.path.join(self.directory, findings_file)
+        try:
+            # Write to a temporary file first so a killed scan never leaves a partial findings file
+            file_descriptor, temporary_file = tempfile.mkstemp(
+                dir=os.path.dirname(findings_path)
+            )
+            try:
+                with os.fdopen(file_descriptor, "wb") as f:
+                    pickle.dump(findings, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temporary_file, findings_path)
+            except Exception:
+                os.remove(temporary_file)
+                raise
+
+            with open(
+                os.path.join(self.directory, checkpoint_journal_file), "a"
+            ) as journal:
+                journal.write(
+                    json.dumps(
+                        {
+                            "check": check_name,
+                            "findings_file": findings_file,
+                            "findings": len(findings),
+                        }
+                    )
+                    + "\n"
+                )
+                journal.flush()
+                os.fsync(journal.fileno())
+            self._completed_checks[check_name] = findings_file
+            return True
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return False
+
+    def load_findings(self, check_name: str) -> Optional[list]:
+        """
+        Load the findings of a check completed in the checkpointed scan.
+
+        Args:
+            check_name (str): The completed check.
+
+        Returns:
+            list | None: The Check_Report findings of the check, None if they could not be loaded.
+        """
+        try:
+            with open(
+                os.path.join(self.directory, self._completed_checks[check_name]), "rb"
+            ) as f:
+                return pickle.load(f)
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
@@ -30,6 +30,14 @@ class ScanBaseException(ProwlerException):
             "message": "Invalid status provided.",
             "remediation": "Please provide a valid status: FAIL, PASS, MANUAL.",
         },
+        (5006, "ScanInvalidCheckpointError"): {
+            "message": "Invalid scan checkpoint provided.",
+            "remediation": "Please provide the checkpoint directory of a previous scan of the same provider.",
+        },
+        (5007, "ScanInvalidSnapshotError"): {
+            "message": "Invalid scan snapshot provided.",
+            "remediation": "Please provide a snapshot exported with --export-snapshot by a scan of the same provider.",
+        },
     }
 
     def __init__(self, code, file=None, original_exception=None, message=None):
@@ -86,3 +94,17 @@ class ScanInvalidStatusError(ScanBaseException):
         super().__init__(
             5005, file=file, original_exception=original_exception, message=message
         )
+
+
+class ScanInvalidCheckpointError(ScanBaseException):
+    def __init__(self, file=None, original_exception=None, message=None):
+        super().__init__(
+            5006, file=file, original_exception=original_exception, message=message
+        )
+
+
+class ScanInvalidSnapshotError(ScanBaseException):
+    def __init__(self, file=None, original_exception=None, message=None):
+        super().__init__(
+            5007, file=file, original_exception=original_exception, message=message
+        )
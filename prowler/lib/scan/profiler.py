@@ -0,0 +1,271 @@
+import csv
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from typing import Generator, Optional
+
+from colorama import Style
+from tabulate import tabulate
+
+from prowler.lib.logger import logger
+
+profile_json_file_suffix = ".profile.json"
+profile_csv_file_suffix = ".profile.csv"
+
+
+@dataclass
+class ProfileRecord:
+    """
+    ProfileRecord holds the performance measures of a check or of a service initialisation.
+
+    Attributes:
+        type (str): "check" or "service".
+        name (str): The check or service name.
+        service (str): The service of the check, or the service itself.
+        wall_time (float): Elapsed time, in seconds.
+        cpu_time (float): CPU time of the thread that executed it, in seconds.
+        memory_peak_delta (int): Peak of the memory allocated while it was executed, in bytes.
+        findings (int): Number of findings, only for checks.
+        api_calls (int): Number of provider API calls.
+        api_retries (int): Number of provider API calls retried, including the throttled ones.
+    """
+
+    type: str
+    name: str
+    service: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    memory_peak_delta: int = 0
+    findings: int = 0
+    api_calls: int = 0
+    api_retries: int = 0
+
+
+class ScanProfiler:
+    """
+    ScanProfiler measures the wall time, CPU time, peak memory, findings and provider API calls of each check
+    and of each service initialisation of a scan.
+
+    The service clients are created when their first check module is imported, so the time spent importing
+    the check modules is attributed to the initialisation of their service.
+
+    The API calls are counted through the botocore event system, so they are only available for AWS. They are
+    attributed to the check or service being profiled in the thread that makes them, or to the latest one
+    started when they are made by a thread pool of the service, so they are approximated with --parallel-checks.
+    The memory is measured with tracemalloc, which also slows down the scan. Its peak is process-wide, so the memory
+    is not measured when the checks and services are executed concurrently.
+
+    Args:
+        measure_memory (bool): Whether to measure the peak memory, only if the checks are executed one at a time.
+
+    Examples:
+        >>> profiler = ScanProfiler()
+        >>> profiler.register_aws_session(aws_provider.session.current_session)
+        >>> with profiler.profile("check", "s3_bucket_public_access", "s3") as record:
+        ...     record.findings = len(check.execute())
+        >>> profiler.write_report("output", "prowler-output")
+    """
+
+    def __init__(self, measure_memory: bool = True) -> None:
+        self._records: dict[tuple[str, str], ProfileRecord] = {}
+        self._lock = threading.Lock()
+        # Records being profiled by thread and the latest one started, for the API calls attribution
+        self._active_records: dict[int, ProfileRecord] = {}
+        self._latest_record: Optional[ProfileRecord] = None
+        # Attempts of the API calls made by each record, to compute the retries
+        self._api_attempts: dict[tuple[str, str], int] = {}
+        self._measure_memory = measure_memory
+        if self._measure_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def profile(
+        self, type: str, name: str, service: str
+    ) -> Generator[ProfileRecord, None, None]:
+        """
+        Profile the code executed within the context, adding its measures to the record of the check or service.
+
+        Args:
+            type (str): "check" or "service".
+            name (str): The check or service name.
+            service (str): The service of the check, or the service itself.
+
+        Yields:
+            ProfileRecord: The record of the check or service.
+        """
+        with self._lock:
+            record = self._records.setdefault(
+                (type, name), ProfileRecord(type=type, name=name, service=service)
+            )
+            thread_id = threading.get_ident()
+            parent_record = self._active_records.get(thread_id)
+            self._active_records[thread_id] = record
+            self._latest_record = record
+        if self._measure_memory:
+            memory_before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.thread_time() - cpu_start
+            if self._measure_memory:
+                memory_peak = tracemalloc.get_traced_memory()[1]
+            with self._lock:
+                record.wall_time += wall_time
+                record.cpu_time += cpu_time
+                if self._measure_memory:
+                    record.memory_peak_delta = max(
+                        record.memory_peak_delta, memory_peak - memory_before
+                    )
+                if parent_record:
+                    self._active_records[thread_id] = parent_record
+                else:
+                    self._active_records.pop(thread_id, None)
+
+    def _get_active_record(self) -> Optional[ProfileRecord]:
+        return self._active_records.get(threading.get_ident(), self._latest_record)
+
+    def _count_api_call(self, **kwargs) -> None:
+        with self._lock:
+            record = self._get_active_record()
+            if record:
+                record.api_calls += 1
+
+    def _count_api_request(self, **kwargs) -> None:
+        # request-created is emitted for every attempt of an API call, so any attempt after the first one is a retry
+        with self._lock:
+            record = self._get_active_record()
+            if record:
+                key = (record.type, record.name)
+                self._api_attempts[key] = self._api_attempts.get(key, 0) + 1
+
+    def register_aws_session(self, session) -> None:
+        """
+        Count the API calls of the clients created from the given boto3 session from now on.
+
+        Args:
+            session (boto3.session.Session): The session of the AWS provider.
+        """
+        try:
+            session.events.register("before-call", self._count_api_call)
+            session.events.register("request-created", self._count_api_request)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def get_records(self) -> list[ProfileRecord]:
+        """Returns the profile records of the checks and services."""
+        records = []
+        with self._lock:
+            for key, record in self._records.items():
+                record = ProfileRecord(**asdict(record))
+                record.api_retries = max(
+                    self._api_attempts.get(key, 0) - record.api_calls, 0
+                )
+                records.append(record)
+        return records
+
+    def write_report(self, output_directory: str, output_filename: str) -> list[str]:
+        """
+        Write the profile records to a JSON and a CSV report.
+
+        Args:
+            output_directory (str): The output directory.
+            output_filename (str): The output filename, without the extension.
+
+        Returns:
+            list[str]: The paths of the reports written.
+        """
+        reports = []
+        try:
+            records = self.get_records()
+            json_report = os.path.join(
+                output_directory, f"{output_filename}{profile_json_file_suffix}"
+            )
+            with open(json_report, "w") as json_file:
+                json.dump([asdict(record) for record in records], json_file, indent=4)
+            reports.append(json_report)
+
+            csv_report = os.path.join(
+                output_directory, f"{output_filename}{profile_csv_file_suffix}"
+            )
+            with open(csv_report, "w", newline="") as csv_file:
+                writer = csv.DictWriter(
+                    csv_file,
+                    fieldnames=[field.name for field in fields(ProfileRecord)],
+                    delimiter=";",
+                )
+                writer.writeheader()
+                for record in records:
+                    writer.writerow(asdict(record))
+            reports.append(csv_report)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return reports
+
+    def stop(self) -> None:
+        """Stop tracing the memory allocations."""
+        if self._measure_memory:
+            tracemalloc.stop()
+
+
+def display_profile_summary_table(
+    records: list[ProfileRecord], reports: list[str], top: int = 10
+) -> None:
+    """
+    Print the checks and services that took the longest and the paths of the profile reports.
+
+    Args:
+        records (list[ProfileRecord]): The profile records.
+        reports (list[str]): The paths of the profile reports.
+        top (int): The number of checks and services to display.
+    """
+    try:
+        profile_table = {
+            "Type": [],
+            "Name": [],
+            "Wall Time (s)": [],
+            "CPU Time (s)": [],
+            "Peak Memory (MiB)": [],
+            "Findings": [],
+            "API Calls": [],
+            "API Retries": [],
+        }
+        for record in sorted(
+            records, key=lambda record: record.wall_time, reverse=True
+        )[:top]:
+            profile_table["Type"].append(record.type)
+            profile_table["Name"].append(record.name)
+            profile_table["Wall Time (s)"].append(f"{record.wall_time:.2f}")
+            profile_table["CPU Time (s)"].append(f"{record.cpu_time:.2f}")
+            profile_table["Peak Memory (MiB)"].append(
+                f"{record.memory_peak_delta / 1024 / 1024:.2f}"
+            )
+            profile_table["Findings"].append(
+                record.findings if record.type == "check" else "-"
+            )
+            profile_table["API Calls"].append(record.api_calls)
+            profile_table["API Retries"].append(record.api_retries)
+
+        print(
+            f"\n{Style.BRIGHT}Scan Profile - Top {top} slowest checks and services:{Style.RESET_ALL}"
+        )
+        print(tabulate(profile_table, headers="keys", tablefmt="rounded_grid"))
+        if reports:
+            print("\nDetailed profile reports:")
+            for report in reports:
+                print(f" - {report}")
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
@@ -1,11 +1,14 @@
 import datetime
+from functools import partial
 from types import SimpleNamespace
-from typing import Generator
+from typing import Generator, Optional
 
 from prowler.lib.check.check import (
     execute,
     import_check,
+    initialize_service_clients,
     list_services,
+    run_checks_from_checkpoint,
     update_audit_metadata,
 )
 from prowler.lib.check.checks_loader import load_checks_to_execute
@@ -15,6 +18,7 @@ from prowler.lib.check.models import CheckMetadata, Severity
 from prowler.lib.logger import logger
 from prowler.lib.outputs.common import Status
 from prowler.lib.outputs.finding import Finding
+from prowler.lib.scan.checkpoint import ScanCheckpoint
 from prowler.lib.scan.exceptions.exceptions import (
     ScanInvalidCategoryError,
     ScanInvalidCheckError,
@@ -97,7 +101,8 @@ class Scan:
         self._bulk_checks_metadata = CheckMetadata.get_bulk(provider.type)
         # Complete checks metadata with the compliance framework specification
         self._bulk_checks_metadata = update_checks_metadata_with_compliance(
-            self._bulk_compliance_frameworks, self._bulk_checks_metadata
+            self._bulk_compliance_frameworks,
+            self._bulk_checks_metadata,
         )
 
         # Create a list of valid categories
@@ -229,6 +234,8 @@ class Scan:
     def scan(
         self,
         custom_checks_metadata: dict = None,
+        parallel_checks: int = 1,
+        checkpoint: ScanCheckpoint = None,
     ) -> Generator[tuple[float, list[Finding]], None, None]:
         """
         Executes the scan by iterating over the checks to execute and executing each check.
@@ -236,6 +243,8 @@ class Scan:
 
         Args:
             custom_checks_metadata (dict): Custom metadata for the checks (default: {}).
+            parallel_checks (int): Number of services to scan concurrently (default: 1, sequential).
+            checkpoint (ScanCheckpoint): Checkpoint to store the completed checks, the checks already completed in it are not executed again (default: None).
 
         Yields:
             Tuple[float, list[Finding]]: A tuple containing the progress and findings for each check.
@@ -266,35 +275,34 @@ class Scan:
 
             start_time = datetime.datetime.now()
 
-            for check_name in checks_to_execute:
+            for check_name, check_findings, resumed in run_checks_from_checkpoint(
+                checks_to_execute,
+                partial(
+                    self._execute_check,
+                    custom_checks_metadata=custom_checks_metadata,
+                ),
+                parallel_checks,
+                checkpoint,
+                # The service clients are initialised concurrently before executing the checks
+                (
+                    partial(
+                        initialize_service_clients,
+                        provider_type=self._provider.type,
+                        parallel_services=parallel_checks,
+                    )
+                    if parallel_checks > 1
+                    else None
+                ),
+            ):
+                # The check was not found or failed, the error is already logged
+                if check_findings is None:
+                    continue
                 try:
+                    if checkpoint and not resumed:
+                        checkpoint.save_findings(check_name, check_findings)
+
                     # Recover service from check name
                     service = get_service_name_from_check_name(check_name)
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                        )
-                        continue
-                    # Execute the check
-                    check_findings = execute(
-                        check,
-                        self._provider,
-                        custom_checks_metadata,
-                        output_options=None,
-                    )
-
-                    # Filter the findings by the status
-                    if self._status:
-                        for finding in check_findings:
-                            if finding.status not in self._status:
-                                check_findings.remove(finding)
 
                     # Remove the executed check
                     self._service_checks_to_execute[service].remove(check_name)
@@ -329,11 +337,6 @@ class Scan:
                             continue
 
                     yield self.progress, findings
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                    )
                 except Exception as error:
                     logger.error(
                         f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -342,9 +345,52 @@ class Scan:
             self._duration = int((datetime.datetime.now() - start_time).total_seconds())
         except Exception as error:
             logger.error(
-                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def _execute_check(
+        self, check_name: str, custom_checks_metadata: dict = None
+    ) -> Optional[list]:
+        """
+        _execute_check imports and executes the given check, returning its findings filtered by status.
+
+        Args:
+            check_name (str): The name of the check to execute.
+            custom_checks_metadata (dict): Custom metadata for the checks.
+
+        Returns:
+            list | None: The findings of the check, None if the check was not found.
+        """
+        # Recover service from check name
+        service = get_service_name_from_check_name(check_name)
+        try:
+            # Import check module
+            check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
+            lib = import_check(check_module_path)
+            # Recover functions from check
+            check_to_execute = getattr(lib, check_name)
+            check = check_to_execute()
+        # If check does not exists in the provider or is from another provider
+        except ModuleNotFoundError:
+            logger.error(
+                f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
+            )
+            return None
+        # Execute the check
+        check_findings = execute(
+            check,
+            self._provider,
+            custom_checks_metadata,
+            output_options=None,
+        )
+
+        # Filter the findings by the status
+        if self._status:
+            check_findings = [
+                finding for finding in check_findings if finding.status in self._status
+            ]
+        return check_findings
+
     def get_completed_services(self) -> set[str]:
         """
         get_completed_services returns the services that have been completed.
@@ -0,0 +1,270 @@
+import gzip
+import os
+import pickle
+import sys
+from datetime import datetime, timezone
+from threading import RLock
+from types import ModuleType
+from typing import Any, Optional
+
+from prowler.config.config import prowler_version
+from prowler.lib.check.check import (
+    get_service_clients_dependencies,
+    service_client_module_pattern,
+)
+from prowler.lib.logger import logger
+from prowler.lib.scan.exceptions.exceptions import ScanInvalidSnapshotError
+from prowler.providers.common.provider import Provider
+
+# Version of the snapshot format, snapshots of other versions cannot be loaded
+snapshot_version = 2
+
+# Attributes taken from the provider of the scan that loads the snapshot, so the checks are evaluated with its
+# configuration instead of the one of the exported scan
+provider_excluded_attributes = {"_audit_config", "_fixer_config", "audit_metadata"}
+service_excluded_attributes = {"provider", "audit_config", "fixer_config"}
+# Lazy attributes bookkeeping of the services, their collectors are bound methods holding the service lock, so it
+# is not stored and the restored services have every lazy attribute collected
+service_lazy_attributes = {
+    "_lazy_attributes",
+    "_lazy_collected",
+    "_lazy_errors",
+    "_lazy_lock",
+}
+
+
+def pickle_value(value: Any) -> Optional[bytes]:
+    """pickle_value returns the given value pickled to be stored in a snapshot, or None if it cannot be pickled."""
+    try:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+
+
+def get_snapshot_state(instance: Any, excluded_attributes: set) -> dict:
+    """
+    get_snapshot_state returns the attributes of the given provider or service that can be stored in a snapshot.
+
+    The SDK clients, sessions, locks and thread pools cannot be stored, so they are left out. The dictionaries of
+    SDK clients, like the regional clients of the AWS services, keep their keys so the checks can still iterate
+    the regions or subscriptions audited.
+
+    Each attribute is pickled once and stored as bytes, see load_snapshot_state.
+
+    Args:
+        instance (Any): The provider or service.
+        excluded_attributes (set): The attributes not stored.
+
+    Returns:
+        dict: The pickled attributes to store, by name.
+    """
+    state = {}
+    for name, value in vars(instance).items():
+        if name in excluded_attributes:
+            continue
+        pickled_value = pickle_value(value)
+        if pickled_value is None and isinstance(value, dict):
+            pickled_value = pickle_value(dict.fromkeys(value))
+        if pickled_value is not None:
+            state[name] = pickled_value
+    return state
+
+
+def load_snapshot_state(state: dict) -> dict:
+    """load_snapshot_state returns the attributes of a state stored with get_snapshot_state, by name."""
+    return {name: pickle.loads(value) for name, value in state.items()}
+
+
+def export_snapshot(provider: Provider, file_path: str) -> int:
+    """
+    export_snapshot writes the resources collected by the service clients of the scan and the provider identity to
+    a snapshot file, so the checks can be executed again from it with --from-snapshot.
+
+    The lazy attributes of the services not accessed by the checks of the scan are collected before exporting
+    them, so the snapshot has every resource of the service.
+
+    Args:
+        provider (Provider): The provider of the scan.
+        file_path (str): The snapshot file path.
+
+    Returns:
+        int: The number of services exported.
+    """
+    try:
+        services = {}
+        for module_name, module in list(sys.modules.items()):
+            if not module_name.startswith(
+                f"prowler.providers.{provider.type}."
+            ) or not service_client_module_pattern.match(module_name):
+                continue
+            client = getattr(module, module_name.split(".")[-1], None)
+            if client is None or pickle_value(client.__class__) is None:
+                continue
+            for attribute in vars(client).get("_lazy_attributes", {}):
+                try:
+                    client.load_attributes(attribute)
+                except Exception as error:
+                    logger.error(
+                        f"{module_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+            state = get_snapshot_state(
+                client, service_excluded_attributes | service_lazy_attributes
+            )
+            if "_lazy_attributes" in vars(client):
+                state["_lazy_attributes"] = pickle_value({})
+            services[module_name] = (client.__class__, state)
+
+        snapshot = {
+            "version": snapshot_version,
+            "prowler_version": prowler_version,
+            "provider": provider.type,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "provider_class": provider.__class__,
+            "provider_state": get_snapshot_state(
+                provider, provider_excluded_attributes
+            ),
+            "services": services,
+        }
+        # The file is replaced at once, so an interrupted export does not leave a broken snapshot
+        temporary_file_path = f"{file_path}.tmp"
+        with gzip.open(temporary_file_path, "wb") as snapshot_file:
+            pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file_path, file_path)
+        logger.info(f"{len(services)} services exported to the snapshot {file_path}")
+        return len(services)
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return 0
+
+
+def load_snapshot(file_path: str, provider: str) -> dict:
+    """
+    load_snapshot loads a snapshot exported with export_snapshot.
+
+    Args:
+        file_path (str): The snapshot file path.
+        provider (str): The provider type of the scan.
+
+    Returns:
+        dict: The snapshot, with the provider and services attributes unpickled.
+
+    Raises:
+        ScanInvalidSnapshotError: If the snapshot cannot be loaded, or it is from another provider or snapshot version.
+    """
+    try:
+        with gzip.open(file_path, "rb") as snapshot_file:
+            snapshot = pickle.load(snapshot_file)
+    except Exception as error:
+        raise ScanInvalidSnapshotError(
+            file=file_path,
+            original_exception=error,
+            message=f"The scan snapshot {file_path} cannot be loaded.",
+        )
+    if not isinstance(snapshot, dict) or snapshot.get("version") != snapshot_version:
+        raise ScanInvalidSnapshotError(
+            file=file_path,
+            message=f"The scan snapshot {file_path} is not a version {snapshot_version} snapshot.",
+        )
+    if snapshot.get("provider") != provider:
+        raise ScanInvalidSnapshotError(
+            file=file_path,
+            message=f"The scan snapshot {file_path} is from the {snapshot.get('provider')} provider, not {provider}.",
+        )
+    if snapshot.get("prowler_version") != prowler_version:
+        logger.warning(
+            f"The scan snapshot {file_path} was exported with Prowler {snapshot.get('prowler_version')}, the checks are executed with Prowler {prowler_version}."
+        )
+    try:
+        snapshot["provider_state"] = load_snapshot_state(snapshot["provider_state"])
+        snapshot["services"] = {
+            module_name: (service_class, load_snapshot_state(state))
+            for module_name, (service_class, state) in snapshot["services"].items()
+        }
+    except Exception as error:
+        raise ScanInvalidSnapshotError(
+            file=file_path,
+            original_exception=error,
+            message=f"The scan snapshot {file_path} cannot be loaded.",
+        )
+    return snapshot
+
+
+def restore_snapshot(
+    snapshot: dict,
+    audit_config: dict,
+    fixer_config: dict,
+    mutelist_path: str = None,
+) -> Provider:
+    """
+    restore_snapshot sets the provider and the service clients of the snapshot as the global provider and the
+    service client singletons, so the checks use them without connecting to the provider.
+
+    Args:
+        snapshot (dict): The snapshot, see load_snapshot.
+        audit_config (dict): The audit configuration to evaluate the checks with.
+        fixer_config (dict): The fixer configuration.
+        mutelist_path (str): The mutelist file to use instead of the mutelist of the exported scan, if any.
+
+    Returns:
+        Provider: The restored provider, which is also the global provider.
+    """
+    provider_class = snapshot["provider_class"]
+    provider = provider_class.__new__(provider_class)
+    provider.__dict__.update(snapshot["provider_state"])
+    provider._audit_config = audit_config
+    provider._fixer_config = fixer_config
+    if mutelist_path:
+        provider._mutelist = provider.mutelist.__class__(mutelist_path=mutelist_path)
+    Provider.set_global_provider(provider)
+
+    for module_name, (service_class, state) in snapshot["services"].items():
+        client = service_class.__new__(service_class)
+        client.__dict__.update(state)
+        if "_lazy_attributes" in state:
+            client._lazy_collected = set()
+            client._lazy_errors = {}
+            client._lazy_lock = RLock()
+        client.provider = provider
+        client.audit_config = provider.audit_config
+        client.fixer_config = provider.fixer_config
+        # The checks import the restored service client instead of creating a new one
+        client_module = ModuleType(module_name)
+        setattr(client_module, module_name.split(".")[-1], client)
+        sys.modules[module_name] = client_module
+    logger.info(
+        f"{len(snapshot['services'])} services restored from the snapshot exported at {snapshot['timestamp']}"
+    )
+    return provider
+
+
+def get_snapshot_checks(snapshot: dict, checks_to_execute: list, provider: str) -> list:
+    """
+    get_snapshot_checks returns the checks that can be executed with the service clients of the snapshot, the
+    other ones would need to connect to the provider, so they are skipped.
+
+    Args:
+        snapshot (dict): The snapshot, see load_snapshot.
+        checks_to_execute (list): The checks to execute.
+        provider (str): The provider type of the scan.
+
+    Returns:
+        list: The checks to execute, in the same order.
+    """
+    snapshot_checks = []
+    for check_name in checks_to_execute:
+        missing_clients = [
+            client_module.split(".")[-1]
+            for client_module in get_service_clients_dependencies(
+                [check_name], provider
+            )
+            if client_module not in snapshot["services"]
+        ]
+        if missing_clients:
+            logger.warning(
+                f"{check_name} - skipped, the snapshot does not include {', '.join(sorted(missing_clients))}."
+            )
+        else:
+            snapshot_checks.append(check_name)
+    return snapshot_checks
@@ -1,5 +1,125 @@
+from typing import Optional
+
 from prowler.lib.logger import logger
 
+# Separators of the parts of the ARNs and of the resource IDs
+RESOURCE_SEPARATORS = frozenset([":", "/"])
+# Suffix of the input resources that match every resource starting with the rest of them
+RESOURCE_WILDCARD = "*"
+# Number of colons before the resource part of an ARN, arn:partition:service:region:account-id:resource
+ARN_RESOURCE_COLONS = 5
+
+
+class ResourceFilter(list):
+    """
+    ResourceFilter is the list of input resources of the scan, e.g. from --resource-arn or --resource-tag,
+    compiled once into hash indexes so each resource retrieved by the services is filtered in constant time
+    instead of searching it in all the input resources.
+
+    A resource is filtered if it is:
+        - One of the input resources.
+        - A part of the resource of an input ARN, from its beginning or after a separator up to its end, or from
+          its beginning up to a separator, e.g. the name or the ID of the resource of an input ARN.
+        - Starts with an input resource ending with *, e.g. arn:aws:s3:::prod-*.
+
+    The input resources must not be changed after the filter is created.
+
+    Attributes:
+        resources (set): The input resources.
+        segments (set): The parts of the input resources, see above.
+        wildcard_prefixes (set): The input resources ending with *, without it.
+
+    Examples:
+        >>> resource_filter = ResourceFilter(["arn:aws:s3:::prod-*", "arn:aws:ec2:eu-west-1:123456789012:instance/i-1"])
+        >>> resource_filter.is_filtered("arn:aws:s3:::prod-logs")
+        True
+        >>> resource_filter.is_filtered("i-1")
+        True
+        >>> resource_filter.get_resource_ids("arn:aws:ec2:eu-west-1:123456789012:instance/")
+        ['i-1']
+    """
+
+    def __init__(self, resources: list = None):
+        super().__init__(resources or [])
+        self.resources = set()
+        self.segments = set()
+        self.wildcard_prefixes = set()
+        self._wildcard_prefix_lengths = []
+        # The next part of the input resources, by the input resource before it
+        self._resource_ids = {}
+        for resource in self:
+            resource = str(resource)
+            self.resources.add(resource)
+            if resource.endswith(RESOURCE_WILDCARD):
+                self.wildcard_prefixes.add(resource[: -len(RESOURCE_WILDCARD)])
+            # Only the separators of the resource part of the ARNs delimit the names and IDs of the resources
+            resource_part_start = 0
+            if resource.startswith("arn:"):
+                colons = [
+                    position
+                    for position, character in enumerate(resource)
+                    if character == ":"
+                ]
+                if len(colons) >= ARN_RESOURCE_COLONS:
+                    resource_part_start = colons[ARN_RESOURCE_COLONS - 1]
+            separators = [
+                position
+                for position, character in enumerate(resource)
+                if character in RESOURCE_SEPARATORS and position >= resource_part_start
+            ]
+            for index, separator in enumerate(separators):
+                self.segments.add(resource[:separator])
+                self.segments.add(resource[separator + 1 :])
+                next_separator = (
+                    separators[index + 1]
+                    if index + 1 < len(separators)
+                    else len(resource)
+                )
+                self._resource_ids.setdefault(resource[: separator + 1], set()).add(
+                    resource[separator + 1 : next_separator]
+                )
+        self.segments.discard("")
+        self._wildcard_prefix_lengths = sorted(
+            {len(prefix) for prefix in self.wildcard_prefixes}
+        )
+
+    def is_filtered(self, resource: str) -> bool:
+        """Returns whether the resource matches the input resources, see ResourceFilter."""
+        if resource in self.resources or resource in self.segments:
+            return True
+        for length in self._wildcard_prefix_lengths:
+            if length > len(resource):
+                break
+            if resource[:length] in self.wildcard_prefixes:
+                return True
+        return False
+
+    def get_resource_ids(self, arn_prefix: str) -> Optional[list]:
+        """
+        Returns the IDs of the input resources with the given ARN prefix, so the services can request only them to
+        the APIs that filter the resources by ID, e.g. describe_instances.
+
+        Args:
+            arn_prefix (str): The ARN of the resources up to their ID, e.g. arn:aws:ec2:eu-west-1:123456789012:instance/
+
+        Returns:
+            list: The sorted IDs, empty if there are no input resources with the prefix, or None if the input
+                resources with wildcards can match resources with the prefix, so all of them must be retrieved.
+        """
+        for wildcard_prefix in self.wildcard_prefixes:
+            if wildcard_prefix.startswith(arn_prefix) or arn_prefix.startswith(
+                wildcard_prefix
+            ):
+                return None
+        return sorted(self._resource_ids.get(arn_prefix, []))
+
+
+def get_resource_filter(audit_resources: list) -> ResourceFilter:
+    """Returns the compiled ResourceFilter of the input resources, compiling them if they are a plain list."""
+    if isinstance(audit_resources, ResourceFilter):
+        return audit_resources
+    return ResourceFilter(audit_resources)
+
 
 def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     """
@@ -8,10 +128,25 @@ def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     Returns True if it is filtered and False if it does not match the input filters
     """
     try:
-        if resource in str(audit_resources):
-            return True
-        return False
+        return get_resource_filter(audit_resources).is_filtered(resource)
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error} ({resource})"
         )
+
+
+def get_resource_ids(audit_resources: list, arn_prefix: str) -> Optional[list]:
+    """
+    Returns the IDs of the input resources with the given ARN prefix, see ResourceFilter.get_resource_ids.
+
+    Returns None if all the resources must be retrieved, e.g. when there are no input resources.
+    """
+    try:
+        if not audit_resources:
+            return None
+        return get_resource_filter(audit_resources).get_resource_ids(arn_prefix)
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error} ({arn_prefix})"
+        )
+        return None
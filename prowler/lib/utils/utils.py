@@ -11,21 +11,39 @@ except ImportError:
 import re
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from hashlib import sha512
-from io import TextIOWrapper
+from io import StringIO, TextIOWrapper
 from ipaddress import ip_address
-from os.path import exists
+from itertools import repeat
+from multiprocessing import get_context
+from os.path import exists, splitext
+from threading import Lock
 from time import mktime
 from typing import Any, Optional
 
 from colorama import Style
 from detect_secrets import SecretsCollection
-from detect_secrets.settings import transient_settings
+from detect_secrets.settings import get_plugins, transient_settings
+from detect_secrets.transformers import get_transformed_file
+from detect_secrets.util.code_snippet import get_code_snippet
+from detect_secrets.util.filetype import FileType, determine_file_type
 
 from prowler.config.config import encoding_format_utf_8
 from prowler.lib.logger import logger
 
+try:
+    # The in-memory scan follows these detect-secrets functions, without them the data is scanned from files
+    from detect_secrets.core.scan import (
+        MAX_LINE_LENGTH,
+        MIN_LINE_LENGTH,
+        _is_filtered_out,
+        _scan_line,
+    )
+except ImportError:
+    _scan_line = None
+
 default_detect_secrets_plugins = [
     {"name": "ArtifactoryDetector"},
     {"name": "AWSKeyDetector"},
@@ -55,6 +73,13 @@ default_detect_secrets_plugins = [
     # {"name": "TelegramBotTokenDetector"}, https://github.com/Yelp/detect-secrets/pull/878
     {"name": "TwilioKeyDetector"},
 ]
+# Name of the data scanned in memory in the secrets found
+SECRETS_SCAN_DATA_NAME = "data"
+# Minimum number of payloads scanned by each process of the secrets scanner, smaller batches are scanned in the
+# current process
+SECRETS_SCAN_PROCESS_MIN_PAYLOADS = 100
+# The detect-secrets settings are global, the scans of the checks executed in parallel configure them one at a time
+detect_secrets_settings_lock = Lock()
 
 
 def open_file(input_file: str, mode: str = "r") -> TextIOWrapper:
@@ -111,6 +136,242 @@ def hash_sha512(string: str) -> str:
     return sha512(string.encode(encoding_format_utf_8)).hexdigest()[0:9]
 
 
+class SecretsScanner:
+    """
+    SecretsScanner scans data and files for secrets with the detect-secrets library.
+
+    The data is scanned in memory instead of being written to temporary files, and the detect-secrets plugins
+    and filters are configured once for each batch of payloads. The batches with enough payloads are scanned
+    in a pool of spawned processes, since the regular expressions of the plugins are CPU bound. If the data
+    cannot be scanned in memory with the installed detect-secrets, it is scanned from a temporary file.
+
+    Attributes:
+        settings (dict): The detect-secrets settings, with the plugins and filters of the scan.
+        processes (int): The maximum number of processes to scan a batch of payloads with.
+
+    Examples:
+        >>> scanner = SecretsScanner(excluded_secrets=["^MYSQL_ALLOW_EMPTY_PASSWORD$"])
+        >>> scanner.scan_batch({"env": "MYSQL_PASSWORD=password", "tags": "no secrets"})
+        {'env': [{'type': 'Secret Keyword', 'filename': 'data', 'hashed_secret': '5baa61e4c9b93f3f0682250b6cf8331b7ee68fd8', 'is_verified': False, 'line_number': 1, 'is_added': False, 'is_removed': False}], 'tags': None}
+    """
+
+    def __init__(
+        self,
+        excluded_secrets: list[str] = None,
+        detect_secrets_plugins: list[dict] = None,
+        processes: int = 1,
+    ):
+        self.settings = {
+            "plugins_used": detect_secrets_plugins or default_detect_secrets_plugins,
+            "filters_used": [
+                {"path": "detect_secrets.filters.common.is_invalid_file"},
+                {"path": "detect_secrets.filters.common.is_known_false_positive"},
+                {"path": "detect_secrets.filters.heuristic.is_likely_id_string"},
+                {"path": "detect_secrets.filters.heuristic.is_potential_secret"},
+            ],
+        }
+        if excluded_secrets:
+            self.settings["filters_used"].append(
+                {
+                    "path": "detect_secrets.filters.regex.should_exclude_line",
+                    "pattern": excluded_secrets,
+                }
+            )
+        self.processes = max(int(processes or 1), 1)
+
+    @classmethod
+    def from_audit_config(cls, audit_config: dict) -> "SecretsScanner":
+        """
+        Create the scanner from the secrets_ignore_patterns, detect_secrets_plugins and secrets_scan_processes
+        values of the audit config.
+
+        Args:
+            audit_config (dict): The audit configuration.
+
+        Returns:
+            SecretsScanner: The secrets scanner.
+        """
+        return cls(
+            excluded_secrets=audit_config.get("secrets_ignore_patterns", []),
+            detect_secrets_plugins=audit_config.get("detect_secrets_plugins"),
+            processes=audit_config.get("secrets_scan_processes", 1),
+        )
+
+    def scan(self, data: str = None, file: str = None) -> Optional[list[dict]]:
+        """
+        Scan the data or the file for secrets.
+
+        Args:
+            data (str): The data to scan for secrets.
+            file (str): The file to scan for secrets.
+
+        Returns:
+            list: The secrets found, or None if there are none.
+        """
+        if file:
+            try:
+                secrets = SecretsCollection()
+                with detect_secrets_settings_lock, transient_settings(self.settings):
+                    secrets.scan_file(file)
+                return secrets.json().get(file)
+            except Exception as error:
+                logger.error(
+                    f"Error scanning for secrets: {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                return None
+        return self.scan_batch({SECRETS_SCAN_DATA_NAME: data})[SECRETS_SCAN_DATA_NAME]
+
+    def scan_batch(self, payloads: dict, file_names: dict = None) -> dict:
+        """
+        Scan a batch of payloads for secrets.
+
+        Args:
+            payloads (dict): The data to scan for secrets, by key.
+            file_names (dict): The file names of the payloads read from files, by key. The file types select the
+                transformers and the keyword patterns of the scan.
+
+        Returns:
+            dict: The secrets found in each payload, or None if there are none, by the keys of the payloads.
+        """
+        keys = list(payloads)
+        file_names = file_names or {}
+        batch = [
+            (payloads[key], file_names.get(key, SECRETS_SCAN_DATA_NAME)) for key in keys
+        ]
+        processes = min(self.processes, len(keys) // SECRETS_SCAN_PROCESS_MIN_PAYLOADS)
+        if processes > 1:
+            try:
+                chunk_size = -(-len(keys) // processes)
+                chunks = [
+                    batch[index : index + chunk_size]
+                    for index in range(0, len(batch), chunk_size)
+                ]
+                # The processes are spawned, forking them from the threads of the checks is not safe
+                with ProcessPoolExecutor(
+                    max_workers=processes, mp_context=get_context("spawn")
+                ) as executor:
+                    results = [
+                        result
+                        for chunk_results in executor.map(
+                            _scan_secrets_batch, repeat(self), chunks
+                        )
+                        for result in chunk_results
+                    ]
+                return dict(zip(keys, results))
+            except Exception as error:
+                logger.error(
+                    f"Unable to scan the secrets in {processes} processes, scanning them in the current one - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        return dict(zip(keys, self._scan_batch(batch)))
+
+    def _scan_batch(self, batch: list[tuple[str, str]]) -> list:
+        with detect_secrets_settings_lock, transient_settings(self.settings):
+            return [self._scan_data(data, file_name) for data, file_name in batch]
+
+    def _scan_data(self, data: str, file_name: str) -> Optional[list[dict]]:
+        if _scan_line is not None:
+            try:
+                return self._scan_data_in_memory(data, file_name)
+            except Exception as error:
+                logger.warning(
+                    f"Unable to scan the secrets in memory, scanning them from a temporary file - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        return self._scan_data_file(data, file_name)
+
+    def _scan_data_in_memory(self, data: str, file_name: str) -> Optional[list[dict]]:
+        # Same steps as detect_secrets.core.scan.scan_file, reading the lines from memory
+        secrets = SecretsCollection()
+        buffer = StringIO(data, newline=None)
+        buffer.name = file_name
+        raw_lines = buffer.readlines()
+        buffer.seek(0)
+        lines = get_transformed_file(buffer) or raw_lines
+        for secret in _scan_secrets_in_lines(lines, raw_lines, file_name):
+            secrets[file_name].add(secret)
+        # If the lines do not have secrets, try again with the eager transformers
+        if not secrets[file_name]:
+            buffer.seek(0)
+            lines = get_transformed_file(buffer, use_eager_transformers=True)
+            for secret in _scan_secrets_in_lines(lines or [], raw_lines, file_name):
+                secrets[file_name].add(secret)
+        return secrets.json().get(file_name)
+
+    def _scan_data_file(self, data: str, file_name: str) -> Optional[list[dict]]:
+        # The temporary file keeps the extension of the file name for the file type of the scan
+        try:
+            temp_data_file = tempfile.NamedTemporaryFile(
+                suffix=splitext(file_name)[1], delete=False
+            )
+            temp_data_file.write(data.encode(encoding_format_utf_8))
+            temp_data_file.close()
+            secrets = SecretsCollection()
+            secrets.scan_file(temp_data_file.name)
+            os.remove(temp_data_file.name)
+            secrets_found = secrets.json().get(temp_data_file.name)
+            if secrets_found:
+                for secret in secrets_found:
+                    secret["filename"] = file_name
+            return secrets_found
+        except Exception as error:
+            logger.error(
+                f"Error scanning for secrets: {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
+
+def _scan_secrets_in_lines(lines: list[str], raw_lines: list[str], file_name: str):
+    # Same steps as detect_secrets.core.scan._process_line_based_plugins, with the raw lines read from memory
+    # The filters of the file names are not applied, the data is not read from a file
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if len(line) < MIN_LINE_LENGTH or len(line) > MAX_LINE_LENGTH:
+            continue
+        context = get_code_snippet(lines=lines, line_number=line_number)
+        raw_context = get_code_snippet(lines=raw_lines, line_number=line_number)
+        if _is_filtered_out(
+            required_filter_parameters=["line"],
+            filename=file_name,
+            line=line,
+            context=context,
+        ):
+            continue
+        for plugin in get_plugins():
+            for secret in _scan_line(
+                plugin=plugin,
+                filename=file_name,
+                line=line,
+                line_number=line_number,
+                context=context,
+                raw_context=raw_context,
+                commit_hash="",
+            ):
+                secret.is_removed = False
+                secret.is_added = False
+                if not _is_filtered_out(
+                    required_filter_parameters=["context"],
+                    filename=secret.filename,
+                    secret=secret.secret_value,
+                    plugin=plugin,
+                    line=line,
+                    context=context,
+                ):
+                    if (
+                        determine_file_type(file_name) == FileType.YAML
+                        and secret.secret_value
+                    ):
+                        # The YAML multi-line strings are grouped in one line, find the raw line of the secret
+                        for index, raw_line in enumerate(raw_lines[line_number - 1 :]):
+                            if secret.secret_value in raw_line:
+                                secret.line_number = line_number + index
+                                break
+                    yield secret
+
+
+def _scan_secrets_batch(scanner: SecretsScanner, batch: list[tuple[str, str]]) -> list:
+    """_scan_secrets_batch scans the payloads in a process of the pool of the secrets scanner."""
+    return scanner._scan_batch(batch)
+
+
 def detect_secrets_scan(
     data: str = None,
     file=None,
@@ -133,55 +394,10 @@ def detect_secrets_scan(
         >>> detect_secrets_scan(file="file.txt")
         {'file.txt': [{'filename': 'file.txt', 'hashed_secret': 'f7c3bc1d808e04732adf679965ccc34ca7ae3441', 'is_verified': False, 'line_number': 1, 'type': 'Secret Keyword'}]}
     """
-    try:
-        if not file:
-            temp_data_file = tempfile.NamedTemporaryFile(delete=False)
-            temp_data_file.write(bytes(data, encoding="raw_unicode_escape"))
-            temp_data_file.close()
-
-        secrets = SecretsCollection()
-
-        if not detect_secrets_plugins:
-            detect_secrets_plugins = default_detect_secrets_plugins
-
-        settings = {
-            "plugins_used": detect_secrets_plugins,
-            "filters_used": [
-                {"path": "detect_secrets.filters.common.is_invalid_file"},
-                {"path": "detect_secrets.filters.common.is_known_false_positive"},
-                {"path": "detect_secrets.filters.heuristic.is_likely_id_string"},
-                {"path": "detect_secrets.filters.heuristic.is_potential_secret"},
-            ],
-        }
-
-        if excluded_secrets and len(excluded_secrets) > 0:
-            settings["filters_used"].append(
-                {
-                    "path": "detect_secrets.filters.regex.should_exclude_line",
-                    "pattern": excluded_secrets,
-                }
-            )
-        with transient_settings(settings):
-            if file:
-                secrets.scan_file(file)
-            else:
-                secrets.scan_file(temp_data_file.name)
-
-        if not file:
-            os.remove(temp_data_file.name)
-
-        detect_secrets_output = secrets.json()
-
-        if detect_secrets_output:
-            if file:
-                return detect_secrets_output[file]
-            else:
-                return detect_secrets_output[temp_data_file.name]
-        else:
-            return None
-    except Exception as e:
-        logger.error(f"Error scanning for secrets: {e}")
-        return None
+    return SecretsScanner(
+        excluded_secrets=excluded_secrets,
+        detect_secrets_plugins=detect_secrets_plugins,
+    ).scan(data=data, file=file)
 
 
 def validate_ip_address(ip_string):
@@ -1,7 +1,9 @@
 import os
 import pathlib
 from datetime import datetime
+from functools import lru_cache
 from re import fullmatch
+from threading import Lock
 from typing import Optional
 
 from boto3.session import Session
@@ -21,9 +23,11 @@ from prowler.config.config import (
 )
 from prowler.lib.check.utils import list_modules, recover_checks_from_service
 from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import ResourceFilter
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.aws.config import (
     AWS_REGION_US_EAST_1,
+    AWS_SERVICE_MAX_WORKERS,
     AWS_STS_GLOBAL_ENDPOINT_REGION,
     BOTO3_USER_AGENT_EXTRA,
     ROLE_SESSION_NAME,
@@ -47,6 +51,8 @@ from prowler.providers.aws.exceptions.exceptions import (
     AWSSessionTokenExpiredError,
     AWSSetUpSessionError,
 )
+from prowler.providers.aws.lib.api_cache.api_cache import AWSAPICache
+from prowler.providers.aws.lib.api_scheduler.api_scheduler import AWSAPIScheduler
 from prowler.providers.aws.lib.arn.arn import parse_iam_credentials_arn
 from prowler.providers.aws.lib.arn.models import ARN
 from prowler.providers.aws.lib.mutelist.mutelist import AWSMutelist
@@ -68,6 +74,9 @@ from prowler.providers.aws.models import (
 from prowler.providers.common.models import Audit_Metadata, Connection
 from prowler.providers.common.provider import Provider
 
+# Lock to create clients from the shared boto3 session, which is not thread-safe
+session_lock = Lock()
+
 
 class AwsProvider(Provider):
     """
@@ -81,11 +90,15 @@ class AwsProvider(Provider):
         _identity (AWSIdentityInfo): The AWS provider identity information.
         _session (AWSSession): The AWS provider session.
         _organizations_metadata (AWSOrganizationsInfo): The AWS Organizations metadata.
-        _audit_resources (list): The list of resources to audit.
+        _audit_resources (list): The list of resources to audit, a ResourceFilter when they are given.
         _audit_config (dict): The audit configuration.
         _scan_unused_services (bool): A boolean indicating whether to scan unused services.
         _enabled_regions (set): The set of enabled regions.
         _mutelist (AWSMutelist): The AWS provider mutelist.
+        _clients (dict): The boto3 clients shared by the services, by service, region and session.
+        _parallel_services (int): The number of services scanned in parallel, which can share a client.
+        _api_scheduler (AWSAPIScheduler): The scheduler of the API calls of the shared boto3 clients.
+        _api_cache (AWSAPICache): The recorded API responses of the scan, when they are recorded or replayed.
         audit_metadata (Audit_Metadata): The audit metadata.
     """
 
@@ -98,6 +111,10 @@ class AwsProvider(Provider):
     _scan_unused_services: bool = False
     _enabled_regions: set = set()
     _mutelist: AWSMutelist
+    _clients: dict
+    _parallel_services: int = 1
+    _api_scheduler: AWSAPIScheduler = None
+    _api_cache: AWSAPICache = None
     # TODO: this is not optional, enforce for all providers
     audit_metadata: Audit_Metadata
 
@@ -123,6 +140,8 @@ class AwsProvider(Provider):
         aws_access_key_id: str = None,
         aws_secret_access_key: str = None,
         aws_session_token: Optional[str] = None,
+        record_api_responses: str = None,
+        replay_api_responses: str = None,
     ):
         """
         Initializes the AWS provider.
@@ -148,6 +167,8 @@ class AwsProvider(Provider):
             - aws_access_key_id: The AWS access key ID.
             - aws_secret_access_key: The AWS secret access key.
             - aws_session_token: The AWS session token, optional.
+            - record_api_responses: The path of the file to record the AWS API responses of the scan into, optional.
+            - replay_api_responses: The path of the file to replay the recorded AWS API responses from instead of calling the AWS APIs, optional.
 
         Raises:
             - ArgumentTypeError: If the input MFA ARN is invalid.
@@ -190,6 +211,16 @@ class AwsProvider(Provider):
 
         logger.info("Initializing AWS provider ...")
 
+        # boto3 clients shared by all the services, see get_client
+        self._clients = {}
+
+        # Recorded AWS API responses, to scan again without calling the AWS APIs
+        if record_api_responses or replay_api_responses:
+            self._api_cache = AWSAPICache(
+                replay_api_responses or record_api_responses,
+                replay=bool(replay_api_responses),
+            )
+
         ######## AWS Session
         logger.info("Generating original session ...")
 
@@ -202,6 +233,8 @@ class AwsProvider(Provider):
             aws_secret_access_key=aws_secret_access_key,
             aws_session_token=aws_session_token,
         )
+        if self._api_cache:
+            self._api_cache.register(aws_session)
         session_config = self.set_session_config(retries_max_attempts)
         # Current session and the original session points to the same session object until we get a new one, if needed
         self._session = AWSSession(
@@ -238,6 +271,8 @@ class AwsProvider(Provider):
             regions=regions,
             profile_region=profile_region,
         )
+        if self._api_cache:
+            self._api_cache.account = self._identity.account
         ########
         ######## AWS Session with Assume Role (if needed)
         if role_arn:
@@ -279,6 +314,8 @@ class AwsProvider(Provider):
                 assumed_role_configuration.info.role_arn.partition
             )
             self._identity.account_arn = f"arn:{assumed_role_configuration.info.role_arn.partition}:iam::{assumed_role_configuration.info.role_arn.account_id}:root"
+            if self._api_cache:
+                self._api_cache.account = self._identity.account
         ########
 
         ######## AWS Organizations Metadata
@@ -328,13 +365,23 @@ class AwsProvider(Provider):
         )
         ########
 
+        # Audit Config, loaded before any client is created since it configures the API scheduler
+        if config_content:
+            self._audit_config = config_content
+        else:
+            if not config_path:
+                config_path = default_config_file_path
+            self._audit_config = load_and_validate_config_file(self._type, config_path)
+
         # Parse Scan Tags
         if resource_tags:
-            self._audit_resources = self.get_tagged_resources(resource_tags)
+            self._audit_resources = ResourceFilter(
+                self.get_tagged_resources(resource_tags)
+            )
 
         # Parse Input Resource ARNs
         if resource_arn:
-            self._audit_resources = resource_arn
+            self._audit_resources = ResourceFilter(resource_arn)
 
         # Get Enabled Regions
         self._enabled_regions = self.get_aws_enabled_regions(
@@ -344,14 +391,6 @@ class AwsProvider(Provider):
         # Set ignore unused services
         self._scan_unused_services = scan_unused_services
 
-        # Audit Config
-        if config_content:
-            self._audit_config = config_content
-        else:
-            if not config_path:
-                config_path = default_config_file_path
-            self._audit_config = load_and_validate_config_file(self._type, config_path)
-
         # Fixer Config
         self._fixer_config = fixer_config
 
@@ -412,6 +451,21 @@ class AwsProvider(Provider):
         """
         return self._mutelist
 
+    @property
+    def api_scheduler(self) -> AWSAPIScheduler:
+        """
+        api_scheduler returns the scheduler of the API calls of the shared boto3 clients, created from the
+        audit config the first time it is used.
+        """
+        if self._api_scheduler is None:
+            self._api_scheduler = AWSAPIScheduler.from_config(self._audit_config)
+        return self._api_scheduler
+
+    @property
+    def api_cache(self) -> AWSAPICache:
+        """api_cache returns the recorded API responses of the scan, or None if they are not recorded or replayed."""
+        return self._api_cache
+
     # TODO: This can be moved to another class since it doesn't need self
     def get_organizations_info(
         self, organizations_session: Session, aws_account_id: str
@@ -619,10 +673,13 @@ class AwsProvider(Provider):
             assumed_session = BotocoreSession()
             assumed_session._credentials = assumed_refreshable_credentials
             assumed_session.set_config_variable("region", self._identity.profile_region)
-            return Session(
+            session = Session(
                 profile_name=self._identity.profile,
                 botocore_session=assumed_session,
             )
+            if self._api_cache:
+                self._api_cache.register(session)
+            return session
         except Exception as error:
             logger.critical(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -738,11 +795,7 @@ class AwsProvider(Provider):
                 enabled_regions = service_regions
 
             for region in enabled_regions:
-                regional_client = self._session.current_session.client(
-                    service, region_name=region, config=self._session.session_config
-                )
-                regional_client.region = region
-                regional_clients[region] = regional_client
+                regional_clients[region] = self.get_client(service, region)
 
             return regional_clients
         except Exception as error:
@@ -750,6 +803,56 @@ class AwsProvider(Provider):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def get_client(self, service: str, region: str):
+        """
+        get_client returns the boto3 client of the given service and region from the current session.
+
+        Creating a boto3 client resolves its endpoint and loads the service model, so the clients are cached
+        and shared by all the services, the quick inventory and the tag lookups. Each client connection pool
+        is sized for the thread pools of the services that can use it at the same time.
+
+        Args:
+            - service: The AWS service name.
+            - region: The AWS region name.
+
+        Returns:
+            - The boto3 client, with its region in the region attribute.
+
+        Example:
+            ec2_client = provider.get_client("ec2", "eu-west-1")
+        """
+        session = self._session.current_session
+        client_key = (service, region, session)
+        # boto3 sessions are not thread-safe and services can be initialised in parallel
+        with session_lock:
+            client = self._clients.get(client_key)
+            if client is None:
+                client_config = Config(
+                    max_pool_connections=AWS_SERVICE_MAX_WORKERS
+                    * self._parallel_services
+                )
+                if self._session.session_config:
+                    client_config = self._session.session_config.merge(client_config)
+                client = session.client(
+                    service, region_name=region, config=client_config
+                )
+                client.region = region
+                # The replayed API calls are not made, so they are not scheduled
+                if not (self._api_cache and self._api_cache.replay):
+                    self.api_scheduler.register(client)
+                self._clients[client_key] = client
+        return client
+
+    def set_parallel_services(self, parallel_services: int) -> None:
+        """
+        set_parallel_services sets the number of services scanned in parallel, to size the connection pool
+        of the clients created from now on.
+
+        Args:
+            - parallel_services: The number of services scanned in parallel.
+        """
+        self._parallel_services = max(parallel_services, 1)
+
     @staticmethod
     def get_available_aws_service_regions(
         service: str, partition: str = "aws", audited_regions: set = None
@@ -765,13 +868,12 @@ class AwsProvider(Provider):
         Returns:
             - A set of strings representing the available regions for the given service and partition.
         """
-        data = read_aws_regions_file()
-        json_regions = set(data["services"][service]["regions"][partition])
+        json_regions = get_aws_regions_catalog().get_service_regions(service, partition)
         if audited_regions:
             # Get common regions between input and json
             regions = json_regions.intersection(audited_regions)
         else:  # Get all regions from json of the service and partition
-            regions = json_regions
+            regions = set(json_regions)
         return regions
 
     def get_checks_from_input_arn(self) -> set:
@@ -800,6 +902,7 @@ class AwsProvider(Provider):
             ]
             service_list = set()
             sub_service_list = set()
+            supported_services = {}
             for resource in self._audit_resources:
                 service = resource.split(":")[2]
                 sub_service = resource.split(":")[5].split("/")[0].replace("-", "_")
@@ -814,13 +917,15 @@ class AwsProvider(Provider):
                         service = "efs"
                     elif service == "logs":
                         service = "cloudwatch"
-                    # Check if Prowler has checks in service
-                    try:
-                        list_modules(self.type, service)
-                    except ModuleNotFoundError:
-                        # Service is not supported
-                        pass
-                    else:
+                    # Check if Prowler has checks in service, once per service
+                    if service not in supported_services:
+                        try:
+                            list_modules(self.type, service)
+                            supported_services[service] = True
+                        except ModuleNotFoundError:
+                            # Service is not supported
+                            supported_services[service] = False
+                    if supported_services[service]:
                         service_list.add(service)
 
                     # Get subservices to execute only applicable checks
@@ -1491,19 +1596,13 @@ class AwsProvider(Provider):
         """
 
         try:
-            regions = set()
-            data = read_aws_regions_file()
+            catalog = get_aws_regions_catalog()
 
             if partition is None:
-                for service in data["services"].values():
-                    for partition in service["regions"]:
-                        regions.update(service["regions"][partition])
+                return catalog.get_regions()
             else:
                 partition = Partition(partition)
-                for service in data["services"].values():
-                    regions.update(service["regions"][partition.value])
-
-            return regions
+                return catalog.get_regions(partition.value)
         except ValueError as value_error:
             logger.error(
                 f"{value_error.__class__.__name__}[{value_error.__traceback__.tb_lineno}]: {value_error}"
@@ -1540,6 +1639,80 @@ def read_aws_regions_file() -> dict:
     return data
 
 
+class AWSRegionsCatalog:
+    """
+    AWSRegionsCatalog indexes the AWS services JSON file for constant time lookups of the services and of
+    their regions by partition.
+
+    Attributes:
+        services (frozenset): The AWS services of the catalog.
+
+    Example:
+        >>> catalog = AWSRegionsCatalog(read_aws_regions_file())
+        >>> catalog.get_service_regions("acm", "aws-cn")
+        frozenset({'cn-north-1', 'cn-northwest-1'})
+    """
+
+    def __init__(self, data: dict):
+        """
+        Build the catalog indexes from the AWS services JSON file data.
+
+        Args:
+            data (dict): The parsed data from the AWS services JSON file.
+        """
+        self._service_regions = {}
+        partition_regions = {}
+        for service, service_data in data["services"].items():
+            self._service_regions[service] = {
+                partition: frozenset(regions)
+                for partition, regions in service_data["regions"].items()
+            }
+            for partition, regions in service_data["regions"].items():
+                partition_regions.setdefault(partition, set()).update(regions)
+        self._partition_regions = {
+            partition: frozenset(regions)
+            for partition, regions in partition_regions.items()
+        }
+        self._all_regions = frozenset().union(*self._partition_regions.values())
+        self.services = frozenset(self._service_regions)
+
+    def is_valid_service(self, service: str) -> bool:
+        """Returns whether the given service is in the catalog."""
+        return service in self._service_regions
+
+    def get_service_regions(self, service: str, partition: str = "aws") -> frozenset:
+        """
+        Returns the regions of the given service and partition.
+
+        Raises:
+            KeyError: If the service or the partition are not in the catalog.
+        """
+        return self._service_regions[service][partition]
+
+    def get_regions(self, partition: str = None) -> set:
+        """
+        Returns the regions of any service in the given partition, or in all of them if partition is None.
+
+        Raises:
+            KeyError: If the partition is not in the catalog.
+        """
+        if partition is None:
+            return set(self._all_regions)
+        return set(self._partition_regions[partition])
+
+
+@lru_cache(maxsize=None)
+def get_aws_regions_catalog() -> AWSRegionsCatalog:
+    """
+    Returns the AWS services and regions catalog, the AWS services JSON file is read once per process
+    on the first call.
+
+    Returns:
+        AWSRegionsCatalog: The AWS services and regions catalog.
+    """
+    return AWSRegionsCatalog(read_aws_regions_file())
+
+
 # TODO: This can be moved to another class since it doesn't need self
 def get_aws_region_for_sts(session_region: str, regions: set[str]) -> str:
     """
@@ -2,3 +2,7 @@ AWS_STS_GLOBAL_ENDPOINT_REGION = "us-east-1"
 AWS_REGION_US_EAST_1 = "us-east-1"
 BOTO3_USER_AGENT_EXTRA = "APN_1826889"
 ROLE_SESSION_NAME = "ProwlerAssessmentSession"
+# Threads of the thread pool of each AWS service, which share the service's boto3 clients
+AWS_SERVICE_MAX_WORKERS = 10
+# Concurrent API calls of each AWS service collecting its resources with asyncio
+AWS_SERVICE_MAX_ASYNC_CONCURRENCY = 100
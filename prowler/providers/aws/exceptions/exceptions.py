@@ -74,6 +74,10 @@ class AWSBaseException(ProwlerException):
             "message": "The provided AWS Session Token is expired",
             "remediation": "Get a new AWS Session Token and configure it for the provider.",
         },
+        (1017, "AWSAPIResponsesFileError"): {
+            "message": "The recorded AWS API responses file cannot be loaded",
+            "remediation": "Check that the file exists and that it was written by a scan with the --record-api-responses option.",
+        },
         (1917, "AWSInvalidPartitionError"): {
             "message": "The provided AWS partition is invalid",
             "remediation": "Check the provided AWS partition and ensure it is valid.",
@@ -226,6 +230,13 @@ class AWSSessionTokenExpiredError(AWSCredentialsError):
         )
 
 
+class AWSAPIResponsesFileError(AWSBaseException):
+    def __init__(self, file=None, original_exception=None, message=None):
+        super().__init__(
+            1017, file=file, original_exception=original_exception, message=message
+        )
+
+
 class AWSInvalidPartitionError(AWSBaseException):
     def __init__(self, file=None, original_exception=None, message=None):
         super().__init__(
@@ -0,0 +1,243 @@
+import base64
+import gzip
+import hashlib
+import json
+import os
+import pathlib
+import threading
+from datetime import datetime
+from io import BytesIO
+
+from botocore.awsrequest import AWSResponse
+from botocore.response import StreamingBody
+
+from prowler.lib.logger import logger
+from prowler.providers.aws.exceptions.exceptions import AWSAPIResponsesFileError
+
+# Version of the format of the recorded API responses file
+API_RESPONSES_FILE_VERSION = 1
+# Error code of the replayed API calls whose response was not recorded
+API_RESPONSE_NOT_RECORDED_ERROR_CODE = "APIResponseNotRecorded"
+
+# Key of the API call context to keep the key of the recorded API response
+api_cache_context_key = "prowler_api_cache_key"
+
+
+def encode_response(value):
+    """Returns the given botocore parsed response with its timestamps, bytes and streams encoded as JSON values."""
+    if isinstance(value, dict):
+        return {key: encode_response(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [encode_response(item) for item in value]
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(value).decode()}
+    return value
+
+
+def decode_response(value):
+    """Returns the botocore parsed response encoded with encode_response."""
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if "__datetime__" in value:
+                return datetime.fromisoformat(value["__datetime__"])
+            if "__bytes__" in value:
+                return base64.b64decode(value["__bytes__"])
+            if "__stream__" in value:
+                data = base64.b64decode(value["__stream__"])
+                return StreamingBody(BytesIO(data), len(data))
+        return {key: decode_response(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_response(item) for item in value]
+    return value
+
+
+def _encode_request_parameter(value) -> str:
+    # The timestamps of the requests are relative to the scan time, so they are left out of the key to replay them
+    if isinstance(value, datetime):
+        return "<timestamp>"
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode()
+    return str(value)
+
+
+class AWSAPICache:
+    """
+    AWSAPICache records the responses of the AWS API calls of a scan into a compressed file, and replays them
+    in a later scan without calling the AWS APIs, e.g. to tune the checks, the mutelist or the audit config.
+
+    The responses are recorded by AWS account, region, service, operation and request parameters through the
+    botocore events of the sessions of the provider, so every client created from them is recorded or replayed
+    and the services do not need to change how they call the AWS APIs. The errors are recorded too, and the
+    API calls not recorded are replayed as an APIResponseNotRecorded error.
+
+    Attributes:
+        file_path (str): The path of the recorded API responses file.
+        replay (bool): Whether the API responses are replayed from the file instead of recorded into it.
+        account (str): The AWS account of the API calls, set once the identity of the provider is known.
+
+    Examples:
+        >>> api_cache = AWSAPICache("prowler-api-responses.json.gz")
+        >>> api_cache.register(session)
+        >>> api_cache.save()
+    """
+
+    def __init__(self, file_path: str, replay: bool = False):
+        self.file_path = file_path
+        self.replay = replay
+        self.account = None
+        self._responses = {}
+        self._not_recorded = 0
+        self._lock = threading.Lock()
+        if replay:
+            self._responses = self.load(file_path)
+
+    @staticmethod
+    def load(file_path: str) -> dict:
+        """
+        Load the API responses from a recorded API responses file.
+
+        Args:
+            file_path (str): The path of the recorded API responses file.
+
+        Returns:
+            dict: The recorded API responses, by request key.
+
+        Raises:
+            AWSAPIResponsesFileError: If the file cannot be read or it is not a recorded API responses file.
+        """
+        try:
+            with gzip.open(file_path, "rt") as responses_file:
+                responses_data = json.load(responses_file)
+            if responses_data.get("version") != API_RESPONSES_FILE_VERSION:
+                raise ValueError(
+                    f"Unsupported version {responses_data.get('version')}, expected {API_RESPONSES_FILE_VERSION}"
+                )
+            return responses_data["responses"]
+        except Exception as error:
+            logger.critical(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            raise AWSAPIResponsesFileError(
+                file=pathlib.Path(__file__).name,
+                original_exception=error,
+                message=f"Unable to load the recorded AWS API responses from {file_path}",
+            )
+
+    def save(self) -> None:
+        """Write the recorded API responses into the recorded API responses file."""
+        if self.replay:
+            return
+        try:
+            with self._lock:
+                responses_data = {
+                    "version": API_RESPONSES_FILE_VERSION,
+                    "responses": dict(self._responses),
+                }
+            # The file is replaced at once, so an interrupted write does not leave a broken file
+            temporary_file_path = f"{self.file_path}.tmp"
+            with gzip.open(temporary_file_path, "wt") as responses_file:
+                json.dump(responses_data, responses_file)
+            os.replace(temporary_file_path, self.file_path)
+            logger.info(
+                f"{len(responses_data['responses'])} AWS API responses recorded in {self.file_path}"
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def log_replay_summary(self) -> None:
+        """Log the API calls replayed whose response was not recorded."""
+        if self.replay and self._not_recorded:
+            logger.warning(
+                f"{self._not_recorded} AWS API calls were not recorded in {self.file_path}, they failed with the {API_RESPONSE_NOT_RECORDED_ERROR_CODE} error."
+            )
+
+    def register(self, session) -> None:
+        """
+        Record or replay the API calls of the clients created from the given boto3 session from now on.
+
+        Args:
+            session (boto3.session.Session): The boto3 session.
+        """
+        session.events.register("before-parameter-build", self._before_parameter_build)
+        if self.replay:
+            # The replayed response is returned before any other handler can make the API call
+            session.events.register_first("before-call", self._before_call)
+        else:
+            session.events.register("after-call", self._after_call)
+
+    def get_request_key(
+        self, region: str, service: str, operation: str, params: dict
+    ) -> str:
+        """
+        Returns the key of the API response of the given request.
+
+        Args:
+            region (str): The region of the API call.
+            service (str): The AWS service name.
+            operation (str): The API operation name.
+            params (dict): The parameters of the API call.
+
+        Returns:
+            str: The key of the API response.
+        """
+        params_hash = hashlib.sha256(
+            json.dumps(
+                params, sort_keys=True, default=_encode_request_parameter
+            ).encode()
+        ).hexdigest()
+        return f"{self.account}/{region}/{service}/{operation}/{params_hash}"
+
+    def _before_parameter_build(self, params, model, context, **kwargs) -> None:
+        context[api_cache_context_key] = self.get_request_key(
+            context.get("client_region"),
+            model.service_model.service_name,
+            model.name,
+            params,
+        )
+
+    def _before_call(self, model, context, **kwargs) -> tuple:
+        request_key = context.get(api_cache_context_key)
+        with self._lock:
+            recorded_response = self._responses.get(request_key)
+            if recorded_response is None:
+                self._not_recorded += 1
+        if recorded_response is None:
+            logger.warning(
+                f"{model.service_model.service_name.upper()} - {model.name} API response not recorded in {context.get('client_region')}."
+            )
+            return AWSResponse(None, 400, {}, None), {
+                "Error": {
+                    "Code": API_RESPONSE_NOT_RECORDED_ERROR_CODE,
+                    "Message": f"The {model.name} API response was not recorded in {self.file_path}",
+                }
+            }
+        return AWSResponse(
+            None, recorded_response["status_code"], {}, None
+        ), decode_response(recorded_response["response"])
+
+    def _after_call(self, http_response, parsed, context, **kwargs) -> None:
+        request_key = context.pop(api_cache_context_key, None)
+        if request_key is None or not isinstance(parsed, dict):
+            return
+        response = encode_response(
+            {
+                key: value
+                for key, value in parsed.items()
+                if not isinstance(value, StreamingBody)
+            }
+        )
+        # The streamed payloads are read to record them, and handed over to the caller as a new stream
+        for key, value in parsed.items():
+            if isinstance(value, StreamingBody):
+                data = value.read()
+                parsed[key] = StreamingBody(BytesIO(data), len(data))
+                response[key] = {"__stream__": base64.b64encode(data).decode()}
+        with self._lock:
+            self._responses[request_key] = {
+                "status_code": http_response.status_code,
+                "response": response,
+            }
@@ -0,0 +1,423 @@
+import asyncio
+import threading
+import time
+from functools import partial
+
+from prowler.lib.logger import logger
+
+# Default maximum number of concurrent AWS API calls of the scan
+DEFAULT_API_MAX_CONCURRENCY = 100
+# Seconds after reducing the concurrency of an API family before it can be reduced again
+THROTTLING_COOLDOWN_SECONDS = 1.0
+
+# Error codes of the throttled API calls, the same ones botocore retries as throttling errors
+THROTTLING_ERROR_CODES = frozenset(
+    [
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "ProvisionedThroughputExceededException",
+        "TransactionInProgressException",
+        "RequestLimitExceeded",
+        "BandwidthLimitExceeded",
+        "LimitExceededException",
+        "RequestThrottled",
+        "SlowDown",
+        "PriorRequestNotComplete",
+        "EC2ThrottledException",
+    ]
+)
+
+# Key of the API call context to keep the API family of the calls in progress
+api_scheduler_context_key = "prowler_api_scheduler_family"
+
+
+def get_error_code(parsed_response) -> str:
+    """Returns the error code of a parsed botocore response, or None."""
+    if isinstance(parsed_response, dict):
+        return parsed_response.get("Error", {}).get("Code")
+    return None
+
+
+def wake_async_waiter(waiter: asyncio.Future) -> None:
+    """Wake an asyncio API call waiting for a free slot, unless it was cancelled."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class TokenBucket:
+    """
+    TokenBucket limits the rate of the API calls, allowing bursts of up to one second of calls.
+
+    Attributes:
+        rate (float): The maximum API calls per second.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._capacity = max(rate, 1.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserve a token without waiting for it.
+
+        Returns:
+            float: The seconds to wait until the token is available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # The token is reserved before waiting, so the waiting calls are served in order
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting until it is available.
+
+        Returns:
+            float: The seconds waited for the token.
+        """
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class APIFamily:
+    """
+    APIFamily holds the adaptive concurrency of the API calls of an AWS service.
+
+    Attributes:
+        name (str): The AWS service name.
+        limit (int): The maximum concurrent API calls, halved when they are throttled and increased by one
+            after as many successful calls as the limit.
+        in_flight (int): The API calls in progress.
+        successes (int): The successful API calls since the limit was changed.
+        throttles (int): The throttled API calls.
+        exhausted (int): The throttled API calls that failed after all their retries.
+        reduced_at (float): The monotonic time of the last concurrency reduction.
+    """
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        self.in_flight = 0
+        self.successes = 0
+        self.throttles = 0
+        self.exhausted = 0
+        self.reduced_at = None
+
+
+class AWSAPIScheduler:
+    """
+    AWSAPIScheduler schedules the AWS API calls of all the boto3 clients of the provider. It bounds the total
+    concurrent API calls, limits the rate of the configured API families with token buckets and adapts the
+    concurrency of each AWS service to its throttling errors, instead of firing every call at once and relying
+    only on the botocore retries.
+
+    The API calls are scheduled through the botocore events of each client, so the services do not need to
+    change how they call the AWS APIs.
+
+    Attributes:
+        max_concurrency (int): The maximum number of concurrent API calls.
+        rate_limits (dict): The maximum API calls per second in each region, by AWS service (e.g. "iam") or by AWS
+            service and operation (e.g. "cloudtrail.LookupEvents"), as the AWS API rate limits are per region.
+
+    Examples:
+        >>> scheduler = AWSAPIScheduler(max_concurrency=50, rate_limits={"iam": 20})
+        >>> scheduler.register(iam_client)
+        >>> scheduler.get_throttles()
+        {'iam': 3}
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_API_MAX_CONCURRENCY,
+        rate_limits: dict = None,
+    ):
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self.rate_limits = {
+            api: float(rate)
+            for api, rate in (rate_limits or {}).items()
+            if rate and float(rate) > 0
+        }
+        self._rate_limiters = {}
+        self._families = {}
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        # Futures of the asyncio API calls waiting for a free slot, with their event loops
+        self._async_waiters = []
+        # Contexts of the API calls scheduled by each thread, until their clients' _make_api_call returns
+        self._local = threading.local()
+
+    @classmethod
+    def from_config(cls, audit_config: dict) -> "AWSAPIScheduler":
+        """
+        Create the scheduler from the api_max_concurrency and api_rate_limits values of the AWS audit config.
+
+        Args:
+            audit_config (dict): The AWS audit configuration.
+
+        Returns:
+            AWSAPIScheduler: The API scheduler.
+        """
+        audit_config = audit_config or {}
+        try:
+            return cls(
+                max_concurrency=audit_config.get(
+                    "api_max_concurrency", DEFAULT_API_MAX_CONCURRENCY
+                ),
+                rate_limits=audit_config.get("api_rate_limits", {}),
+            )
+        except (TypeError, ValueError, AttributeError) as error:
+            logger.error(
+                f"Invalid AWS API scheduler configuration, using the default one - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return cls()
+
+    def register(self, client) -> None:
+        """
+        Schedule the API calls of the given boto3 client.
+
+        Args:
+            client (botocore.client.BaseClient): The boto3 client.
+        """
+        # The asyncio transport schedules the API calls of the client without blocking its event loop
+        client.meta.api_scheduler = self
+        # The API call is scheduled before any other handler can respond to it
+        client.meta.events.register_first(
+            "before-call.*.*",
+            partial(self._before_call, region=client.meta.region_name),
+        )
+        client.meta.events.register("needs-retry", self._needs_retry)
+        client.meta.events.register("after-call", self._after_call)
+        client.meta.events.register("after-call-error", self._after_call_error)
+        # The after-call events are not emitted if a before-call handler raises, so the slot is released when
+        # the API call returns
+        client._make_api_call = partial(self._make_api_call, client._make_api_call)
+
+    def _get_family(self, name: str) -> APIFamily:
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = APIFamily(name, self.max_concurrency)
+        return family
+
+    def _get_rate_limiter(self, service: str, operation: str, region: str):
+        api = f"{service}.{operation}"
+        if api not in self.rate_limits:
+            api = service
+            if api not in self.rate_limits:
+                return None
+        with self._condition:
+            rate_limiter = self._rate_limiters.get((api, region))
+            if rate_limiter is None:
+                rate_limiter = self._rate_limiters[(api, region)] = TokenBucket(
+                    self.rate_limits[api]
+                )
+        return rate_limiter
+
+    def acquire(self, service: str, operation: str, region: str = None) -> None:
+        """
+        Wait until an API call of the given AWS service and operation can be made.
+
+        Args:
+            service (str): The AWS service name.
+            operation (str): The API operation name.
+            region (str): The region of the API call.
+        """
+        rate_limiter = self._get_rate_limiter(service, operation, region)
+        if rate_limiter:
+            rate_limiter.acquire()
+        with self._condition:
+            family = self._get_family(service)
+            while (
+                self._in_flight >= self.max_concurrency
+                or family.in_flight >= family.limit
+            ):
+                self._condition.wait()
+            self._in_flight += 1
+            family.in_flight += 1
+
+    def try_acquire(self, service: str) -> bool:
+        """
+        Take a slot for an API call of the given AWS service if there is one free, without waiting.
+
+        Args:
+            service (str): The AWS service name.
+
+        Returns:
+            bool: Whether the slot was taken.
+        """
+        with self._condition:
+            return self._take_slot(service)
+
+    def _take_slot(self, service: str) -> bool:
+        # Called with the condition held
+        family = self._get_family(service)
+        if self._in_flight >= self.max_concurrency or family.in_flight >= family.limit:
+            return False
+        self._in_flight += 1
+        family.in_flight += 1
+        return True
+
+    async def acquire_async(
+        self, service: str, operation: str, region: str = None
+    ) -> None:
+        """
+        Wait until an API call of the given AWS service and operation can be made, without blocking the event
+        loop of the asyncio API calls.
+
+        Args:
+            service (str): The AWS service name.
+            operation (str): The API operation name.
+            region (str): The region of the API call.
+        """
+        rate_limiter = self._get_rate_limiter(service, operation, region)
+        if rate_limiter:
+            wait = rate_limiter.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._take_slot(service):
+                    return
+                # The waiter is added with the condition held, so a release cannot be missed
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+
+    def release(self, service: str, success: bool = True) -> None:
+        """
+        Release the API call of the given AWS service, increasing its concurrency after enough successful calls.
+
+        Args:
+            service (str): The AWS service name.
+            success (bool): Whether the API call succeeded.
+        """
+        with self._condition:
+            family = self._get_family(service)
+            self._in_flight -= 1
+            family.in_flight -= 1
+            if success:
+                family.successes += 1
+                if (
+                    family.limit < self.max_concurrency
+                    and family.successes >= family.limit
+                ):
+                    family.limit += 1
+                    family.successes = 0
+            self._condition.notify_all()
+            async_waiters, self._async_waiters = self._async_waiters, []
+        # The asyncio API calls can wait in the event loops of other threads
+        for loop, waiter in async_waiters:
+            try:
+                loop.call_soon_threadsafe(wake_async_waiter, waiter)
+            except RuntimeError:
+                # The event loop of the waiter is already closed
+                pass
+
+    def throttled(self, service: str, operation: str) -> None:
+        """
+        Record a throttled API call of the given AWS service, halving its concurrency.
+
+        Args:
+            service (str): The AWS service name.
+            operation (str): The API operation name.
+        """
+        with self._condition:
+            family = self._get_family(service)
+            family.throttles += 1
+            family.successes = 0
+            # The concurrency is halved once per burst of throttled calls, not once per call
+            now = time.monotonic()
+            if (
+                family.reduced_at is not None
+                and now - family.reduced_at < THROTTLING_COOLDOWN_SECONDS
+            ):
+                return
+            limit = max(min(family.limit, family.in_flight) // 2, 1)
+            if limit < family.limit:
+                family.limit = limit
+                family.reduced_at = now
+                logger.warning(
+                    f"{service.upper()} - {operation} API calls throttled, reducing the {service} API concurrency to {limit}."
+                )
+
+    def _get_scheduled_contexts(self) -> list:
+        if not hasattr(self._local, "contexts"):
+            self._local.contexts = []
+        return self._local.contexts
+
+    def _make_api_call(self, make_api_call, operation_name, api_params):
+        contexts = self._get_scheduled_contexts()
+        scheduled = len(contexts)
+        try:
+            return make_api_call(operation_name, api_params)
+        finally:
+            # The API calls that did not reach their after-call events release their slots here
+            for context in contexts[scheduled:]:
+                service = context.pop(api_scheduler_context_key, None)
+                if service is not None:
+                    self.release(service, success=False)
+            del contexts[scheduled:]
+
+    def _before_call(self, model, context, region=None, **kwargs) -> None:
+        # The asyncio API calls are already scheduled with acquire_async
+        if api_scheduler_context_key in context:
+            return
+        service = model.service_model.service_name
+        self.acquire(service, model.name, region)
+        context[api_scheduler_context_key] = service
+        self._get_scheduled_contexts().append(context)
+
+    def _needs_retry(self, response, operation, **kwargs) -> None:
+        if response and get_error_code(response[1]) in THROTTLING_ERROR_CODES:
+            self.throttled(operation.service_model.service_name, operation.name)
+
+    def _after_call(self, parsed, model, context, **kwargs) -> None:
+        service = context.pop(api_scheduler_context_key, None)
+        if service is None:
+            return
+        error_code = get_error_code(parsed)
+        if error_code in THROTTLING_ERROR_CODES:
+            with self._condition:
+                self._get_family(service).exhausted += 1
+            logger.error(
+                f"{service.upper()} - {model.name} API call failed after all its retries because it was throttled ({error_code})."
+            )
+        self.release(service, success=error_code is None)
+
+    def _after_call_error(self, context, **kwargs) -> None:
+        service = context.pop(api_scheduler_context_key, None)
+        if service is not None:
+            self.release(service, success=False)
+
+    def get_throttles(self) -> dict[str, int]:
+        """Returns the throttled API calls by AWS service."""
+        with self._condition:
+            return {
+                name: family.throttles
+                for name, family in self._families.items()
+                if family.throttles
+            }
+
+    def log_throttling_summary(self) -> None:
+        """Log the throttled API calls of each AWS service, and the ones that failed after all their retries."""
+        with self._condition:
+            families = [
+                family for family in self._families.values() if family.throttles
+            ]
+            for family in families:
+                logger.warning(
+                    f"{family.name.upper()} - {family.throttles} API calls throttled, {family.exhausted} of them failed after all their retries. Final {family.name} API concurrency: {family.limit}."
+                )
@@ -1,4 +1,4 @@
-from argparse import ArgumentTypeError, Namespace
+from argparse import SUPPRESS, ArgumentTypeError, Namespace
 from re import fullmatch, search
 
 from prowler.providers.aws.aws_provider import AwsProvider
@@ -74,6 +74,34 @@ def init_parser(self):
         nargs="?",
         help="Specify AWS Organizations management role ARN to be assumed, to get Organization metadata",
     )
+    # Multi-Account Scan
+    multi_account_subparser = aws_parser.add_argument_group("Multi-Account Scan")
+    multi_account_subparser.add_argument(
+        "--accounts",
+        nargs="+",
+        default=None,
+        type=validate_account_id,
+        help="AWS account IDs to scan assuming the -R/--role role in each of them, e.g. --role arn:aws:iam::111111111111:role/ProwlerScan --accounts 111111111111 222222222222",
+    )
+    multi_account_subparser.add_argument(
+        "--organizational-units",
+        nargs="+",
+        default=None,
+        help="AWS Organizations organizational unit or root IDs whose active accounts, including the ones of their child organizational units, are scanned assuming the -R/--role role in each of them. The organizational units are listed with the credentials of -O/--organizations-role if set",
+    )
+    multi_account_subparser.add_argument(
+        "--parallel-accounts",
+        default=1,
+        type=int,
+        help="Number of AWS accounts scanned in parallel in a multi-account scan, each one in its own process (Default: 1)",
+    )
+    # AWS account scanned by each process of a multi-account scan, set by the multi-account scan itself
+    multi_account_subparser.add_argument(
+        "--multi-account-id",
+        default=None,
+        type=validate_account_id,
+        help=SUPPRESS,
+    )
     # AWS Security Hub
     aws_security_hub_subparser = aws_parser.add_argument_group("AWS Security Hub")
     aws_security_hub_subparser.add_argument(
@@ -149,6 +177,22 @@ def init_parser(self):
         help="Set the maximum attemps for the Boto3 standard retrier config (Default: 3)",
     )
 
+    # Recorded API Responses
+    api_responses_subparser = aws_parser.add_argument_group("AWS API Responses")
+    api_responses_parser = api_responses_subparser.add_mutually_exclusive_group()
+    api_responses_parser.add_argument(
+        "--record-api-responses",
+        default=None,
+        metavar="FILE",
+        help="Record the AWS API responses of the scan into a compressed file, to replay them later with --replay-api-responses",
+    )
+    api_responses_parser.add_argument(
+        "--replay-api-responses",
+        default=None,
+        metavar="FILE",
+        help="Replay the AWS API responses recorded with --record-api-responses instead of calling the AWS APIs. Use the same provider options of the recorded scan",
+    )
+
     # Scan Unused Services
     scan_unused_services_subparser = aws_parser.add_argument_group(
         "Scan Unused Services"
@@ -219,9 +263,42 @@ def validate_arguments(arguments: Namespace) -> tuple[bool, str]:
                 "To use -I/--external-id, -T/--session-duration or --role-session-name options -R/--role option is needed",
             )
 
+    # Multi-account scans assume the role in each account
+    if arguments.accounts or arguments.organizational_units:
+        if not arguments.role:
+            return (
+                False,
+                "To use --accounts or --organizational-units options -R/--role option is needed",
+            )
+        if getattr(arguments, "checks_folder", None):
+            return (
+                False,
+                "The -x/--checks-folder option cannot be used with --accounts or --organizational-units options",
+            )
+        if getattr(arguments, "from_snapshot", None) or getattr(
+            arguments, "replay_api_responses", None
+        ):
+            return (
+                False,
+                "The --from-snapshot and --replay-api-responses options cannot be used with --accounts or --organizational-units options",
+            )
+        if arguments.parallel_accounts < 1:
+            return (
+                False,
+                "The --parallel-accounts option must be greater than 0",
+            )
+
     return (True, "")
 
 
+def validate_account_id(account_id: str) -> str:
+    """validate_account_id validates that the input account_id is an AWS account ID"""
+    if fullmatch(r"\d{12}", account_id):
+        return account_id
+    else:
+        raise ArgumentTypeError("AWS account ID must be 12 digits long")
+
+
 def validate_bucket(bucket_name: str) -> str:
     """validate_bucket validates that the input bucket_name is valid"""
     if search(
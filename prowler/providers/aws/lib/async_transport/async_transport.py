@@ -0,0 +1,410 @@
+import asyncio
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import lru_cache, partial
+from typing import Optional
+from urllib.parse import urlsplit
+
+import botocore
+from botocore.awsrequest import AWSResponse
+from botocore.client import BaseClient
+from botocore.compress import maybe_compress_request
+from botocore.endpoint import Endpoint, convert_to_response_dict
+from botocore.exceptions import (
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    HTTPClientError,
+    ReadTimeoutError,
+)
+from botocore.hooks import first_non_none_response
+from botocore.httpchecksum import (
+    apply_request_checksum,
+    handle_checksum_body,
+    resolve_checksum_context,
+)
+
+from prowler.lib.logger import logger
+from prowler.providers.aws.config import (
+    AWS_SERVICE_MAX_ASYNC_CONCURRENCY,
+    AWS_SERVICE_MAX_WORKERS,
+)
+from prowler.providers.aws.lib.api_scheduler.api_scheduler import (
+    api_scheduler_context_key,
+)
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:
+    # Without aiohttp the asyncio API calls are made by the boto3 clients in a thread pool
+    aiohttp = None
+
+# botocore version pinned in pyproject.toml, which the transport is tested with. It follows the steps of
+# BaseClient._make_api_call and Endpoint._send_request with private botocore methods, so with any other version
+# the API calls are made by the clients in a thread pool, as when aiohttp is not installed
+ASYNC_TRANSPORT_BOTOCORE_VERSION = "1.35.99"
+ASYNC_TRANSPORT_BOTOCORE_METHODS = {
+    BaseClient: (
+        "_emit_api_params",
+        "_resolve_endpoint_ruleset",
+        "_convert_to_request_dict",
+    ),
+    Endpoint: (
+        "_update_retries_context",
+        "_add_modeled_error_fields",
+        "create_request",
+    ),
+}
+
+# Asyncio transport of the service collection in progress, see AWSService.__async_call__
+current_async_transport: ContextVar = ContextVar(
+    "current_async_transport", default=None
+)
+
+
+class AsyncRawResponse:
+    """AsyncRawResponse holds the body read by aiohttp, with the interface botocore expects from urllib3 responses."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def stream(self, **kwargs):
+        if self._body:
+            yield self._body
+
+
+class AWSAsyncTransport:
+    """
+    AWSAsyncTransport makes the API calls of the boto3 clients with asyncio, so a service can have hundreds of
+    API calls in flight without a thread for each of them.
+
+    The API calls are built, signed, retried and parsed by botocore with the handlers registered in the
+    clients, like the AWS API scheduler, the recorded API responses or the moto mocks, only the HTTP requests
+    are sent with aiohttp. The API calls with streaming input or output, and the ones of clients whose API
+    calls are customised, are made by the client in a thread pool instead, as when aiohttp is not installed
+    or the installed botocore is not the one the transport is tested with, see is_botocore_supported.
+
+    Attributes:
+        max_concurrency (int): The maximum number of concurrent HTTP connections.
+
+    Examples:
+        >>> async with AWSAsyncTransport() as transport:
+        ...     await transport.call(s3_client, "get_bucket_policy", Bucket="bucket")
+    """
+
+    def __init__(self, max_concurrency: int = AWS_SERVICE_MAX_ASYNC_CONCURRENCY):
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self._session = None
+        self._thread_pool = None
+
+    async def __aenter__(self) -> "AWSAsyncTransport":
+        if aiohttp is not None and is_botocore_supported():
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                # botocore neither compresses the responses nor adds headers that are not signed
+                auto_decompress=False,
+                skip_auto_headers=("Accept-Encoding", "Content-Type"),
+                # As botocore, the proxy environment variables are used if the client config has no proxies
+                trust_env=True,
+            )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False)
+            self._thread_pool = None
+
+    async def call(self, client: BaseClient, method_name: str, **kwargs) -> dict:
+        """
+        Make an API call of the given boto3 client.
+
+        Args:
+            client (BaseClient): The boto3 client.
+            method_name (str): The client method of the API call, e.g. get_bucket_policy.
+            kwargs: The parameters of the API call.
+
+        Returns:
+            dict: The parsed response, as returned by the client method.
+
+        Raises:
+            ClientError: If the API call fails, as the client method.
+        """
+        operation_name = client.meta.method_to_api_mapping[method_name]
+        operation_model = client.meta.service_model.operation_model(operation_name)
+        if (
+            self._session is None
+            or operation_model.has_streaming_input
+            or operation_model.has_streaming_output
+            or operation_model.has_event_stream_output
+            or getattr(type(client)._make_api_call, "__module__", None)
+            != BaseClient.__module__
+        ):
+            return await self._call_in_thread(client, method_name, **kwargs)
+        return await self._make_api_call(client, operation_model, kwargs)
+
+    async def _call_in_thread(self, client: BaseClient, method_name: str, **kwargs):
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=AWS_SERVICE_MAX_WORKERS)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._thread_pool, partial(getattr(client, method_name), **kwargs)
+        )
+
+    async def _make_api_call(
+        self, client: BaseClient, operation_model, api_params: dict
+    ) -> dict:
+        # Same steps as BaseClient._make_api_call, awaiting the HTTP requests
+        service_model = client.meta.service_model
+        service_id = service_model.service_id.hyphenize()
+        operation_name = operation_model.name
+        request_context = {
+            "client_region": client.meta.region_name,
+            "client_config": client.meta.config,
+            "has_streaming_input": operation_model.has_streaming_input,
+            "auth_type": operation_model.resolved_auth_type,
+            "unsigned_payload": operation_model.unsigned_payload,
+        }
+        api_params = client._emit_api_params(
+            api_params=api_params,
+            operation_model=operation_model,
+            context=request_context,
+        )
+        endpoint_url, additional_headers, properties = client._resolve_endpoint_ruleset(
+            operation_model, api_params, request_context
+        )
+        if properties:
+            request_context["endpoint_properties"] = properties
+        request_dict = client._convert_to_request_dict(
+            api_params=api_params,
+            operation_model=operation_model,
+            endpoint_url=endpoint_url,
+            context=request_context,
+            headers=additional_headers,
+        )
+        resolve_checksum_context(request_dict, operation_model, api_params)
+
+        # The API scheduler would block the event loop waiting for a slot, so it is awaited here
+        scheduler = getattr(client.meta, "api_scheduler", None)
+        if scheduler is not None:
+            await scheduler.acquire_async(
+                service_model.service_name, operation_name, client.meta.region_name
+            )
+            request_context[api_scheduler_context_key] = service_model.service_name
+        try:
+            _, event_response = client.meta.events.emit_until_response(
+                f"before-call.{service_id}.{operation_name}",
+                model=operation_model,
+                params=request_dict,
+                request_signer=client._request_signer,
+                context=request_context,
+            )
+            if event_response is not None:
+                http, parsed_response = event_response
+            else:
+                maybe_compress_request(
+                    client.meta.config, request_dict, operation_model
+                )
+                apply_request_checksum(request_dict)
+                http, parsed_response = await self._send_request(
+                    client, request_dict, operation_model
+                )
+        except Exception as error:
+            client.meta.events.emit(
+                f"after-call-error.{service_id}.{operation_name}",
+                exception=error,
+                context=request_context,
+            )
+            raise
+
+        client.meta.events.emit(
+            f"after-call.{service_id}.{operation_name}",
+            http_response=http,
+            parsed=parsed_response,
+            model=operation_model,
+            context=request_context,
+        )
+        if http.status_code >= 300:
+            error_info = parsed_response.get("Error", {})
+            error_code = error_info.get("QueryErrorCode") or error_info.get("Code")
+            raise client.exceptions.from_code(error_code)(
+                parsed_response, operation_name
+            )
+        return parsed_response
+
+    async def _send_request(
+        self, client: BaseClient, request_dict: dict, operation_model
+    ):
+        # Same steps as Endpoint._send_request, with the retries waiting without blocking the event loop
+        endpoint = client._endpoint
+        service_id = operation_model.service_model.service_id.hyphenize()
+        context = request_dict["context"]
+        attempts = 1
+        endpoint._update_retries_context(context, attempts)
+        request = endpoint.create_request(request_dict, operation_model)
+        success_response, exception = await self._get_response(
+            client, request, operation_model, context
+        )
+        while True:
+            retry_delay = first_non_none_response(
+                client.meta.events.emit(
+                    f"needs-retry.{service_id}.{operation_model.name}",
+                    response=success_response,
+                    endpoint=endpoint,
+                    operation=operation_model,
+                    attempts=attempts,
+                    caught_exception=exception,
+                    request_dict=request_dict,
+                )
+            )
+            if retry_delay is None:
+                break
+            await asyncio.sleep(retry_delay)
+            attempts += 1
+            endpoint._update_retries_context(context, attempts, success_response)
+            request.reset_stream()
+            # Create a new request when retried (including a new signature)
+            request = endpoint.create_request(request_dict, operation_model)
+            success_response, exception = await self._get_response(
+                client, request, operation_model, context
+            )
+        if success_response is not None and "ResponseMetadata" in success_response[1]:
+            success_response[1]["ResponseMetadata"]["RetryAttempts"] = attempts - 1
+        if exception is not None:
+            raise exception
+        return success_response
+
+    async def _get_response(
+        self, client: BaseClient, request, operation_model, context
+    ):
+        endpoint = client._endpoint
+        events = client.meta.events
+        service_id = operation_model.service_model.service_id.hyphenize()
+        success_response, exception = None, None
+        try:
+            http_response = first_non_none_response(
+                events.emit(
+                    f"before-send.{service_id}.{operation_model.name}",
+                    request=request,
+                )
+            )
+            if http_response is None:
+                http_response = await self._send(client, request)
+        except Exception as error:
+            logger.debug(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            exception = error
+        response_dict = None
+        if exception is None:
+            response_dict = convert_to_response_dict(http_response, operation_model)
+            handle_checksum_body(http_response, response_dict, context, operation_model)
+            protocol = operation_model.metadata["protocol"]
+            customized_response_dict = {}
+            events.emit(
+                f"before-parse.{service_id}.{operation_model.name}",
+                operation_model=operation_model,
+                response_dict=response_dict,
+                customized_response_dict=customized_response_dict,
+            )
+            parser = endpoint._response_parser_factory.create_parser(protocol)
+            parsed_response = parser.parse(response_dict, operation_model.output_shape)
+            parsed_response.update(customized_response_dict)
+            if http_response.status_code >= 300:
+                endpoint._add_modeled_error_fields(
+                    response_dict, parsed_response, operation_model, parser
+                )
+            success_response = (http_response, parsed_response)
+        events.emit(
+            f"response-received.{service_id}.{operation_model.name}",
+            response_dict=response_dict,
+            parsed_response=success_response[1] if success_response else None,
+            context=context,
+            exception=exception,
+        )
+        return success_response, exception
+
+    async def _send(self, client: BaseClient, request) -> AWSResponse:
+        config = client.meta.config
+        headers = {
+            name: value.decode("utf-8") if isinstance(value, bytes) else value
+            for name, value in request.headers.items()
+        }
+        body = request.body
+        if hasattr(body, "read"):
+            body = body.read()
+        try:
+            async with self._session.request(
+                request.method,
+                # The URL is already quoted and signed by botocore
+                URL(request.url, encoded=True),
+                headers=headers,
+                data=body or None,
+                allow_redirects=False,
+                proxy=get_proxy(client, request.url),
+                ssl=get_ssl_verification(client),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=config.connect_timeout,
+                    sock_read=config.read_timeout,
+                ),
+            ) as response:
+                content = await response.read()
+                return AWSResponse(
+                    request.url,
+                    response.status,
+                    response.headers,
+                    AsyncRawResponse(content),
+                )
+        except aiohttp.ServerTimeoutError as error:
+            if isinstance(error, getattr(aiohttp, "ConnectionTimeoutError", ())):
+                raise ConnectTimeoutError(endpoint_url=request.url, error=error)
+            raise ReadTimeoutError(endpoint_url=request.url, error=error)
+        except aiohttp.ClientConnectionError as error:
+            raise EndpointConnectionError(endpoint_url=request.url, error=error)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            raise HTTPClientError(error=error)
+
+
+@lru_cache(maxsize=None)
+def is_botocore_supported() -> bool:
+    """is_botocore_supported returns whether the installed botocore is the one the asyncio transport is tested with."""
+    if botocore.__version__ != ASYNC_TRANSPORT_BOTOCORE_VERSION:
+        logger.info(
+            f"botocore {botocore.__version__} is installed instead of {ASYNC_TRANSPORT_BOTOCORE_VERSION}, the asyncio API calls are made in threads."
+        )
+        return False
+    missing_methods = [
+        f"{botocore_class.__name__}.{method}"
+        for botocore_class, methods in ASYNC_TRANSPORT_BOTOCORE_METHODS.items()
+        for method in methods
+        if not callable(getattr(botocore_class, method, None))
+    ]
+    if missing_methods:
+        logger.info(
+            f"botocore {botocore.__version__} is missing {', '.join(missing_methods)}, the asyncio API calls are made in threads."
+        )
+        return False
+    return True
+
+
+def get_proxy(client: BaseClient, url: str) -> Optional[str]:
+    """get_proxy returns the proxy of the boto3 client config for the URL, as botocore selects it, or None."""
+    proxies = client.meta.config.proxies or {}
+    proxy = proxies.get(urlsplit(url).scheme)
+    if not proxy or proxy.startswith(("http:", "https:")):
+        return proxy
+    if proxy.startswith("//"):
+        return f"http:{proxy}"
+    return f"http://{proxy}"
+
+
+def get_ssl_verification(client: BaseClient):
+    """get_ssl_verification returns the aiohttp SSL argument of the TLS verification of the boto3 client."""
+    verify = getattr(client._endpoint.http_session, "_verify", True)
+    if verify is False:
+        return False
+    if isinstance(verify, str):
+        return ssl.create_default_context(cafile=verify)
+    return True
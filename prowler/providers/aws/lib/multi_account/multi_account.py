@@ -0,0 +1,449 @@
+import csv
+import json
+import os
+import re
+import subprocess
+import sys
+from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from boto3.session import Session
+from colorama import Fore, Style
+
+from prowler.config.config import (
+    csv_file_suffix,
+    json_asff_file_suffix,
+    json_ocsf_file_suffix,
+    output_file_timestamp,
+)
+from prowler.lib.logger import logger
+
+# Role ARN to assume in each account, replacing the account of the --role ARN
+role_arn_pattern = re.compile(r"^arn:([\w-]+):iam::\d{12}:(role/.+)$")
+
+
+def get_account_role_arn(role_arn: str, account_id: str) -> str:
+    """
+    get_account_role_arn returns the ARN of the given IAM role in another AWS account.
+
+    Args:
+        role_arn (str): The ARN of the IAM role to assume, e.g. arn:aws:iam::111111111111:role/ProwlerScan
+        account_id (str): The AWS account ID.
+
+    Returns:
+        str: The ARN of the IAM role in the AWS account, e.g. arn:aws:iam::222222222222:role/ProwlerScan
+
+    Raises:
+        ValueError: If the role ARN is not an IAM role ARN.
+    """
+    role_arn_match = role_arn_pattern.match(role_arn)
+    if not role_arn_match:
+        raise ValueError(f"{role_arn} is not an IAM role ARN")
+    partition, role = role_arn_match.groups()
+    return f"arn:{partition}:iam::{account_id}:{role}"
+
+
+def get_organizational_units_accounts(
+    session: Session, organizational_units: list
+) -> list:
+    """
+    get_organizational_units_accounts returns the active AWS accounts of the given AWS Organizations
+    organizational units or roots, including the ones of their child organizational units.
+
+    Args:
+        session (Session): The session of the AWS Organizations management or delegated administrator account.
+        organizational_units (list): The organizational unit or root IDs, e.g. ou-ab12-cd34ef56 or r-ab12.
+
+    Returns:
+        list: The AWS account IDs.
+    """
+    organizations_client = session.client("organizations")
+    list_accounts_paginator = organizations_client.get_paginator(
+        "list_accounts_for_parent"
+    )
+    list_children_paginator = organizations_client.get_paginator(
+        "list_organizational_units_for_parent"
+    )
+    accounts = []
+    parents = list(organizational_units)
+    while parents:
+        parent_id = parents.pop(0)
+        for page in list_accounts_paginator.paginate(ParentId=parent_id):
+            for account in page["Accounts"]:
+                if account.get("Status") == "ACTIVE":
+                    accounts.append(account["Id"])
+        for page in list_children_paginator.paginate(ParentId=parent_id):
+            parents.extend(
+                organizational_unit["Id"]
+                for organizational_unit in page["OrganizationalUnits"]
+            )
+    return accounts
+
+
+def get_account_file_path(file_path: str, account_id: str) -> str:
+    """get_account_file_path returns the path of the file of an account, prefixing its name with the account ID."""
+    directory, filename = os.path.split(file_path)
+    return os.path.join(directory, f"{account_id}-{filename}")
+
+
+def merge_csv_outputs(csv_outputs: list, merged_csv: str) -> bool:
+    """
+    merge_csv_outputs merges the given CSV outputs into a single CSV output with the header of the first one.
+
+    Args:
+        csv_outputs (list): The paths of the CSV outputs, the missing ones are skipped.
+        merged_csv (str): The path of the merged CSV output.
+
+    Returns:
+        bool: True if any CSV output was merged, False otherwise.
+    """
+    csv_outputs = [output for output in csv_outputs if os.path.exists(output)]
+    if not csv_outputs:
+        return False
+    with open(merged_csv, "w", newline="") as merged_file:
+        writer = csv.writer(merged_file, delimiter=";")
+        header_written = False
+        for csv_output in csv_outputs:
+            with open(csv_output, newline="") as csv_file:
+                reader = csv.reader(csv_file, delimiter=";")
+                header = next(reader, None)
+                if header is None:
+                    continue
+                if not header_written:
+                    writer.writerow(header)
+                    header_written = True
+                writer.writerows(reader)
+    return True
+
+
+def merge_json_outputs(json_outputs: list, merged_json: str) -> bool:
+    """
+    merge_json_outputs merges the given JSON outputs, which are lists of findings, into a single JSON output.
+
+    Args:
+        json_outputs (list): The paths of the JSON outputs, the missing ones are skipped.
+        merged_json (str): The path of the merged JSON output.
+
+    Returns:
+        bool: True if any JSON output was merged, False otherwise.
+    """
+    json_outputs = [output for output in json_outputs if os.path.exists(output)]
+    if not json_outputs:
+        return False
+    # The findings are written one account at a time, so only one account is loaded in memory
+    with open(merged_json, "w") as merged_file:
+        merged_file.write("[")
+        first_finding = True
+        for json_output in json_outputs:
+            with open(json_output) as json_file:
+                for finding in json.load(json_file):
+                    if not first_finding:
+                        merged_file.write(",")
+                    merged_file.write(json.dumps(finding, indent=4))
+                    first_finding = False
+        merged_file.write("]")
+    return True
+
+
+def merge_outputs(
+    output_directory: str, account_filenames: list, merged_filename: str
+) -> list:
+    """
+    merge_outputs merges the CSV, JSON OCSF, JSON ASFF and compliance outputs of the accounts scanned into a
+    single output of each format and compliance framework. The HTML outputs are not merged.
+
+    Args:
+        output_directory (str): The output directory.
+        account_filenames (list): The output filenames of the accounts, without the extension.
+        merged_filename (str): The merged output filename, without the extension.
+
+    Returns:
+        list: The paths of the merged outputs.
+    """
+    merged_outputs = []
+    try:
+        for file_suffix, merge in [
+            (csv_file_suffix, merge_csv_outputs),
+            (json_ocsf_file_suffix, merge_json_outputs),
+            (json_asff_file_suffix, merge_json_outputs),
+        ]:
+            merged_output = os.path.join(
+                output_directory, f"{merged_filename}{file_suffix}"
+            )
+            if merge(
+                [
+                    os.path.join(output_directory, f"{filename}{file_suffix}")
+                    for filename in account_filenames
+                ],
+                merged_output,
+            ):
+                merged_outputs.append(merged_output)
+
+        # The compliance outputs are named <output filename>_<compliance framework>.csv
+        compliance_directory = os.path.join(output_directory, "compliance")
+        compliance_outputs = (
+            os.listdir(compliance_directory)
+            if os.path.isdir(compliance_directory)
+            else []
+        )
+        compliance_frameworks = []
+        for filename in account_filenames:
+            for compliance_output in sorted(compliance_outputs):
+                if compliance_output.startswith(
+                    f"{filename}_"
+                ) and compliance_output.endswith(csv_file_suffix):
+                    compliance_framework = compliance_output[
+                        len(filename) + 1 : -len(csv_file_suffix)
+                    ]
+                    if compliance_framework not in compliance_frameworks:
+                        compliance_frameworks.append(compliance_framework)
+        for compliance_framework in compliance_frameworks:
+            merged_output = os.path.join(
+                compliance_directory,
+                f"{merged_filename}_{compliance_framework}{csv_file_suffix}",
+            )
+            if merge_csv_outputs(
+                [
+                    os.path.join(
+                        compliance_directory,
+                        f"{filename}_{compliance_framework}{csv_file_suffix}",
+                    )
+                    for filename in account_filenames
+                ],
+                merged_output,
+            ):
+                merged_outputs.append(merged_output)
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return merged_outputs
+
+
+def set_account_arguments(args: Namespace, account_id: str) -> None:
+    """
+    set_account_arguments sets the arguments of the scan of an account: its IAM role, output filename and the
+    per-account checkpoint, snapshot and recorded API responses files.
+
+    Args:
+        args (Namespace): The arguments of the multi-account scan.
+        account_id (str): The AWS account ID to scan.
+    """
+    args.role = get_account_role_arn(args.role, account_id)
+    args.output_filename = get_account_output_filename(args, account_id)
+    # The MFA token is not requested again, the process of the account uses the MFA session credentials
+    if args.mfa:
+        args.profile = None
+        args.mfa = False
+    args.accounts = None
+    args.organizational_units = None
+    args.multi_account_id = None
+    if getattr(args, "checkpoint_directory", None):
+        args.checkpoint_directory = os.path.join(args.checkpoint_directory, account_id)
+    if getattr(args, "resume", None):
+        account_checkpoint = os.path.join(args.resume, account_id)
+        # The accounts not started in the interrupted scan are scanned from scratch
+        if os.path.exists(account_checkpoint):
+            args.resume = account_checkpoint
+        else:
+            args.resume = None
+            args.checkpoint_directory = account_checkpoint
+    if getattr(args, "export_snapshot", None):
+        args.export_snapshot = get_account_file_path(args.export_snapshot, account_id)
+    if getattr(args, "record_api_responses", None):
+        args.record_api_responses = get_account_file_path(
+            args.record_api_responses, account_id
+        )
+
+
+def get_account_output_filename(args: Namespace, account_id: str) -> str:
+    """get_account_output_filename returns the output filename of an account, the default one of a single account scan unless --output-filename is set."""
+    if args.output_filename:
+        return f"{args.output_filename}-{account_id}"
+    return f"prowler-output-{account_id}-{output_file_timestamp}"
+
+
+def get_account_command(argv: list, account_id: str) -> list:
+    """
+    get_account_command returns the command that scans an AWS account of a multi-account scan, running Prowler
+    again with the same arguments and the account ID of --multi-account-id, see set_account_arguments.
+
+    Args:
+        argv (list): The arguments of the multi-account scan, without the program name.
+        account_id (str): The AWS account ID to scan.
+
+    Returns:
+        list: The command of the scan of the account.
+    """
+    return [
+        sys.executable,
+        "-m",
+        "prowler",
+        *argv,
+        "--multi-account-id",
+        account_id,
+    ]
+
+
+def scan_account(
+    args: Namespace, account_id: str, environment: dict, argv: list
+) -> int:
+    """
+    scan_account scans an AWS account of a multi-account scan in a new Prowler process, writing its console
+    output to a log file in the output directory.
+
+    Args:
+        args (Namespace): The arguments of the multi-account scan.
+        account_id (str): The AWS account ID to scan.
+        environment (dict): The environment variables of the process.
+        argv (list): The arguments of the multi-account scan, without the program name.
+
+    Returns:
+        int: The exit code of the scan of the account.
+    """
+    log_filename = os.path.join(
+        args.output_directory, f"{get_account_output_filename(args, account_id)}.log"
+    )
+    try:
+        with open(log_filename, "w") as log_file:
+            return subprocess.run(
+                get_account_command(argv, account_id),
+                env=environment,
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            ).returncode
+    except Exception as error:
+        logger.error(
+            f"{account_id} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return 1
+
+
+def scan_accounts(args: Namespace) -> None:
+    """
+    scan_accounts scans the AWS accounts of --accounts and --organizational-units in parallel, running one
+    Prowler process per account with up to --parallel-accounts processes at the same time, and exits.
+
+    Each process runs Prowler again with the same arguments and --multi-account-id, so the scan of the account
+    sets its own arguments with set_account_arguments. Each process resolves the base credentials from the same
+    profile or environment and assumes the --role in its account, so both are refreshed when they expire. With
+    --mfa, the MFA token is requested once and the MFA session credentials are passed to the processes instead,
+    which cannot refresh them, so the scans of the accounts must finish before they expire. The console output
+    of each account is written to a log file in the output directory, while this process reports the progress
+    of the accounts and merges their outputs once all of them finish. The outputs of each account are kept too.
+
+    Args:
+        args (Namespace): The arguments of the multi-account scan.
+    """
+    from prowler.providers.aws.aws_provider import AwsProvider
+    from prowler.providers.aws.lib.arn.arn import parse_iam_credentials_arn
+    from prowler.providers.aws.models import AWSAssumeRoleInfo
+
+    # Base credentials, to list the accounts of the organizational units
+    base_session = AwsProvider.setup_session(mfa=args.mfa, profile=args.profile)
+    base_credentials = base_session.get_credentials()
+    if base_credentials is None:
+        logger.critical("No AWS credentials found to assume the role in each account.")
+        sys.exit(1)
+    environment = dict(os.environ)
+    # The MFA token cannot be requested again in the processes of the accounts
+    if args.mfa:
+        mfa_credentials = base_credentials.get_frozen_credentials()
+        environment["AWS_ACCESS_KEY_ID"] = mfa_credentials.access_key
+        environment["AWS_SECRET_ACCESS_KEY"] = mfa_credentials.secret_key
+        environment["AWS_SESSION_TOKEN"] = mfa_credentials.token
+        if base_session.region_name:
+            environment["AWS_DEFAULT_REGION"] = base_session.region_name
+        environment.pop("AWS_PROFILE", None)
+        logger.warning(
+            "The MFA session credentials are passed to the processes of the accounts and cannot be refreshed, the scans of the accounts that do not finish before they expire will fail."
+        )
+
+    # Accounts to scan
+    accounts = list(args.accounts or [])
+    if args.organizational_units:
+        organizations_session = base_session
+        if args.organizations_role:
+            organizations_credentials = AwsProvider.assume_role(
+                base_session,
+                AWSAssumeRoleInfo(
+                    role_arn=parse_iam_credentials_arn(args.organizations_role),
+                    session_duration=args.session_duration,
+                    external_id=args.external_id,
+                    mfa_enabled=False,
+                    role_session_name=args.role_session_name,
+                ),
+            )
+            organizations_session = Session(
+                aws_access_key_id=organizations_credentials.aws_access_key_id,
+                aws_secret_access_key=organizations_credentials.aws_secret_access_key,
+                aws_session_token=organizations_credentials.aws_session_token,
+                region_name=base_session.region_name,
+            )
+        accounts.extend(
+            get_organizational_units_accounts(
+                organizations_session, args.organizational_units
+            )
+        )
+    # Remove the duplicated accounts keeping their order
+    accounts = list(dict.fromkeys(accounts))
+    if not accounts:
+        logger.critical("There are no AWS accounts to scan.")
+        sys.exit(1)
+
+    os.makedirs(args.output_directory, exist_ok=True)
+    merged_filename = args.output_filename or (
+        f"prowler-output-accounts-{output_file_timestamp}"
+    )
+    account_filenames = [
+        get_account_output_filename(args, account_id) for account_id in accounts
+    ]
+    parallel_accounts = max(getattr(args, "parallel_accounts", 1), 1)
+    print(
+        f"{Style.BRIGHT}Scanning {len(accounts)} AWS accounts, {parallel_accounts} in parallel. The console output of each account is in {args.output_directory}/<output filename>.log{Style.RESET_ALL}"
+    )
+
+    exit_codes = {}
+    with ThreadPoolExecutor(max_workers=parallel_accounts) as executor:
+        futures = {
+            executor.submit(
+                scan_account, args, account_id, environment, sys.argv[1:]
+            ): account_id
+            for account_id in accounts
+        }
+        for future in as_completed(futures):
+            account_id = futures[future]
+            exit_codes[account_id] = future.result()
+            # Exit code 3 means that the account has failed findings
+            if exit_codes[account_id] in (0, 3):
+                account_status = f"{Fore.GREEN}completed{Style.RESET_ALL}"
+            else:
+                account_status = f"{Fore.RED}failed with exit code {exit_codes[account_id]}{Style.RESET_ALL}"
+            print(
+                f"-> [{len(exit_codes)}/{len(accounts)}] AWS account {Fore.YELLOW}{account_id}{Style.RESET_ALL} {account_status}"
+            )
+
+    merged_outputs = merge_outputs(
+        args.output_directory, account_filenames, merged_filename
+    )
+    if merged_outputs:
+        print(f"\n{Style.BRIGHT}Merged outputs of the accounts:{Style.RESET_ALL}")
+        for merged_output in merged_outputs:
+            print(f" - {merged_output}")
+    if "html" in (getattr(args, "output_formats", None) or []):
+        print(
+            f"\n{Style.BRIGHT}The HTML outputs are not merged, each account keeps its own HTML output in {args.output_directory}.{Style.RESET_ALL}"
+        )
+
+    failed_accounts = [
+        account_id
+        for account_id, exit_code in exit_codes.items()
+        if exit_code not in (0, 3)
+    ]
+    if failed_accounts:
+        logger.error(
+            f"The scan of the AWS accounts {', '.join(failed_accounts)} failed, see their log files in {args.output_directory}."
+        )
+        sys.exit(1)
+    sys.exit(3 if 3 in exit_codes.values() else 0)
@@ -7,7 +7,6 @@ from boto3.dynamodb.conditions import Attr
 from prowler.lib.check.models import Check_Report_AWS
 from prowler.lib.logger import logger
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class AWSMutelist(Mutelist):
@@ -42,6 +41,7 @@ class AWSMutelist(Mutelist):
                 self.get_mutelist_file_from_local_file(mutelist_path)
         if self._mutelist:
             self._mutelist = self.validate_mutelist(self._mutelist)
+        self.compile_mutelist()
 
     def is_finding_muted(
         self,
@@ -53,7 +53,7 @@ class AWSMutelist(Mutelist):
             finding.check_metadata.CheckID,
             finding.region,
             finding.resource_id,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+            finding.resource_tags,
         )
 
     def get_mutelist_file_from_s3(self, aws_session: Session = None):
@@ -1,7 +1,19 @@
+import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import wraps
+from threading import RLock
+from typing import Awaitable, Callable
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.aws.config import (
+    AWS_SERVICE_MAX_ASYNC_CONCURRENCY,
+    AWS_SERVICE_MAX_WORKERS,
+)
+from prowler.providers.aws.lib.async_transport.async_transport import (
+    AWSAsyncTransport,
+    current_async_transport,
+)
 
 # TODO: review the following code
 # from prowler.providers.aws.aws_provider import (
@@ -9,7 +21,7 @@ from prowler.providers.aws.aws_provider import AwsProvider
 #     get_default_region,
 # )
 
-MAX_WORKERS = 10
+MAX_WORKERS = AWS_SERVICE_MAX_WORKERS
 
 
 class AWSService:
@@ -18,6 +30,8 @@ class AWSService:
     - Shared information like the account ID and ARN, the AWS partition and the checks audited
     - AWS Session
     - Thread pool for the __threading_call__
+    - Asyncio transport for the __async_call__, for the services with many API calls per resource
+    - Lazy attributes, collected on first access instead of within the service's __init__
     - Also handles if the AWS Service is Global
     """
 
@@ -62,11 +76,85 @@ class AWSService:
         # We cannot include this within an else because some services needs both the regional_clients
         # and a single client like S3
         self.region = provider.get_default_region(self.service)
-        self.client = self.session.client(self.service, self.region)
+        self.client = provider.get_client(self.service, self.region)
 
         # Thread pool for __threading_call__
         self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
 
+        # Lazy attributes, see register_lazy_attributes
+        self._lazy_attributes = {}
+        self._lazy_collected = set()
+        self._lazy_errors = {}
+        self._lazy_lock = RLock()
+
+    def __getattr__(self, name):
+        # __getattr__ is only called when the attribute has not been set yet,
+        # so it is used to collect the lazy attributes on their first access
+        lazy_attributes = self.__dict__.get("_lazy_attributes", {})
+        if name in lazy_attributes:
+            self.load_attributes(name)
+            if name in self.__dict__:
+                return self.__dict__[name]
+            # Surface the collector's error instead of a misleading missing attribute
+            collector, _ = lazy_attributes[name]
+            if collector in self._lazy_errors:
+                raise self._lazy_errors[collector]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def register_lazy_attributes(
+        self,
+        attributes: list[str],
+        collector: Callable[[], None],
+        depends_on: list[str] = None,
+    ):
+        """
+        Register attributes that are collected on demand, the first time they are accessed
+        or requested through load_attributes, instead of within the service's __init__.
+
+        Args:
+            attributes (list[str]): The attributes populated by the collector.
+            collector (Callable[[], None]): The function that sets and populates the attributes.
+            depends_on (list[str]): Lazy attributes the collector needs, loaded before running it.
+
+        Examples:
+            >>> self.register_lazy_attributes(["snapshots"], self._collect_snapshots)
+        """
+        for attribute in attributes:
+            self._lazy_attributes[attribute] = (collector, depends_on or [])
+
+    def load_attributes(self, *attributes: str):
+        """
+        Collect the given lazy attributes if they have not been collected yet. Non-lazy
+        attributes are ignored, so it is safe to call it with any attribute name.
+
+        Args:
+            attributes (str): The attributes to load.
+
+        Examples:
+            >>> service.load_attributes("snapshots", "images")
+        """
+        for attribute in attributes:
+            collector, depends_on = self._lazy_attributes.get(attribute, (None, []))
+            if collector is None or collector in self._lazy_collected:
+                continue
+            with self._lazy_lock:
+                if collector in self._lazy_collected:
+                    continue
+                # Dependencies are loaded from this thread before the collector starts its own threads
+                self.load_attributes(*depends_on)
+                logger.info(
+                    f"{self.service.upper()} - Collecting '{attribute}' on demand..."
+                )
+                try:
+                    collector()
+                except Exception as error:
+                    self._lazy_errors[collector] = error
+                    raise
+                finally:
+                    self._lazy_collected.add(collector)
+
     def __get_session__(self):
         return self.session
 
@@ -102,6 +190,94 @@ class AWSService:
                 # Handle exceptions if necessary
                 pass  # Replace 'pass' with any additional exception handling logic. Currently handled within the called function
 
+    def __async_call__(
+        self,
+        call: Callable[..., Awaitable],
+        iterator=None,
+        max_concurrency: int = None,
+    ):
+        """
+        Asyncio counterpart of __threading_call__, for the collections with many API calls per resource. The
+        coroutine is awaited for each item, up to max_concurrency at the same time, making its API calls with
+        __async_api_call__, so hundreds of them can be in flight without a thread for each one.
+
+        The asyncio collection is enabled with the service_async_collection of the audit config. Otherwise, the
+        coroutine of each item runs in the thread pool of the service, as with __threading_call__.
+
+        Args:
+            call (Callable[..., Awaitable]): The coroutine function, called with each item.
+            iterator: The items, the regional clients by default.
+            max_concurrency (int): The maximum number of items processed at the same time, the
+                service_async_max_concurrency of the audit config by default.
+
+        Examples:
+            >>> self.__async_call__(self._get_bucket_policy, self.buckets.values())
+        """
+        if not self.audit_config.get("service_async_collection", False):
+            # The asyncio collection is opt-in, by default each coroutine runs in the thread pool of the service
+
+            @wraps(call)
+            def call_in_thread(item):
+                return asyncio.run(call(item))
+
+            return self.__threading_call__(call_in_thread, iterator)
+
+        items = list(
+            iterator if iterator is not None else self.regional_clients.values()
+        )
+        if max_concurrency is None:
+            max_concurrency = self.audit_config.get(
+                "service_async_max_concurrency", AWS_SERVICE_MAX_ASYNC_CONCURRENCY
+            )
+
+        call_name = call.__name__.strip("_")
+        call_name = " ".join([x.capitalize() for x in call_name.split("_")])
+        if iterator is None:
+            logger.info(
+                f"{self.service.upper()} - Starting asyncio tasks for '{call_name}' function across {len(items)} regions..."
+            )
+        else:
+            logger.info(
+                f"{self.service.upper()} - Starting asyncio tasks for '{call_name}' function to process {len(items)} items..."
+            )
+
+        async def process_items():
+            semaphore = asyncio.Semaphore(max_concurrency)
+            async with AWSAsyncTransport(max_concurrency) as transport:
+                current_async_transport.set(transport)
+
+                async def process_item(item):
+                    async with semaphore:
+                        await call(item)
+
+                # As in __threading_call__, the errors are handled within the called function
+                await asyncio.gather(
+                    *(process_item(item) for item in items), return_exceptions=True
+                )
+
+        asyncio.run(process_items())
+
+    async def __async_api_call__(self, client, method_name: str, **kwargs) -> dict:
+        """
+        Make an API call of the given boto3 client from a coroutine of __async_call__.
+
+        Args:
+            client: The boto3 client.
+            method_name (str): The client method of the API call, e.g. get_bucket_policy.
+            kwargs: The parameters of the API call.
+
+        Returns:
+            dict: The response of the API call, as returned by the client method.
+
+        Examples:
+            >>> await self.__async_api_call__(regional_client, "get_bucket_policy", Bucket=bucket.name)
+        """
+        transport = current_async_transport.get()
+        if transport is None:
+            # Without the asyncio collection the coroutine runs in its own thread, see __async_call__
+            return getattr(client, method_name)(**kwargs)
+        return await transport.call(client, method_name, **kwargs)
+
     def get_unknown_arn(self, resource_type: str = None, region: str = None) -> str:
         """
         Generate an unknown ARN for the service
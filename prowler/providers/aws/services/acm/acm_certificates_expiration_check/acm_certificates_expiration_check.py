@@ -19,9 +19,13 @@ class acm_certificates_expiration_check(Check):
                     report.status = "FAIL"
                     if certificate.expiration_days < 0:
                         report.status_extended = f"ACM Certificate {certificate.id} for {certificate.name} has expired ({abs(certificate.expiration_days)} days ago)."
-                        report.check_metadata.Severity = Severity.high
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.high}
+                        )
                     else:
                         report.status_extended = f"ACM Certificate {certificate.id} for {certificate.name} is about to expire in {certificate.expiration_days} days."
-                        report.check_metadata.Severity = Severity.medium
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.medium}
+                        )
                 findings.append(report)
         return findings
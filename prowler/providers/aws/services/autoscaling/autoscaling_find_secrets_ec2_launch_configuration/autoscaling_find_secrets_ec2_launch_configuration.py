@@ -4,7 +4,7 @@ from base64 import b64decode
 from prowler.config.config import encoding_format_utf_8
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.lib.logger import logger
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import SecretsScanner
 from prowler.providers.aws.services.autoscaling.autoscaling_client import (
     autoscaling_client,
 )
@@ -13,15 +13,12 @@ from prowler.providers.aws.services.autoscaling.autoscaling_client import (
 class autoscaling_find_secrets_ec2_launch_configuration(Check):
     def execute(self):
         findings = []
-        secrets_ignore_patterns = autoscaling_client.audit_config.get(
-            "secrets_ignore_patterns", []
-        )
+        # The User Data of all the launch configurations is scanned in one batch
+        configurations_user_data = {}
         for (
             configuration_arn,
             configuration,
         ) in autoscaling_client.launch_configurations.items():
-            report = Check_Report_AWS(metadata=self.metadata(), resource=configuration)
-
             if configuration.user_data:
                 user_data = b64decode(configuration.user_data)
                 try:
@@ -41,14 +38,22 @@ class autoscaling_find_secrets_ec2_launch_configuration(Check):
                         f"{configuration.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                     )
                     continue
+                configurations_user_data[configuration_arn] = user_data
+        configurations_secrets = SecretsScanner.from_audit_config(
+            autoscaling_client.audit_config
+        ).scan_batch(configurations_user_data)
+
+        for (
+            configuration_arn,
+            configuration,
+        ) in autoscaling_client.launch_configurations.items():
+            report = Check_Report_AWS(metadata=self.metadata(), resource=configuration)
 
-                has_secrets = detect_secrets_scan(
-                    data=user_data,
-                    excluded_secrets=secrets_ignore_patterns,
-                    detect_secrets_plugins=autoscaling_client.audit_config.get(
-                        "detect_secrets_plugins"
-                    ),
-                )
+            if configuration.user_data:
+                # The User Data that cannot be decoded is not reported
+                if configuration_arn not in configurations_secrets:
+                    continue
+                has_secrets = configurations_secrets[configuration_arn]
 
                 if has_secrets:
                     report.status = "FAIL"
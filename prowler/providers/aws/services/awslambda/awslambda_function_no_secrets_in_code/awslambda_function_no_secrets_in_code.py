@@ -1,20 +1,56 @@
-import os
-import tempfile
-
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import SecretsScanner
 from prowler.providers.aws.services.awslambda.awslambda_client import awslambda_client
+from prowler.providers.aws.services.awslambda.lib.code import (
+    LambdaCodeSecretsCache,
+    scan_lambda_code,
+)
 
 
 class awslambda_function_no_secrets_in_code(Check):
     def execute(self):
         findings = []
         if awslambda_client.functions:
-            secrets_ignore_patterns = awslambda_client.audit_config.get(
-                "secrets_ignore_patterns", []
+            secrets_scanner = SecretsScanner.from_audit_config(
+                awslambda_client.audit_config
             )
-            for function, function_code in awslambda_client._get_function_code():
+            code_secrets_cache = LambdaCodeSecretsCache(secrets_scanner)
+
+            # The functions deployed from the same code package are scanned once
+            functions_by_code = {}
+            for function in awslambda_client.functions.values():
+                functions_by_code.setdefault(
+                    function.code_sha256 or function.arn, []
+                ).append(function)
+
+            code_secrets = {}
+            functions_to_fetch = []
+            for code_key, functions in functions_by_code.items():
+                cached_secrets = code_secrets_cache.get(functions[0].code_sha256)
+                if cached_secrets is not None:
+                    code_secrets[code_key] = cached_secrets
+                else:
+                    functions_to_fetch.append(functions[0])
+
+            for function, function_code in awslambda_client._get_function_code(
+                functions_to_fetch
+            ):
                 if function_code:
+                    secrets_findings = scan_lambda_code(
+                        function_code.code_zip, secrets_scanner
+                    )
+                    code_secrets[function.code_sha256 or function.arn] = (
+                        secrets_findings
+                    )
+                    code_secrets_cache.set(function.code_sha256, secrets_findings)
+            code_secrets_cache.save()
+
+            for code_key, functions in functions_by_code.items():
+                # The functions whose code could not be downloaded are not reported
+                if code_key not in code_secrets:
+                    continue
+                secrets_findings = code_secrets[code_key]
+                for function in functions:
                     report = Check_Report_AWS(
                         metadata=self.metadata(), resource=function
                     )
@@ -23,42 +59,10 @@ class awslambda_function_no_secrets_in_code(Check):
                     report.status_extended = (
                         f"No secrets found in Lambda function {function.name} code."
                     )
-                    with tempfile.TemporaryDirectory() as tmp_dir_name:
-                        function_code.code_zip.extractall(tmp_dir_name)
-                        # List all files
-                        files_in_zip = next(os.walk(tmp_dir_name))[2]
-                        secrets_findings = []
-                        for file in files_in_zip:
-                            detect_secrets_output = detect_secrets_scan(
-                                file=f"{tmp_dir_name}/{file}",
-                                excluded_secrets=secrets_ignore_patterns,
-                                detect_secrets_plugins=awslambda_client.audit_config.get(
-                                    "detect_secrets_plugins",
-                                ),
-                            )
-                            if detect_secrets_output:
-                                for (
-                                    secret
-                                ) in (
-                                    detect_secrets_output
-                                ):  # Appears that only 1 file is being scanned at a time, so could rework this
-                                    output_file_name = secret["filename"].replace(
-                                        f"{tmp_dir_name}/", ""
-                                    )
-                                    secrets_string = ", ".join(
-                                        [
-                                            f"{secret['type']} on line {secret['line_number']}"
-                                            for secret in detect_secrets_output
-                                        ]
-                                    )
-                                    secrets_findings.append(
-                                        f"{output_file_name}: {secrets_string}"
-                                    )
-
-                        if secrets_findings:
-                            final_output_string = "; ".join(secrets_findings)
-                            report.status = "FAIL"
-                            report.status_extended = f"Potential {'secrets' if len(secrets_findings) > 1 else 'secret'} found in Lambda function {function.name} code -> {final_output_string}."
+                    if secrets_findings:
+                        final_output_string = "; ".join(secrets_findings)
+                        report.status = "FAIL"
+                        report.status_extended = f"Potential {'secrets' if len(secrets_findings) > 1 else 'secret'} found in Lambda function {function.name} code -> {final_output_string}."
 
                     findings.append(report)
 
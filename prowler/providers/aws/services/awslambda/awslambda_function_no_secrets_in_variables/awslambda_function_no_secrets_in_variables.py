@@ -1,15 +1,22 @@
 import json
 
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import SecretsScanner
 from prowler.providers.aws.services.awslambda.awslambda_client import awslambda_client
 
 
 class awslambda_function_no_secrets_in_variables(Check):
     def execute(self):
         findings = []
-        secrets_ignore_patterns = awslambda_client.audit_config.get(
-            "secrets_ignore_patterns", []
+        # The variables of all the functions are scanned in one batch
+        functions_secrets = SecretsScanner.from_audit_config(
+            awslambda_client.audit_config
+        ).scan_batch(
+            {
+                function.arn: json.dumps(function.environment, indent=2)
+                for function in awslambda_client.functions.values()
+                if function.environment
+            }
         )
         for function in awslambda_client.functions.values():
             report = Check_Report_AWS(metadata=self.metadata(), resource=function)
@@ -20,13 +27,7 @@ class awslambda_function_no_secrets_in_variables(Check):
             )
 
             if function.environment:
-                detect_secrets_output = detect_secrets_scan(
-                    data=json.dumps(function.environment, indent=2),
-                    excluded_secrets=secrets_ignore_patterns,
-                    detect_secrets_plugins=awslambda_client.audit_config.get(
-                        "detect_secrets_plugins",
-                    ),
-                )
+                detect_secrets_output = functions_secrets.get(function.arn)
                 original_env_vars = []
                 for name, value in function.environment.items():
                     original_env_vars.append(name)
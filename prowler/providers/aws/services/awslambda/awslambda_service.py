@@ -46,6 +46,7 @@ class Lambda(AWSService):
                             vpc_id=vpc_config.get("VpcId"),
                             subnet_ids=set(vpc_config.get("SubnetIds", [])),
                             region=regional_client.region,
+                            code_sha256=function.get("CodeSha256"),
                         )
                         if "Runtime" in function:
                             self.functions[lambda_arn].runtime = function["Runtime"]
@@ -62,14 +63,17 @@ class Lambda(AWSService):
                 f" {error}"
             )
 
-    def _get_function_code(self):
+    def _get_function_code(self, functions: list = None):
+        """Yields the given functions, or all of them, with their code as it is downloaded."""
         logger.info("Lambda - Getting Function Code...")
+        if functions is None:
+            functions = self.functions.values()
         # Use a thread pool handle the queueing and execution of the _fetch_function_code tasks, up to max_workers tasks concurrently.
         lambda_functions_to_fetch = {
             self.thread_pool.submit(
                 self._fetch_function_code, function.name, function.region
             ): function
-            for function in self.functions.values()
+            for function in functions
         }
 
         for fetched_lambda_code in as_completed(lambda_functions_to_fetch):
@@ -205,3 +209,4 @@ class Function(BaseModel):
     vpc_id: Optional[str] = None
     subnet_ids: Optional[set] = None
     tags: Optional[list] = []
+    code_sha256: Optional[str] = None
@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Optional
+from zipfile import ZipFile
+
+from prowler.config.config import encoding_format_utf_8, prowler_version
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import SecretsScanner
+
+# Set PROWLER_LAMBDA_CODE_CACHE=false to scan the code of all the functions in every scan
+LAMBDA_CODE_CACHE_ENABLED_VARIABLE = "PROWLER_LAMBDA_CODE_CACHE"
+LAMBDA_CODE_CACHE_DIRECTORY_VARIABLE = "PROWLER_LAMBDA_CODE_CACHE_DIRECTORY"
+default_lambda_code_cache_directory = os.path.join(
+    os.path.expanduser("~"), ".cache", "prowler", "lambda_code"
+)
+lambda_code_cache_file_prefix = "secrets_"
+lambda_code_cache_file_suffix = ".json"
+
+# Maximum size in bytes of the files of the code packages scanned for secrets, the bigger ones are skipped
+LAMBDA_CODE_MAX_FILE_SIZE = 5 * 1024 * 1024
+# Extensions of the compiled, archive and media files of the code packages, which are not scanned for secrets
+LAMBDA_CODE_SKIPPED_EXTENSIONS = frozenset(
+    [
+        ".bin",
+        ".class",
+        ".dll",
+        ".dylib",
+        ".egg",
+        ".exe",
+        ".gif",
+        ".gz",
+        ".ico",
+        ".jar",
+        ".jpeg",
+        ".jpg",
+        ".node",
+        ".pdf",
+        ".png",
+        ".pyc",
+        ".so",
+        ".tar",
+        ".ttf",
+        ".wasm",
+        ".whl",
+        ".woff",
+        ".woff2",
+        ".zip",
+    ]
+)
+
+
+def is_lambda_code_cache_enabled() -> bool:
+    """Returns whether the cache of the secrets found in the Lambda code is enabled."""
+    return os.getenv(LAMBDA_CODE_CACHE_ENABLED_VARIABLE, "true").lower() not in (
+        "false",
+        "0",
+        "no",
+    )
+
+
+def get_lambda_code_cache_directory() -> str:
+    """Returns the directory where the cache of the secrets found in the Lambda code is stored."""
+    return os.getenv(
+        LAMBDA_CODE_CACHE_DIRECTORY_VARIABLE, default_lambda_code_cache_directory
+    )
+
+
+def get_lambda_code_files(code_zip: ZipFile) -> dict:
+    """
+    Read the text files of a Lambda code package from memory, including the ones in subdirectories.
+
+    The files bigger than LAMBDA_CODE_MAX_FILE_SIZE, the ones with the extensions of
+    LAMBDA_CODE_SKIPPED_EXTENSIONS and the binary ones are skipped.
+
+    Args:
+        code_zip (ZipFile): The code package.
+
+    Returns:
+        dict: The content of the files, by path in the package.
+    """
+    files = {}
+    for member in code_zip.infolist():
+        if (
+            member.is_dir()
+            or os.path.splitext(member.filename)[1].lower()
+            in LAMBDA_CODE_SKIPPED_EXTENSIONS
+        ):
+            continue
+        if member.file_size > LAMBDA_CODE_MAX_FILE_SIZE:
+            logger.info(
+                f"Lambda - {member.filename} not scanned for secrets, it is bigger than {LAMBDA_CODE_MAX_FILE_SIZE} bytes"
+            )
+            continue
+        try:
+            files[member.filename] = code_zip.read(member).decode(encoding_format_utf_8)
+        except UnicodeDecodeError:
+            # The binary files are ignored, as detect-secrets does
+            continue
+    return files
+
+
+def scan_lambda_code(code_zip: ZipFile, secrets_scanner: SecretsScanner) -> list:
+    """
+    Scan the files of a Lambda code package for secrets, without extracting them to disk.
+
+    Args:
+        code_zip (ZipFile): The code package.
+        secrets_scanner (SecretsScanner): The secrets scanner.
+
+    Returns:
+        list: The secrets found in each file, as "<file>: <secret type> on line <line>, ..." strings.
+    """
+    files = get_lambda_code_files(code_zip)
+    files_secrets = secrets_scanner.scan_batch(
+        files, file_names={file_name: file_name for file_name in files}
+    )
+    secrets_findings = []
+    for file_name, file_secrets in files_secrets.items():
+        if file_secrets:
+            secrets_string = ", ".join(
+                [
+                    f"{secret['type']} on line {secret['line_number']}"
+                    for secret in file_secrets
+                ]
+            )
+            secrets_findings.append(f"{file_name}: {secrets_string}")
+    return secrets_findings
+
+
+class LambdaCodeSecretsCache:
+    """
+    LambdaCodeSecretsCache keeps the secrets found in the Lambda code packages between scans, by the SHA-256 of
+    the code, so the functions whose code did not change are neither downloaded nor scanned again.
+
+    The cache file depends on the Prowler version and the settings of the secrets scanner, so the code is scanned
+    again when any of them changes.
+
+    Attributes:
+        enabled (bool): Whether the cache is enabled, see PROWLER_LAMBDA_CODE_CACHE.
+        cache_file (str): The cache file of the settings of the secrets scanner.
+
+    Examples:
+        >>> cache = LambdaCodeSecretsCache(secrets_scanner)
+        >>> cache.set(function.code_sha256, scan_lambda_code(code_zip, secrets_scanner))
+        >>> cache.save()
+    """
+
+    def __init__(self, secrets_scanner: SecretsScanner):
+        self.enabled = is_lambda_code_cache_enabled()
+        fingerprint = hashlib.sha256(
+            json.dumps(
+                {
+                    "prowler_version": prowler_version,
+                    "settings": secrets_scanner.settings,
+                    "max_file_size": LAMBDA_CODE_MAX_FILE_SIZE,
+                    "skipped_extensions": sorted(LAMBDA_CODE_SKIPPED_EXTENSIONS),
+                },
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+        self.cache_file = os.path.join(
+            get_lambda_code_cache_directory(),
+            f"{lambda_code_cache_file_prefix}{fingerprint}{lambda_code_cache_file_suffix}",
+        )
+        self._secrets = self._load() if self.enabled else {}
+        self._updated = False
+
+    def _load(self) -> dict:
+        try:
+            with open(self.cache_file, "r", encoding=encoding_format_utf_8) as f:
+                secrets = json.load(f)
+            return secrets if isinstance(secrets, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as error:
+            logger.debug(
+                f"Lambda code cache file {self.cache_file} could not be read -- {error.__class__.__name__}: {error}"
+            )
+            return {}
+
+    def get(self, code_sha256: str) -> Optional[list]:
+        """Returns the secrets found in the code with the given SHA-256, or None if it is not cached."""
+        if not code_sha256:
+            return None
+        return self._secrets.get(code_sha256)
+
+    def set(self, code_sha256: str, secrets_findings: list):
+        """Stores the secrets found in the code with the given SHA-256."""
+        if code_sha256:
+            self._secrets[code_sha256] = secrets_findings
+            self._updated = True
+
+    def save(self):
+        """Writes the cache file if it changed, removing the cache files of other settings."""
+        if not self.enabled or not self._updated:
+            return
+        cache_directory = os.path.dirname(self.cache_file)
+        try:
+            os.makedirs(cache_directory, exist_ok=True)
+            # Write to a temporary file first so concurrent runs never read a partial file
+            file_descriptor, temporary_file = tempfile.mkstemp(dir=cache_directory)
+            try:
+                # The code scanned by other runs since the cache was loaded is kept
+                self._secrets = {**self._load(), **self._secrets}
+                with os.fdopen(
+                    file_descriptor, "w", encoding=encoding_format_utf_8
+                ) as f:
+                    json.dump(self._secrets, f)
+                os.replace(temporary_file, self.cache_file)
+            except Exception:
+                os.remove(temporary_file)
+                raise
+
+            with os.scandir(cache_directory) as cache_files:
+                for outdated_file in cache_files:
+                    if (
+                        outdated_file.name.startswith(lambda_code_cache_file_prefix)
+                        and outdated_file.name.endswith(lambda_code_cache_file_suffix)
+                        and outdated_file.path != self.cache_file
+                    ):
+                        os.remove(outdated_file.path)
+            self._updated = False
+        except Exception as error:
+            logger.debug(
+                f"Lambda code cache file {self.cache_file} could not be written -- {error.__class__.__name__}: {error}"
+            )
@@ -1,5 +1,5 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import SecretsScanner
 from prowler.providers.aws.services.cloudformation.cloudformation_client import (
     cloudformation_client,
 )
@@ -11,28 +11,27 @@ class cloudformation_stack_outputs_find_secrets(Check):
     def execute(self):
         """Execute the cloudformation_stack_outputs_find_secrets check"""
         findings = []
-        secrets_ignore_patterns = cloudformation_client.audit_config.get(
-            "secrets_ignore_patterns", []
-        )
+        # The Outputs of all the Stacks are scanned in one batch
+        stacks_outputs = {}
         for stack in cloudformation_client.stacks:
-            report = Check_Report_AWS(metadata=self.metadata(), resource=stack)
-            report.status = "PASS"
-            report.status_extended = (
-                f"No secrets found in CloudFormation Stack {stack.name} Outputs."
-            )
             if stack.outputs:
                 data = ""
                 # Store the CloudFormation Stack Outputs into a file
                 for output in stack.outputs:
                     data += f"{output}\n"
+                stacks_outputs[stack.arn] = data
+        stacks_secrets = SecretsScanner.from_audit_config(
+            cloudformation_client.audit_config
+        ).scan_batch(stacks_outputs)
 
-                detect_secrets_output = detect_secrets_scan(
-                    data=data,
-                    excluded_secrets=secrets_ignore_patterns,
-                    detect_secrets_plugins=cloudformation_client.audit_config.get(
-                        "detect_secrets_plugins",
-                    ),
-                )
+        for stack in cloudformation_client.stacks:
+            report = Check_Report_AWS(metadata=self.metadata(), resource=stack)
+            report.status = "PASS"
+            report.status_extended = (
+                f"No secrets found in CloudFormation Stack {stack.name} Outputs."
+            )
+            if stack.outputs:
+                detect_secrets_output = stacks_secrets.get(stack.arn)
                 # If secrets are found, update the report status
                 if detect_secrets_output:
                     secrets_string = ", ".join(
@@ -1,5 +1,8 @@
-from datetime import datetime, timedelta
-from typing import Optional
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Callable, Optional
 
 from botocore.client import ClientError
 from pydantic.v1 import BaseModel
@@ -15,6 +18,8 @@ class Cloudtrail(AWSService):
         super().__init__(__class__.__name__, provider)
         self.trail_arn_template = f"arn:{self.audited_partition}:cloudtrail:{self.region}:{self.audited_account}:trail"
         self.trails = {}
+        # CloudTrail events shared by the threat detection checks
+        self.event_store = CloudTrailEventStore(self._lookup_events, self.thread_pool)
         self.__threading_call__(self._get_trails)
         if self.trails:
             self._get_trail_status()
@@ -193,19 +198,22 @@ class Cloudtrail(AWSService):
 
     def _lookup_events(self, trail, event_name, minutes):
         logger.info("CloudTrail - Lookup Events...")
+        events = []
         try:
             regional_client = self.regional_clients[trail.region]
-            response = regional_client.lookup_events(
+            lookup_events_paginator = regional_client.get_paginator("lookup_events")
+            for page in lookup_events_paginator.paginate(
                 LookupAttributes=[
                     {"AttributeKey": "EventName", "AttributeValue": event_name}
                 ],
-                StartTime=datetime.now() - timedelta(minutes=minutes),
-            )
-            return response.get("Events")
+                StartTime=datetime.now(timezone.utc) - timedelta(minutes=minutes),
+            ):
+                events.extend(page.get("Events", []))
         except Exception as error:
             logger.error(
-                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                f"{trail.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
+        return events
 
     def _list_tags_for_resource(self):
         logger.info("CloudTrail - List Tags...")
@@ -253,3 +261,156 @@ class Trail(BaseModel):
     data_events: list[Event_Selector] = []
     tags: Optional[list] = []
     has_insight_selectors: str = None
+
+
+class CloudTrailEvent(BaseModel):
+    event_name: str
+    # Region of the trail whose events were looked up
+    region: str
+    event_time: Optional[datetime] = None
+    principal_arn: Optional[str] = None
+    principal_type: Optional[str] = None
+
+
+class CloudTrailEventStore:
+    """
+    CloudTrailEventStore looks up the CloudTrail events of each event name once, following all the pages of
+    LookupEvents, and indexes them by event name and principal ARN, so the threat detection checks share the
+    events of the same time window instead of looking them up again.
+
+    The event names of a query are looked up concurrently, and a check waits for the lookups of the event
+    names already requested by another check instead of repeating them.
+
+    Attributes:
+        lookup_events (Callable): Returns the raw events of a trail, event name and minutes,
+            see Cloudtrail._lookup_events.
+    """
+
+    def __init__(
+        self, lookup_events: Callable[..., list], thread_pool: ThreadPoolExecutor
+    ):
+        self.lookup_events = lookup_events
+        self._thread_pool = thread_pool
+        # (region, event name) -> (minutes looked up, future of the events)
+        self._lookups = {}
+        # principal ARN -> (region, event name) -> events
+        self._principal_events = {}
+        self._lock = Lock()
+
+    def _load(self, trail: "Trail", event_name: str, minutes: int) -> list:
+        events = []
+        for event in self.lookup_events(
+            trail=trail, event_name=event_name, minutes=minutes
+        ):
+            try:
+                # The event is only decoded once for all the checks
+                user_identity = json.loads(event["CloudTrailEvent"]).get(
+                    "userIdentity", {}
+                )
+                events.append(
+                    CloudTrailEvent(
+                        event_name=event_name,
+                        region=trail.region,
+                        event_time=event.get("EventTime"),
+                        principal_arn=user_identity.get("arn"),
+                        principal_type=user_identity.get("type"),
+                    )
+                )
+            except Exception as error:
+                logger.error(
+                    f"{trail.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        principal_events = {}
+        for event in events:
+            if event.principal_arn:
+                principal_events.setdefault(event.principal_arn, []).append(event)
+        with self._lock:
+            # The lookup of a wider time window started meanwhile indexes its own events
+            if self._lookups.get((trail.region, event_name), (minutes,))[0] != minutes:
+                return events
+            for events_by_name in self._principal_events.values():
+                events_by_name.pop((trail.region, event_name), None)
+            for principal_arn, principal_event_list in principal_events.items():
+                self._principal_events.setdefault(principal_arn, {})[
+                    (trail.region, event_name)
+                ] = principal_event_list
+        return events
+
+    def get_events(self, trails, event_names: list, minutes: int) -> list:
+        """
+        Get the CloudTrail events of the given event names from the last minutes, looking up the ones that
+        have not been looked up for that time window yet.
+
+        Args:
+            trails: The trails whose regions are looked up.
+            event_names (list): The event names.
+            minutes (int): The minutes of the time window.
+
+        Returns:
+            list[CloudTrailEvent]: The events.
+        """
+        lookups = []
+        with self._lock:
+            for trail in trails:
+                for event_name in dict.fromkeys(event_names):
+                    key = (trail.region, event_name)
+                    lookup = self._lookups.get(key)
+                    # The events of a wider time window include the ones of a narrower one
+                    if lookup is None or lookup[0] < minutes:
+                        lookup = (
+                            minutes,
+                            self._thread_pool.submit(
+                                self._load, trail, event_name, minutes
+                            ),
+                        )
+                        self._lookups[key] = lookup
+                    lookups.append(lookup[1])
+        if not lookups:
+            return []
+        start_time = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+        return [
+            event
+            for lookup in lookups
+            for event in lookup.result()
+            if not event.event_time or event.event_time >= start_time
+        ]
+
+    def get_principal_events(self, principal_arn: str) -> list:
+        """
+        Get the CloudTrail events of the given principal ARN among the events looked up.
+
+        Args:
+            principal_arn (str): The ARN of the principal of the events.
+
+        Returns:
+            list[CloudTrailEvent]: The events.
+        """
+        with self._lock:
+            return [
+                event
+                for events in self._principal_events.get(principal_arn, {}).values()
+                for event in events
+            ]
+
+    def get_principal_event_names(
+        self, trails, event_names: list, minutes: int
+    ) -> dict:
+        """
+        Get the event names of each principal among the CloudTrail events of the given event names from the
+        last minutes. The events without principal ARN, like the ones of the AWS services, are ignored.
+
+        Args:
+            trails: The trails whose regions are looked up.
+            event_names (list): The event names.
+            minutes (int): The minutes of the time window.
+
+        Returns:
+            dict: The event names by principal ARN and type.
+        """
+        principal_event_names = {}
+        for event in self.get_events(trails, event_names, minutes):
+            if event.principal_arn:
+                principal_event_names.setdefault(
+                    (event.principal_arn, event.principal_type), set()
+                ).add(event.event_name)
+        return principal_event_names
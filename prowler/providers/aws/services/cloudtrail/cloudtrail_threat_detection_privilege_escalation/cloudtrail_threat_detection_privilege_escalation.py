@@ -1,5 +1,3 @@
-import json
-
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.providers.aws.services.cloudtrail.cloudtrail_client import (
     cloudtrail_client,
@@ -74,7 +72,6 @@ class cloudtrail_threat_detection_privilege_escalation(Check):
             default_threat_detection_privilege_escalation_actions,
         )
 
-        potential_privilege_escalation = {}
         found_potential_privilege_escalation = False
         multiregion_trail = None
         # Check if any trail is multi-region so we only need to check once
@@ -87,33 +84,13 @@ class cloudtrail_threat_detection_privilege_escalation(Check):
             if not multiregion_trail
             else [multiregion_trail]
         )
-        for trail in trails_to_scan:
-            for event_name in privilege_escalation_actions:
-                for event_log in cloudtrail_client._lookup_events(
-                    trail=trail,
-                    event_name=event_name,
-                    minutes=threat_detection_minutes,
-                ):
-                    event_log = json.loads(event_log["CloudTrailEvent"])
-                    if (
-                        "arn" in event_log["userIdentity"]
-                    ):  # Ignore event logs without ARN since they are AWS services
-                        if (
-                            event_log["userIdentity"]["arn"],
-                            event_log["userIdentity"]["type"],
-                        ) not in potential_privilege_escalation:
-                            potential_privilege_escalation[
-                                (
-                                    event_log["userIdentity"]["arn"],
-                                    event_log["userIdentity"]["type"],
-                                )
-                            ] = set()
-                        potential_privilege_escalation[
-                            (
-                                event_log["userIdentity"]["arn"],
-                                event_log["userIdentity"]["type"],
-                            )
-                        ].add(event_name)
+        potential_privilege_escalation = (
+            cloudtrail_client.event_store.get_principal_event_names(
+                trails=trails_to_scan,
+                event_names=privilege_escalation_actions,
+                minutes=threat_detection_minutes,
+            )
+        )
         for aws_identity, actions in potential_privilege_escalation.items():
             identity_threshold = round(
                 len(actions) / len(privilege_escalation_actions), 2
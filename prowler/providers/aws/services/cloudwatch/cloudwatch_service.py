@@ -7,7 +7,9 @@ from pydantic.v1 import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.utils.utils import SecretsScanner
 from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.services.cloudwatch.lib.log_events import LogEventsWatermarks
 
 
 class CloudWatch(AWSService):
@@ -89,6 +91,7 @@ class Logs(AWSService):
         self.__threading_call__(self._describe_resource_policies)
         self.metric_filters = []
         self.__threading_call__(self._describe_metric_filters)
+        self.log_events_watermarks = None
         if self.log_groups:
             if (
                 "cloudwatch_log_group_no_secrets_in_logs"
@@ -97,6 +100,11 @@ class Logs(AWSService):
                 self.events_per_log_group_threshold = (
                     1000  # The threshold for number of events to return per log group.
                 )
+                # Only the log events written since the previous scan are retrieved in the incremental scans
+                if self.audit_config.get("log_group_secrets_incremental_scan", False):
+                    self.log_events_watermarks = LogEventsWatermarks(
+                        SecretsScanner.from_audit_config(self.audit_config)
+                    )
                 self.__threading_call__(self._get_log_events)
             self.__threading_call__(
                 self._list_tags_for_resource, self.log_groups.values()
@@ -203,15 +211,34 @@ class Logs(AWSService):
             f"CloudWatch Logs - Retrieving log events for {total_log_groups} log groups in {regional_client.region}..."
         )
         try:
+            filter_log_events_paginator = regional_client.get_paginator(
+                "filter_log_events"
+            )
             for count, log_group in enumerate(regional_log_groups, start=1):
-                events = regional_client.filter_log_events(
-                    logGroupName=log_group.name,
-                    limit=self.events_per_log_group_threshold,
-                )["events"]
-                for event in events:
-                    if event["logStreamName"] not in log_group.log_streams:
-                        log_group.log_streams[event["logStreamName"]] = []
-                    log_group.log_streams[event["logStreamName"]].append(event)
+                filter_parameters = {"logGroupName": log_group.name}
+                start_time = None
+                if self.log_events_watermarks:
+                    start_time = self.log_events_watermarks.get_start_time(
+                        log_group.arn
+                    )
+                    if start_time is not None:
+                        filter_parameters["startTime"] = start_time
+                for page in filter_log_events_paginator.paginate(
+                    **filter_parameters,
+                    PaginationConfig={"MaxItems": self.events_per_log_group_threshold},
+                ):
+                    for event in page["events"]:
+                        # The log events at the start time were already scanned
+                        if (
+                            start_time is not None
+                            and self.log_events_watermarks.is_scanned(
+                                log_group.arn, event
+                            )
+                        ):
+                            continue
+                        if event["logStreamName"] not in log_group.log_streams:
+                            log_group.log_streams[event["logStreamName"]] = []
+                        log_group.log_streams[event["logStreamName"]].append(event)
                 if count % 10 == 0:
                     logger.info(
                         f"CloudWatch Logs - Retrieved log events for {count}/{total_log_groups} log groups in {regional_client.region}..."
@@ -293,7 +320,7 @@ class LogGroup(BaseModel):
     never_expire: bool
     kms_id: Optional[str]
     region: str
-    log_streams: dict[str, list[str]] = (
+    log_streams: dict[str, list[dict]] = (
         {}
     )  # Log stream name as the key, array of events as the value
     tags: Optional[list] = []
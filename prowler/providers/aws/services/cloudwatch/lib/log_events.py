@@ -0,0 +1,249 @@
+import hashlib
+import json
+import os
+import tempfile
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Optional
+
+from prowler.config.config import encoding_format_utf_8, prowler_version
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import SecretsScanner
+
+LOG_EVENTS_CACHE_DIRECTORY_VARIABLE = "PROWLER_LOG_EVENTS_CACHE_DIRECTORY"
+default_log_events_cache_directory = os.path.join(
+    os.path.expanduser("~"), ".cache", "prowler", "cloudwatch_logs"
+)
+log_events_watermarks_file_name = "watermarks.json"
+
+# Maximum size in characters of the chunks of log events scanned for secrets together
+LOG_EVENTS_CHUNK_MAX_SIZE = 256 * 1024
+MILLISECONDS_PER_DAY = 24 * 60 * 60 * 1000
+
+
+def get_log_events_cache_directory() -> str:
+    """Returns the directory where the watermarks of the log events scanned for secrets are stored."""
+    return os.getenv(
+        LOG_EVENTS_CACHE_DIRECTORY_VARIABLE, default_log_events_cache_directory
+    )
+
+
+def get_log_event_data(log_event: dict) -> str:
+    """Returns the message of a log event as scanned for secrets, indenting the JSON messages one key per line."""
+    try:
+        return json.dumps(json.loads(log_event["message"]), indent=2)
+    except Exception:
+        return json.dumps(log_event["message"], indent=2)
+
+
+def get_log_events_chunks(log_events: list) -> list:
+    """
+    Split the log events of a log stream into chunks of up to LOG_EVENTS_CHUNK_MAX_SIZE characters.
+
+    A log event bigger than LOG_EVENTS_CHUNK_MAX_SIZE is a chunk on its own.
+
+    Args:
+        log_events (list): The log events of the log stream.
+
+    Returns:
+        list: The chunks, as (data, first_lines, log_events) tuples, where first_lines holds the line of the data
+            where each of the log events starts.
+    """
+    chunks = []
+    lines, first_lines, chunk_events, size = [], [], [], 0
+    for log_event in log_events:
+        event_data = get_log_event_data(log_event)
+        if chunk_events and size + len(event_data) > LOG_EVENTS_CHUNK_MAX_SIZE:
+            chunks.append(("\n".join(lines), first_lines, chunk_events))
+            lines, first_lines, chunk_events, size = [], [], [], 0
+        first_lines.append(len(lines) + 1)
+        lines.extend(event_data.split("\n"))
+        chunk_events.append(log_event)
+        size += len(event_data) + 1
+    if chunk_events:
+        chunks.append(("\n".join(lines), first_lines, chunk_events))
+    return chunks
+
+
+def scan_log_events(log_groups: list, secrets_scanner: SecretsScanner) -> dict:
+    """
+    Scan the log events of the log groups for secrets, in chunks of log events scanned in one batch.
+
+    The line of each secret in its chunk is mapped back to its log event, so the log events are scanned once.
+
+    Args:
+        log_groups (list): The log groups, with their log events by log stream.
+        secrets_scanner (SecretsScanner): The secrets scanner.
+
+    Returns:
+        dict: The secrets found in each log group by ARN, as dicts with the log_stream, the timestamp of the log
+            event, the line_number in the log event and the type of the secret.
+    """
+    chunks = {}
+    for log_group in log_groups:
+        for log_stream_name, log_events in log_group.log_streams.items():
+            for chunk in get_log_events_chunks(log_events):
+                chunks[(log_group.arn, log_stream_name, len(chunks))] = chunk
+    chunks_secrets = secrets_scanner.scan_batch(
+        {key: chunk[0] for key, chunk in chunks.items()}
+    )
+
+    log_groups_secrets = {log_group.arn: [] for log_group in log_groups}
+    for key, (_, first_lines, log_events) in chunks.items():
+        log_group_arn, log_stream_name, _ = key
+        for secret in chunks_secrets[key] or []:
+            event_index = max(bisect_right(first_lines, secret["line_number"]) - 1, 0)
+            log_groups_secrets[log_group_arn].append(
+                {
+                    "log_stream": log_stream_name,
+                    "timestamp": log_events[event_index]["timestamp"],
+                    "line_number": secret["line_number"] - first_lines[event_index] + 1,
+                    "type": secret["type"],
+                }
+            )
+    return log_groups_secrets
+
+
+class LogEventsWatermarks:
+    """
+    LogEventsWatermarks keeps, by log group ARN, the timestamp of the last log event scanned for secrets and the
+    secrets found until then, so the following scans only retrieve and scan the new log events.
+
+    The watermarks depend on the Prowler version and the settings of the secrets scanner, so the log groups are
+    scanned again from the beginning when any of them changes.
+
+    Attributes:
+        watermarks_file (str): The file where the watermarks are stored.
+        fingerprint (str): The hash of the Prowler version and the settings of the secrets scanner.
+
+    Examples:
+        >>> watermarks = LogEventsWatermarks(secrets_scanner)
+        >>> watermarks.get_start_time(log_group.arn)
+        1718000000000
+        >>> watermarks.update(log_group, log_events, secrets)
+        >>> watermarks.save()
+    """
+
+    def __init__(self, secrets_scanner: SecretsScanner):
+        self.watermarks_file = os.path.join(
+            get_log_events_cache_directory(), log_events_watermarks_file_name
+        )
+        self.fingerprint = hashlib.sha256(
+            json.dumps(
+                {
+                    "prowler_version": prowler_version,
+                    "settings": secrets_scanner.settings,
+                },
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+        self._watermarks = self._load()
+        self._updated = set()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.watermarks_file, "r", encoding=encoding_format_utf_8) as f:
+                watermarks = json.load(f)
+            return watermarks if isinstance(watermarks, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as error:
+            logger.debug(
+                f"Log events watermarks file {self.watermarks_file} could not be read -- {error.__class__.__name__}: {error}"
+            )
+            return {}
+
+    def _get(self, log_group_arn: str) -> dict:
+        watermark = self._watermarks.get(log_group_arn)
+        if not isinstance(watermark, dict) or (
+            watermark.get("fingerprint") != self.fingerprint
+        ):
+            return {}
+        return watermark
+
+    def get_start_time(self, log_group_arn: str) -> Optional[int]:
+        """Returns the timestamp of the last log event scanned in the log group, or None if it was never scanned."""
+        return self._get(log_group_arn).get("timestamp")
+
+    def is_scanned(self, log_group_arn: str, log_event: dict) -> bool:
+        """Returns whether the log event was scanned before, as the log events at the start time are retrieved again."""
+        watermark = self._get(log_group_arn)
+        return log_event["timestamp"] == watermark.get("timestamp") and log_event.get(
+            "eventId"
+        ) in watermark.get("event_ids", [])
+
+    def get_secrets(self, log_group_arn: str) -> list:
+        """Returns the secrets found in the log events scanned before in the log group."""
+        return self._get(log_group_arn).get("secrets", [])
+
+    def update(self, log_group, log_events: list, secrets: list):
+        """
+        Move the watermark of the log group to its last scanned log event and keep the secrets found.
+
+        The secrets of the log events deleted by the retention policy of the log group are discarded.
+
+        Args:
+            log_group (LogGroup): The log group.
+            log_events (list): The log events scanned.
+            secrets (list): The secrets found in the log events, see scan_log_events.
+        """
+        watermark = self._get(log_group.arn)
+        timestamp = watermark.get("timestamp")
+        event_ids = set(watermark.get("event_ids", []))
+        for log_event in log_events:
+            if timestamp is None or log_event["timestamp"] > timestamp:
+                timestamp = log_event["timestamp"]
+                event_ids = set()
+            if log_event["timestamp"] == timestamp:
+                event_ids.add(log_event.get("eventId"))
+        log_group_secrets = watermark.get("secrets", []) + secrets
+        if not log_group.never_expire:
+            expiration = (
+                int(datetime.now(timezone.utc).timestamp() * 1000)
+                - log_group.retention_days * MILLISECONDS_PER_DAY
+            )
+            log_group_secrets = [
+                secret
+                for secret in log_group_secrets
+                if secret["timestamp"] >= expiration
+            ]
+        self._watermarks[log_group.arn] = {
+            "fingerprint": self.fingerprint,
+            "timestamp": timestamp,
+            "event_ids": sorted(event_id for event_id in event_ids if event_id),
+            "secrets": log_group_secrets,
+        }
+        self._updated.add(log_group.arn)
+
+    def save(self):
+        """Writes the watermarks of the log groups updated in this scan, keeping the ones of the other log groups."""
+        if not self._updated:
+            return
+        watermarks_directory = os.path.dirname(self.watermarks_file)
+        try:
+            os.makedirs(watermarks_directory, exist_ok=True)
+            # Write to a temporary file first so concurrent runs never read a partial file
+            file_descriptor, temporary_file = tempfile.mkstemp(dir=watermarks_directory)
+            try:
+                # The log groups scanned by other runs since the watermarks were loaded are kept
+                self._watermarks = {
+                    **self._load(),
+                    **{
+                        log_group_arn: self._watermarks[log_group_arn]
+                        for log_group_arn in self._updated
+                    },
+                }
+                with os.fdopen(
+                    file_descriptor, "w", encoding=encoding_format_utf_8
+                ) as f:
+                    json.dump(self._watermarks, f)
+                os.replace(temporary_file, self.watermarks_file)
+            except Exception:
+                os.remove(temporary_file)
+                raise
+            self._updated = set()
+        except Exception as error:
+            logger.debug(
+                f"Log events watermarks file {self.watermarks_file} could not be written -- {error.__class__.__name__}: {error}"
+            )
@@ -1,7 +1,7 @@
 import json
 
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import SecretsScanner
 from prowler.providers.aws.services.codebuild.codebuild_client import codebuild_client
 
 
@@ -11,8 +11,17 @@ class codebuild_project_no_secrets_in_variables(Check):
         sensitive_vars_excluded = codebuild_client.audit_config.get(
             "excluded_sensitive_environment_variables", []
         )
-        secrets_ignore_patterns = codebuild_client.audit_config.get(
-            "secrets_ignore_patterns", []
+        # The plaintext variables of all the projects are scanned in one batch
+        variables_secrets = SecretsScanner.from_audit_config(
+            codebuild_client.audit_config
+        ).scan_batch(
+            {
+                (project.arn, env_var.name): json.dumps({env_var.name: env_var.value})
+                for project in codebuild_client.projects.values()
+                for env_var in project.environment_variables or []
+                if env_var.type == "PLAINTEXT"
+                and env_var.name not in sensitive_vars_excluded
+            }
         )
         for project in codebuild_client.projects.values():
             report = Check_Report_AWS(metadata=self.metadata(), resource=project)
@@ -26,12 +35,8 @@ class codebuild_project_no_secrets_in_variables(Check):
                         env_var.type == "PLAINTEXT"
                         and env_var.name not in sensitive_vars_excluded
                     ):
-                        detect_secrets_output = detect_secrets_scan(
-                            data=json.dumps({env_var.name: env_var.value}),
-                            excluded_secrets=secrets_ignore_patterns,
-                            detect_secrets_plugins=codebuild_client.audit_config.get(
-                                "detect_secrets_plugins",
-                            ),
+                        detect_secrets_output = variables_secrets.get(
+                            (project.arn, env_var.name)
                         )
                         if detect_secrets_output:
                             secrets_info = [
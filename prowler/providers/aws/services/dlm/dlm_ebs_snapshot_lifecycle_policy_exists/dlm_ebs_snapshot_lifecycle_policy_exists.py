@@ -1,8 +1,13 @@
-from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    requires_service_attributes,
+)
 from prowler.providers.aws.services.dlm.dlm_client import dlm_client
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 
 
+@requires_service_attributes("ec2_client.regions_with_snapshots")
 class dlm_ebs_snapshot_lifecycle_policy_exists(Check):
     def execute(self):
         findings = []
@@ -1,7 +1,12 @@
-from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    requires_service_attributes,
+)
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 
 
+@requires_service_attributes("ec2_client.ebs_block_public_access_snapshots_states")
 class ec2_ebs_snapshot_account_block_public_access(Check):
     def execute(self):
         findings = []
@@ -1,8 +1,13 @@
-from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    requires_service_attributes,
+)
 from prowler.providers.aws.services.backup.backup_client import backup_client
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 
 
+@requires_service_attributes("ec2_client.volumes")
 class ec2_ebs_volume_protected_by_backup_plan(Check):
     def execute(self):
         findings = []
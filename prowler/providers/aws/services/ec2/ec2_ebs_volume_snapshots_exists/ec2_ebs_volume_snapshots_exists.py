@@ -1,7 +1,15 @@
-from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    requires_service_attributes,
+)
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 
 
+@requires_service_attributes(
+    "ec2_client.volumes",
+    "ec2_client.volumes_with_snapshots",
+)
 class ec2_ebs_volume_snapshots_exists(Check):
     def execute(self):
         findings = []
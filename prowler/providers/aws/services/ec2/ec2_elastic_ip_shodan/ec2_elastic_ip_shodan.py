@@ -1,10 +1,15 @@
 import shodan
 
-from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    requires_service_attributes,
+)
 from prowler.lib.logger import logger
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 
 
+@requires_service_attributes("ec2_client.elastic_ips")
 class ec2_elastic_ip_shodan(Check):
     def execute(self):
         findings = []
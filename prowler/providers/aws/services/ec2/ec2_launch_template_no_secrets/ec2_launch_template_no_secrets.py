@@ -2,23 +2,23 @@ import zlib
 from base64 import b64decode
 
 from prowler.config.config import encoding_format_utf_8
-from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    requires_service_attributes,
+)
 from prowler.lib.logger import logger
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import SecretsScanner
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 
 
+@requires_service_attributes("ec2_client.launch_templates")
 class ec2_launch_template_no_secrets(Check):
     def execute(self):
         findings = []
-        secrets_ignore_patterns = ec2_client.audit_config.get(
-            "secrets_ignore_patterns", []
-        )
+        # The User Data of all the template versions is scanned in one batch
+        versions_user_data = {}
         for template in ec2_client.launch_templates:
-            report = Check_Report_AWS(metadata=self.metadata(), resource=template)
-
-            versions_with_secrets = []
-
             for version in template.versions:
                 if not version.template_data.user_data:
                     continue
@@ -42,12 +42,19 @@ class ec2_launch_template_no_secrets(Check):
                     )
                     continue
 
-                version_secrets = detect_secrets_scan(
-                    data=user_data,
-                    excluded_secrets=secrets_ignore_patterns,
-                    detect_secrets_plugins=ec2_client.audit_config.get(
-                        "detect_secrets_plugins"
-                    ),
+                versions_user_data[(template.arn, version.version_number)] = user_data
+        versions_secrets = SecretsScanner.from_audit_config(
+            ec2_client.audit_config
+        ).scan_batch(versions_user_data)
+
+        for template in ec2_client.launch_templates:
+            report = Check_Report_AWS(metadata=self.metadata(), resource=template)
+
+            versions_with_secrets = []
+
+            for version in template.versions:
+                version_secrets = versions_secrets.get(
+                    (template.arn, version.version_number)
                 )
 
                 if version_secrets:
@@ -1,8 +1,13 @@
-from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    requires_service_attributes,
+)
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 from prowler.providers.aws.services.ec2.lib.network_acls import check_network_acl
 
 
+@requires_service_attributes("ec2_client.network_acls")
 class ec2_networkacl_allow_ingress_any_port(Check):
     def execute(self):
         findings = []
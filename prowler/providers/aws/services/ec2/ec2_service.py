@@ -3,11 +3,17 @@ from ipaddress import IPv4Address, IPv6Address, ip_address
 from typing import Optional, Union
 
 from botocore.client import ClientError
-from pydantic.v1 import BaseModel
+from pydantic.v1 import BaseModel, validator
 
 from prowler.lib.logger import logger
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import get_resource_ids, is_resource_filtered
 from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    SecurityGroupRulesIndex,
+)
+
+# Maximum number of values of each filter of the EC2 describe API calls
+EC2_FILTER_MAX_VALUES = 200
 
 
 class EC2(AWSService):
@@ -17,40 +23,100 @@ class EC2(AWSService):
         self.account_arn_template = f"arn:{self.audited_partition}:ec2:{self.region}:{self.audited_account}:account"
         self.instances = []
         self.__threading_call__(self._describe_instances)
-        self.__threading_call__(self._get_instance_user_data, self.instances)
+        self.__async_call__(self._get_instance_user_data, self.instances)
         self.security_groups = {}
         self.regions_with_sgs = []
         self.__threading_call__(self._describe_security_groups)
+        self.network_interfaces = {}
+        self.__threading_call__(self._describe_network_interfaces)
+        # The following attributes are only collected if a check uses them
+        self.register_lazy_attributes(["network_acls"], self._collect_network_acls)
+        self.register_lazy_attributes(
+            ["snapshots", "volumes_with_snapshots", "regions_with_snapshots"],
+            self._collect_snapshots,
+        )
+        self.register_lazy_attributes(["images"], self._collect_images)
+        self.register_lazy_attributes(["volumes"], self._collect_volumes)
+        self.register_lazy_attributes(
+            ["attributes_for_regions"],
+            self._collect_resources_for_regions,
+            depends_on=["snapshots", "volumes"],
+        )
+        self.register_lazy_attributes(
+            ["ebs_encryption_by_default"],
+            self._collect_ebs_encryption_settings,
+            depends_on=["attributes_for_regions"],
+        )
+        self.register_lazy_attributes(["elastic_ips"], self._collect_ec2_addresses)
+        self.register_lazy_attributes(
+            ["ebs_block_public_access_snapshots_states"],
+            self._collect_snapshot_block_public_access_states,
+            depends_on=["attributes_for_regions"],
+        )
+        self.register_lazy_attributes(
+            ["instance_metadata_defaults"],
+            self._collect_instance_metadata_defaults,
+            depends_on=["attributes_for_regions"],
+        )
+        self.register_lazy_attributes(
+            ["launch_templates"], self._collect_launch_templates
+        )
+        self.register_lazy_attributes(["vpn_endpoints"], self._collect_vpn_endpoints)
+        self.register_lazy_attributes(
+            ["transit_gateways"], self._collect_transit_gateways
+        )
+
+    def _collect_network_acls(self):
         self.network_acls = {}
         self.__threading_call__(self._describe_network_acls)
+
+    def _collect_snapshots(self):
         self.snapshots = []
         self.volumes_with_snapshots = {}
         self.regions_with_snapshots = {}
         self.__threading_call__(self._describe_snapshots)
         self.__threading_call__(self._determine_public_snapshots, self.snapshots)
-        self.network_interfaces = {}
-        self.__threading_call__(self._describe_network_interfaces)
+
+    def _collect_images(self):
         self.images = []
         self.__threading_call__(self._describe_images)
+
+    def _collect_volumes(self):
         self.volumes = []
         self.__threading_call__(self._describe_volumes)
+
+    def _collect_resources_for_regions(self):
         self.attributes_for_regions = {}
         self.__threading_call__(self._get_resources_for_regions)
+
+    def _collect_ebs_encryption_settings(self):
         self.ebs_encryption_by_default = []
         self.__threading_call__(self._get_ebs_encryption_settings)
+
+    def _collect_ec2_addresses(self):
         self.elastic_ips = []
         self.__threading_call__(self._describe_ec2_addresses)
+
+    def _collect_snapshot_block_public_access_states(self):
         self.ebs_block_public_access_snapshots_states = []
         self.__threading_call__(self._get_snapshot_block_public_access_state)
+
+    def _collect_instance_metadata_defaults(self):
         self.instance_metadata_defaults = []
         self.__threading_call__(self._get_instance_metadata_defaults)
+
+    def _collect_launch_templates(self):
         self.launch_templates = []
         self.__threading_call__(self._describe_launch_templates)
         self.__threading_call__(
             self._describe_launch_template_versions, self.launch_templates
         )
+
+    def _collect_vpn_endpoints(self):
         self.vpn_endpoints = {}
         self.__threading_call__(self._describe_vpn_endpoints)
+
+    def _collect_transit_gateways(self):
         self.transit_gateways = {}
         self.__threading_call__(self._describe_transit_gateways)
 
@@ -59,12 +125,36 @@ class EC2(AWSService):
             f"arn:{self.audited_partition}:ec2:{region}:{self.audited_account}:volume"
         )
 
+    def _paginate_by_resource_ids(self, paginator, arn_prefix, filter_name):
+        """
+        Paginate the API call requesting only the input resources with the given ARN prefix, or all the resources
+        if there are no input resources or they can not be requested by ID.
+        """
+        resource_ids = get_resource_ids(self.audit_resources, arn_prefix)
+        if resource_ids is None:
+            yield from paginator.paginate()
+            return
+        # No API calls in the regions without input resources
+        for index in range(0, len(resource_ids), EC2_FILTER_MAX_VALUES):
+            yield from paginator.paginate(
+                Filters=[
+                    {
+                        "Name": filter_name,
+                        "Values": resource_ids[index : index + EC2_FILTER_MAX_VALUES],
+                    }
+                ]
+            )
+
     def _describe_instances(self, regional_client):
         try:
             describe_instances_paginator = regional_client.get_paginator(
                 "describe_instances"
             )
-            for page in describe_instances_paginator.paginate():
+            for page in self._paginate_by_resource_ids(
+                describe_instances_paginator,
+                f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:instance/",
+                "instance-id",
+            ):
                 for reservation in page["Reservations"]:
                     for instance in reservation["Instances"]:
                         arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:instance/{instance['InstanceId']}"
@@ -329,11 +419,16 @@ class EC2(AWSService):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _get_instance_user_data(self, instance):
+    async def _get_instance_user_data(self, instance):
         try:
             regional_client = self.regional_clients[instance.region]
-            user_data = regional_client.describe_instance_attribute(
-                Attribute="userData", InstanceId=instance.id
+            user_data = (
+                await self.__async_api_call__(
+                    regional_client,
+                    "describe_instance_attribute",
+                    Attribute="userData",
+                    InstanceId=instance.id,
+                )
             )["UserData"]
             if "Value" in user_data:
                 instance.user_data = user_data["Value"]
@@ -374,7 +469,11 @@ class EC2(AWSService):
             describe_volumes_paginator = regional_client.get_paginator(
                 "describe_volumes"
             )
-            for page in describe_volumes_paginator.paginate():
+            for page in self._paginate_by_resource_ids(
+                describe_volumes_paginator,
+                f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:volume/",
+                "volume-id",
+            ):
                 for volume in page["Volumes"]:
                     arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:volume/{volume['VolumeId']}"
                     if not self.audit_resources or (
@@ -719,6 +818,14 @@ class SecurityGroup(BaseModel):
     ingress_rules: list[dict]
     egress_rules: list[dict]
     tags: Optional[list] = []
+    ingress_rules_index: Optional[SecurityGroupRulesIndex]
+
+    @validator("ingress_rules_index", pre=True, always=True)
+    def build_ingress_rules_index(cls, ingress_rules_index, values):
+        # The ingress rules are indexed once for all the port exposure checks
+        if ingress_rules_index is None:
+            return SecurityGroupRulesIndex.from_rules(values.get("ingress_rules", []))
+        return ingress_rules_index
 
 
 class NetworkACL(BaseModel):
@@ -1,6 +1,12 @@
 import ipaddress
+from bisect import bisect_right
 from typing import Any
 
+from pydantic.v1 import BaseModel
+
+# Number of ports of a rule open to all the ports
+ALL_PORTS = 65536
+
 
 def check_security_group(
     ingress_rule: Any, protocol: str, ports: list = [], any_address: bool = False
@@ -47,56 +53,150 @@ def check_security_group(
 
     # Check for specific ports in ingress rules
     if "FromPort" in ingress_rule:
-        # If there is a port range
-        if ingress_rule["FromPort"] != ingress_rule["ToPort"]:
-            # Calculate port range, adding 1
-            diff = (ingress_rule["ToPort"] - ingress_rule["FromPort"]) + 1
-            ingress_port_range = []
-            for x in range(diff):
-                ingress_port_range.append(int(ingress_rule["FromPort"]) + x)
-        # If FromPort and ToPort are the same
+        # The port range is compared by its bounds instead of listing all its ports
+        from_port = int(ingress_rule["FromPort"])
+        to_port = int(ingress_rule["ToPort"])
+        is_public = any(
+            _is_cidr_public(ip_ingress_rule["CidrIp"], any_address)
+            for ip_ingress_rule in ingress_rule["IpRanges"]
+        ) or any(
+            _is_cidr_public(ip_ingress_rule["CidrIpv6"], any_address)
+            for ip_ingress_rule in ingress_rule["Ipv6Ranges"]
+        )
+        if is_public:
+            # If there are input ports to check
+            if ports and ingress_rule["IpProtocol"] == protocol:
+                for port in ports:
+                    if from_port <= port <= to_port:
+                        return True
+            # If empty input ports check if all ports are open
+            if to_port - from_port + 1 == ALL_PORTS:
+                return True
+            # If None input ports check if any port is open
+            if ports is None:
+                return True
+
+    return False
+
+
+class SecurityGroupRulesIndex(BaseModel):
+    """
+    SecurityGroupRulesIndex indexes the ingress rules of a security group, so the port exposure checks query it
+    instead of evaluating every rule with check_security_group.
+
+    The open port ranges of each protocol are kept as sorted and merged intervals, so a port is looked up with a
+    binary search. The exposure is indexed both for the public CIDRs and only for the any-address CIDRs
+    (0.0.0.0/0 and ::/0), matching the any_address argument of check_security_group.
+
+    Attributes:
+        all_traffic (dict): Whether an all traffic rule is exposed, by any_address.
+        all_ports (dict): Whether a rule with all the ports is exposed, by any_address.
+        any_port (dict): Whether a rule with ports is exposed, by any_address.
+        port_ranges (dict): The exposed port intervals, as (from port, to port) tuples, by any_address and protocol.
+    """
+
+    all_traffic: dict[bool, bool] = {True: False, False: False}
+    all_ports: dict[bool, bool] = {True: False, False: False}
+    any_port: dict[bool, bool] = {True: False, False: False}
+    port_ranges: dict[bool, dict[str, list[tuple[int, int]]]] = {True: {}, False: {}}
+
+    @classmethod
+    def from_rules(cls, ingress_rules: list[dict]) -> "SecurityGroupRulesIndex":
+        """
+        Build the index of the given ingress rules.
+
+        Args:
+            ingress_rules (list[dict]): The IpPermissions of the security group.
+
+        Returns:
+            SecurityGroupRulesIndex: The index of the ingress rules.
+        """
+        index = cls()
+        for ingress_rule in ingress_rules or []:
+            cidrs = [
+                ip_range["CidrIp"] for ip_range in ingress_rule.get("IpRanges", [])
+            ] + [
+                ip_range["CidrIpv6"] for ip_range in ingress_rule.get("Ipv6Ranges", [])
+            ]
+            for any_address in (True, False):
+                # Each CIDR is classified once for all the checks
+                if not any(_is_valid_cidr_public(cidr, any_address) for cidr in cidrs):
+                    continue
+                if ingress_rule.get("IpProtocol") == "-1":
+                    index.all_traffic[any_address] = True
+                if "FromPort" in ingress_rule:
+                    from_port = int(ingress_rule["FromPort"])
+                    to_port = int(ingress_rule["ToPort"])
+                    index.any_port[any_address] = True
+                    if to_port - from_port + 1 == ALL_PORTS:
+                        index.all_ports[any_address] = True
+                    if from_port <= to_port:
+                        index.port_ranges[any_address].setdefault(
+                            ingress_rule["IpProtocol"], []
+                        ).append((from_port, to_port))
+        for port_ranges in index.port_ranges.values():
+            for protocol, intervals in port_ranges.items():
+                port_ranges[protocol] = _merge_intervals(intervals)
+        return index
+
+    def is_exposed(
+        self, protocol: str, ports: list = [], any_address: bool = False
+    ) -> bool:
+        """
+        Check if any ingress rule of the security group has public access to the ports using the protocol, the
+        same as check_security_group for each ingress rule.
+
+        Args:
+            protocol (str): Protocol to check.
+            ports (list): List of ports to check. If empty, only all the ports open will be checked. If None, any port will be checked. (Default: [])
+            any_address (bool): If True, only 0.0.0.0/0 or "::/0" will be public and do not search for public addresses. (Default: False)
+
+        Returns:
+            bool: True if the security group has public access to the ports using the protocol.
+        """
+        if self.all_traffic[any_address] or self.all_ports[any_address]:
+            return True
+        if ports is None:
+            return self.any_port[any_address]
+        intervals = self.port_ranges[any_address].get(protocol)
+        if not intervals:
+            return False
+        return any(_is_port_in_intervals(port, intervals) for port in ports)
+
+
+def _merge_intervals(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Sort the port intervals and merge the overlapping and adjacent ones."""
+    merged = []
+    for from_port, to_port in sorted(intervals):
+        if merged and from_port <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], to_port))
         else:
-            ingress_port_range = []
-            ingress_port_range.append(int(ingress_rule["FromPort"]))
+            merged.append((from_port, to_port))
+    return merged
 
-        # Test Security Group
-        # IPv4
-        for ip_ingress_rule in ingress_rule["IpRanges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIp"], any_address):
-                # If there are input ports to check
-                if ports:
-                    for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
-                            return True
-                # If empty input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
-                    return True
-                # If None input ports check if any port is open
-                if ports is None:
-                    return True
-
-        # IPv6
-        for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIpv6"], any_address):
-                # If there are input ports to check
-                if ports:
-                    for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
-                            return True
-                # If empty input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
-                    return True
-                # If None input ports check if any port is open
-                if ports is None:
-                    return True
 
-    return False
+def _is_port_in_intervals(port: int, intervals: list[tuple[int, int]]) -> bool:
+    """Check if the port is in the sorted and merged intervals with a binary search."""
+    position = bisect_right(intervals, (port, ALL_PORTS)) - 1
+    return position >= 0 and intervals[position][0] <= port <= intervals[position][1]
+
+
+def _is_valid_cidr_public(cidr: str, any_address: bool = False) -> bool:
+    """
+    Check if the CIDR is public like _is_cidr_public, considering an invalid CIDR as not public so a single
+    malformed rule does not prevent indexing the whole security group.
+
+    Args:
+        cidr (str): The CIDR to check.
+        any_address (bool): If True, only 0.0.0.0/0 or ::/0 are considered public.
+
+    Returns:
+        bool: True if the CIDR is valid and public, False otherwise.
+    """
+    try:
+        return _is_cidr_public(cidr, any_address)
+    except ValueError:
+        return False
 
 
 def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
@@ -1,11 +1,17 @@
+import json
 import re
+from functools import lru_cache
 from ipaddress import ip_address, ip_network
 from typing import Optional, Tuple
 
 from py_iam_expand.actions import InvalidActionHandling, expand_actions
 
 from prowler.lib.logger import logger
-from prowler.providers.aws.aws_provider import read_aws_regions_file
+from prowler.providers.aws.aws_provider import get_aws_regions_catalog
+
+# Maximum number of expanded IAM action patterns and evaluated policy documents kept in memory
+ACTION_PATTERNS_CACHE_SIZE = 8192
+EFFECTIVE_ACTIONS_CACHE_SIZE = 4096
 
 
 def _get_patterns_from_standard_value(value):
@@ -21,6 +27,51 @@ def _get_patterns_from_standard_value(value):
     return patterns
 
 
+def get_canonical_policy(policy: dict) -> str:
+    """
+    Returns the canonical JSON of a policy document, the same for the policy documents that only differ in the
+    order of their keys, so the repeated policies of the account are evaluated once.
+
+    Args:
+        policy (dict): The IAM policy document.
+
+    Returns:
+        str: The canonical JSON of the policy document.
+    """
+    return json.dumps(policy, sort_keys=True, separators=(",", ":"), default=str)
+
+
+@lru_cache(maxsize=None)
+def get_all_actions() -> frozenset[str]:
+    """Returns all the IAM actions, expanded only once since it is the largest expansion."""
+    return frozenset(expand_actions("*", InvalidActionHandling.REMOVE))
+
+
+@lru_cache(maxsize=ACTION_PATTERNS_CACHE_SIZE)
+def expand_action_pattern(pattern: str) -> frozenset[str]:
+    """
+    Expands an IAM action pattern with wildcards into the IAM actions it matches, removing the invalid ones.
+    The expansions are cached, since the same patterns repeat across the policies.
+
+    Args:
+        pattern (str): The IAM action pattern, e.g. s3:Get*.
+
+    Returns:
+        frozenset[str]: The IAM actions matched by the pattern.
+    """
+    if pattern == "*":
+        return get_all_actions()
+    return frozenset(expand_actions(pattern, InvalidActionHandling.REMOVE))
+
+
+def expand_action_patterns(patterns) -> set[str]:
+    """Expands the given IAM action patterns, see expand_action_pattern."""
+    expanded = set()
+    for pattern in patterns:
+        expanded.update(expand_action_pattern(pattern))
+    return expanded
+
+
 def get_effective_actions(policy: dict) -> set[str]:
     """
     Calculates the set of effectively allowed IAM actions from a policy document.
@@ -30,6 +81,9 @@ def get_effective_actions(policy: dict) -> set[str]:
     and applies the Deny > Allow precedence. Assumes standard AWS policy
     format where Action/NotAction is a string or a list of strings.
 
+    The effective actions are memoised by the canonical policy document,
+    so the policies attached to many principals are only evaluated once.
+
     Args:
         policy (dict): The IAM policy document.
 
@@ -38,6 +92,12 @@ def get_effective_actions(policy: dict) -> set[str]:
     """
     if not policy or "Statement" not in policy:
         return set()
+    return set(_get_effective_actions(get_canonical_policy(policy)))
+
+
+@lru_cache(maxsize=EFFECTIVE_ACTIONS_CACHE_SIZE)
+def _get_effective_actions(canonical_policy: str) -> frozenset[str]:
+    policy = json.loads(canonical_policy)
 
     directly_allowed_actions = set()
     directly_denied_actions = set()
@@ -64,14 +124,7 @@ def get_effective_actions(policy: dict) -> set[str]:
 
         action_patterns_to_expand = _get_patterns_from_standard_value(actions)
         if action_patterns_to_expand:
-            expanded = set()
-            for pattern in action_patterns_to_expand:
-                expanded.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
+            expanded = expand_action_patterns(action_patterns_to_expand)
             if effect == "allow":
                 directly_allowed_actions.update(expanded)
             else:  # deny
@@ -79,14 +132,7 @@ def get_effective_actions(policy: dict) -> set[str]:
 
         not_action_patterns_to_expand = _get_patterns_from_standard_value(not_actions)
         if not_action_patterns_to_expand:
-            expanded_exclusions = set()
-            for pattern in not_action_patterns_to_expand:
-                expanded_exclusions.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
+            expanded_exclusions = expand_action_patterns(not_action_patterns_to_expand)
             if effect == "allow":
                 allow_not_action_exclusions.update(expanded_exclusions)
                 has_allow_not_action_statement = True
@@ -94,21 +140,14 @@ def get_effective_actions(policy: dict) -> set[str]:
                 deny_not_action_exclusions.update(expanded_exclusions)
                 has_deny_not_action_statement = True
 
-    all_actions = None
-
     # Actions allowed by "Allow Action" statements
     potentially_allowed = directly_allowed_actions
 
     # Actions allowed by "Allow NotAction" statements
     if has_allow_not_action_statement:
-        if all_actions is None:
-            all_actions = set(
-                expand_actions(
-                    "*",
-                    InvalidActionHandling.REMOVE,
-                )
-            )
-        allowed_by_not_action = all_actions.difference(allow_not_action_exclusions)
+        allowed_by_not_action = get_all_actions().difference(
+            allow_not_action_exclusions
+        )
         potentially_allowed.update(allowed_by_not_action)
 
     # Actions denied by "Deny Action" statements
@@ -116,19 +155,12 @@ def get_effective_actions(policy: dict) -> set[str]:
 
     # Actions denied by "Deny NotAction" statements
     if has_deny_not_action_statement:
-        if all_actions is None:
-            all_actions = set(
-                expand_actions(
-                    "*",
-                    InvalidActionHandling.REMOVE,
-                )
-            )
-        denied_by_not_action = all_actions.difference(deny_not_action_exclusions)
+        denied_by_not_action = get_all_actions().difference(deny_not_action_exclusions)
         potentially_denied.update(denied_by_not_action)
 
     effective_actions = potentially_allowed.difference(potentially_denied)
 
-    return effective_actions
+    return frozenset(effective_actions)
 
 
 def check_full_service_access(service: str, policy: dict) -> bool:
@@ -147,12 +179,7 @@ def check_full_service_access(service: str, policy: dict) -> bool:
         return False
 
     service_wildcard = f"{service}:*" if service != "*" else "*"
-    all_target_service_actions = set(
-        expand_actions(
-            service_wildcard,
-            InvalidActionHandling.REMOVE,
-        )
-    )
+    all_target_service_actions = expand_action_pattern(service_wildcard)
 
     effective_allowed_actions = get_effective_actions(policy)
 
@@ -164,8 +191,6 @@ def check_full_service_access(service: str, policy: dict) -> bool:
     if not isinstance(statements, list):
         statements = [statements]
 
-    all_aws_actions_for_inversion = None
-
     for statement in statements:
         effect = statement.get("Effect", "")
         resources = statement.get("Resource", [])
@@ -183,35 +208,14 @@ def check_full_service_access(service: str, policy: dict) -> bool:
 
         # Use the shared helper function instead of the duplicated one
         action_patterns = _get_patterns_from_standard_value(actions)
-        for pattern in action_patterns:
-            statement_specific_allowed.update(
-                expand_actions(
-                    pattern,
-                    InvalidActionHandling.REMOVE,
-                )
-            )
+        statement_specific_allowed.update(expand_action_patterns(action_patterns))
 
         not_action_patterns = _get_patterns_from_standard_value(not_actions)
         if not_action_patterns:
-            if all_aws_actions_for_inversion is None:
-                all_aws_actions_for_inversion = set(
-                    expand_actions(
-                        "*",
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
-
-            statement_exclusions = set()
-            for pattern in not_action_patterns:
-                statement_exclusions.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
+            statement_exclusions = expand_action_patterns(not_action_patterns)
             # Actions allowed by THIS NotAction statement
             statement_specific_allowed.update(
-                all_aws_actions_for_inversion.difference(statement_exclusions)
+                get_all_actions().difference(statement_exclusions)
             )
 
         actions_allowed_on_all_resources.update(
@@ -866,9 +870,7 @@ def is_valid_aws_service(service):
     Returns:
         bool: True if the service is valid, False otherwise.
     """
-    if service in read_aws_regions_file()["services"]:
-        return True
-    return False
+    return get_aws_regions_catalog().is_valid_service(service)
 
 
 def is_codebuild_using_allowed_github_org(
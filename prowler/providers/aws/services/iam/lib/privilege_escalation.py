@@ -1,7 +1,14 @@
+import json
+from functools import lru_cache
+
 from py_iam_expand.actions import expand_actions
 
 from prowler.lib.logger import logger
-from prowler.providers.aws.services.iam.lib.policy import get_effective_actions
+from prowler.providers.aws.services.iam.lib.policy import (
+    EFFECTIVE_ACTIONS_CACHE_SIZE,
+    get_canonical_policy,
+    get_effective_actions,
+)
 
 # Does the tool analyze both users and roles, or just one or the other? --> Everything using AttachementCount.
 # Does the tool take a principal-centric or policy-centric approach? --> Policy-centric approach.
@@ -91,6 +98,23 @@ privilege_escalation_policies_combination = {
 }
 
 
+@lru_cache(maxsize=None)
+def get_privilege_escalation_combinations() -> dict[str, frozenset[str]]:
+    """
+    Returns the IAM actions of each privilege escalation combination, expanded only once.
+
+    The patterns are expanded with the default handling of expand_actions, so an invalid pattern raises an error
+    instead of being removed from its combination, which would match with the rest of its actions.
+    """
+    combinations = {}
+    for combo_key, patterns in privilege_escalation_policies_combination.items():
+        expanded_required_actions = set()
+        for action_pattern in patterns:
+            expanded_required_actions.update(expand_actions(action_pattern))
+        combinations[combo_key] = frozenset(expanded_required_actions)
+    return combinations
+
+
 def check_privilege_escalation(policy: dict) -> str:
     """
     Checks if the policy allows known privilege escalation combinations.
@@ -102,12 +126,16 @@ def check_privilege_escalation(policy: dict) -> str:
         str: A comma-separated string of the privilege escalation actions found,
             or an empty string if none are found.
     """
-    policies_affected = ""
     if not policy:
-        return policies_affected
+        return ""
+    return _check_privilege_escalation(get_canonical_policy(policy))
 
+
+@lru_cache(maxsize=EFFECTIVE_ACTIONS_CACHE_SIZE)
+def _check_privilege_escalation(canonical_policy: str) -> str:
+    policies_affected = ""
     try:
-        effective_allowed_actions = get_effective_actions(policy)
+        effective_allowed_actions = get_effective_actions(json.loads(canonical_policy))
 
         matched_combo_actions = set()
         matched_combo_keys = set()
@@ -116,10 +144,10 @@ def check_privilege_escalation(policy: dict) -> str:
             combo_key,
             required_actions_patterns,
         ) in privilege_escalation_policies_combination.items():
-            # Expand the required actions for the current combo
-            expanded_required_actions = set()
-            for action_pattern in required_actions_patterns:
-                expanded_required_actions.update(expand_actions(action_pattern))
+            # The required actions of the combo are expanded once for all the policies
+            expanded_required_actions = get_privilege_escalation_combinations()[
+                combo_key
+            ]
 
             # Check if all expanded required actions are present in the effective actions
             if expanded_required_actions and expanded_required_actions.issubset(
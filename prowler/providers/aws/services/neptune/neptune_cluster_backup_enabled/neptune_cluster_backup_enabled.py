@@ -20,7 +20,9 @@ class neptune_cluster_backup_enabled(Check):
             else:
                 if cluster.backup_retention_period > 0:
                     report.status = "FAIL"
-                    report.check_metadata.Severity = Severity.low
+                    report.check_metadata = report.check_metadata.copy(
+                        update={"Severity": Severity.low}
+                    )
                     report.status_extended = f"Neptune Cluster {cluster.name} has backup enabled with retention period {cluster.backup_retention_period} days. Recommended to increase the backup retention period to a minimum of 7 days."
 
             findings.append(report)
@@ -17,7 +17,9 @@ class rds_instance_certificate_expiration(Check):
         for db_instance in rds_client.db_instances.values():
             report = Check_Report_AWS(metadata=self.metadata(), resource=db_instance)
             report.status = "FAIL"
-            report.check_metadata.Severity = Severity.critical
+            report.check_metadata = report.check_metadata.copy(
+                update={"Severity": Severity.critical}
+            )
             report.status_extended = (
                 f"RDS Instance {db_instance.id} certificate has expired."
             )
@@ -29,7 +31,9 @@ class rds_instance_certificate_expiration(Check):
                         utc
                     ) + relativedelta.relativedelta(months=6):
                         report.status = "PASS"
-                        report.check_metadata.Severity = Severity.informational
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.informational}
+                        )
                         report.status_extended = f"RDS Instance {db_instance.id} certificate has over 6 months of validity left."
                     elif cert.valid_till < datetime.now(
                         utc
@@ -41,7 +45,9 @@ class rds_instance_certificate_expiration(Check):
                         months=3
                     ):
                         report.status = "PASS"
-                        report.check_metadata.Severity = Severity.low
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.low}
+                        )
                         report.status_extended = f"RDS Instance {db_instance.id} certificate has between 3 and 6 months of validity."
                     elif cert.valid_till < datetime.now(
                         utc
@@ -53,7 +59,9 @@ class rds_instance_certificate_expiration(Check):
                         months=1
                     ):
                         report.status = "FAIL"
-                        report.check_metadata.Severity = Severity.medium
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.medium}
+                        )
                         report.status_extended = f"RDS Instance {db_instance.id} certificate less than 3 months of validity."
                     elif cert.valid_till < datetime.now(
                         utc
@@ -63,11 +71,15 @@ class rds_instance_certificate_expiration(Check):
                         utc
                     ):
                         report.status = "FAIL"
-                        report.check_metadata.Severity = Severity.high
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.high}
+                        )
                         report.status_extended = f"RDS Instance {db_instance.id} certificate less than 1 month of validity."
                     else:
                         report.status = "FAIL"
-                        report.check_metadata.Severity = Severity.critical
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.critical}
+                        )
                         report.status_extended = (
                             f"RDS Instance {db_instance.id} certificate has expired."
                         )
@@ -76,7 +88,9 @@ class rds_instance_certificate_expiration(Check):
                         utc
                     ) + relativedelta.relativedelta(months=6):
                         report.status = "PASS"
-                        report.check_metadata.Severity = Severity.informational
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.informational}
+                        )
                         report.status_extended = f"RDS Instance {db_instance.id} custom certificate has over 6 months of validity left."
                     elif cert.valid_till < datetime.now(
                         utc
@@ -88,7 +102,9 @@ class rds_instance_certificate_expiration(Check):
                         months=3
                     ):
                         report.status = "PASS"
-                        report.check_metadata.Severity = Severity.low
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.low}
+                        )
                         report.status_extended = f"RDS Instance {db_instance.id} custom certificate has between 3 and 6 months of validity."
                     elif cert.valid_till < datetime.now(
                         utc
@@ -100,7 +116,9 @@ class rds_instance_certificate_expiration(Check):
                         months=1
                     ):
                         report.status = "FAIL"
-                        report.check_metadata.Severity = Severity.medium
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.medium}
+                        )
                         report.status_extended = f"RDS Instance {db_instance.id} custom certificate less than 3 months of validity."
                     elif cert.valid_till < datetime.now(
                         utc
@@ -110,11 +128,15 @@ class rds_instance_certificate_expiration(Check):
                         utc
                     ):
                         report.status = "FAIL"
-                        report.check_metadata.Severity = Severity.high
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.high}
+                        )
                         report.status_extended = f"RDS Instance {db_instance.id} custom certificate less than 1 month of validity."
                     else:
                         report.status = "FAIL"
-                        report.check_metadata.Severity = Severity.critical
+                        report.check_metadata = report.check_metadata.copy(
+                            update={"Severity": Severity.critical}
+                        )
                         report.status_extended = f"RDS Instance {db_instance.id} custom certificate has expired."
             findings.append(report)
 
@@ -146,7 +146,7 @@ class Route53Domains(AWSService):
             # Route53Domains is a global service that supports endpoints in multiple AWS Regions
             # but you must specify the US East (N. Virginia) Region to create, update, or otherwise work with domains.
             self.region = "us-east-1"
-            self.client = self.session.client(self.service, self.region)
+            self.client = self.provider.get_client(self.service, self.region)
             self._list_domains()
             self._get_domain_detail()
             self._list_tags_for_domain()
@@ -17,22 +17,18 @@ class S3(AWSService):
         self.regions_with_buckets = []
         self.buckets = {}
         self._list_buckets(provider)
-        self.__threading_call__(self._get_bucket_versioning, self.buckets.values())
-        self.__threading_call__(self._get_bucket_logging, self.buckets.values())
-        self.__threading_call__(self._get_bucket_policy, self.buckets.values())
-        self.__threading_call__(self._get_bucket_acl, self.buckets.values())
-        self.__threading_call__(self._get_public_access_block, self.buckets.values())
-        self.__threading_call__(self._get_bucket_encryption, self.buckets.values())
-        self.__threading_call__(
-            self._get_bucket_ownership_controls, self.buckets.values()
-        )
-        self.__threading_call__(
-            self._get_object_lock_configuration, self.buckets.values()
-        )
-        self.__threading_call__(self._get_bucket_tagging, self.buckets.values())
-        self.__threading_call__(self._get_bucket_replication, self.buckets.values())
-        self.__threading_call__(self._get_bucket_lifecycle, self.buckets.values())
-        self.__threading_call__(
+        self.__async_call__(self._get_bucket_versioning, self.buckets.values())
+        self.__async_call__(self._get_bucket_logging, self.buckets.values())
+        self.__async_call__(self._get_bucket_policy, self.buckets.values())
+        self.__async_call__(self._get_bucket_acl, self.buckets.values())
+        self.__async_call__(self._get_public_access_block, self.buckets.values())
+        self.__async_call__(self._get_bucket_encryption, self.buckets.values())
+        self.__async_call__(self._get_bucket_ownership_controls, self.buckets.values())
+        self.__async_call__(self._get_object_lock_configuration, self.buckets.values())
+        self.__async_call__(self._get_bucket_tagging, self.buckets.values())
+        self.__async_call__(self._get_bucket_replication, self.buckets.values())
+        self.__async_call__(self._get_bucket_lifecycle, self.buckets.values())
+        self.__async_call__(
             self._get_bucket_notification_configuration, self.buckets.values()
         )
 
@@ -97,12 +93,12 @@ class S3(AWSService):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _get_bucket_versioning(self, bucket):
+    async def _get_bucket_versioning(self, bucket):
         logger.info("S3 - Get buckets versioning...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            bucket_versioning = regional_client.get_bucket_versioning(
-                Bucket=bucket.name
+            bucket_versioning = await self.__async_api_call__(
+                regional_client, "get_bucket_versioning", Bucket=bucket.name
             )
             if "Status" in bucket_versioning:
                 if "Enabled" == bucket_versioning["Status"]:
@@ -129,12 +125,14 @@ class S3(AWSService):
                     f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def _get_bucket_encryption(self, bucket):
+    async def _get_bucket_encryption(self, bucket):
         logger.info("S3 - Get buckets encryption...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            bucket.encryption = regional_client.get_bucket_encryption(
-                Bucket=bucket.name
+            bucket.encryption = (
+                await self.__async_api_call__(
+                    regional_client, "get_bucket_encryption", Bucket=bucket.name
+                )
             )["ServerSideEncryptionConfiguration"]["Rules"][0][
                 "ApplyServerSideEncryptionByDefault"
             ][
@@ -161,11 +159,13 @@ class S3(AWSService):
                     f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def _get_bucket_logging(self, bucket):
+    async def _get_bucket_logging(self, bucket):
         logger.info("S3 - Get buckets logging...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            bucket_logging = regional_client.get_bucket_logging(Bucket=bucket.name)
+            bucket_logging = await self.__async_api_call__(
+                regional_client, "get_bucket_logging", Bucket=bucket.name
+            )
             if "LoggingEnabled" in bucket_logging:
                 bucket.logging = True
                 bucket.logging_target_bucket = bucket_logging["LoggingEnabled"][
@@ -190,12 +190,14 @@ class S3(AWSService):
                     f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def _get_public_access_block(self, bucket):
+    async def _get_public_access_block(self, bucket):
         logger.info("S3 - Get buckets public access block...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            public_access_block = regional_client.get_public_access_block(
-                Bucket=bucket.name
+            public_access_block = (
+                await self.__async_api_call__(
+                    regional_client, "get_public_access_block", Bucket=bucket.name
+                )
             )["PublicAccessBlockConfiguration"]
             bucket.public_access_block = PublicAccessBlock(
                 block_public_acls=public_access_block["BlockPublicAcls"],
@@ -233,12 +235,16 @@ class S3(AWSService):
                     f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def _get_bucket_acl(self, bucket):
+    async def _get_bucket_acl(self, bucket):
         logger.info("S3 - Get buckets acl...")
         try:
             regional_client = self.regional_clients[bucket.region]
             grantees = []
-            acl_grants = regional_client.get_bucket_acl(Bucket=bucket.name)["Grants"]
+            acl_grants = (
+                await self.__async_api_call__(
+                    regional_client, "get_bucket_acl", Bucket=bucket.name
+                )
+            )["Grants"]
             for grant in acl_grants:
                 grantee = ACL_Grantee(type=grant["Grantee"]["Type"])
                 if "DisplayName" in grant["Grantee"]:
@@ -270,12 +276,16 @@ class S3(AWSService):
                     f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def _get_bucket_policy(self, bucket):
+    async def _get_bucket_policy(self, bucket):
         logger.info("S3 - Get buckets policy...")
         try:
             regional_client = self.regional_clients[bucket.region]
             bucket.policy = json.loads(
-                regional_client.get_bucket_policy(Bucket=bucket.name)["Policy"]
+                (
+                    await self.__async_api_call__(
+                        regional_client, "get_bucket_policy", Bucket=bucket.name
+                    )
+                )["Policy"]
             )
         except ClientError as error:
             if error.response["Error"]["Code"] == "NoSuchBucketPolicy":
@@ -298,12 +308,14 @@ class S3(AWSService):
                     f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def _get_bucket_ownership_controls(self, bucket):
+    async def _get_bucket_ownership_controls(self, bucket):
         logger.info("S3 - Get buckets ownership controls...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            bucket.ownership = regional_client.get_bucket_ownership_controls(
-                Bucket=bucket.name
+            bucket.ownership = (
+                await self.__async_api_call__(
+                    regional_client, "get_bucket_ownership_controls", Bucket=bucket.name
+                )
             )["OwnershipControls"]["Rules"][0]["ObjectOwnership"]
         except ClientError as error:
             if error.response["Error"]["Code"] == "NoSuchBucket":
@@ -326,11 +338,13 @@ class S3(AWSService):
                     f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def _get_object_lock_configuration(self, bucket):
+    async def _get_object_lock_configuration(self, bucket):
         logger.info("S3 - Get buckets ownership controls...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            regional_client.get_object_lock_configuration(Bucket=bucket.name)
+            await self.__async_api_call__(
+                regional_client, "get_object_lock_configuration", Bucket=bucket.name
+            )
             bucket.object_lock = True
         except Exception as error:
             if (
@@ -356,13 +370,15 @@ class S3(AWSService):
                         f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                     )
 
-    def _get_bucket_tagging(self, bucket):
+    async def _get_bucket_tagging(self, bucket):
         logger.info("S3 - Get buckets logging...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            bucket_tags = regional_client.get_bucket_tagging(Bucket=bucket.name)[
-                "TagSet"
-            ]
+            bucket_tags = (
+                await self.__async_api_call__(
+                    regional_client, "get_bucket_tagging", Bucket=bucket.name
+                )
+            )["TagSet"]
             bucket.tags = bucket_tags
         except ClientError as error:
             bucket.tags = []
@@ -385,12 +401,14 @@ class S3(AWSService):
                     f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def _get_bucket_lifecycle(self, bucket):
+    async def _get_bucket_lifecycle(self, bucket):
         logger.info("S3 - Get buckets lifecycle...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            lifecycle_configuration = (
-                regional_client.get_bucket_lifecycle_configuration(Bucket=bucket.name)
+            lifecycle_configuration = await self.__async_api_call__(
+                regional_client,
+                "get_bucket_lifecycle_configuration",
+                Bucket=bucket.name,
             )
             for rule in lifecycle_configuration["Rules"]:
                 bucket.lifecycle.append(
@@ -407,12 +425,14 @@ class S3(AWSService):
                     f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def _get_bucket_replication(self, bucket):
+    async def _get_bucket_replication(self, bucket):
         logger.info("S3 - Get buckets replication...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            replication_config = regional_client.get_bucket_replication(
-                Bucket=bucket.name
+            replication_config = (
+                await self.__async_api_call__(
+                    regional_client, "get_bucket_replication", Bucket=bucket.name
+                )
             )["ReplicationConfiguration"]["Rules"]
             if replication_config:
                 for rule in replication_config:
@@ -447,14 +467,14 @@ class S3(AWSService):
                     f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def _get_bucket_notification_configuration(self, bucket):
+    async def _get_bucket_notification_configuration(self, bucket):
         logger.info("S3 - Get bucket's notification configuration...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            bucket_notification_config = (
-                regional_client.get_bucket_notification_configuration(
-                    Bucket=bucket.name
-                )
+            bucket_notification_config = await self.__async_api_call__(
+                regional_client,
+                "get_bucket_notification_configuration",
+                Bucket=bucket.name,
             )
 
             if any(
@@ -575,7 +595,7 @@ class S3Control(AWSService):
         logger.info("S3 - Listing account multi region access points...")
         try:
             region = "us-west-2"
-            client = self.session.client(self.service, region)
+            client = self.provider.get_client(self.service, region)
             list_multi_region_access_points = client.list_multi_region_access_points(
                 AccountId=self.audited_account
             ).get("AccessPoints", [])
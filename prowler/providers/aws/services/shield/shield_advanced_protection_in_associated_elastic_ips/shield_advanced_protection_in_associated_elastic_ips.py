@@ -1,8 +1,13 @@
-from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    requires_service_attributes,
+)
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 from prowler.providers.aws.services.shield.shield_client import shield_client
 
 
+@requires_service_attributes("ec2_client.elastic_ips")
 class shield_advanced_protection_in_associated_elastic_ips(Check):
     def execute(self):
         findings = []
@@ -1,15 +1,22 @@
 import json
 
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import SecretsScanner
 from prowler.providers.aws.services.ssm.ssm_client import ssm_client
 
 
 class ssm_document_secrets(Check):
     def execute(self):
         findings = []
-        secrets_ignore_patterns = ssm_client.audit_config.get(
-            "secrets_ignore_patterns", []
+        # The content of all the documents is scanned in one batch
+        documents_secrets = SecretsScanner.from_audit_config(
+            ssm_client.audit_config
+        ).scan_batch(
+            {
+                document.arn: json.dumps(document.content, indent=2)
+                for document in ssm_client.documents.values()
+                if document.content
+            }
         )
         for document in ssm_client.documents.values():
             report = Check_Report_AWS(metadata=self.metadata(), resource=document)
@@ -19,13 +26,7 @@ class ssm_document_secrets(Check):
             )
 
             if document.content:
-                detect_secrets_output = detect_secrets_scan(
-                    data=json.dumps(document.content, indent=2),
-                    excluded_secrets=secrets_ignore_patterns,
-                    detect_secrets_plugins=ssm_client.audit_config.get(
-                        "detect_secrets_plugins"
-                    ),
-                )
+                detect_secrets_output = documents_secrets.get(document.arn)
                 if detect_secrets_output:
                     secrets_string = ", ".join(
                         [
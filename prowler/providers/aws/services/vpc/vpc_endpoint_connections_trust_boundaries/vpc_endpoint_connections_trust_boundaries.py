@@ -1,10 +1,15 @@
 from re import compile
 
-from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    requires_service_attributes,
+)
 from prowler.providers.aws.services.iam.lib.policy import is_condition_block_restrictive
 from prowler.providers.aws.services.vpc.vpc_client import vpc_client
 
 
+@requires_service_attributes("vpc_client.vpc_endpoints")
 class vpc_endpoint_connections_trust_boundaries(Check):
     def execute(self):
         findings = []
@@ -1,7 +1,12 @@
-from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    requires_service_attributes,
+)
 from prowler.providers.aws.services.vpc.vpc_client import vpc_client
 
 
+@requires_service_attributes("vpc_client.vpc_endpoints")
 class vpc_endpoint_multi_az_enabled(Check):
     def execute(self):
         findings = []
@@ -1,9 +1,14 @@
 from re import compile
 
-from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    requires_service_attributes,
+)
 from prowler.providers.aws.services.vpc.vpc_client import vpc_client
 
 
+@requires_service_attributes("vpc_client.vpc_endpoint_services")
 class vpc_endpoint_services_allowed_principals_trust_boundaries(Check):
     def execute(self):
         findings = []
@@ -17,19 +17,38 @@ class VPC(AWSService):
             f"arn:{self.audited_partition}:ec2:{self.region}:{self.audited_account}:vpc"
         )
         self.vpcs = {}
-        self.vpc_peering_connections = []
-        self.vpc_endpoints = []
-        self.vpc_endpoint_services = []
         self.__threading_call__(self._describe_vpcs)
-        self.__threading_call__(self._describe_vpc_peering_connections)
-        self.__threading_call__(self._describe_vpc_endpoints)
-        self.__threading_call__(self._describe_vpc_endpoint_services)
         self._describe_flow_logs()
-        self._describe_peering_route_tables()
-        self._describe_vpc_endpoint_service_permissions()
         self.vpc_subnets = {}
         self.__threading_call__(self._describe_vpc_subnets)
         self._describe_network_interfaces()
+        # The following attributes are only collected if a check uses them
+        self.register_lazy_attributes(
+            ["vpc_peering_connections"], self._collect_vpc_peering_connections
+        )
+        self.register_lazy_attributes(["vpc_endpoints"], self._collect_vpc_endpoints)
+        self.register_lazy_attributes(
+            ["vpc_endpoint_services"], self._collect_vpc_endpoint_services
+        )
+        self.register_lazy_attributes(
+            ["vpn_connections"], self._collect_vpn_connections
+        )
+
+    def _collect_vpc_peering_connections(self):
+        self.vpc_peering_connections = []
+        self.__threading_call__(self._describe_vpc_peering_connections)
+        self._describe_peering_route_tables()
+
+    def _collect_vpc_endpoints(self):
+        self.vpc_endpoints = []
+        self.__threading_call__(self._describe_vpc_endpoints)
+
+    def _collect_vpc_endpoint_services(self):
+        self.vpc_endpoint_services = []
+        self.__threading_call__(self._describe_vpc_endpoint_services)
+        self._describe_vpc_endpoint_service_permissions()
+
+    def _collect_vpn_connections(self):
         self.vpn_connections = {}
         self.__threading_call__(self._describe_vpn_connections)
 
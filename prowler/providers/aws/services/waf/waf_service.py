@@ -17,7 +17,7 @@ class WAF(AWSService):
         if self.audited_partition == "aws":
             # AWS WAF is available globally for CloudFront distributions, but you must use the Region US East (N. Virginia) to create your web ACL and any resources used in the web ACL, such as rule groups, IP sets, and regex pattern sets.
             self.region = "us-east-1"
-            self.client = self.session.client(self.service, self.region)
+            self.client = self.provider.get_client(self.service, self.region)
             self._list_rules()
             self.__threading_call__(self._get_rule, self.rules.values())
             self._list_rule_groups()
@@ -1,6 +1,5 @@
 from prowler.lib.check.models import Check_Report_Azure
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class AzureMutelist(Mutelist):
@@ -14,11 +13,11 @@ class AzureMutelist(Mutelist):
             finding.check_metadata.CheckID,
             finding.location,
             finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+            finding.resource_tags,
         ) or self.is_muted(
             finding.subscription,  # support Azure Subscription Name in mutelist
             finding.check_metadata.CheckID,
             finding.location,
             finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+            finding.resource_tags,
         )
@@ -176,6 +176,8 @@ class Provider(ABC):
                         config_path=arguments.config_file,
                         mutelist_path=arguments.mutelist_file,
                         fixer_config=fixer_config,
+                        record_api_responses=arguments.record_api_responses,
+                        replay_api_responses=arguments.replay_api_responses,
                     )
                 elif "azure" in provider_class_name.lower():
                     provider_class(
@@ -1,6 +1,5 @@
 from prowler.lib.check.models import Check_Report_GCP
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class GCPMutelist(Mutelist):
@@ -13,5 +12,5 @@ class GCPMutelist(Mutelist):
             finding.check_metadata.CheckID,
             finding.location,
             finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+            finding.resource_tags,
         )
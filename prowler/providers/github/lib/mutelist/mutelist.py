@@ -1,6 +1,5 @@
 from prowler.lib.check.models import CheckReportGithub
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class GithubMutelist(Mutelist):
@@ -14,5 +13,5 @@ class GithubMutelist(Mutelist):
             finding.check_metadata.CheckID,
             "*",  # TODO: Study regions in GitHub
             finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+            finding.resource_tags,
         )
@@ -1,6 +1,5 @@
 from prowler.lib.check.models import Check_Report_Kubernetes
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class KubernetesMutelist(Mutelist):
@@ -14,5 +13,5 @@ class KubernetesMutelist(Mutelist):
             finding.check_metadata.CheckID,
             finding.namespace,
             finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+            finding.resource_tags,
         )
@@ -1,6 +1,5 @@
 from prowler.lib.check.models import CheckReportM365
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class M365Mutelist(Mutelist):
@@ -14,5 +13,5 @@ class M365Mutelist(Mutelist):
             finding.check_metadata.CheckID,
             finding.location,
             finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+            finding.resource_tags,
         )
@@ -1,6 +1,5 @@
 from prowler.lib.check.models import CheckReportNHN
 from prowler.lib.mutelist.mutelist import Mutelist
-from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class NHNMutelist(Mutelist):
@@ -10,5 +9,5 @@ class NHNMutelist(Mutelist):
             finding.check_metadata.CheckID,
             finding.location,
             finding.resource_name,
-            unroll_dict(unroll_tags(finding.resource_tags)),
+            finding.resource_tags,
         )
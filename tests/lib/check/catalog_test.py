@@ -0,0 +1,139 @@
+import os
+from unittest import mock
+
+import pytest
+
+from prowler.lib.check.catalog import (
+    get_cached_catalog_section,
+    get_catalog_fingerprint,
+    is_catalog_cache_enabled,
+)
+
+
+def create_check(prowler_path, service, check_name):
+    check_path = prowler_path / "providers" / "aws" / "services" / service / check_name
+    check_path.mkdir(parents=True)
+    (check_path / f"{check_name}.metadata.json").write_text("{}")
+    return check_path
+
+
+class TestCatalog:
+    @pytest.fixture(autouse=True)
+    def clear_catalog_fingerprint(self):
+        get_catalog_fingerprint.cache_clear()
+        yield
+        get_catalog_fingerprint.cache_clear()
+
+    def test_is_catalog_cache_enabled(self):
+        with mock.patch.dict(os.environ, {"PROWLER_CATALOG_CACHE": "true"}):
+            assert is_catalog_cache_enabled()
+        with mock.patch.dict(os.environ, {"PROWLER_CATALOG_CACHE": "false"}):
+            assert not is_catalog_cache_enabled()
+
+    def test_get_cached_catalog_section_disabled(self, tmp_path):
+        builder = mock.MagicMock(return_value={"check": "metadata"})
+        with mock.patch.dict(
+            os.environ,
+            {
+                "PROWLER_CATALOG_CACHE": "false",
+                "PROWLER_CATALOG_CACHE_DIRECTORY": str(tmp_path),
+            },
+        ):
+            get_cached_catalog_section("aws", "checks_metadata", builder)
+            get_cached_catalog_section("aws", "checks_metadata", builder)
+
+        assert builder.call_count == 2
+        assert os.listdir(tmp_path) == []
+
+    def test_get_cached_catalog_section(self, tmp_path):
+        prowler_path = tmp_path / "prowler"
+        create_check(prowler_path, "ec2", "ec2_ami_public")
+        builder = mock.MagicMock(return_value={"ec2_ami_public": "metadata"})
+        with (
+            mock.patch.dict(
+                os.environ,
+                {
+                    "PROWLER_CATALOG_CACHE": "true",
+                    "PROWLER_CATALOG_CACHE_DIRECTORY": str(tmp_path / "cache"),
+                },
+            ),
+            mock.patch("prowler.lib.check.catalog.prowler.__path__", [prowler_path]),
+        ):
+            assert get_cached_catalog_section("aws", "checks_metadata", builder) == {
+                "ec2_ami_public": "metadata"
+            }
+            assert get_cached_catalog_section("aws", "checks_metadata", builder) == {
+                "ec2_ami_public": "metadata"
+            }
+            assert builder.call_count == 1
+
+            # A new custom check invalidates the cached section
+            create_check(prowler_path, "ec2", "ec2_custom_check")
+            get_catalog_fingerprint.cache_clear()
+            get_cached_catalog_section("aws", "checks_metadata", builder)
+            assert builder.call_count == 2
+            # Outdated files are removed
+            assert len(os.listdir(tmp_path / "cache")) == 1
+
+    def test_get_catalog_fingerprint_metadata_changed(self, tmp_path):
+        prowler_path = tmp_path / "prowler"
+        check_path = create_check(prowler_path, "ec2", "ec2_ami_public")
+        with mock.patch("prowler.lib.check.catalog.prowler.__path__", [prowler_path]):
+            fingerprint = get_catalog_fingerprint("aws")
+            assert get_catalog_fingerprint("aws") == fingerprint
+
+            (check_path / "ec2_ami_public.metadata.json").write_text('{"a": "b"}')
+            # The fingerprint is computed once per process
+            assert get_catalog_fingerprint("aws") == fingerprint
+            get_catalog_fingerprint.cache_clear()
+            assert get_catalog_fingerprint("aws") != fingerprint
+
+    @pytest.mark.parametrize("untrusted_path", ["directory", "file"])
+    def test_get_cached_catalog_section_untrusted(self, tmp_path, untrusted_path):
+        prowler_path = tmp_path / "prowler"
+        create_check(prowler_path, "ec2", "ec2_ami_public")
+        cache_directory = tmp_path / "cache"
+        builder = mock.MagicMock(return_value={"ec2_ami_public": "metadata"})
+        with (
+            mock.patch.dict(
+                os.environ,
+                {
+                    "PROWLER_CATALOG_CACHE": "true",
+                    "PROWLER_CATALOG_CACHE_DIRECTORY": str(cache_directory),
+                },
+            ),
+            mock.patch("prowler.lib.check.catalog.prowler.__path__", [prowler_path]),
+        ):
+            get_cached_catalog_section("aws", "checks_metadata", builder)
+            assert oct(cache_directory.stat().st_mode & 0o777) == "0o700"
+
+            if untrusted_path == "directory":
+                cache_directory.chmod(0o777)
+            else:
+                (cache_file,) = cache_directory.iterdir()
+                cache_file.chmod(0o666)
+
+            # Cache files writable by other users are never unpickled
+            get_cached_catalog_section("aws", "checks_metadata", builder)
+            assert builder.call_count == 2
+
+    def test_get_cached_catalog_section_not_owned(self, tmp_path):
+        prowler_path = tmp_path / "prowler"
+        create_check(prowler_path, "ec2", "ec2_ami_public")
+        builder = mock.MagicMock(return_value={"ec2_ami_public": "metadata"})
+        with (
+            mock.patch.dict(
+                os.environ,
+                {
+                    "PROWLER_CATALOG_CACHE": "true",
+                    "PROWLER_CATALOG_CACHE_DIRECTORY": str(tmp_path / "cache"),
+                },
+            ),
+            mock.patch("prowler.lib.check.catalog.prowler.__path__", [prowler_path]),
+        ):
+            get_cached_catalog_section("aws", "checks_metadata", builder)
+            with mock.patch(
+                "prowler.lib.check.catalog.os.getuid", return_value=os.getuid() + 1
+            ):
+                get_cached_catalog_section("aws", "checks_metadata", builder)
+            assert builder.call_count == 2
@@ -1,26 +1,35 @@
 import json
 import os
 import pathlib
+import threading
+import time
 from importlib.machinery import FileFinder
 from logging import ERROR
 from pkgutil import ModuleInfo
 from unittest import mock
 
+import pytest
 from boto3 import client
 from mock import Mock, patch
 from moto import mock_aws
 
+from prowler.lib.check.catalog import get_catalog_fingerprint
 from prowler.lib.check.check import (
     exclude_checks_to_run,
     exclude_services_to_run,
     execute,
     execute_checks,
+    get_service_clients_dependencies,
+    group_checks_by_service,
+    initialize_service_clients,
     list_categories,
     list_checks_json,
     list_services,
     parse_checks_from_file,
     parse_checks_from_folder,
     remove_custom_checks_module,
+    run_checks,
+    run_checks_from_checkpoint,
     update_audit_metadata,
 )
 from prowler.lib.check.models import load_check_metadata
@@ -29,6 +38,7 @@ from prowler.lib.check.utils import (
     recover_checks_from_provider,
     recover_checks_from_service,
 )
+from prowler.lib.scan.checkpoint import ScanCheckpoint
 from prowler.providers.aws.aws_provider import AwsProvider
 from prowler.providers.aws.services.accessanalyzer.accessanalyzer_service import (
     Analyzer,
@@ -478,10 +488,14 @@ class TestCheck:
         for test in test_cases:
             check_folder = test["input"]["path"]
             provider = test["input"]["provider"]
+            fingerprint = get_catalog_fingerprint(provider)
             assert (
                 parse_checks_from_folder(aws_provider, check_folder) == test["expected"]
             )
+            # The custom checks are part of the catalog fingerprint
+            assert get_catalog_fingerprint(provider) != fingerprint
             remove_custom_checks_module(check_folder, provider)
+            assert get_catalog_fingerprint(provider) == fingerprint
 
     def test_exclude_checks_to_run(self):
         test_cases = [
@@ -973,3 +987,227 @@ class TestCheck:
             assert caplog.record_tuples == [
                 ("root", 40, f"Check '{checks[0]}' was not found for the AWS provider")
             ]
+
+    def test_group_checks_by_service(self):
+        assert group_checks_by_service(
+            ["ec2_ami_public", "s3_bucket_public_access", "ec2_instance_public_ip"]
+        ) == {
+            "ec2": ["ec2_ami_public", "ec2_instance_public_ip"],
+            "s3": ["s3_bucket_public_access"],
+        }
+
+    def test_run_checks_sequential(self):
+        checks = ["ec2_ami_public", "s3_bucket_public_access"]
+        results = list(run_checks(checks, lambda check_name: [check_name]))
+        assert results == [
+            ("ec2_ami_public", ["ec2_ami_public"]),
+            ("s3_bucket_public_access", ["s3_bucket_public_access"]),
+        ]
+
+    def test_run_checks_parallel_keeps_order(self):
+        checks = sorted(
+            [
+                "ec2_ami_public",
+                "ec2_instance_public_ip",
+                "iam_root_mfa_enabled",
+                "s3_bucket_public_access",
+                "s3_bucket_default_encryption",
+            ]
+        )
+        executed_by_service = {}
+
+        def execute_check(check_name):
+            # The first service is the slowest one to finish
+            if check_name.startswith("ec2"):
+                time.sleep(0.05)
+            executed_by_service.setdefault(check_name.split("_")[0], set()).add(
+                threading.get_ident()
+            )
+            return [check_name]
+
+        results = list(run_checks(checks, execute_check, parallel_checks=3))
+        assert [check_name for check_name, _ in results] == checks
+        assert all(findings == [check_name] for check_name, findings in results)
+        # Each service's checks are executed by the same worker
+        assert all(len(threads) == 1 for threads in executed_by_service.values())
+
+    def test_run_checks_parallel_check_exception(self, caplog):
+        caplog.set_level(ERROR)
+        checks = ["ec2_ami_public", "s3_bucket_public_access"]
+
+        def execute_check(check_name):
+            if check_name == "ec2_ami_public":
+                raise Exception("error")
+            return [check_name]
+
+        results = list(run_checks(checks, execute_check, parallel_checks=2))
+        assert results == [
+            ("ec2_ami_public", None),
+            ("s3_bucket_public_access", ["s3_bucket_public_access"]),
+        ]
+        assert "ec2_ami_public - Exception" in caplog.text
+
+    def test_run_checks_parallel_worker_base_exception(self):
+        checks = ["ec2_ami_public", "ec2_instance_public_ip", "s3_bucket_public_access"]
+
+        def execute_check(check_name):
+            if check_name == "ec2_ami_public":
+                raise SystemExit(1)
+            return [check_name]
+
+        results = run_checks(checks, execute_check, parallel_checks=2)
+        # The dead worker's checks are reported instead of blocking the scan forever
+        with pytest.raises(SystemExit):
+            next(results)
+
+    def test_run_checks_from_checkpoint(self, tmp_path):
+        checks = ["ec2_ami_public", "iam_root_mfa_enabled", "s3_bucket_public_access"]
+        checkpoint = ScanCheckpoint(str(tmp_path), "aws")
+        checkpoint.save_findings("iam_root_mfa_enabled", ["iam_finding"])
+        executed_checks = []
+
+        def execute_check(check_name):
+            executed_checks.append(check_name)
+            return [check_name]
+
+        results = list(
+            run_checks_from_checkpoint(
+                checks,
+                execute_check,
+                parallel_checks=2,
+                checkpoint=ScanCheckpoint(str(tmp_path), "aws", resume=True),
+            )
+        )
+        assert results == [
+            ("ec2_ami_public", ["ec2_ami_public"], False),
+            ("iam_root_mfa_enabled", ["iam_finding"], True),
+            ("s3_bucket_public_access", ["s3_bucket_public_access"], False),
+        ]
+        assert sorted(executed_checks) == ["ec2_ami_public", "s3_bucket_public_access"]
+
+    def test_run_checks_from_checkpoint_initialize_services(self, tmp_path):
+        checks = ["ec2_ami_public", "iam_root_mfa_enabled", "s3_bucket_public_access"]
+        checkpoint = ScanCheckpoint(str(tmp_path), "aws")
+        checkpoint.save_findings("iam_root_mfa_enabled", ["iam_finding"])
+        initialize_services = Mock()
+
+        results = list(
+            run_checks_from_checkpoint(
+                checks,
+                lambda check_name: [check_name],
+                parallel_checks=2,
+                checkpoint=ScanCheckpoint(str(tmp_path), "aws", resume=True),
+                initialize_services=initialize_services,
+            )
+        )
+        assert len(results) == 3
+        # Only the services of the checks to execute are initialised
+        initialize_services.assert_called_once_with(
+            ["ec2_ami_public", "s3_bucket_public_access"]
+        )
+
+    def test_get_service_clients_dependencies(self):
+        assert get_service_clients_dependencies(
+            [
+                "keyvault_logging_enabled",
+                "monitor_alert_create_policy_assignment",
+                "keyvault_non_existent_check",
+            ],
+            "azure",
+        ) == {
+            "prowler.providers.azure.services.keyvault.keyvault_client": {
+                "prowler.providers.azure.services.monitor.monitor_client"
+            },
+            "prowler.providers.azure.services.monitor.monitor_client": set(),
+        }
+
+    def test_get_service_clients_dependencies_kubernetes(self):
+        assert get_service_clients_dependencies(
+            ["apiserver_always_pull_images_plugin"], "kubernetes"
+        ) == {
+            "prowler.providers.kubernetes.services.apiserver.apiserver_client": {
+                "prowler.providers.kubernetes.services.core.core_client"
+            },
+            "prowler.providers.kubernetes.services.core.core_client": set(),
+        }
+
+    def test_initialize_service_clients(self):
+        initialized_clients = []
+
+        def import_module(client_module):
+            time.sleep(0.05)
+            initialized_clients.append(client_module)
+
+        with (
+            patch(
+                "prowler.lib.check.check.get_service_clients_dependencies",
+                return_value={
+                    "test.services.keyvault.keyvault_client": {
+                        "test.services.monitor.monitor_client"
+                    },
+                    "test.services.app.app_client": {
+                        "test.services.monitor.monitor_client"
+                    },
+                    "test.services.monitor.monitor_client": set(),
+                    "test.services.storage.storage_client": set(),
+                },
+            ),
+            patch(
+                "prowler.lib.check.check.importlib.import_module",
+                side_effect=import_module,
+            ),
+        ):
+            initialize_service_clients(["keyvault_logging_enabled"], "azure", 4)
+
+        assert sorted(initialized_clients) == [
+            "test.services.app.app_client",
+            "test.services.keyvault.keyvault_client",
+            "test.services.monitor.monitor_client",
+            "test.services.storage.storage_client",
+        ]
+        # The service clients are initialised after the service clients they depend on
+        assert initialized_clients.index(
+            "test.services.monitor.monitor_client"
+        ) < initialized_clients.index("test.services.keyvault.keyvault_client")
+        assert initialized_clients.index(
+            "test.services.monitor.monitor_client"
+        ) < initialized_clients.index("test.services.app.app_client")
+
+    def test_initialize_service_clients_error(self, caplog):
+        initialized_clients = []
+
+        def import_module(client_module):
+            if client_module == "test.services.monitor.monitor_client":
+                raise ValueError("monitor error")
+            initialized_clients.append(client_module)
+
+        with (
+            patch(
+                "prowler.lib.check.check.get_service_clients_dependencies",
+                return_value={
+                    "test.services.keyvault.keyvault_client": {
+                        "test.services.monitor.monitor_client"
+                    },
+                    "test.services.monitor.monitor_client": set(),
+                },
+            ),
+            patch(
+                "prowler.lib.check.check.importlib.import_module",
+                side_effect=import_module,
+            ),
+        ):
+            caplog.set_level(ERROR)
+            initialize_service_clients(["keyvault_logging_enabled"], "azure", 2)
+
+        assert initialized_clients == ["test.services.keyvault.keyvault_client"]
+        assert "test.services.monitor.monitor_client - ValueError" in caplog.text
+
+    def test_run_checks_from_checkpoint_without_checkpoint(self):
+        checks = ["ec2_ami_public", "s3_bucket_public_access"]
+        results = list(
+            run_checks_from_checkpoint(checks, lambda check_name: [check_name])
+        )
+        assert results == [
+            ("ec2_ami_public", ["ec2_ami_public"], False),
+            ("s3_bucket_public_access", ["s3_bucket_public_access"], False),
+        ]
@@ -1,6 +1,10 @@
 from unittest import mock
 
-from prowler.lib.check.compliance import update_checks_metadata_with_compliance
+from prowler.lib.check.compliance import (
+    build_compliance_index,
+    check_compliance_index,
+    update_checks_metadata_with_compliance,
+)
 from prowler.lib.check.compliance_models import (
     CIS_Requirement_Attribute,
     CIS_Requirement_Attribute_AssessmentStatus,
@@ -291,6 +295,46 @@ class TestCompliance:
         assert accessanalyzer_enabled_attribute.AdditionalInformation == "Additional"
         assert accessanalyzer_enabled_attribute.References == "References"
 
+    def test_build_compliance_index(self):
+        compliance_index = build_compliance_index(custom_compliance_metadata)
+
+        assert set(compliance_index) == {
+            "accessanalyzer_enabled",
+            "iam_user_mfa_enabled_console_access",
+        }
+        accessanalyzer_enabled_compliance = compliance_index["accessanalyzer_enabled"]
+        assert [
+            (compliance.Provider, compliance.Requirements[0].Id)
+            for compliance in accessanalyzer_enabled_compliance
+        ] == [("aws", "1.1.1")]
+        # The requirement's Compliance is shared between its checks
+        assert (
+            compliance_index["iam_user_mfa_enabled_console_access"][0]
+            is accessanalyzer_enabled_compliance[0]
+        )
+
+    def test_update_checks_metadata_reloaded_frameworks(self):
+        bulk_checks_metadata = update_checks_metadata_with_compliance(
+            custom_compliance_metadata, self.get_custom_check_metadata()
+        )
+        check_compliance_index[("aws", "accessanalyzer_enabled")] = (
+            bulk_checks_metadata["accessanalyzer_enabled"].Compliance,
+            {"Framework1-1.0": ["1.1.1"]},
+        )
+
+        # The index is built from the frameworks passed, not from the previously loaded ones
+        reloaded_compliance_frameworks = {
+            "framework1_aws": custom_compliance_metadata["framework1_aws"].copy(
+                update={"Requirements": []}
+            )
+        }
+        bulk_checks_metadata = update_checks_metadata_with_compliance(
+            reloaded_compliance_frameworks, bulk_checks_metadata
+        )
+
+        assert bulk_checks_metadata["accessanalyzer_enabled"].Compliance == []
+        assert check_compliance_index == {}
+
     def test_list_no_provider(self):
         bulk_compliance_frameworks = custom_compliance_metadata
 
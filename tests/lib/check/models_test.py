@@ -1,6 +1,15 @@
 from unittest import mock
 
-from prowler.lib.check.models import CheckMetadata
+import pytest
+
+from prowler.lib.check.custom_checks_metadata import update_check_metadata
+from prowler.lib.check.models import (
+    Check_Report,
+    CheckMetadata,
+    Severity,
+    SharedCheckMetadata,
+    load_required_service_attributes,
+)
 from tests.lib.check.compliance_check_test import custom_compliance_metadata
 
 mock_metadata = CheckMetadata(
@@ -325,3 +334,91 @@ class TestCheckMetada:
 
         result = CheckMetadata.list(bulk_checks_metadata=bulk_metadata)
         assert result == set()
+
+
+class TestLoadRequiredServiceAttributes:
+    def test_load_required_service_attributes(self):
+        ec2_client = mock.MagicMock()
+        with (
+            mock.patch(
+                "prowler.providers.common.provider.Provider.get_global_provider",
+                return_value=mock.MagicMock(),
+            ),
+            mock.patch(
+                "prowler.providers.aws.services.ec2.ec2_service.EC2",
+                new=mock.MagicMock(),
+            ),
+        ):
+            from prowler.providers.aws.services.ec2.ec2_ebs_volume_snapshots_exists.ec2_ebs_volume_snapshots_exists import (
+                ec2_ebs_volume_snapshots_exists,
+            )
+
+            with mock.patch(
+                "prowler.providers.aws.services.ec2.ec2_ebs_volume_snapshots_exists.ec2_ebs_volume_snapshots_exists.ec2_client",
+                new=ec2_client,
+            ):
+                load_required_service_attributes(ec2_ebs_volume_snapshots_exists())
+
+        ec2_client.load_attributes.assert_has_calls(
+            [mock.call("volumes"), mock.call("volumes_with_snapshots")]
+        )
+
+    def test_load_required_service_attributes_without_declaration(self):
+        check = mock.MagicMock(spec=object)
+
+        # Checks without declarations do not load anything
+        load_required_service_attributes(check)
+
+
+class TestCheckReportSharedMetadata:
+    def test_check_report_with_shared_metadata(self):
+        shared_metadata = SharedCheckMetadata(**mock_metadata.dict())
+        first_report = Check_Report(metadata=shared_metadata, resource={})
+        second_report = Check_Report(metadata=shared_metadata, resource={})
+
+        # The metadata is not copied for each finding
+        assert first_report.check_metadata is shared_metadata
+        assert second_report.check_metadata is shared_metadata
+        # The shared metadata is read-only
+        with pytest.raises(TypeError):
+            first_report.check_metadata.Severity = Severity.low
+
+        # Findings replace their metadata to change its fields without affecting the others
+        first_report.check_metadata = first_report.check_metadata.copy(
+            update={"Severity": Severity.low}
+        )
+        assert first_report.check_metadata.Severity == Severity.low
+        assert second_report.check_metadata.Severity == Severity.high
+        assert shared_metadata.Severity == Severity.high
+
+    def test_check_report_with_json_metadata(self):
+        report = Check_Report(metadata=mock_metadata.json(), resource={})
+
+        assert report.check_metadata == mock_metadata
+
+    def test_check_metadata_is_shared(self):
+        with (
+            mock.patch(
+                "prowler.providers.common.provider.Provider.get_global_provider",
+                return_value=mock.MagicMock(),
+            ),
+            mock.patch(
+                "prowler.providers.aws.services.ec2.ec2_service.EC2",
+                new=mock.MagicMock(),
+            ),
+        ):
+            from prowler.providers.aws.services.ec2.ec2_ebs_volume_snapshots_exists.ec2_ebs_volume_snapshots_exists import (
+                ec2_ebs_volume_snapshots_exists,
+            )
+
+            check = ec2_ebs_volume_snapshots_exists()
+
+        shared_metadata = check.metadata()
+        assert check.metadata() is shared_metadata
+        assert type(shared_metadata) is SharedCheckMetadata
+        assert shared_metadata.CheckID == "ec2_ebs_volume_snapshots_exists"
+
+        # Custom metadata changes are included in the next findings
+        update_check_metadata(check, {"Severity": "low"})
+        assert check.metadata() is not shared_metadata
+        assert check.metadata().Severity == Severity.low
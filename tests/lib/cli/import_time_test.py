@@ -0,0 +1,56 @@
+import json
+import subprocess
+import sys
+
+# Modules that must only be imported when the provider, output format or integration is used
+LAZY_MODULES = [
+    "checkov",
+    "kubernetes",
+    "slack_sdk",
+    "prowler.lib.outputs.asff.asff",
+    "prowler.lib.outputs.csv.csv",
+    "prowler.lib.outputs.html.html",
+    "prowler.lib.outputs.ocsf.ocsf",
+    "prowler.lib.outputs.compliance.cis.cis_aws",
+    "prowler.lib.outputs.compliance.iso27001.iso27001_aws",
+    "prowler.providers.aws.lib.s3.s3",
+    "prowler.providers.aws.lib.security_hub.security_hub",
+    "prowler.providers.aws.lib.quick_inventory.quick_inventory",
+    "prowler.providers.kubernetes.models",
+]
+
+# Generous upper bound to catch import time regressions without being flaky
+IMPORT_TIME_LIMIT_SECONDS = 5
+
+IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import prowler.__main__
+
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_prowler_main() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestImportTime:
+    def test_main_does_not_import_lazy_modules(self):
+        imported_modules = set(import_prowler_main()["modules"])
+
+        for module in LAZY_MODULES:
+            assert module not in imported_modules
+
+    def test_main_import_time(self):
+        assert import_prowler_main()["elapsed"] < IMPORT_TIME_LIMIT_SECONDS
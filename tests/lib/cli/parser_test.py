@@ -5,7 +5,7 @@ from argparse import ArgumentTypeError
 import pytest
 from mock import patch
 
-from prowler.lib.cli.parser import ProwlerArgumentParser
+from prowler.lib.cli.parser import ProwlerArgumentParser, validate_parallel_checks
 from prowler.providers.aws.config import ROLE_SESSION_NAME
 from prowler.providers.aws.lib.arguments.arguments import (
     validate_bucket,
@@ -374,6 +374,105 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.unix_timestamp
 
+    def test_root_parser_streaming_outputs(self):
+        command = [prowler_command, "--streaming-outputs"]
+        parsed = self.parser.parse(command)
+        assert parsed.streaming_outputs
+
+    def test_root_parser_checkpoint_directory(self):
+        command = [prowler_command, "--checkpoint-directory", "checkpoint"]
+        parsed = self.parser.parse(command)
+        assert parsed.checkpoint_directory == "checkpoint"
+        assert not parsed.resume
+
+    def test_root_parser_resume(self):
+        command = [prowler_command, "--resume", "checkpoint"]
+        parsed = self.parser.parse(command)
+        assert parsed.resume == "checkpoint"
+        assert not parsed.checkpoint_directory
+
+    def test_root_parser_checkpoint_directory_without_value(self):
+        command = [prowler_command, "--checkpoint-directory"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_root_parser_resume_without_value(self):
+        command = [prowler_command, "--resume"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_root_parser_checkpoint_directory_and_resume(self):
+        command = [
+            prowler_command,
+            "--checkpoint-directory",
+            "checkpoint",
+            "--resume",
+            "checkpoint",
+        ]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_root_parser_profile_scan(self):
+        command = [prowler_command, "--profile-scan"]
+        parsed = self.parser.parse(command)
+        assert parsed.profile_scan
+
+    def test_root_parser_default_profile_scan(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.profile_scan
+
+    def test_root_parser_export_snapshot(self):
+        snapshot_file = "./snapshot.pickle.gz"
+        command = [prowler_command, "--export-snapshot", snapshot_file]
+        parsed = self.parser.parse(command)
+        assert parsed.export_snapshot == snapshot_file
+        assert not parsed.from_snapshot
+
+    def test_root_parser_from_snapshot(self):
+        snapshot_file = "./snapshot.pickle.gz"
+        command = [prowler_command, "--from-snapshot", snapshot_file]
+        parsed = self.parser.parse(command)
+        assert parsed.from_snapshot == snapshot_file
+        assert not parsed.export_snapshot
+
+    def test_root_parser_export_snapshot_without_value(self):
+        command = [prowler_command, "--export-snapshot"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_root_parser_from_snapshot_without_value(self):
+        command = [prowler_command, "--from-snapshot"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_root_parser_parallel_checks_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == 1
+
+    def test_root_parser_parallel_checks_without_value(self):
+        command = [prowler_command, "--parallel-checks"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_root_parser_parallel_checks(self):
+        command = [prowler_command, "--parallel-checks", "8"]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == 8
+
     def test_logging_parser_only_logs_set(self):
         command = [prowler_command, "--only-logs"]
         parsed = self.parser.parse(command)
@@ -1087,6 +1186,116 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.scan_unused_services
 
+    def test_aws_parser_record_api_responses(self):
+        argument = "--record-api-responses"
+        file_path = "./api-responses.json.gz"
+        command = [prowler_command, argument, file_path]
+        parsed = self.parser.parse(command)
+        assert parsed.record_api_responses == file_path
+        assert not parsed.replay_api_responses
+
+    def test_aws_parser_replay_api_responses(self):
+        argument = "--replay-api-responses"
+        file_path = "./api-responses.json.gz"
+        command = [prowler_command, argument, file_path]
+        parsed = self.parser.parse(command)
+        assert parsed.replay_api_responses == file_path
+        assert not parsed.record_api_responses
+
+    def test_aws_parser_record_api_responses_without_value(self):
+        command = [prowler_command, "--record-api-responses"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_aws_parser_replay_api_responses_without_value(self):
+        command = [prowler_command, "--replay-api-responses"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_aws_parser_multi_account(self):
+        role = "arn:aws:iam::123456789012:role/ProwlerScan"
+        command = [
+            prowler_command,
+            "--role",
+            role,
+            "--accounts",
+            "111111111111",
+            "222222222222",
+            "--organizational-units",
+            "ou-ab12-cd34ef56",
+            "--parallel-accounts",
+            "4",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.accounts == ["111111111111", "222222222222"]
+        assert parsed.organizational_units == ["ou-ab12-cd34ef56"]
+        assert parsed.parallel_accounts == 4
+
+    def test_aws_parser_multi_account_default_parallel_accounts(self):
+        command = [
+            prowler_command,
+            "--role",
+            "arn:aws:iam::123456789012:role/ProwlerScan",
+            "--accounts",
+            "111111111111",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_accounts == 1
+        assert parsed.multi_account_id is None
+
+    def test_aws_parser_multi_account_id(self):
+        command = [
+            prowler_command,
+            "--role",
+            "arn:aws:iam::123456789012:role/ProwlerScan",
+            "--accounts",
+            "111111111111",
+            "222222222222",
+            "--multi-account-id",
+            "222222222222",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.accounts == ["111111111111", "222222222222"]
+        assert parsed.multi_account_id == "222222222222"
+
+    def test_aws_parser_multi_account_parallel_accounts_without_value(self):
+        command = [
+            prowler_command,
+            "--role",
+            "arn:aws:iam::123456789012:role/ProwlerScan",
+            "--accounts",
+            "111111111111",
+            "--parallel-accounts",
+        ]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_aws_parser_multi_account_invalid_account(self):
+        command = [
+            prowler_command,
+            "--role",
+            "arn:aws:iam::123456789012:role/ProwlerScan",
+            "--accounts",
+            "1111",
+        ]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_aws_parser_multi_account_without_role(self):
+        command = [prowler_command, "--accounts", "111111111111"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
     def test_aws_parser_fixer(self):
         argument = "--fixer"
         command = [prowler_command, argument]
@@ -1318,6 +1527,15 @@ class Test_Parser:
         ):
             validate_azure_region(invalid_region)
 
+    def test_validate_parallel_checks_valid(self):
+        assert validate_parallel_checks("1") == 1
+        assert validate_parallel_checks("16") == 16
+
+    def test_validate_parallel_checks_invalid(self):
+        for parallel_checks in ["0", "-2", "two"]:
+            with pytest.raises(ArgumentTypeError):
+                validate_parallel_checks(parallel_checks)
+
     def test_validate_bucket_invalid_bucket_names(self):
         bad_bucket_names = [
             "xn--bucket-name",
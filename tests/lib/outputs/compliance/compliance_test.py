@@ -91,6 +91,28 @@ class TestCompliance:
             "CIS-1.5": ["2.1.3"],
         }
 
+        # The check's requirements are indexed once, each finding gets its own copy
+        check_compliance_result = get_check_compliance(
+            finding, "aws", bulk_checks_metadata
+        )
+        assert check_compliance_result == {
+            "CIS-1.4": ["2.1.3"],
+            "CIS-1.5": ["2.1.3"],
+        }
+        check_compliance_result["CIS-1.4"].append("1.1")
+        assert get_check_compliance(finding, "aws", bulk_checks_metadata) == {
+            "CIS-1.4": ["2.1.3"],
+            "CIS-1.5": ["2.1.3"],
+        }
+
+        # The requirements are indexed again when the check's compliance changes
+        bulk_checks_metadata["iam_user_accesskey_unused"].Compliance = check_compliance[
+            :1
+        ]
+        assert get_check_compliance(finding, "aws", bulk_checks_metadata) == {
+            "CIS-1.4": ["2.1.3"],
+        }
+
     def test_get_check_compliance_gcp(self):
         check_compliance = [
             Compliance(
@@ -0,0 +1,137 @@
+import json
+from types import SimpleNamespace
+
+from mock import MagicMock, patch
+
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.compliance import get_compliance_output_class
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
+from prowler.lib.outputs.outputs import extract_findings_statistics
+from prowler.lib.outputs.streaming import StreamingOutputs
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, set_mocked_aws_provider
+
+OUTPUT_FILENAME = "prowler-output"
+
+
+def generate_check_report(finding_output):
+    # The Check_Report fields used by the streaming outputs
+    return SimpleNamespace(
+        check_metadata=SimpleNamespace(
+            CheckID=finding_output.metadata.CheckID,
+            Severity=finding_output.metadata.Severity,
+        ),
+        status=finding_output.status,
+        muted=finding_output.muted,
+        finding_output=finding_output,
+    )
+
+
+def generate_output(provider, check_report, output_options):
+    return check_report.finding_output
+
+
+class TestStreamingOutputs:
+    def run_streaming_outputs(self, tmp_path, output_modes, check_findings):
+        output_options = MagicMock()
+        output_options.output_modes = output_modes
+        output_options.output_directory = str(tmp_path)
+        output_options.output_filename = OUTPUT_FILENAME
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+
+        streaming_outputs = StreamingOutputs(
+            provider=provider,
+            output_options=output_options,
+            bulk_compliance_frameworks={},
+            keep_asff_findings=True,
+        )
+        with patch(
+            "prowler.lib.outputs.streaming.Finding.generate_output",
+            side_effect=generate_output,
+        ):
+            for findings in check_findings:
+                streaming_outputs.write(
+                    [generate_check_report(finding) for finding in findings]
+                )
+        streaming_outputs.close()
+        return streaming_outputs
+
+    def test_streaming_outputs(self, tmp_path):
+        check_findings = [
+            [
+                generate_finding_output(status="FAIL", resource_uid="resource-1"),
+                generate_finding_output(status="PASS", resource_uid="resource-2"),
+            ],
+            [],
+            [
+                generate_finding_output(
+                    status="FAIL", muted=True, resource_uid="resource-3"
+                )
+            ],
+        ]
+
+        streaming_outputs = self.run_streaming_outputs(
+            tmp_path, ["csv", "json-ocsf", "json-asff", "html"], check_findings
+        )
+
+        assert streaming_outputs.stats == extract_findings_statistics(
+            [finding for findings in check_findings for finding in findings]
+        )
+        assert len(streaming_outputs.generated_outputs["regular"]) == 4
+        for output in streaming_outputs.generated_outputs["regular"]:
+            assert output.file_descriptor.closed
+            assert not output.data
+
+        with open(tmp_path / f"{OUTPUT_FILENAME}.csv") as csv_file:
+            assert len(csv_file.readlines()) == 4
+        with open(tmp_path / f"{OUTPUT_FILENAME}.ocsf.json") as ocsf_file:
+            assert len(json.load(ocsf_file)) == 3
+        with open(tmp_path / f"{OUTPUT_FILENAME}.asff.json") as asff_file:
+            assert len(json.load(asff_file)) == 3
+        with open(tmp_path / f"{OUTPUT_FILENAME}.html") as html_file:
+            html = html_file.read()
+            assert html.startswith("<!DOCTYPE html>")
+            assert html.count("<tr class=") == 3
+            assert html.rstrip().endswith("</html>")
+        assert len(streaming_outputs.asff_findings) == 3
+
+    def test_streaming_outputs_finding_summaries(self, tmp_path):
+        check_findings = [
+            [
+                generate_finding_output(status="FAIL", resource_uid="resource-1"),
+                generate_finding_output(status="FAIL", resource_uid="resource-2"),
+                generate_finding_output(status="PASS", resource_uid="resource-3"),
+            ]
+        ]
+
+        streaming_outputs = self.run_streaming_outputs(tmp_path, [], check_findings)
+
+        assert [summary.status for summary in streaming_outputs.findings] == [
+            "FAIL",
+            "FAIL",
+            "PASS",
+        ]
+        # Findings with the same values share the summary
+        assert streaming_outputs.findings[0] is streaming_outputs.findings[1]
+        assert (
+            streaming_outputs.findings[0].check_metadata.CheckID
+            == "service_test_check_id"
+        )
+        assert not streaming_outputs.generated_outputs["regular"]
+
+    def test_streaming_outputs_without_findings(self, tmp_path):
+        streaming_outputs = self.run_streaming_outputs(tmp_path, ["csv"], [[]])
+
+        assert streaming_outputs.findings == []
+        assert streaming_outputs.stats["findings_count"] == 0
+        assert not streaming_outputs.generated_outputs["regular"]
+        assert not (tmp_path / f"{OUTPUT_FILENAME}.csv").exists()
+
+
+class TestGetComplianceOutputClass:
+    def test_get_compliance_output_class(self):
+        assert get_compliance_output_class("aws", "cis_2.0_aws") is AWSCIS
+        assert get_compliance_output_class("nhn", "iso27001_2022_nhn") is NHNISO27001
+        assert get_compliance_output_class("aws", "soc2_aws") is GenericCompliance
+        assert get_compliance_output_class("github", "soc2_github") is GenericCompliance
@@ -0,0 +1,93 @@
+import json
+import os
+
+import pytest
+
+from prowler.config.config import prowler_version
+from prowler.lib.check.models import Check_Report_AWS
+from prowler.lib.scan.checkpoint import (
+    ScanCheckpoint,
+    checkpoint_journal_file,
+    checkpoint_manifest_file,
+)
+from prowler.lib.scan.exceptions.exceptions import ScanInvalidCheckpointError
+from tests.lib.check.models_test import mock_metadata
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1
+
+
+def generate_check_report(status: str) -> Check_Report_AWS:
+    report = Check_Report_AWS(
+        metadata=mock_metadata.json(),
+        resource={"id": "resource-id", "region": AWS_REGION_EU_WEST_1},
+    )
+    report.status = status
+    report.status_extended = f"Resource is {status}"
+    report.region = AWS_REGION_EU_WEST_1
+    return report
+
+
+class TestScanCheckpoint:
+    def test_new_checkpoint(self, tmp_path):
+        checkpoint = ScanCheckpoint(str(tmp_path), "aws")
+
+        assert checkpoint.get_completed_checks() == set()
+        with open(tmp_path / checkpoint_manifest_file) as manifest_file:
+            assert json.load(manifest_file) == {
+                "provider": "aws",
+                "prowler_version": prowler_version,
+            }
+
+    def test_new_checkpoint_existing_checkpoint(self, tmp_path):
+        ScanCheckpoint(str(tmp_path), "aws")
+
+        with pytest.raises(ScanInvalidCheckpointError):
+            ScanCheckpoint(str(tmp_path), "aws")
+
+    def test_resume_checkpoint(self, tmp_path):
+        checkpoint = ScanCheckpoint(str(tmp_path), "aws")
+        assert checkpoint.save_findings(
+            "accessanalyzer_enabled",
+            [generate_check_report("PASS"), generate_check_report("FAIL")],
+        )
+        assert checkpoint.save_findings("ec2_ami_public", [])
+
+        resumed_checkpoint = ScanCheckpoint(str(tmp_path), "aws", resume=True)
+
+        assert resumed_checkpoint.get_completed_checks() == {
+            "accessanalyzer_enabled",
+            "ec2_ami_public",
+        }
+        findings = resumed_checkpoint.load_findings("accessanalyzer_enabled")
+        assert [finding.status for finding in findings] == ["PASS", "FAIL"]
+        assert findings[1].status_extended == "Resource is FAIL"
+        assert findings[1].check_metadata.CheckID == mock_metadata.CheckID
+        assert resumed_checkpoint.load_findings("ec2_ami_public") == []
+
+    def test_resume_checkpoint_incomplete_journal_entry(self, tmp_path):
+        checkpoint = ScanCheckpoint(str(tmp_path), "aws")
+        checkpoint.save_findings("accessanalyzer_enabled", [])
+        # The scan was killed while writing the journal
+        with open(tmp_path / checkpoint_journal_file, "a") as journal:
+            journal.write('{"check": "ec2_ami_pu')
+
+        resumed_checkpoint = ScanCheckpoint(str(tmp_path), "aws", resume=True)
+
+        assert resumed_checkpoint.get_completed_checks() == {"accessanalyzer_enabled"}
+
+    def test_resume_checkpoint_not_found(self, tmp_path):
+        with pytest.raises(ScanInvalidCheckpointError):
+            ScanCheckpoint(str(tmp_path / "not-found"), "aws", resume=True)
+
+    def test_resume_checkpoint_other_provider(self, tmp_path):
+        ScanCheckpoint(str(tmp_path), "aws")
+
+        with pytest.raises(ScanInvalidCheckpointError):
+            ScanCheckpoint(str(tmp_path), "azure", resume=True)
+
+    def test_save_findings_not_serializable(self, tmp_path):
+        checkpoint = ScanCheckpoint(str(tmp_path), "aws")
+
+        assert not checkpoint.save_findings("accessanalyzer_enabled", [lambda: None])
+        assert checkpoint.get_completed_checks() == set()
+        assert os.listdir(tmp_path / "findings") == []
+        assert not (tmp_path / checkpoint_journal_file).exists()
@@ -0,0 +1,129 @@
+import csv
+import json
+from threading import Thread
+
+from boto3 import session
+from moto import mock_aws
+
+from prowler.lib.scan.profiler import (
+    ScanProfiler,
+    display_profile_summary_table,
+    profile_csv_file_suffix,
+    profile_json_file_suffix,
+)
+from tests.providers.aws.utils import AWS_REGION_US_EAST_1
+
+OUTPUT_FILENAME = "prowler-output"
+
+
+class TestScanProfiler:
+    def test_profile(self):
+        profiler = ScanProfiler()
+        with profiler.profile("service", "s3", "s3"):
+            pass
+        with profiler.profile("check", "s3_bucket_public_access", "s3") as record:
+            memory = [0] * 100000
+            record.findings = 3
+        # The measures of the same check or service are added up
+        with profiler.profile("service", "s3", "s3"):
+            pass
+        profiler.stop()
+        del memory
+
+        records = {
+            (record.type, record.name): record for record in profiler.get_records()
+        }
+        assert len(records) == 2
+        check_record = records[("check", "s3_bucket_public_access")]
+        assert check_record.service == "s3"
+        assert check_record.findings == 3
+        assert check_record.wall_time > 0
+        assert check_record.cpu_time >= 0
+        assert check_record.memory_peak_delta > 100000
+        assert records[("service", "s3")].findings == 0
+
+    def test_profile_without_memory(self):
+        profiler = ScanProfiler(measure_memory=False)
+        with profiler.profile("check", "s3_bucket_public_access", "s3") as record:
+            memory = [0] * 100000
+            record.findings = 3
+        profiler.stop()
+        del memory
+
+        (record,) = profiler.get_records()
+        assert record.findings == 3
+        assert record.wall_time > 0
+        # The peak memory is process-wide, so it is not measured for the checks executed concurrently
+        assert record.memory_peak_delta == 0
+
+    def test_profile_exception(self):
+        profiler = ScanProfiler()
+        try:
+            with profiler.profile("check", "s3_bucket_public_access", "s3"):
+                raise ValueError("check error")
+        except ValueError:
+            pass
+        profiler.stop()
+
+        (record,) = profiler.get_records()
+        assert record.wall_time > 0
+        assert not profiler._active_records
+
+    @mock_aws
+    def test_register_aws_session(self):
+        aws_session = session.Session(region_name=AWS_REGION_US_EAST_1)
+        profiler = ScanProfiler()
+        profiler.register_aws_session(aws_session)
+
+        with profiler.profile("service", "s3", "s3"):
+            s3_client = aws_session.client("s3")
+            s3_client.list_buckets()
+        with profiler.profile("check", "s3_bucket_public_access", "s3"):
+            s3_client.list_buckets()
+            # The API calls of the threads of the service are attributed to the latest check started
+            thread = Thread(target=s3_client.list_buckets)
+            thread.start()
+            thread.join()
+        # The retries are the attempts of the API calls besides the first one
+        profiler._count_api_request()
+        profiler.stop()
+
+        records = {
+            (record.type, record.name): record for record in profiler.get_records()
+        }
+        assert records[("service", "s3")].api_calls == 1
+        assert records[("service", "s3")].api_retries == 0
+        assert records[("check", "s3_bucket_public_access")].api_calls == 2
+        assert records[("check", "s3_bucket_public_access")].api_retries == 1
+
+    def test_write_report(self, tmp_path, capsys):
+        profiler = ScanProfiler()
+        with profiler.profile("check", "s3_bucket_public_access", "s3") as record:
+            record.findings = 2
+        with profiler.profile("check", "ec2_ami_public", "ec2"):
+            pass
+        profiler.stop()
+
+        reports = profiler.write_report(str(tmp_path), OUTPUT_FILENAME)
+
+        assert reports == [
+            f"{tmp_path}/{OUTPUT_FILENAME}{profile_json_file_suffix}",
+            f"{tmp_path}/{OUTPUT_FILENAME}{profile_csv_file_suffix}",
+        ]
+        with open(reports[0]) as json_file:
+            json_report = json.load(json_file)
+        assert [record["name"] for record in json_report] == [
+            "s3_bucket_public_access",
+            "ec2_ami_public",
+        ]
+        assert json_report[0]["findings"] == 2
+        with open(reports[1]) as csv_file:
+            csv_report = list(csv.DictReader(csv_file, delimiter=";"))
+        assert len(csv_report) == 2
+        assert csv_report[0]["type"] == "check"
+        assert csv_report[0]["findings"] == "2"
+
+        display_profile_summary_table(profiler.get_records(), reports, top=1)
+        output = capsys.readouterr().out
+        assert "Top 1 slowest checks and services" in output
+        assert reports[0] in output
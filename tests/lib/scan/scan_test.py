@@ -5,6 +5,7 @@ from unittest import mock
 import pytest
 from mock import MagicMock, patch
 
+from prowler.lib.scan.checkpoint import ScanCheckpoint
 from prowler.lib.scan.exceptions.exceptions import (
     ScanInvalidCategoryError,
     ScanInvalidCheckError,
@@ -304,6 +305,89 @@ class TestScan:
         }
         mock_logger.error.assert_not_called()
 
+    @patch("importlib.import_module")
+    def test_scan_parallel_checks(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_logger,
+        mock_generate_output,
+        mock_recover_checks_from_provider,
+        mock_load_check_metadata,
+    ):
+        mock_check_class = MagicMock()
+        mock_check_instance = mock_check_class.return_value
+        mock_check_instance.Provider = "aws"
+        mock_check_instance.CheckID = "accessanalyzer_enabled"
+        mock_check_instance.CheckTitle = "Check if IAM Access Analyzer is enabled"
+        mock_check_instance.Categories = []
+
+        mock_import_module.return_value = MagicMock(
+            accessanalyzer_enabled=mock_check_class
+        )
+
+        checks_to_execute = {"accessanalyzer_enabled"}
+        custom_checks_metadata = {}
+        mock_global_provider.type = "aws"
+
+        scan = Scan(mock_global_provider, checks=checks_to_execute)
+        results = list(scan.scan(custom_checks_metadata, parallel_checks=4))
+
+        assert mock_execute.call_count == 1
+        assert len(results) == 1
+        assert results[0][1] == mock_execute.side_effect()
+        assert results[0][0] == 100.0
+        assert scan.progress == 100.0
+        assert scan.service_checks_completed == {
+            "accessanalyzer": {"accessanalyzer_enabled"},
+        }
+        mock_logger.error.assert_not_called()
+
+    @patch("importlib.import_module")
+    def test_scan_checkpoint(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_logger,
+        mock_generate_output,
+        mock_recover_checks_from_provider,
+        mock_load_check_metadata,
+        tmp_path,
+    ):
+        mock_check_class = MagicMock()
+        mock_check_instance = mock_check_class.return_value
+        mock_check_instance.Provider = "aws"
+        mock_check_instance.CheckID = "accessanalyzer_enabled"
+        mock_check_instance.CheckTitle = "Check if IAM Access Analyzer is enabled"
+        mock_check_instance.Categories = []
+
+        mock_import_module.return_value = MagicMock(
+            accessanalyzer_enabled=mock_check_class
+        )
+
+        checks_to_execute = {"accessanalyzer_enabled"}
+        mock_global_provider.type = "aws"
+
+        scan = Scan(mock_global_provider, checks=checks_to_execute)
+        list(scan.scan(checkpoint=ScanCheckpoint(str(tmp_path), "aws")))
+        assert mock_execute.call_count == 1
+
+        # The resumed scan does not execute the completed check again
+        resumed_scan = Scan(mock_global_provider, checks=checks_to_execute)
+        results = list(
+            resumed_scan.scan(
+                checkpoint=ScanCheckpoint(str(tmp_path), "aws", resume=True)
+            )
+        )
+
+        assert mock_execute.call_count == 1
+        assert len(results) == 1
+        assert results[0][0] == 100.0
+        assert resumed_scan.service_checks_completed == {
+            "accessanalyzer": {"accessanalyzer_enabled"},
+        }
+        mock_logger.error.assert_not_called()
+
     def test_init_invalid_severity(
         mock_provider,
     ):
@@ -0,0 +1,192 @@
+import gzip
+import pickle
+import sys
+from threading import Lock
+from types import ModuleType, SimpleNamespace
+
+import pytest
+from boto3 import client
+from mock import patch
+from moto import mock_aws
+
+from prowler.lib.scan.exceptions.exceptions import ScanInvalidSnapshotError
+from prowler.lib.scan.snapshot import (
+    export_snapshot,
+    get_snapshot_checks,
+    get_snapshot_state,
+    load_snapshot,
+    load_snapshot_state,
+    restore_snapshot,
+    snapshot_version,
+)
+from prowler.providers.common.provider import Provider
+from tests.providers.aws.utils import (
+    AWS_ACCOUNT_NUMBER,
+    AWS_REGION_EU_WEST_1,
+    AWS_REGION_US_EAST_1,
+    set_mocked_aws_provider,
+)
+
+S3_CLIENT_MODULE = "prowler.providers.aws.services.s3.s3_client"
+S3_CHECK_MODULE = "prowler.providers.aws.services.s3.s3_bucket_default_encryption.s3_bucket_default_encryption"
+BUCKET_NAME = "bucket-test"
+EC2_CLIENT_MODULE = "prowler.providers.aws.services.ec2.ec2_client"
+EC2_CHECK_MODULE = "prowler.providers.aws.services.ec2.ec2_ebs_snapshots_encrypted.ec2_ebs_snapshots_encrypted"
+
+
+class PickledCounter:
+    pickled = 0
+
+    def __getstate__(self):
+        PickledCounter.pickled += 1
+        return {}
+
+
+class TestScanSnapshot:
+    def test_get_snapshot_state(self):
+        service = SimpleNamespace(
+            buckets={"bucket": "data"},
+            regional_clients={
+                AWS_REGION_US_EAST_1: Lock(),
+                AWS_REGION_EU_WEST_1: Lock(),
+            },
+            lock=Lock(),
+            provider="provider",
+        )
+
+        state = get_snapshot_state(service, {"provider"})
+        # The attributes are stored pickled
+        assert all(isinstance(value, bytes) for value in state.values())
+        assert load_snapshot_state(state) == {
+            "buckets": {"bucket": "data"},
+            # The regions of the clients are kept
+            "regional_clients": {
+                AWS_REGION_US_EAST_1: None,
+                AWS_REGION_EU_WEST_1: None,
+            },
+        }
+
+    def test_get_snapshot_state_pickled_once(self):
+        PickledCounter.pickled = 0
+        service = SimpleNamespace(counter=PickledCounter())
+
+        state = get_snapshot_state(service, set())
+
+        assert PickledCounter.pickled == 1
+        assert isinstance(load_snapshot_state(state)["counter"], PickledCounter)
+
+    @mock_aws
+    def test_export_and_restore_snapshot(self, tmp_path):
+        client("s3", region_name=AWS_REGION_US_EAST_1).create_bucket(Bucket=BUCKET_NAME)
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        file_path = str(tmp_path / "snapshot.pickle.gz")
+
+        from prowler.providers.aws.services.s3.s3_service import S3
+
+        s3_client_module = ModuleType(S3_CLIENT_MODULE)
+        s3_client_module.s3_client = S3(aws_provider)
+        with patch.dict(sys.modules, {S3_CLIENT_MODULE: s3_client_module}):
+            assert export_snapshot(aws_provider, file_path) >= 1
+
+        snapshot = load_snapshot(file_path, "aws")
+        assert snapshot["version"] == snapshot_version
+        assert S3_CLIENT_MODULE in snapshot["services"]
+
+        # The checks are executed against the restored services without connecting to AWS
+        with patch.dict(sys.modules), patch.object(Provider, "_global", None):
+            with patch("botocore.endpoint.Endpoint.make_request") as make_request:
+                sys.modules.pop(S3_CHECK_MODULE, None)
+                provider = restore_snapshot(
+                    snapshot,
+                    audit_config={"max_security_group_rules": 10},
+                    fixer_config={},
+                )
+                assert Provider.get_global_provider() is provider
+                assert provider.identity.account == AWS_ACCOUNT_NUMBER
+                assert provider.audit_config == {"max_security_group_rules": 10}
+
+                from prowler.providers.aws.services.s3.s3_bucket_default_encryption.s3_bucket_default_encryption import (
+                    s3_bucket_default_encryption,
+                )
+                from prowler.providers.aws.services.s3.s3_client import s3_client
+
+                assert s3_client.provider is provider
+                assert list(s3_client.regional_clients) == [AWS_REGION_US_EAST_1]
+                result = s3_bucket_default_encryption().execute()
+                assert len(result) == 1
+                assert result[0].resource_id == BUCKET_NAME
+                make_request.assert_not_called()
+
+    @mock_aws
+    def test_export_and_restore_snapshot_lazy_attributes(self, tmp_path):
+        ec2 = client("ec2", region_name=AWS_REGION_US_EAST_1)
+        volume = ec2.create_volume(AvailabilityZone="us-east-1a", Size=10)
+        snapshot_id = ec2.create_snapshot(VolumeId=volume["VolumeId"])["SnapshotId"]
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        file_path = str(tmp_path / "snapshot.pickle.gz")
+
+        from prowler.providers.aws.services.ec2.ec2_service import EC2
+
+        ec2_client_module = ModuleType(EC2_CLIENT_MODULE)
+        ec2_client_module.ec2_client = EC2(aws_provider)
+        with patch.dict(sys.modules, {EC2_CLIENT_MODULE: ec2_client_module}):
+            assert export_snapshot(aws_provider, file_path) >= 1
+
+        snapshot = load_snapshot(file_path, "aws")
+        # The lazy attributes are collected before the export and their collectors are not stored
+        assert snapshot["services"][EC2_CLIENT_MODULE][1]["_lazy_attributes"] == {}
+        assert "_lazy_lock" not in snapshot["services"][EC2_CLIENT_MODULE][1]
+
+        with patch.dict(sys.modules), patch.object(Provider, "_global", None):
+            with patch("botocore.endpoint.Endpoint.make_request") as make_request:
+                sys.modules.pop(EC2_CHECK_MODULE, None)
+                restore_snapshot(snapshot, audit_config={}, fixer_config={})
+
+                from prowler.lib.check.models import load_required_service_attributes
+                from prowler.providers.aws.services.ec2.ec2_ebs_snapshots_encrypted.ec2_ebs_snapshots_encrypted import (
+                    ec2_ebs_snapshots_encrypted,
+                )
+
+                check = ec2_ebs_snapshots_encrypted()
+                load_required_service_attributes(check)
+                result = check.execute()
+                assert snapshot_id in [finding.resource_id for finding in result]
+                make_request.assert_not_called()
+
+    def test_load_snapshot_invalid_file(self, tmp_path):
+        file_path = tmp_path / "snapshot.pickle.gz"
+        file_path.write_text("not a snapshot")
+        with pytest.raises(ScanInvalidSnapshotError):
+            load_snapshot(str(file_path), "aws")
+
+    def test_load_snapshot_other_provider(self, tmp_path):
+        file_path = str(tmp_path / "snapshot.pickle.gz")
+        with gzip.open(file_path, "wb") as snapshot_file:
+            pickle.dump(
+                {"version": snapshot_version, "provider": "azure", "services": {}},
+                snapshot_file,
+            )
+        with pytest.raises(ScanInvalidSnapshotError):
+            load_snapshot(file_path, "aws")
+
+    def test_load_snapshot_invalid_state(self, tmp_path):
+        file_path = str(tmp_path / "snapshot.pickle.gz")
+        with gzip.open(file_path, "wb") as snapshot_file:
+            pickle.dump(
+                {
+                    "version": snapshot_version,
+                    "provider": "aws",
+                    "prowler_version": "",
+                    "provider_state": {"_identity": b"not pickled"},
+                    "services": {},
+                },
+                snapshot_file,
+            )
+        with pytest.raises(ScanInvalidSnapshotError):
+            load_snapshot(file_path, "aws")
+
+    def test_get_snapshot_checks(self):
+        snapshot = {"services": {S3_CLIENT_MODULE: None}}
+        assert get_snapshot_checks(
+            snapshot, ["ec2_ami_public", "s3_bucket_default_encryption"], "aws"
+        ) == ["s3_bucket_default_encryption"]
@@ -1,4 +1,11 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+import pickle
+
+from prowler.lib.scan_filters.scan_filters import (
+    ResourceFilter,
+    get_resource_ids,
+    is_resource_filtered,
+)
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1
 
 
 class Test_Scan_Filters:
@@ -15,3 +22,73 @@ class Test_Scan_Filters:
         )
         assert is_resource_filtered("test_bucket", audit_resources)
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_is_resource_filtered_partial_resources(self):
+        audit_resources = [
+            "arn:aws:s3:::test_bucket",
+            f"arn:aws:logs:{AWS_REGION_US_EAST_1}:123456789012:log-group:test:*",
+        ]
+        # Only the complete names and IDs of the input resources are filtered
+        assert not is_resource_filtered("test", audit_resources)
+        assert not is_resource_filtered("arn:aws:s3:::test", audit_resources)
+        assert not is_resource_filtered("arn:aws:s3:::test_bucket_2", audit_resources)
+        assert is_resource_filtered(
+            f"arn:aws:logs:{AWS_REGION_US_EAST_1}:123456789012:log-group:test",
+            audit_resources,
+        )
+
+    def test_is_resource_filtered_wildcard(self):
+        resource_filter = ResourceFilter(["arn:aws:s3:::prod-*"])
+        assert is_resource_filtered("arn:aws:s3:::prod-logs", resource_filter)
+        assert not is_resource_filtered("arn:aws:s3:::dev-logs", resource_filter)
+
+
+class Test_ResourceFilter:
+    def test_resource_filter(self):
+        resource_filter = ResourceFilter(
+            [
+                "arn:aws:iam::123456789012:user/test_user",
+                "arn:aws:s3:::test_bucket",
+            ]
+        )
+        # It is still the list of input resources
+        assert resource_filter == [
+            "arn:aws:iam::123456789012:user/test_user",
+            "arn:aws:s3:::test_bucket",
+        ]
+        assert resource_filter.is_filtered("arn:aws:iam::123456789012:user/test_user")
+        assert resource_filter.is_filtered("test_user")
+        assert not resource_filter.is_filtered("arn:aws:iam::123456789012:user/test")
+        assert not ResourceFilter()
+
+    def test_get_resource_ids(self):
+        arn_prefix = f"arn:aws:ec2:{AWS_REGION_US_EAST_1}:123456789012:instance/"
+        resource_filter = ResourceFilter(
+            [
+                f"{arn_prefix}i-2",
+                f"{arn_prefix}i-1",
+                "arn:aws:s3:::test_bucket",
+            ]
+        )
+        assert resource_filter.get_resource_ids(arn_prefix) == ["i-1", "i-2"]
+        assert (
+            resource_filter.get_resource_ids(
+                f"arn:aws:ec2:{AWS_REGION_EU_WEST_1}:123456789012:instance/"
+            )
+            == []
+        )
+        assert get_resource_ids([], arn_prefix) is None
+
+    def test_get_resource_ids_wildcard(self):
+        arn_prefix = f"arn:aws:ec2:{AWS_REGION_US_EAST_1}:123456789012:instance/"
+        resource_filter = ResourceFilter(
+            [f"{arn_prefix}i-1", f"arn:aws:ec2:{AWS_REGION_US_EAST_1}:*"]
+        )
+        # All the resources must be retrieved to filter them
+        assert resource_filter.get_resource_ids(arn_prefix) is None
+
+    def test_pickle(self):
+        resource_filter = ResourceFilter(["arn:aws:s3:::test_bucket"])
+        loaded_resource_filter = pickle.loads(pickle.dumps(resource_filter))
+        assert loaded_resource_filter == resource_filter
+        assert loaded_resource_filter.is_filtered("test_bucket")
@@ -16,7 +16,12 @@ from moto import mock_aws
 from pytest import raises
 from tzlocal import get_localzone
 
-from prowler.providers.aws.aws_provider import AwsProvider, get_aws_region_for_sts
+from prowler.providers.aws.aws_provider import (
+    AwsProvider,
+    AWSRegionsCatalog,
+    get_aws_region_for_sts,
+    get_aws_regions_catalog,
+)
 from prowler.providers.aws.config import (
     AWS_STS_GLOBAL_ENDPOINT_REGION,
     BOTO3_USER_AGENT_EXTRA,
@@ -890,6 +895,87 @@ aws:
 
         assert response == {}
 
+    @mock_aws
+    def test_generate_regional_clients_shared_clients(self):
+        aws_provider = AwsProvider()
+        aws_provider._enabled_regions = [AWS_REGION_EU_WEST_1]
+
+        regional_clients = aws_provider.generate_regional_clients("ec2")
+
+        assert (
+            aws_provider.generate_regional_clients("ec2")[AWS_REGION_EU_WEST_1]
+            is regional_clients[AWS_REGION_EU_WEST_1]
+        )
+        assert (
+            aws_provider.get_client("ec2", AWS_REGION_EU_WEST_1)
+            is regional_clients[AWS_REGION_EU_WEST_1]
+        )
+
+    @mock_aws
+    def test_get_client(self):
+        aws_provider = AwsProvider()
+
+        client = aws_provider.get_client("s3", AWS_REGION_EU_WEST_1)
+
+        assert client.region == AWS_REGION_EU_WEST_1
+        assert client.meta.region_name == AWS_REGION_EU_WEST_1
+        assert client.meta.config.max_pool_connections == 10
+        assert client.meta.config.retries["mode"] == "standard"
+        assert aws_provider.get_client("s3", AWS_REGION_EU_WEST_1) is client
+        assert aws_provider.get_client("s3", AWS_REGION_US_EAST_1) is not client
+
+        # A new session gets new clients
+        aws_provider._session.current_session = session.Session()
+        assert aws_provider.get_client("s3", AWS_REGION_EU_WEST_1) is not client
+
+    @mock_aws
+    def test_get_client_api_scheduler(self):
+        aws_provider = AwsProvider(
+            config_content={
+                "api_max_concurrency": 20,
+                "api_rate_limits": {"iam": 5},
+            }
+        )
+
+        client = aws_provider.get_client("iam", AWS_REGION_US_EAST_1)
+        client.list_roles()
+
+        assert aws_provider.api_scheduler.max_concurrency == 20
+        assert aws_provider.api_scheduler.rate_limits == {"iam": 5.0}
+        assert aws_provider.api_scheduler._families["iam"].successes == 1
+
+    def test_record_and_replay_api_responses(self, tmp_path):
+        file_path = str(tmp_path / "api-responses.json.gz")
+        with mock_aws():
+            client("s3", region_name=AWS_REGION_US_EAST_1).create_bucket(
+                Bucket="test-bucket"
+            )
+            aws_provider = AwsProvider(record_api_responses=file_path)
+            recorded_buckets = aws_provider.get_client(
+                "s3", AWS_REGION_US_EAST_1
+            ).list_buckets()["Buckets"]
+            aws_provider.api_cache.save()
+
+        # The provider is initialised and the services collect their resources without calling the AWS APIs
+        with patch("botocore.endpoint.Endpoint.make_request") as make_request:
+            aws_provider = AwsProvider(replay_api_responses=file_path)
+            s3_client = aws_provider.get_client("s3", AWS_REGION_US_EAST_1)
+            assert s3_client.list_buckets()["Buckets"] == recorded_buckets
+            make_request.assert_not_called()
+        assert aws_provider.identity.account == AWS_ACCOUNT_NUMBER
+        assert aws_provider.api_cache.replay
+        # The replayed API calls are not scheduled
+        assert not aws_provider.api_scheduler._families
+
+    @mock_aws
+    def test_get_client_parallel_services(self):
+        aws_provider = AwsProvider()
+        aws_provider.set_parallel_services(4)
+
+        client = aws_provider.get_client("s3", AWS_REGION_EU_WEST_1)
+
+        assert client.meta.config.max_pool_connections == 40
+
     @mock_aws
     def test_get_default_region(self):
         region = [AWS_REGION_EU_WEST_1]
@@ -964,34 +1050,36 @@ aws:
         )
 
         with patch(
-            "prowler.providers.aws.aws_provider.parse_json_file",
-            return_value={
-                "services": {
-                    "ec2": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                                "ca-central-1",
-                                "eu-central-1",
-                                "eu-central-2",
-                                "eu-north-1",
-                                "eu-south-1",
-                                "eu-south-2",
-                                AWS_REGION_EU_WEST_1,
-                                "eu-west-2",
-                                "eu-west-3",
-                                "me-central-1",
-                                "me-south-1",
-                                "sa-east-1",
-                                AWS_REGION_US_EAST_1,
-                                "us-east-2",
-                                "us-west-1",
-                                "us-west-2",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalog",
+            return_value=AWSRegionsCatalog(
+                {
+                    "services": {
+                        "ec2": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                    "ca-central-1",
+                                    "eu-central-1",
+                                    "eu-central-2",
+                                    "eu-north-1",
+                                    "eu-south-1",
+                                    "eu-south-2",
+                                    AWS_REGION_EU_WEST_1,
+                                    "eu-west-2",
+                                    "eu-west-3",
+                                    "me-central-1",
+                                    "me-south-1",
+                                    "sa-east-1",
+                                    AWS_REGION_US_EAST_1,
+                                    "us-east-2",
+                                    "us-west-1",
+                                    "us-west-2",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert aws_provider.get_available_aws_service_regions(
                 "ec2", "aws", {AWS_REGION_US_EAST_1}
@@ -1002,34 +1090,36 @@ aws:
         aws_provider = AwsProvider()
 
         with patch(
-            "prowler.providers.aws.aws_provider.parse_json_file",
-            return_value={
-                "services": {
-                    "ec2": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                                "ca-central-1",
-                                "eu-central-1",
-                                "eu-central-2",
-                                "eu-north-1",
-                                "eu-south-1",
-                                "eu-south-2",
-                                AWS_REGION_EU_WEST_1,
-                                "eu-west-2",
-                                "eu-west-3",
-                                "me-central-1",
-                                "me-south-1",
-                                "sa-east-1",
-                                AWS_REGION_US_EAST_1,
-                                "us-east-2",
-                                "us-west-1",
-                                "us-west-2",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalog",
+            return_value=AWSRegionsCatalog(
+                {
+                    "services": {
+                        "ec2": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                    "ca-central-1",
+                                    "eu-central-1",
+                                    "eu-central-2",
+                                    "eu-north-1",
+                                    "eu-south-1",
+                                    "eu-south-2",
+                                    AWS_REGION_EU_WEST_1,
+                                    "eu-west-2",
+                                    "eu-west-3",
+                                    "me-central-1",
+                                    "me-south-1",
+                                    "sa-east-1",
+                                    AWS_REGION_US_EAST_1,
+                                    "us-east-2",
+                                    "us-west-1",
+                                    "us-west-2",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert (
                 len(aws_provider.get_available_aws_service_regions("ec2", "aws")) == 17
@@ -1762,26 +1852,73 @@ aws:
     def test_get_regions_aws_count(self):
         assert len(AwsProvider.get_regions(partition="aws")) == 33
 
-    def test_get_all_regions(self):
+    def test_get_aws_regions_catalog(self):
+        get_aws_regions_catalog.cache_clear()
         with patch(
             "prowler.providers.aws.aws_provider.read_aws_regions_file",
             return_value={
                 "services": {
                     "acm": {
                         "regions": {
-                            "aws": [
-                                "af-south-1",
-                            ],
-                            "aws-cn": [
-                                "cn-north-1",
-                            ],
-                            "aws-us-gov": [
-                                "us-gov-west-1",
-                            ],
+                            "aws": ["af-south-1", "eu-west-1"],
+                            "aws-cn": ["cn-north-1"],
+                            "aws-us-gov": [],
                         }
-                    }
+                    },
+                    "s3": {
+                        "regions": {
+                            "aws": ["eu-west-1", "us-east-1"],
+                            "aws-cn": [],
+                            "aws-us-gov": ["us-gov-west-1"],
+                        }
+                    },
                 }
             },
+        ) as read_aws_regions_file:
+            catalog = get_aws_regions_catalog()
+            # The AWS services file is read just once
+            assert get_aws_regions_catalog() is catalog
+            read_aws_regions_file.assert_called_once()
+        get_aws_regions_catalog.cache_clear()
+
+        assert catalog.services == {"acm", "s3"}
+        assert catalog.is_valid_service("acm")
+        assert not catalog.is_valid_service("unknown")
+        assert catalog.get_service_regions("acm", "aws") == {"af-south-1", "eu-west-1"}
+        assert catalog.get_service_regions("s3", "aws-cn") == set()
+        assert catalog.get_regions("aws") == {"af-south-1", "eu-west-1", "us-east-1"}
+        assert catalog.get_regions() == {
+            "af-south-1",
+            "eu-west-1",
+            "us-east-1",
+            "cn-north-1",
+            "us-gov-west-1",
+        }
+        with pytest.raises(KeyError):
+            catalog.get_service_regions("unknown", "aws")
+
+    def test_get_all_regions(self):
+        with patch(
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalog",
+            return_value=AWSRegionsCatalog(
+                {
+                    "services": {
+                        "acm": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                ],
+                                "aws-cn": [
+                                    "cn-north-1",
+                                ],
+                                "aws-us-gov": [
+                                    "us-gov-west-1",
+                                ],
+                            }
+                        }
+                    }
+                }
+            ),
         ):
             assert AwsProvider.get_regions(partition=None) == {
                 "af-south-1",
@@ -1791,24 +1928,26 @@ aws:
 
     def test_get_regions_with_us_gov_partition(self):
         with patch(
-            "prowler.providers.aws.aws_provider.read_aws_regions_file",
-            return_value={
-                "services": {
-                    "acm": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                            ],
-                            "aws-cn": [
-                                "cn-north-1",
-                            ],
-                            "aws-us-gov": [
-                                "us-gov-west-1",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalog",
+            return_value=AWSRegionsCatalog(
+                {
+                    "services": {
+                        "acm": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                ],
+                                "aws-cn": [
+                                    "cn-north-1",
+                                ],
+                                "aws-us-gov": [
+                                    "us-gov-west-1",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert AwsProvider.get_regions("aws-us-gov") == {
                 "us-gov-west-1",
@@ -1816,24 +1955,26 @@ aws:
 
     def test_get_regions_with_aws_partition(self):
         with patch(
-            "prowler.providers.aws.aws_provider.read_aws_regions_file",
-            return_value={
-                "services": {
-                    "acm": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                            ],
-                            "aws-cn": [
-                                "cn-north-1",
-                            ],
-                            "aws-us-gov": [
-                                "us-gov-west-1",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalog",
+            return_value=AWSRegionsCatalog(
+                {
+                    "services": {
+                        "acm": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                ],
+                                "aws-cn": [
+                                    "cn-north-1",
+                                ],
+                                "aws-us-gov": [
+                                    "us-gov-west-1",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert AwsProvider.get_regions("aws") == {
                 "af-south-1",
@@ -1841,24 +1982,26 @@ aws:
 
     def test_get_regions_with_cn_partition(self):
         with patch(
-            "prowler.providers.aws.aws_provider.read_aws_regions_file",
-            return_value={
-                "services": {
-                    "acm": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                            ],
-                            "aws-cn": [
-                                "cn-north-1",
-                            ],
-                            "aws-us-gov": [
-                                "us-gov-west-1",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalog",
+            return_value=AWSRegionsCatalog(
+                {
+                    "services": {
+                        "acm": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                ],
+                                "aws-cn": [
+                                    "cn-north-1",
+                                ],
+                                "aws-us-gov": [
+                                    "us-gov-west-1",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert AwsProvider.get_regions("aws-cn") == {
                 "cn-north-1",
@@ -1866,24 +2009,26 @@ aws:
 
     def test_get_regions_with_unknown_partition(self):
         with patch(
-            "prowler.providers.aws.aws_provider.read_aws_regions_file",
-            return_value={
-                "services": {
-                    "acm": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                            ],
-                            "aws-cn": [
-                                "cn-north-1",
-                            ],
-                            "aws-us-gov": [
-                                "us-gov-west-1",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalog",
+            return_value=AWSRegionsCatalog(
+                {
+                    "services": {
+                        "acm": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                ],
+                                "aws-cn": [
+                                    "cn-north-1",
+                                ],
+                                "aws-us-gov": [
+                                    "us-gov-west-1",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             partition = "unknown"
             with pytest.raises(AWSInvalidPartitionError) as exception:
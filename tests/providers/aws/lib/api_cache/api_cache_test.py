@@ -0,0 +1,108 @@
+from datetime import datetime
+
+import pytest
+from boto3 import session
+from botocore.exceptions import ClientError
+from mock import patch
+from moto import mock_aws
+
+from prowler.providers.aws.exceptions.exceptions import AWSAPIResponsesFileError
+from prowler.providers.aws.lib.api_cache.api_cache import (
+    API_RESPONSE_NOT_RECORDED_ERROR_CODE,
+    AWSAPICache,
+    decode_response,
+    encode_response,
+)
+from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, AWS_REGION_US_EAST_1
+
+BUCKET_NAME = "test-bucket"
+
+
+class TestAWSAPICache:
+    def test_encode_response(self):
+        response = {
+            "Buckets": [
+                {"Name": BUCKET_NAME, "CreationDate": datetime(2024, 1, 1, 10, 0, 0)}
+            ],
+            "Plaintext": b"data",
+            "Count": 1,
+        }
+        assert decode_response(encode_response(response)) == response
+
+    def test_get_request_key(self):
+        api_cache = AWSAPICache("api-responses.json.gz")
+        api_cache.account = AWS_ACCOUNT_NUMBER
+        request_key = api_cache.get_request_key(
+            AWS_REGION_US_EAST_1, "s3", "ListBuckets", {"MaxBuckets": 10}
+        )
+        assert request_key.startswith(
+            f"{AWS_ACCOUNT_NUMBER}/{AWS_REGION_US_EAST_1}/s3/ListBuckets/"
+        )
+        # The order of the parameters does not change the key
+        assert api_cache.get_request_key(
+            AWS_REGION_US_EAST_1,
+            "cloudtrail",
+            "LookupEvents",
+            {"MaxResults": 50, "StartTime": datetime(2024, 1, 1)},
+        ) == api_cache.get_request_key(
+            AWS_REGION_US_EAST_1,
+            "cloudtrail",
+            "LookupEvents",
+            {"StartTime": datetime(2024, 2, 1), "MaxResults": 50},
+        )
+        assert request_key != api_cache.get_request_key(
+            AWS_REGION_US_EAST_1, "s3", "ListBuckets", {"MaxBuckets": 20}
+        )
+
+    def test_record_and_replay(self, tmp_path):
+        file_path = str(tmp_path / "api-responses.json.gz")
+        with mock_aws():
+            aws_session = session.Session(region_name=AWS_REGION_US_EAST_1)
+            api_cache = AWSAPICache(file_path)
+            api_cache.account = AWS_ACCOUNT_NUMBER
+            api_cache.register(aws_session)
+
+            s3_client = aws_session.client("s3")
+            s3_client.create_bucket(Bucket=BUCKET_NAME)
+            s3_client.put_object(Bucket=BUCKET_NAME, Key="object", Body=b"data")
+            recorded_buckets = s3_client.list_buckets()["Buckets"]
+            # The streamed payload is still available after recording it
+            assert (
+                s3_client.get_object(Bucket=BUCKET_NAME, Key="object")["Body"].read()
+                == b"data"
+            )
+            iam_client = aws_session.client("iam")
+            with pytest.raises(ClientError):
+                iam_client.get_role(RoleName="missing-role")
+            api_cache.save()
+
+        # The recorded API responses are replayed without calling the AWS APIs
+        aws_session = session.Session(region_name=AWS_REGION_US_EAST_1)
+        api_cache = AWSAPICache(file_path, replay=True)
+        api_cache.account = AWS_ACCOUNT_NUMBER
+        api_cache.register(aws_session)
+        with patch("botocore.endpoint.Endpoint.make_request") as make_request:
+            s3_client = aws_session.client("s3")
+            assert s3_client.list_buckets()["Buckets"] == recorded_buckets
+            assert (
+                s3_client.get_object(Bucket=BUCKET_NAME, Key="object")["Body"].read()
+                == b"data"
+            )
+            iam_client = aws_session.client("iam")
+            with pytest.raises(ClientError) as error:
+                iam_client.get_role(RoleName="missing-role")
+            assert error.value.response["Error"]["Code"] == "NoSuchEntity"
+            with pytest.raises(ClientError) as error:
+                s3_client.get_bucket_policy(Bucket=BUCKET_NAME)
+            assert (
+                error.value.response["Error"]["Code"]
+                == API_RESPONSE_NOT_RECORDED_ERROR_CODE
+            )
+            make_request.assert_not_called()
+        assert api_cache._not_recorded == 1
+
+    def test_load_invalid_file(self, tmp_path):
+        file_path = tmp_path / "api-responses.json.gz"
+        file_path.write_text("not a recorded API responses file")
+        with pytest.raises(AWSAPIResponsesFileError):
+            AWSAPICache(str(file_path), replay=True)
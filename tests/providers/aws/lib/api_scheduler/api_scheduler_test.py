@@ -0,0 +1,214 @@
+import asyncio
+from threading import Thread
+from time import sleep
+
+import pytest
+from boto3 import client
+from botocore.stub import Stubber
+from mock import patch
+from moto import mock_aws
+
+from prowler.providers.aws.lib.api_scheduler.api_scheduler import (
+    DEFAULT_API_MAX_CONCURRENCY,
+    AWSAPIScheduler,
+    TokenBucket,
+)
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1
+
+
+class TestTokenBucket:
+    def test_acquire(self):
+        token_bucket = TokenBucket(2)
+        with patch(
+            "prowler.providers.aws.lib.api_scheduler.api_scheduler.time.sleep"
+        ) as mock_sleep:
+            # The bucket allows a burst of one second of calls
+            assert token_bucket.acquire() == 0
+            assert token_bucket.acquire() == 0
+            assert round(token_bucket.acquire(), 1) == 0.5
+            assert round(token_bucket.acquire(), 1) == 1.0
+            assert mock_sleep.call_count == 2
+
+
+class TestAWSAPIScheduler:
+    def test_from_config(self):
+        scheduler = AWSAPIScheduler.from_config(
+            {
+                "api_max_concurrency": 20,
+                "api_rate_limits": {"iam": 10, "cloudtrail.LookupEvents": 2, "s3": 0},
+            }
+        )
+        assert scheduler.max_concurrency == 20
+        assert scheduler.rate_limits == {"iam": 10.0, "cloudtrail.LookupEvents": 2.0}
+
+    def test_from_config_default(self):
+        scheduler = AWSAPIScheduler.from_config({})
+        assert scheduler.max_concurrency == DEFAULT_API_MAX_CONCURRENCY
+        assert scheduler.rate_limits == {}
+
+    def test_from_config_invalid(self):
+        scheduler = AWSAPIScheduler.from_config(
+            {"api_max_concurrency": "many", "api_rate_limits": ["iam"]}
+        )
+        assert scheduler.max_concurrency == DEFAULT_API_MAX_CONCURRENCY
+        assert scheduler.rate_limits == {}
+
+    def test_rate_limits_by_operation_and_region(self):
+        scheduler = AWSAPIScheduler(
+            rate_limits={"cloudtrail.LookupEvents": 2, "cloudtrail": 10}
+        )
+        lookup_events = scheduler._get_rate_limiter(
+            "cloudtrail", "LookupEvents", AWS_REGION_US_EAST_1
+        )
+        assert lookup_events.rate == 2
+        assert (
+            scheduler._get_rate_limiter(
+                "cloudtrail", "LookupEvents", AWS_REGION_US_EAST_1
+            )
+            is lookup_events
+        )
+        assert (
+            scheduler._get_rate_limiter(
+                "cloudtrail", "LookupEvents", AWS_REGION_EU_WEST_1
+            )
+            is not lookup_events
+        )
+        assert (
+            scheduler._get_rate_limiter(
+                "cloudtrail", "DescribeTrails", AWS_REGION_US_EAST_1
+            ).rate
+            == 10
+        )
+        assert not scheduler._get_rate_limiter("iam", "ListRoles", AWS_REGION_US_EAST_1)
+
+    def test_max_concurrency(self):
+        scheduler = AWSAPIScheduler(max_concurrency=2)
+        scheduler.acquire("iam", "ListRoles")
+        scheduler.acquire("s3", "ListBuckets")
+
+        # The third API call waits until another one finishes
+        blocked_call = Thread(target=scheduler.acquire, args=("ec2", "DescribeVpcs"))
+        blocked_call.start()
+        sleep(0.1)
+        assert blocked_call.is_alive()
+
+        scheduler.release("iam")
+        blocked_call.join(timeout=5)
+        assert not blocked_call.is_alive()
+        assert scheduler._in_flight == 2
+
+    def test_acquire_async(self):
+        scheduler = AWSAPIScheduler(max_concurrency=1)
+        scheduler.acquire("iam", "ListRoles")
+
+        async def acquire_async():
+            # The waiting API call does not block the event loop of the other ones
+            blocked_call = asyncio.create_task(
+                scheduler.acquire_async("iam", "ListUsers")
+            )
+            await asyncio.sleep(0.05)
+            assert not blocked_call.done()
+            scheduler.release("iam")
+            await asyncio.wait_for(blocked_call, timeout=5)
+
+        asyncio.run(acquire_async())
+        assert scheduler._in_flight == 1
+        assert not scheduler.try_acquire("s3")
+
+    def test_acquire_async_released_from_thread(self):
+        scheduler = AWSAPIScheduler(max_concurrency=1)
+        scheduler.acquire("iam", "ListRoles")
+
+        async def acquire_async():
+            # The waiting API call is woken by the release of a call made in another thread
+            blocked_call = asyncio.create_task(
+                scheduler.acquire_async("iam", "ListUsers")
+            )
+            await asyncio.sleep(0.05)
+            assert not blocked_call.done()
+            assert len(scheduler._async_waiters) == 1
+            release = Thread(target=scheduler.release, args=("iam",))
+            release.start()
+            await asyncio.wait_for(blocked_call, timeout=5)
+            release.join()
+
+        asyncio.run(acquire_async())
+        assert scheduler._in_flight == 1
+        assert not scheduler._async_waiters
+
+    def test_throttled(self):
+        scheduler = AWSAPIScheduler(max_concurrency=8)
+        for _ in range(8):
+            scheduler.acquire("iam", "ListRoles")
+
+        scheduler.throttled("iam", "ListRoles")
+        assert scheduler._families["iam"].limit == 4
+        # The concurrency is reduced once per burst of throttled calls
+        scheduler.throttled("iam", "ListRoles")
+        assert scheduler._families["iam"].limit == 4
+        assert scheduler.get_throttles() == {"iam": 2}
+
+        # The concurrency increases again after as many successful calls as the limit
+        for _ in range(8):
+            scheduler.release("iam")
+        assert scheduler._families["iam"].limit == 5
+        assert scheduler._in_flight == 0
+
+    @mock_aws
+    def test_register(self):
+        scheduler = AWSAPIScheduler(rate_limits={"s3": 100})
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        scheduler.register(s3_client)
+
+        s3_client.list_buckets()
+
+        assert scheduler._families["s3"].in_flight == 0
+        assert scheduler._families["s3"].successes == 1
+        assert ("s3", AWS_REGION_US_EAST_1) in scheduler._rate_limiters
+        assert scheduler._in_flight == 0
+
+    @mock_aws
+    def test_register_before_call_error(self):
+        scheduler = AWSAPIScheduler(max_concurrency=1)
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        scheduler.register(s3_client)
+
+        def before_call_error(**kwargs):
+            raise ValueError("before-call error")
+
+        # The handler raises after the slot is taken, so the after-call events are not emitted
+        s3_client.meta.events.register("before-call.s3.ListBuckets", before_call_error)
+        with pytest.raises(ValueError):
+            s3_client.list_buckets()
+        s3_client.meta.events.unregister(
+            "before-call.s3.ListBuckets", before_call_error
+        )
+
+        assert scheduler._families["s3"].in_flight == 0
+        assert scheduler._in_flight == 0
+        # The slot is free for the next API calls
+        s3_client.list_buckets()
+        assert scheduler._families["s3"].successes == 1
+        assert scheduler._in_flight == 0
+
+    def test_register_throttled_call(self):
+        scheduler = AWSAPIScheduler()
+        iam_client = client("iam", region_name=AWS_REGION_US_EAST_1)
+        scheduler.register(iam_client)
+
+        with patch(
+            "prowler.providers.aws.lib.api_scheduler.api_scheduler.logger"
+        ) as mock_logger:
+            with Stubber(iam_client) as stubber:
+                stubber.add_client_error(
+                    "list_roles", service_error_code="ThrottlingException"
+                )
+                try:
+                    iam_client.list_roles()
+                except iam_client.exceptions.ClientError:
+                    pass
+
+            mock_logger.error.assert_called_once()
+        assert scheduler._families["iam"].exhausted == 1
+        assert scheduler._families["iam"].in_flight == 0
+        assert scheduler._in_flight == 0
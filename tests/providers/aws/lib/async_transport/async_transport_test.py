@@ -0,0 +1,232 @@
+import asyncio
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from os import path
+
+import botocore
+import pytest
+from boto3 import client, session
+from botocore.config import Config
+from botocore.stub import Stubber
+from mock import patch
+from moto import mock_aws
+
+from prowler.providers.aws.lib.api_scheduler.api_scheduler import AWSAPIScheduler
+from prowler.providers.aws.lib.async_transport.async_transport import (
+    ASYNC_TRANSPORT_BOTOCORE_VERSION,
+    AWSAsyncTransport,
+    get_proxy,
+    is_botocore_supported,
+)
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1
+
+BUCKET_NAME = "bucket-test"
+PYPROJECT_FILE = (
+    f"{path.dirname(path.realpath(__file__))}/../../../../../pyproject.toml"
+)
+
+
+class ThrottledDynamoDBHandler(BaseHTTPRequestHandler):
+    """DynamoDB endpoint that throttles the first request."""
+
+    requests = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.requests.append(dict(self.headers))
+        if len(self.requests) == 1:
+            status, body = 400, {"__type": "ThrottlingException", "message": "slow"}
+        else:
+            status, body = 200, {"TableNames": ["table"]}
+        body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_api_calls(*api_calls):
+    async def make_calls():
+        async with AWSAsyncTransport() as transport:
+            return [
+                await transport.call(api_client, method_name, **kwargs)
+                for api_client, method_name, kwargs in api_calls
+            ]
+
+    return asyncio.run(make_calls())
+
+
+class TestAWSAsyncTransport:
+    @mock_aws
+    def test_call(self):
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        s3_client.create_bucket(Bucket=BUCKET_NAME)
+        s3_client.put_bucket_tagging(
+            Bucket=BUCKET_NAME,
+            Tagging={"TagSet": [{"Key": "key", "Value": "value"}]},
+        )
+        ec2_client = client("ec2", region_name=AWS_REGION_EU_WEST_1)
+
+        tagging, vpcs = make_api_calls(
+            (s3_client, "get_bucket_tagging", {"Bucket": BUCKET_NAME}),
+            (ec2_client, "describe_vpcs", {}),
+        )
+
+        assert tagging["TagSet"] == [{"Key": "key", "Value": "value"}]
+        assert len(vpcs["Vpcs"]) == 1
+
+    @mock_aws
+    def test_call_error(self):
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+
+        # The API errors are raised as the ones of the client methods
+        with pytest.raises(s3_client.exceptions.NoSuchBucket):
+            make_api_calls((s3_client, "get_bucket_policy", {"Bucket": BUCKET_NAME}))
+
+    @mock_aws
+    def test_call_scheduled(self):
+        scheduler = AWSAPIScheduler(max_concurrency=1)
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        s3_client.create_bucket(Bucket=BUCKET_NAME)
+        scheduler.register(s3_client)
+
+        make_api_calls(
+            (s3_client, "get_bucket_location", {"Bucket": BUCKET_NAME}),
+            (s3_client, "get_bucket_acl", {"Bucket": BUCKET_NAME}),
+        )
+
+        assert scheduler._families["s3"].successes == 2
+        assert scheduler._in_flight == 0
+
+    def test_call_stubbed(self):
+        iam_client = client("iam", region_name=AWS_REGION_US_EAST_1)
+        with Stubber(iam_client) as stubber:
+            stubber.add_response("list_roles", {"Roles": []})
+            assert make_api_calls((iam_client, "list_roles", {})) == [{"Roles": []}]
+
+    def test_call_http_with_retries(self):
+        ThrottledDynamoDBHandler.requests = []
+        server = HTTPServer(("127.0.0.1", 0), ThrottledDynamoDBHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            dynamodb_client = session.Session(
+                aws_access_key_id="access-key",
+                aws_secret_access_key="secret-key",
+                region_name=AWS_REGION_US_EAST_1,
+            ).client("dynamodb", endpoint_url=f"http://127.0.0.1:{server.server_port}")
+
+            (response,) = make_api_calls((dynamodb_client, "list_tables", {}))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert response["TableNames"] == ["table"]
+        assert response["ResponseMetadata"]["RetryAttempts"] == 1
+        # Each attempt is signed by botocore
+        assert len(ThrottledDynamoDBHandler.requests) == 2
+        assert all(
+            request["Authorization"].startswith("AWS4-HMAC-SHA256")
+            for request in ThrottledDynamoDBHandler.requests
+        )
+
+    def test_call_http_with_proxy(self):
+        ThrottledDynamoDBHandler.requests = []
+        proxy = HTTPServer(("127.0.0.1", 0), ThrottledDynamoDBHandler)
+        threading.Thread(target=proxy.serve_forever, daemon=True).start()
+        try:
+            dynamodb_client = session.Session(
+                aws_access_key_id="access-key",
+                aws_secret_access_key="secret-key",
+                region_name=AWS_REGION_US_EAST_1,
+            ).client(
+                "dynamodb",
+                endpoint_url="http://dynamodb.prowler.invalid",
+                config=Config(proxies={"http": f"127.0.0.1:{proxy.server_port}"}),
+            )
+
+            (response,) = make_api_calls((dynamodb_client, "list_tables", {}))
+        finally:
+            proxy.shutdown()
+            proxy.server_close()
+
+        # The requests are sent through the proxy of the client config
+        assert response["TableNames"] == ["table"]
+        assert [request["Host"] for request in ThrottledDynamoDBHandler.requests] == [
+            "dynamodb.prowler.invalid",
+            "dynamodb.prowler.invalid",
+        ]
+
+    def test_get_proxy(self):
+        proxies = {
+            "http": "proxy.example.com:3128",
+            "https": "https://proxy.example.com:3129",
+        }
+        s3_client = client(
+            "s3", region_name=AWS_REGION_US_EAST_1, config=Config(proxies=proxies)
+        )
+
+        assert (
+            get_proxy(s3_client, "http://bucket.s3.amazonaws.com/")
+            == "http://proxy.example.com:3128"
+        )
+        assert (
+            get_proxy(s3_client, "https://bucket.s3.amazonaws.com/")
+            == "https://proxy.example.com:3129"
+        )
+        assert (
+            get_proxy(
+                client("s3", region_name=AWS_REGION_US_EAST_1),
+                "https://bucket.s3.amazonaws.com/",
+            )
+            is None
+        )
+
+    @mock_aws
+    def test_call_without_aiohttp(self):
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        s3_client.create_bucket(Bucket=BUCKET_NAME)
+
+        with patch(
+            "prowler.providers.aws.lib.async_transport.async_transport.aiohttp",
+            new=None,
+        ):
+            with patch.object(
+                s3_client, "get_bucket_acl", wraps=s3_client.get_bucket_acl
+            ) as get_bucket_acl:
+                make_api_calls((s3_client, "get_bucket_acl", {"Bucket": BUCKET_NAME}))
+
+        # The API call is made by the client in a thread
+        get_bucket_acl.assert_called_once_with(Bucket=BUCKET_NAME)
+
+    def test_botocore_pinned_version(self):
+        with open(PYPROJECT_FILE) as pyproject_file:
+            pinned_version = re.search(
+                r'"botocore==([^"]+)"', pyproject_file.read()
+            ).group(1)
+
+        # The transport follows private botocore methods, so it is tested with the pinned botocore
+        assert ASYNC_TRANSPORT_BOTOCORE_VERSION == pinned_version
+        assert botocore.__version__ == pinned_version
+        assert is_botocore_supported()
+
+    @mock_aws
+    def test_call_unsupported_botocore(self):
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        s3_client.create_bucket(Bucket=BUCKET_NAME)
+
+        with patch(
+            "prowler.providers.aws.lib.async_transport.async_transport.is_botocore_supported",
+            return_value=False,
+        ):
+            with patch.object(
+                s3_client, "get_bucket_acl", wraps=s3_client.get_bucket_acl
+            ) as get_bucket_acl:
+                make_api_calls((s3_client, "get_bucket_acl", {"Bucket": BUCKET_NAME}))
+
+        # The API call is made by the client in a thread
+        get_bucket_acl.assert_called_once_with(Bucket=BUCKET_NAME)
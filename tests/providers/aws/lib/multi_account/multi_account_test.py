@@ -0,0 +1,347 @@
+import csv
+import json
+import os
+import subprocess
+import sys
+from argparse import Namespace
+
+import boto3
+import pytest
+from mock import patch
+from moto import mock_aws
+
+from prowler.config.config import (
+    csv_file_suffix,
+    json_asff_file_suffix,
+    json_ocsf_file_suffix,
+)
+from prowler.providers.aws.lib.multi_account.multi_account import (
+    get_account_command,
+    get_account_role_arn,
+    get_organizational_units_accounts,
+    merge_outputs,
+    scan_accounts,
+    set_account_arguments,
+)
+from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, AWS_REGION_US_EAST_1
+
+MODULE = "prowler.providers.aws.lib.multi_account.multi_account"
+ROLE_ARN = f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:role/ProwlerScan"
+ACCOUNT_A = "111111111111"
+ACCOUNT_B = "222222222222"
+
+
+def get_multi_account_arguments(output_directory: str, **kwargs) -> Namespace:
+    arguments = {
+        "role": ROLE_ARN,
+        "accounts": [ACCOUNT_A, ACCOUNT_B],
+        "organizational_units": None,
+        "organizations_role": None,
+        "parallel_accounts": 2,
+        "profile": None,
+        "mfa": False,
+        "session_duration": 3600,
+        "external_id": None,
+        "role_session_name": "ProwlerAssessmentSession",
+        "output_directory": output_directory,
+        "output_filename": None,
+        "checkpoint_directory": None,
+        "resume": None,
+        "export_snapshot": None,
+        "record_api_responses": None,
+    }
+    arguments.update(kwargs)
+    return Namespace(**arguments)
+
+
+def write_account_outputs(output_directory, filename: str, findings: list) -> None:
+    with open(
+        os.path.join(output_directory, f"{filename}{csv_file_suffix}"), "w"
+    ) as csv_file:
+        writer = csv.writer(csv_file, delimiter=";")
+        writer.writerow(["ACCOUNT_UID", "CHECK_ID"])
+        for finding in findings:
+            writer.writerow([finding["account"], finding["check"]])
+    for file_suffix in (json_ocsf_file_suffix, json_asff_file_suffix):
+        with open(
+            os.path.join(output_directory, f"{filename}{file_suffix}"), "w"
+        ) as json_file:
+            json.dump(findings, json_file)
+    os.makedirs(os.path.join(output_directory, "compliance"), exist_ok=True)
+    with open(
+        os.path.join(
+            output_directory, "compliance", f"{filename}_cis_2.0_aws{csv_file_suffix}"
+        ),
+        "w",
+    ) as compliance_file:
+        writer = csv.writer(compliance_file, delimiter=";")
+        writer.writerow(["ACCOUNTID", "REQUIREMENTS_ID"])
+        for finding in findings:
+            writer.writerow([finding["account"], "1.1"])
+
+
+class TestMultiAccount:
+    def test_get_account_role_arn(self):
+        assert (
+            get_account_role_arn(ROLE_ARN, ACCOUNT_A)
+            == f"arn:aws:iam::{ACCOUNT_A}:role/ProwlerScan"
+        )
+        assert (
+            get_account_role_arn(
+                "arn:aws-cn:iam::123456789012:role/path/ProwlerScan", ACCOUNT_A
+            )
+            == f"arn:aws-cn:iam::{ACCOUNT_A}:role/path/ProwlerScan"
+        )
+
+    def test_get_account_role_arn_invalid(self):
+        with pytest.raises(ValueError):
+            get_account_role_arn(f"arn:aws:iam::{ACCOUNT_A}:user/prowler", ACCOUNT_B)
+
+    @mock_aws
+    def test_get_organizational_units_accounts(self):
+        organizations_client = boto3.client(
+            "organizations", region_name=AWS_REGION_US_EAST_1
+        )
+        organizations_client.create_organization(FeatureSet="ALL")
+        root_id = organizations_client.list_roots()["Roots"][0]["Id"]
+        parent_ou = organizations_client.create_organizational_unit(
+            ParentId=root_id, Name="parent"
+        )["OrganizationalUnit"]["Id"]
+        child_ou = organizations_client.create_organizational_unit(
+            ParentId=parent_ou, Name="child"
+        )["OrganizationalUnit"]["Id"]
+        other_ou = organizations_client.create_organizational_unit(
+            ParentId=root_id, Name="other"
+        )["OrganizationalUnit"]["Id"]
+        accounts = {}
+        for name, organizational_unit in [
+            ("parent", parent_ou),
+            ("child", child_ou),
+            ("other", other_ou),
+        ]:
+            account_id = organizations_client.create_account(
+                AccountName=name, Email=f"{name}@example.com"
+            )["CreateAccountStatus"]["AccountId"]
+            organizations_client.move_account(
+                AccountId=account_id,
+                SourceParentId=root_id,
+                DestinationParentId=organizational_unit,
+            )
+            accounts[name] = account_id
+
+        # The accounts of the child organizational units are included
+        assert get_organizational_units_accounts(
+            boto3.Session(region_name=AWS_REGION_US_EAST_1), [parent_ou]
+        ) == [accounts["parent"], accounts["child"]]
+
+    def test_merge_outputs(self, tmp_path):
+        write_account_outputs(
+            tmp_path,
+            f"prowler-output-{ACCOUNT_A}",
+            [{"account": ACCOUNT_A, "check": "check_a"}],
+        )
+        write_account_outputs(
+            tmp_path,
+            f"prowler-output-{ACCOUNT_B}",
+            [
+                {"account": ACCOUNT_B, "check": "check_a"},
+                {"account": ACCOUNT_B, "check": "check_b"},
+            ],
+        )
+
+        merged_outputs = merge_outputs(
+            str(tmp_path),
+            [
+                f"prowler-output-{ACCOUNT_A}",
+                f"prowler-output-{ACCOUNT_B}",
+                # Accounts without outputs are skipped
+                "prowler-output-333333333333",
+            ],
+            "prowler-output-accounts",
+        )
+
+        assert merged_outputs == [
+            f"{tmp_path}/prowler-output-accounts{csv_file_suffix}",
+            f"{tmp_path}/prowler-output-accounts{json_ocsf_file_suffix}",
+            f"{tmp_path}/prowler-output-accounts{json_asff_file_suffix}",
+            f"{tmp_path}/compliance/prowler-output-accounts_cis_2.0_aws{csv_file_suffix}",
+        ]
+        with open(merged_outputs[0]) as csv_file:
+            rows = list(csv.reader(csv_file, delimiter=";"))
+        assert rows == [
+            ["ACCOUNT_UID", "CHECK_ID"],
+            [ACCOUNT_A, "check_a"],
+            [ACCOUNT_B, "check_a"],
+            [ACCOUNT_B, "check_b"],
+        ]
+        for merged_output in merged_outputs[1:3]:
+            with open(merged_output) as json_file:
+                assert [finding["account"] for finding in json.load(json_file)] == [
+                    ACCOUNT_A,
+                    ACCOUNT_B,
+                    ACCOUNT_B,
+                ]
+        with open(merged_outputs[3]) as compliance_file:
+            rows = list(csv.reader(compliance_file, delimiter=";"))
+        assert rows == [
+            ["ACCOUNTID", "REQUIREMENTS_ID"],
+            [ACCOUNT_A, "1.1"],
+            [ACCOUNT_B, "1.1"],
+            [ACCOUNT_B, "1.1"],
+        ]
+
+    def test_set_account_arguments(self, tmp_path):
+        os.makedirs(tmp_path / "checkpoint" / ACCOUNT_A)
+        args = get_multi_account_arguments(
+            str(tmp_path),
+            profile="prowler",
+            mfa=True,
+            output_filename="scan",
+            resume=str(tmp_path / "checkpoint"),
+            export_snapshot=str(tmp_path / "snapshot.pickle.gz"),
+        )
+
+        set_account_arguments(args, ACCOUNT_A)
+
+        assert args.role == f"arn:aws:iam::{ACCOUNT_A}:role/ProwlerScan"
+        assert args.output_filename == f"scan-{ACCOUNT_A}"
+        assert not args.profile
+        assert not args.mfa
+        assert not args.accounts
+        assert not args.multi_account_id
+        assert args.resume == str(tmp_path / "checkpoint" / ACCOUNT_A)
+        assert args.export_snapshot == str(tmp_path / f"{ACCOUNT_A}-snapshot.pickle.gz")
+
+    def test_set_account_arguments_without_mfa(self, tmp_path):
+        args = get_multi_account_arguments(str(tmp_path), profile="prowler")
+
+        set_account_arguments(args, ACCOUNT_A)
+
+        # The process of the account resolves the base credentials of the profile
+        assert args.profile == "prowler"
+        assert not args.mfa
+
+    def test_set_account_arguments_resume_account_not_started(self, tmp_path):
+        args = get_multi_account_arguments(
+            str(tmp_path), resume=str(tmp_path / "checkpoint")
+        )
+
+        set_account_arguments(args, ACCOUNT_B)
+
+        # The account is scanned from scratch, checkpointing it in the same directory
+        assert not args.resume
+        assert args.checkpoint_directory == str(tmp_path / "checkpoint" / ACCOUNT_B)
+
+    def test_get_account_command(self):
+        assert get_account_command(
+            ["aws", "--role", ROLE_ARN, "--accounts", ACCOUNT_A, ACCOUNT_B], ACCOUNT_B
+        ) == [
+            sys.executable,
+            "-m",
+            "prowler",
+            "aws",
+            "--role",
+            ROLE_ARN,
+            "--accounts",
+            ACCOUNT_A,
+            ACCOUNT_B,
+            "--multi-account-id",
+            ACCOUNT_B,
+        ]
+
+    @mock_aws
+    def test_scan_accounts(self, tmp_path, capsys):
+        args = get_multi_account_arguments(
+            str(tmp_path), output_filename="scan", output_formats=["csv", "html"]
+        )
+        write_account_outputs(
+            tmp_path, f"scan-{ACCOUNT_A}", [{"account": ACCOUNT_A, "check": "check"}]
+        )
+        write_account_outputs(
+            tmp_path, f"scan-{ACCOUNT_B}", [{"account": ACCOUNT_B, "check": "check"}]
+        )
+        exit_codes = {ACCOUNT_A: 0, ACCOUNT_B: 3}
+
+        def run_account(command, **kwargs):
+            account_id = command[-1]
+            kwargs["stdout"].write(f"scan of {account_id}")
+            return subprocess.CompletedProcess(command, exit_codes[account_id])
+
+        with patch(f"{MODULE}.subprocess.run", side_effect=run_account) as mock_run:
+            with patch(f"{MODULE}.sys.argv", ["prowler", "aws", "--role", ROLE_ARN]):
+                with pytest.raises(SystemExit) as exit_error:
+                    scan_accounts(args)
+
+        # The exit code 3 of the accounts with failed findings is kept
+        assert exit_error.value.code == 3
+        assert sorted(call.args[0][-1] for call in mock_run.call_args_list) == [
+            ACCOUNT_A,
+            ACCOUNT_B,
+        ]
+        # Each account is scanned by Prowler with the same arguments
+        assert mock_run.call_args.args[0][:6] == [
+            sys.executable,
+            "-m",
+            "prowler",
+            "aws",
+            "--role",
+            ROLE_ARN,
+        ]
+        # The process of the account resolves and refreshes the base credentials itself
+        assert mock_run.call_args.kwargs["env"] == dict(os.environ)
+        with open(tmp_path / f"scan-{ACCOUNT_B}.log") as log_file:
+            assert log_file.read() == f"scan of {ACCOUNT_B}"
+        output = capsys.readouterr().out
+        assert "[2/2] AWS account" in output
+        assert "The HTML outputs are not merged" in output
+        assert os.path.exists(tmp_path / f"scan{csv_file_suffix}")
+        assert os.path.exists(tmp_path / f"scan{json_ocsf_file_suffix}")
+
+    @mock_aws
+    def test_scan_accounts_failed_account(self, tmp_path):
+        args = get_multi_account_arguments(str(tmp_path), parallel_accounts=1)
+
+        with patch(
+            f"{MODULE}.subprocess.run",
+            side_effect=[
+                subprocess.CompletedProcess([], 1),
+                subprocess.CompletedProcess([], 0),
+            ],
+        ):
+            with pytest.raises(SystemExit) as exit_error:
+                scan_accounts(args)
+
+        assert exit_error.value.code == 1
+
+    @mock_aws
+    def test_scan_accounts_mfa(self, tmp_path):
+        args = get_multi_account_arguments(
+            str(tmp_path), accounts=[ACCOUNT_A], mfa=True
+        )
+        mfa_session = boto3.Session(
+            aws_access_key_id="ASIAMFASESSION",
+            aws_secret_access_key="secret",
+            aws_session_token="token",
+            region_name=AWS_REGION_US_EAST_1,
+        )
+
+        with patch(
+            "prowler.providers.aws.aws_provider.AwsProvider.setup_session",
+            return_value=mfa_session,
+        ):
+            with patch(
+                f"{MODULE}.subprocess.run",
+                return_value=subprocess.CompletedProcess([], 0),
+            ) as mock_run:
+                with patch.dict(os.environ, {"AWS_PROFILE": "prowler"}):
+                    with patch(f"{MODULE}.logger.warning") as mock_warning:
+                        with pytest.raises(SystemExit):
+                            scan_accounts(args)
+
+        # The MFA session credentials are passed to the process of the account
+        environment = mock_run.call_args.kwargs["env"]
+        assert environment["AWS_ACCESS_KEY_ID"] == "ASIAMFASESSION"
+        assert environment["AWS_SESSION_TOKEN"] == "token"
+        assert "AWS_PROFILE" not in environment
+        # The MFA session credentials cannot be refreshed
+        mock_warning.assert_called_once()
@@ -3,11 +3,11 @@ from json import dumps
 from os import path
 
 import botocore
+import pytest
 import yaml
 from boto3 import client, resource
 from mock import MagicMock, patch
 from moto import mock_aws
-import pytest
 
 from prowler.config.config import encoding_format_utf_8
 from prowler.providers.aws.lib.mutelist.mutelist import AWSMutelist
@@ -1955,3 +1955,188 @@ class TestAWSMutelist:
             "prowler",
             "",
         )
+
+    def test_is_muted_compiled_same_as_is_muted_in_check(self):
+        mutelist_content = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "ec2": {
+                            "Regions": [AWS_REGION_EU_WEST_1],
+                            "Resources": ["i-*"],
+                        },
+                        "s3_bucket_*": {
+                            "Regions": ["*"],
+                            "Resources": ["prowler-.*", "test"],
+                            "Tags": ["environment=dev", "project=.*"],
+                            "Exceptions": {
+                                "Regions": [AWS_REGION_US_EAST_1],
+                                "Resources": ["prowler-pro"],
+                            },
+                        },
+                        "lambda_function_no_secrets_in_code": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        },
+                        "*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Tags": ["muted=true | ignored=true"],
+                            "Exceptions": {"Accounts": ["111122223333"]},
+                        },
+                    }
+                },
+                AWS_ACCOUNT_NUMBER: {
+                    "Checks": {
+                        "iam_user_mfa_enabled_console_access": {
+                            "Regions": ["*"],
+                            "Resources": ["admin"],
+                        }
+                    }
+                },
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        for account in [AWS_ACCOUNT_NUMBER, "111122223333"]:
+            for check in [
+                "ec2_instance_public_ip",
+                "s3_bucket_public_access",
+                "awslambda_function_no_secrets_in_code",
+                "iam_user_mfa_enabled_console_access",
+                "vpc_flow_logs_enabled",
+            ]:
+                for region in [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1]:
+                    for finding_resource in [
+                        "i-123",
+                        "prowler-pro",
+                        "prowler-dev",
+                        "admin",
+                    ]:
+                        for tags in [
+                            "",
+                            "environment=dev | project=prowler",
+                            "muted=true",
+                        ]:
+                            expected = any(
+                                mutelist.is_muted_in_check(
+                                    mutelist_content["Accounts"][muted_account][
+                                        "Checks"
+                                    ],
+                                    account,
+                                    check,
+                                    region,
+                                    finding_resource,
+                                    tags,
+                                )
+                                for muted_account in mutelist_content["Accounts"]
+                                if muted_account in (account, "*")
+                            )
+                            assert (
+                                mutelist.is_muted(
+                                    account, check, region, finding_resource, tags
+                                )
+                                == expected
+                            ), (account, check, region, finding_resource, tags)
+
+    def test_is_muted_finding_tags_not_unrolled(self):
+        mutelist_content = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "s3_bucket_public_access": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Tags": ["environment=dev"],
+                        }
+                    }
+                }
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        assert mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER,
+            "s3_bucket_public_access",
+            AWS_REGION_US_EAST_1,
+            "prowler",
+            [{"Key": "environment", "Value": "dev"}],
+        )
+        # The tags are only unrolled for the muted checks
+        with patch("prowler.lib.mutelist.mutelist.unroll_tags") as unroll_tags:
+            assert not mutelist.is_muted(
+                AWS_ACCOUNT_NUMBER,
+                "ec2_instance_public_ip",
+                AWS_REGION_US_EAST_1,
+                "prowler",
+                [{"Key": "environment", "Value": "dev"}],
+            )
+            unroll_tags.assert_not_called()
+
+    def test_is_muted_finding_tags_none(self):
+        mutelist_content = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "ec2_instance_public_ip": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Tags": ["*"],
+                        },
+                        "s3_bucket_public_access": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Tags": ["environment=dev"],
+                        },
+                    }
+                }
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        # The resources without tags have None tags, unrolled to ""
+        assert mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER,
+            "ec2_instance_public_ip",
+            AWS_REGION_US_EAST_1,
+            "i-123",
+            None,
+        )
+        assert not mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER,
+            "s3_bucket_public_access",
+            AWS_REGION_US_EAST_1,
+            "prowler",
+            None,
+        )
+
+    def test_is_muted_mutelist_replaced(self):
+        mutelist = AWSMutelist(mutelist_content={})
+        assert not mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER,
+            "s3_bucket_public_access",
+            AWS_REGION_US_EAST_1,
+            "prowler",
+            "",
+        )
+
+        mutelist._mutelist = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "s3_bucket_public_access": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        }
+                    }
+                }
+            }
+        }
+        # The mutelist is compiled again when it is replaced
+        assert mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER,
+            "s3_bucket_public_access",
+            AWS_REGION_US_EAST_1,
+            "prowler",
+            "",
+        )
@@ -1,4 +1,11 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from boto3 import client
 from mock import patch
+from moto import mock_aws
 
 from prowler.providers.aws.lib.service.service import AWSService
 from tests.providers.aws.utils import (
@@ -18,6 +25,61 @@ def mock_generate_regional_clients(provider, service):
     return {AWS_REGION_US_EAST_1: regional_client}
 
 
+class LazyService(AWSService):
+    def __init__(self, provider):
+        super().__init__("s3", provider)
+        self.collector_calls = []
+        self.register_lazy_attributes(["items", "item_names"], self._collect_items)
+        self.register_lazy_attributes(
+            ["items_summary"], self._collect_items_summary, depends_on=["items"]
+        )
+        self.register_lazy_attributes(["broken"], self._collect_broken)
+
+    def _collect_items(self):
+        self.collector_calls.append("items")
+        self.items = []
+        self.item_names = set()
+        # Simulate a slow collection populated from the service threads
+        time.sleep(0.05)
+        self.__threading_call__(self._add_item, ["a", "b"])
+
+    def _add_item(self, name):
+        self.items.append(name)
+        self.item_names.add(name)
+
+    def _collect_items_summary(self):
+        self.collector_calls.append("items_summary")
+        self.items_summary = len(self.items)
+
+    def _collect_broken(self):
+        raise AttributeError("'NoneType' object has no attribute 'get'")
+
+
+class AsyncService(AWSService):
+    def __init__(self, provider, bucket_names, max_concurrency=None):
+        super().__init__("s3", provider)
+        self.bucket_tags = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.__async_call__(self._get_bucket_tags, bucket_names, max_concurrency)
+
+    async def _get_bucket_tags(self, bucket_name):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Let the other buckets start their API calls
+            await asyncio.sleep(0.01)
+            self.bucket_tags[bucket_name] = (
+                await self.__async_api_call__(
+                    self.regional_clients[AWS_REGION_US_EAST_1],
+                    "get_bucket_tagging",
+                    Bucket=bucket_name,
+                )
+            )["TagSet"]
+        finally:
+            self.in_flight -= 1
+
+
 @patch(
     "prowler.providers.aws.aws_provider.AwsProvider.generate_regional_clients",
     new=mock_generate_regional_clients,
@@ -152,3 +214,130 @@ class TestAWSService:
             service.get_unknown_arn(region="eu-west-1", resource_type="bucket")
             == f"arn:aws:{service_name}:eu-west-1:{AWS_ACCOUNT_NUMBER}:bucket/unknown"
         )
+
+    def test_AWSService_lazy_attributes_not_collected_on_init(self):
+        service = LazyService(set_mocked_aws_provider())
+
+        assert service.collector_calls == []
+        assert "items" not in service.__dict__
+
+    def test_AWSService_lazy_attributes_collected_on_first_access(self):
+        service = LazyService(set_mocked_aws_provider())
+
+        assert sorted(service.items) == ["a", "b"]
+        # Both attributes are populated by the same collector, that runs once
+        assert service.item_names == {"a", "b"}
+        assert service.collector_calls == ["items"]
+
+    def test_AWSService_load_attributes(self):
+        service = LazyService(set_mocked_aws_provider())
+
+        service.load_attributes("item_names", "not_lazy_attribute")
+        service.load_attributes("items")
+
+        assert service.collector_calls == ["items"]
+        assert "items" in service.__dict__
+
+    def test_AWSService_lazy_attributes_depends_on(self):
+        service = LazyService(set_mocked_aws_provider())
+
+        assert service.items_summary == 2
+        assert service.collector_calls == ["items", "items_summary"]
+
+    def test_AWSService_lazy_attributes_concurrent_first_access(self):
+        service = LazyService(set_mocked_aws_provider())
+        results = []
+
+        def read_items():
+            service.load_attributes("items")
+            results.append(sorted(service.items))
+
+        threads = [threading.Thread(target=read_items) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [["a", "b"]] * 5
+        assert service.collector_calls == ["items"]
+
+    def test_AWSService_lazy_attributes_collector_error(self):
+        service = LazyService(set_mocked_aws_provider())
+
+        for _ in range(2):
+            with pytest.raises(AttributeError, match="'NoneType' object"):
+                service.broken
+
+    def test_AWSService_missing_attribute(self):
+        service = LazyService(set_mocked_aws_provider())
+
+        with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+            service.unknown
+
+    @mock_aws
+    def test_AWSService_async_call(self):
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        bucket_names = [f"bucket-{index}" for index in range(6)]
+        for bucket_name in bucket_names:
+            s3_client.create_bucket(Bucket=bucket_name)
+            s3_client.put_bucket_tagging(
+                Bucket=bucket_name,
+                Tagging={"TagSet": [{"Key": "name", "Value": bucket_name}]},
+            )
+
+        # The missing bucket fails without stopping the other ones
+        service = AsyncService(
+            set_mocked_aws_provider(audit_config={"service_async_collection": True}),
+            bucket_names + ["missing-bucket"],
+            max_concurrency=2,
+        )
+
+        assert service.bucket_tags == {
+            bucket_name: [{"Key": "name", "Value": bucket_name}]
+            for bucket_name in bucket_names
+        }
+        assert service.max_in_flight == 2
+
+    @mock_aws
+    def test_AWSService_async_call_in_threads(self):
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        bucket_names = [f"bucket-{index}" for index in range(6)]
+        for bucket_name in bucket_names:
+            s3_client.create_bucket(Bucket=bucket_name)
+            s3_client.put_bucket_tagging(
+                Bucket=bucket_name,
+                Tagging={"TagSet": [{"Key": "name", "Value": bucket_name}]},
+            )
+
+        # Without the asyncio collection the coroutines run in the thread pool of the service
+        with patch(
+            "prowler.providers.aws.lib.service.service.AWSAsyncTransport"
+        ) as async_transport:
+            service = AsyncService(
+                set_mocked_aws_provider(), bucket_names + ["missing-bucket"]
+            )
+
+        async_transport.assert_not_called()
+        assert service.bucket_tags == {
+            bucket_name: [{"Key": "name", "Value": bucket_name}]
+            for bucket_name in bucket_names
+        }
+
+    @mock_aws
+    def test_AWSService_async_call_default_concurrency(self):
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        bucket_names = [f"bucket-{index}" for index in range(6)]
+        for bucket_name in bucket_names:
+            s3_client.create_bucket(Bucket=bucket_name)
+
+        service = AsyncService(
+            set_mocked_aws_provider(
+                audit_config={
+                    "service_async_collection": True,
+                    "service_async_max_concurrency": 3,
+                }
+            ),
+            bucket_names,
+        )
+
+        assert service.max_in_flight == 3
@@ -5,6 +5,9 @@ from prowler.providers.aws.services.awslambda.awslambda_service import (
     Function,
     LambdaCode,
 )
+from prowler.providers.aws.services.awslambda.lib.code import (
+    LAMBDA_CODE_CACHE_DIRECTORY_VARIABLE,
+)
 from tests.providers.aws.services.awslambda.awslambda_service_test import (
     create_zip_file,
 )
@@ -17,6 +20,9 @@ from tests.providers.aws.utils import (
 LAMBDA_FUNCTION_NAME = "test-lambda"
 LAMBDA_FUNCTION_RUNTIME = "nodejs4.3"
 LAMBDA_FUNCTION_ARN = f"arn:aws:lambda:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:function/{LAMBDA_FUNCTION_NAME}"
+LAMBDA_FUNCTION_CODE_SHA256 = (
+    "fe0a3e5d8e1d9a5c7f2d3a4b6c8e0f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e"
+)
 LAMBDA_FUNCTION_CODE_WITH_SECRETS = """
 def lambda_handler(event, context):
         db_password = "test-password"
@@ -53,19 +59,19 @@ def get_lambda_code_with_secrets(code):
     )
 
 
-def mock_get_function_codewith_secrets():
+def mock_get_function_codewith_secrets(functions=None):
     yield create_lambda_function(), get_lambda_code_with_secrets(
         LAMBDA_FUNCTION_CODE_WITH_SECRETS
     )
 
 
-def mock_get_function_codewithout_secrets():
+def mock_get_function_codewithout_secrets(functions=None):
     yield create_lambda_function(), get_lambda_code_with_secrets(
         LAMBDA_FUNCTION_CODE_WITHOUT_SECRETS
     )
 
 
-def mock_get_function_codewith_metadata_api():
+def mock_get_function_codewith_metadata_api(functions=None):
     yield create_lambda_function(), get_lambda_code_with_secrets(
         LAMBDA_FUNCTION_CODE_WITH_METADATA_API
     )
@@ -201,3 +207,70 @@ class Test_awslambda_function_no_secrets_in_code:
                 == f"No secrets found in Lambda function {LAMBDA_FUNCTION_NAME} code."
             )
             assert result[0].resource_tags == []
+
+    def test_functions_with_the_same_code(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(LAMBDA_CODE_CACHE_DIRECTORY_VARIABLE, str(tmp_path))
+        function_arn_2 = f"{LAMBDA_FUNCTION_ARN}-2"
+        functions = {
+            LAMBDA_FUNCTION_ARN: create_lambda_function(),
+            function_arn_2: Function(
+                name=f"{LAMBDA_FUNCTION_NAME}-2",
+                security_groups=[],
+                arn=function_arn_2,
+                region=AWS_REGION_US_EAST_1,
+                runtime=LAMBDA_FUNCTION_RUNTIME,
+            ),
+        }
+        for function in functions.values():
+            function.code_sha256 = LAMBDA_FUNCTION_CODE_SHA256
+        fetched_functions = []
+
+        def get_function_code(functions=None):
+            for function in functions:
+                fetched_functions.append(function.arn)
+                yield function, get_lambda_code_with_secrets(
+                    LAMBDA_FUNCTION_CODE_WITH_SECRETS
+                )
+
+        lambda_client = mock.MagicMock()
+        lambda_client.functions = functions
+        lambda_client._get_function_code = get_function_code
+        lambda_client.audit_config = {"secrets_ignore_patterns": []}
+
+        with (
+            mock.patch(
+                "prowler.providers.common.provider.Provider.get_global_provider",
+                return_value=set_mocked_aws_provider(),
+            ),
+            mock.patch(
+                "prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code.awslambda_function_no_secrets_in_code.awslambda_client",
+                new=lambda_client,
+            ),
+        ):
+            # Test Check
+            from prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code.awslambda_function_no_secrets_in_code import (
+                awslambda_function_no_secrets_in_code,
+            )
+
+            check = awslambda_function_no_secrets_in_code()
+            result = check.execute()
+
+            # The code shared by both functions is downloaded and scanned once
+            assert fetched_functions == [LAMBDA_FUNCTION_ARN]
+            assert len(result) == 2
+            assert [finding.resource_arn for finding in result] == [
+                LAMBDA_FUNCTION_ARN,
+                function_arn_2,
+            ]
+            for finding in result:
+                assert finding.status == "FAIL"
+                assert (
+                    finding.status_extended
+                    == f"Potential secret found in Lambda function {finding.resource_id} code -> lambda_function.py: Secret Keyword on line 3."
+                )
+
+            # The next scans take the secrets of the unchanged code from the cache
+            result = check.execute()
+            assert fetched_functions == [LAMBDA_FUNCTION_ARN]
+            assert len(result) == 2
+            assert all(finding.status == "FAIL" for finding in result)
@@ -233,6 +233,7 @@ class Test_Lambda_Service:
                 "db-password": "test-password"
             }
             assert awslambda.functions[lambda_arn_2].region == AWS_REGION_US_EAST_1
+            assert awslambda.functions[lambda_arn_2].code_sha256
             # Emtpy policy
             assert awslambda.functions[lambda_arn_2].policy == {}
 
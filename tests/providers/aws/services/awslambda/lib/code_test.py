@@ -0,0 +1,104 @@
+import io
+import zipfile
+
+from mock import patch
+
+from prowler.lib.utils.utils import SecretsScanner
+from prowler.providers.aws.services.awslambda.lib.code import (
+    LAMBDA_CODE_CACHE_DIRECTORY_VARIABLE,
+    LAMBDA_CODE_CACHE_ENABLED_VARIABLE,
+    LambdaCodeSecretsCache,
+    get_lambda_code_files,
+    scan_lambda_code,
+)
+
+LAMBDA_CODE_WITH_SECRETS = """
+def lambda_handler(event, context):
+        db_password = "test-password"
+        return event
+"""
+LAMBDA_CODE_SHA256 = "fe0a3e5d8e1d9a5c7f2d3a4b6c8e0f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e"
+
+
+def create_code_zip(files: dict) -> zipfile.ZipFile:
+    zip_output = io.BytesIO()
+    with zipfile.ZipFile(zip_output, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for file_name, content in files.items():
+            zip_file.writestr(file_name, content)
+    zip_output.seek(0)
+    return zipfile.ZipFile(zip_output)
+
+
+class Test_get_lambda_code_files:
+    def test_get_lambda_code_files(self):
+        code_zip = create_code_zip(
+            {
+                "lambda_function.py": "print('hello')",
+                "lib/config.py": "DEBUG = False",
+                "lib/module.cpython-311.pyc": "compiled",
+                "lib/binary": b"\xff\xfe\x00",
+                "big_file.txt": "a" * 100,
+            }
+        )
+        with patch(
+            "prowler.providers.aws.services.awslambda.lib.code.LAMBDA_CODE_MAX_FILE_SIZE",
+            50,
+        ):
+            assert get_lambda_code_files(code_zip) == {
+                "lambda_function.py": "print('hello')",
+                "lib/config.py": "DEBUG = False",
+            }
+
+
+class Test_scan_lambda_code:
+    def test_scan_lambda_code_subdirectories(self):
+        code_zip = create_code_zip(
+            {
+                "lambda_function.py": "print('hello')",
+                "src/handler/app.py": LAMBDA_CODE_WITH_SECRETS,
+            }
+        )
+        assert scan_lambda_code(code_zip, SecretsScanner()) == [
+            "src/handler/app.py: Secret Keyword on line 3"
+        ]
+
+    def test_scan_lambda_code_without_secrets(self):
+        code_zip = create_code_zip({"lambda_function.py": "print('hello')"})
+        assert scan_lambda_code(code_zip, SecretsScanner()) == []
+
+
+class Test_LambdaCodeSecretsCache:
+    def test_save_and_load(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(LAMBDA_CODE_CACHE_DIRECTORY_VARIABLE, str(tmp_path))
+        cache = LambdaCodeSecretsCache(SecretsScanner())
+        assert cache.get(LAMBDA_CODE_SHA256) is None
+        cache.set(LAMBDA_CODE_SHA256, ["app.py: Secret Keyword on line 3"])
+        cache.save()
+
+        # The code packages are not scanned again in the next scans
+        assert LambdaCodeSecretsCache(SecretsScanner()).get(LAMBDA_CODE_SHA256) == [
+            "app.py: Secret Keyword on line 3"
+        ]
+        # Other secrets scanner settings scan the code again
+        assert (
+            LambdaCodeSecretsCache(SecretsScanner(excluded_secrets=["password"])).get(
+                LAMBDA_CODE_SHA256
+            )
+            is None
+        )
+
+    def test_without_code_sha256(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(LAMBDA_CODE_CACHE_DIRECTORY_VARIABLE, str(tmp_path))
+        cache = LambdaCodeSecretsCache(SecretsScanner())
+        cache.set(None, [])
+        cache.save()
+        assert cache.get(None) is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_disabled(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(LAMBDA_CODE_CACHE_DIRECTORY_VARIABLE, str(tmp_path))
+        monkeypatch.setenv(LAMBDA_CODE_CACHE_ENABLED_VARIABLE, "false")
+        cache = LambdaCodeSecretsCache(SecretsScanner())
+        cache.set(LAMBDA_CODE_SHA256, [])
+        cache.save()
+        assert list(tmp_path.iterdir()) == []
@@ -1,7 +1,16 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import mock
+
 from boto3 import client
 from moto import mock_aws
 
-from prowler.providers.aws.services.cloudtrail.cloudtrail_service import Cloudtrail
+from prowler.providers.aws.services.cloudtrail.cloudtrail_service import (
+    Cloudtrail,
+    CloudTrailEventStore,
+)
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
     AWS_REGION_EU_SOUTH_2,
@@ -10,6 +19,54 @@ from tests.providers.aws.utils import (
     set_mocked_aws_provider,
 )
 
+ATTACKER_ARN = f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/Attacker"
+
+
+def mock_lookup_events(trail=None, event_name=None, minutes=None) -> list:
+    return [
+        {
+            "EventTime": datetime.now(timezone.utc) - timedelta(minutes=30),
+            "CloudTrailEvent": json.dumps(
+                {
+                    "eventName": event_name,
+                    "userIdentity": {"type": "IAMUser", "arn": ATTACKER_ARN},
+                }
+            ),
+        },
+        {
+            "EventTime": datetime.now(timezone.utc) - timedelta(minutes=90),
+            "CloudTrailEvent": json.dumps(
+                {"eventName": event_name, "userIdentity": {"type": "AWSService"}}
+            ),
+        },
+    ]
+
+
+class Test_CloudTrailEventStore:
+    def test_get_principal_event_names(self):
+        lookup_events = mock.MagicMock(side_effect=mock_lookup_events)
+        event_store = CloudTrailEventStore(lookup_events, ThreadPoolExecutor())
+        trails = [SimpleNamespace(region=AWS_REGION_US_EAST_1)]
+
+        assert event_store.get_principal_event_names(
+            trails, ["ListRoles", "ListUsers", "ListRoles"], 120
+        ) == {(ATTACKER_ARN, "IAMUser"): {"ListRoles", "ListUsers"}}
+        assert lookup_events.call_count == 2
+        assert len(event_store.get_principal_events(ATTACKER_ARN)) == 2
+
+    def test_get_events_shared_lookups(self):
+        lookup_events = mock.MagicMock(side_effect=mock_lookup_events)
+        event_store = CloudTrailEventStore(lookup_events, ThreadPoolExecutor())
+        trails = [SimpleNamespace(region=AWS_REGION_US_EAST_1)]
+
+        assert len(event_store.get_events(trails, ["ListRoles"], 120)) == 2
+        # The events of a narrower time window are taken from the previous lookup
+        assert len(event_store.get_events(trails, ["ListRoles"], 60)) == 1
+        assert lookup_events.call_count == 1
+        # A wider time window is looked up again
+        assert len(event_store.get_events(trails, ["ListRoles"], 240)) == 2
+        assert lookup_events.call_count == 2
+
 
 class Test_Cloudtrail_Service:
     # Test Cloudtrail Service
@@ -314,6 +371,15 @@ class Test_Cloudtrail_Service:
         )
         cloudtrail = Cloudtrail(aws_provider)
         assert len(cloudtrail.trails) == len(aws_provider.identity.audited_regions)
+        trail = cloudtrail.trails[
+            f"arn:aws:cloudtrail:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:trail/{trail_name_us}"
+        ]
+        assert isinstance(
+            cloudtrail._lookup_events(
+                trail=trail, event_name="CreateTrail", minutes=1440
+            ),
+            list,
+        )
 
     @mock_aws
     def test_list_tags_for_resource(self):
@@ -1,7 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 from moto import mock_aws
 
+from prowler.providers.aws.services.cloudtrail.cloudtrail_service import (
+    CloudTrailEventStore,
+)
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
     AWS_REGION_US_EAST_1,
@@ -45,7 +49,9 @@ class Test_cloudtrail_threat_detection_privilege_escalation:
     def test_no_trails(self):
         cloudtrail_client = mock.MagicMock()
         cloudtrail_client.trails = {}
-        cloudtrail_client._lookup_events = mock__get_lookup_events__
+        cloudtrail_client.event_store = CloudTrailEventStore(
+            mock__get_lookup_events__, ThreadPoolExecutor()
+        )
         cloudtrail_client._get_trail_arn_template = mock_get_trail_arn_template
         cloudtrail_client.audited_account = AWS_ACCOUNT_NUMBER
         cloudtrail_client.region = AWS_REGION_US_EAST_1
@@ -97,7 +103,9 @@ class Test_cloudtrail_threat_detection_privilege_escalation:
             "threat_detection_privilege_escalation_minutes": 1440,
         }
 
-        cloudtrail_client._lookup_events = mock__get_lookup_events__
+        cloudtrail_client.event_store = CloudTrailEventStore(
+            mock__get_lookup_events__, ThreadPoolExecutor()
+        )
         cloudtrail_client._get_trail_arn_template = mock_get_trail_arn_template
 
         with (
@@ -150,7 +158,9 @@ class Test_cloudtrail_threat_detection_privilege_escalation:
             "threat_detection_privilege_escalation_minutes": 1440,
         }
 
-        cloudtrail_client._lookup_events = mock__get_lookup_events__
+        cloudtrail_client.event_store = CloudTrailEventStore(
+            mock__get_lookup_events__, ThreadPoolExecutor()
+        )
         cloudtrail_client._get_trail_arn_template = mock_get_trail_arn_template
 
         with (
@@ -203,7 +213,9 @@ class Test_cloudtrail_threat_detection_privilege_escalation:
             "threat_detection_privilege_escalation_minutes": 1440,
         }
 
-        cloudtrail_client._lookup_events = mock__get_lookup_events__
+        cloudtrail_client.event_store = CloudTrailEventStore(
+            mock__get_lookup_events__, ThreadPoolExecutor()
+        )
         cloudtrail_client._get_trail_arn_template = mock_get_trail_arn_template
 
         with (
@@ -256,7 +268,9 @@ class Test_cloudtrail_threat_detection_privilege_escalation:
             "threat_detection_privilege_escalation_minutes": 1440,
         }
 
-        cloudtrail_client._lookup_events = mock__get_lookup_events_aws_service__
+        cloudtrail_client.event_store = CloudTrailEventStore(
+            mock__get_lookup_events_aws_service__, ThreadPoolExecutor()
+        )
         cloudtrail_client._get_trail_arn_template = mock_get_trail_arn_template
 
         with (
@@ -222,3 +222,92 @@ class Test_cloudwatch_log_group_no_secrets_in_logs:
             result = check.execute()
 
             assert len(result) == 0
+
+    @mock_aws
+    def test_cloudwatch_log_group_with_secrets_incremental_scan(
+        self, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("PROWLER_LOG_EVENTS_CACHE_DIRECTORY", str(tmp_path))
+        # Generate Logs Client
+        logs_client = client("logs", region_name=AWS_REGION_US_EAST_1)
+        # Request Logs group
+        logs_client.create_log_group(logGroupName="test", tags={"test": "test"})
+        logs_client.create_log_stream(logGroupName="test", logStreamName="test stream")
+        logs_client.put_log_events(
+            logGroupName="test",
+            logStreamName="test stream",
+            logEvents=[
+                {
+                    "timestamp": timestamp,
+                    "message": "password = password123",
+                }
+            ],
+        )
+        from prowler.providers.aws.services.cloudwatch.cloudwatch_service import Logs
+
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1],
+            audit_config={"log_group_secrets_incremental_scan": True},
+        )
+
+        from prowler.providers.common.models import Audit_Metadata
+
+        aws_provider.audit_metadata = Audit_Metadata(
+            services_scanned=0,
+            # We need to set this check to call _describe_log_groups
+            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            completed_checks=0,
+            audit_progress=0,
+        )
+
+        with mock.patch(
+            "prowler.providers.common.provider.Provider.get_global_provider",
+            return_value=aws_provider,
+        ):
+            from prowler.providers.aws.services.cloudwatch.cloudwatch_log_group_no_secrets_in_logs.cloudwatch_log_group_no_secrets_in_logs import (
+                cloudwatch_log_group_no_secrets_in_logs,
+            )
+
+            with mock.patch(
+                "prowler.providers.aws.services.cloudwatch.cloudwatch_log_group_no_secrets_in_logs.cloudwatch_log_group_no_secrets_in_logs.logs_client",
+                new=Logs(aws_provider),
+            ):
+                check = cloudwatch_log_group_no_secrets_in_logs()
+                result = check.execute()
+
+                assert len(result) == 1
+                assert result[0].status == "FAIL"
+
+            logs_client.put_log_events(
+                logGroupName="test",
+                logStreamName="test stream",
+                logEvents=[
+                    {
+                        "timestamp": timestamp + 1,
+                        "message": "non sensitive message",
+                    }
+                ],
+            )
+
+            with mock.patch(
+                "prowler.providers.aws.services.cloudwatch.cloudwatch_log_group_no_secrets_in_logs.cloudwatch_log_group_no_secrets_in_logs.logs_client",
+                new=Logs(aws_provider),
+            ) as service_client:
+                # Only the log events written since the previous scan are retrieved
+                assert [
+                    event["message"]
+                    for event in service_client.log_groups[
+                        f"arn:aws:logs:{AWS_REGION_US_EAST_1}:123456789012:log-group:test:*"
+                    ].log_streams["test stream"]
+                ] == ["non sensitive message"]
+
+                check = cloudwatch_log_group_no_secrets_in_logs()
+                result = check.execute()
+
+                # The secrets found in the previous scan are still reported
+                assert len(result) == 1
+                assert result[0].status == "FAIL"
+                assert (
+                    result[0].status_extended
+                    == f"Potential secrets found in log group test in log stream test stream at {dttimestamp} - Secret Keyword on line 1."
+                )
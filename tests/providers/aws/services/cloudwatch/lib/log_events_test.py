@@ -0,0 +1,180 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from mock import patch
+
+from prowler.lib.utils.utils import SecretsScanner
+from prowler.providers.aws.services.cloudwatch.cloudwatch_service import LogGroup
+from prowler.providers.aws.services.cloudwatch.lib.log_events import (
+    LOG_EVENTS_CACHE_DIRECTORY_VARIABLE,
+    LogEventsWatermarks,
+    get_log_events_chunks,
+    scan_log_events,
+)
+from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, AWS_REGION_US_EAST_1
+
+LOG_GROUP_ARN = (
+    f"arn:aws:logs:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:log-group:test:*"
+)
+timestamp = int(datetime.now(timezone.utc).timestamp() * 1000)
+
+
+def create_log_group(log_streams: dict = {}, retention_days: int = 9999) -> LogGroup:
+    return LogGroup(
+        arn=LOG_GROUP_ARN,
+        name="test",
+        retention_days=retention_days,
+        never_expire=retention_days == 9999,
+        kms_id=None,
+        region=AWS_REGION_US_EAST_1,
+        log_streams=log_streams,
+    )
+
+
+def create_log_event(message: str, event_timestamp: int = timestamp, event_id="1"):
+    return {
+        "logStreamName": "test stream",
+        "timestamp": event_timestamp,
+        "message": message,
+        "eventId": event_id,
+    }
+
+
+class Test_get_log_events_chunks:
+    def test_get_log_events_chunks(self):
+        log_events = [
+            create_log_event(json.dumps({"user": "test", "action": "login"})),
+            create_log_event("non sensitive message"),
+            create_log_event("a" * 100),
+        ]
+        with patch(
+            "prowler.providers.aws.services.cloudwatch.lib.log_events.LOG_EVENTS_CHUNK_MAX_SIZE",
+            100,
+        ):
+            chunks = get_log_events_chunks(log_events)
+
+        assert len(chunks) == 2
+        data, first_lines, chunk_events = chunks[0]
+        # The JSON messages are indented one key per line
+        assert (
+            data
+            == '{\n  "user": "test",\n  "action": "login"\n}\n"non sensitive message"'
+        )
+        assert first_lines == [1, 5]
+        assert chunk_events == log_events[:2]
+        # The log events bigger than the chunks are scanned on their own
+        assert chunks[1][1] == [1]
+        assert chunks[1][2] == log_events[2:]
+
+
+class Test_scan_log_events:
+    def test_scan_log_events(self):
+        log_group = create_log_group(
+            {
+                "test stream": [
+                    create_log_event("non sensitive message", timestamp),
+                    create_log_event(
+                        json.dumps({"user": "test", "password": "password123"}),
+                        timestamp + 1,
+                    ),
+                    create_log_event(
+                        json.dumps({"db_password": "anotherPassword456"}),
+                        timestamp + 2,
+                    ),
+                ]
+            }
+        )
+
+        assert scan_log_events([log_group], SecretsScanner()) == {
+            LOG_GROUP_ARN: [
+                {
+                    "log_stream": "test stream",
+                    "timestamp": timestamp + 1,
+                    "line_number": 3,
+                    "type": "Secret Keyword",
+                },
+                {
+                    "log_stream": "test stream",
+                    "timestamp": timestamp + 2,
+                    "line_number": 2,
+                    "type": "Secret Keyword",
+                },
+            ]
+        }
+
+    def test_scan_log_events_without_secrets(self):
+        log_group = create_log_group(
+            {"test stream": [create_log_event("non sensitive message")]}
+        )
+
+        assert scan_log_events([log_group], SecretsScanner()) == {LOG_GROUP_ARN: []}
+
+
+class Test_LogEventsWatermarks:
+    def test_update_and_save(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(LOG_EVENTS_CACHE_DIRECTORY_VARIABLE, str(tmp_path))
+        log_group = create_log_group()
+        secret = {
+            "log_stream": "test stream",
+            "timestamp": timestamp,
+            "line_number": 1,
+            "type": "Secret Keyword",
+        }
+        watermarks = LogEventsWatermarks(SecretsScanner())
+        assert watermarks.get_start_time(LOG_GROUP_ARN) is None
+
+        watermarks.update(
+            log_group,
+            [
+                create_log_event("password = password123", timestamp - 1, "1"),
+                create_log_event("non sensitive message", timestamp, "2"),
+                create_log_event("non sensitive message", timestamp, "3"),
+            ],
+            [secret],
+        )
+        watermarks.save()
+
+        watermarks = LogEventsWatermarks(SecretsScanner())
+        assert watermarks.get_start_time(LOG_GROUP_ARN) == timestamp
+        assert watermarks.get_secrets(LOG_GROUP_ARN) == [secret]
+        # Only the log events at the start time are retrieved again
+        assert watermarks.is_scanned(
+            LOG_GROUP_ARN, create_log_event("message", timestamp, "3")
+        )
+        assert not watermarks.is_scanned(
+            LOG_GROUP_ARN, create_log_event("message", timestamp, "4")
+        )
+
+    def test_update_expired_secrets(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(LOG_EVENTS_CACHE_DIRECTORY_VARIABLE, str(tmp_path))
+        expired_timestamp = int(
+            (datetime.now(timezone.utc) - timedelta(days=8)).timestamp() * 1000
+        )
+        secrets = [
+            {
+                "log_stream": "test stream",
+                "timestamp": event_timestamp,
+                "line_number": 1,
+                "type": "Secret Keyword",
+            }
+            for event_timestamp in (expired_timestamp, timestamp)
+        ]
+        watermarks = LogEventsWatermarks(SecretsScanner())
+
+        watermarks.update(create_log_group(retention_days=7), [], secrets)
+
+        # The log events older than the retention of the log group were deleted
+        assert watermarks.get_secrets(LOG_GROUP_ARN) == secrets[1:]
+        assert watermarks.get_start_time(LOG_GROUP_ARN) is None
+
+    def test_other_settings(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(LOG_EVENTS_CACHE_DIRECTORY_VARIABLE, str(tmp_path))
+        watermarks = LogEventsWatermarks(SecretsScanner())
+        watermarks.update(
+            create_log_group(), [create_log_event("non sensitive message")], []
+        )
+        watermarks.save()
+
+        # The log groups are scanned again from the beginning with other settings
+        watermarks = LogEventsWatermarks(SecretsScanner(excluded_secrets=["test"]))
+        assert watermarks.get_start_time(LOG_GROUP_ARN) is None
@@ -11,6 +11,7 @@ from freezegun import freeze_time
 from moto import mock_aws
 
 from prowler.config.config import encoding_format_utf_8
+from prowler.lib.scan_filters.scan_filters import ResourceFilter
 from prowler.providers.aws.services.ec2.ec2_service import EC2
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
@@ -152,6 +153,31 @@ class Test_EC2_Service:
         assert ec2.instances[0].network_interfaces is not None
         assert ec2.instances[0].virtualization_type == "hvm"
 
+    @mock_aws
+    def test_describe_instances_audit_resources(self):
+        ec2_resource = resource("ec2", region_name=AWS_REGION_US_EAST_1)
+        ec2_client = client("ec2", region_name=AWS_REGION_US_EAST_1)
+        image_id = ec2_client.describe_images()["Images"][0]["ImageId"]
+        instances = ec2_resource.create_instances(
+            MinCount=2,
+            MaxCount=2,
+            ImageId=image_id,
+        )
+        instance_arn = f"arn:aws:ec2:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:instance/{instances[0].id}"
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1]
+        )
+        aws_provider._audit_resources = ResourceFilter([instance_arn])
+
+        # The instances are filtered by the API call, not after retrieving them
+        with mock.patch(
+            "prowler.providers.aws.services.ec2.ec2_service.is_resource_filtered",
+            return_value=True,
+        ):
+            ec2 = EC2(aws_provider)
+
+        assert [instance.arn for instance in ec2.instances] == [instance_arn]
+
     # Test EC2 Describe Security Groups
     @mock_aws
     def test_describe_security_groups(self):
@@ -1,7 +1,9 @@
 import pytest
 
 from prowler.providers.aws.services.ec2.lib.security_groups import (
+    SecurityGroupRulesIndex,
     _is_cidr_public,
+    _merge_intervals,
     check_security_group,
 )
 
@@ -390,3 +392,124 @@ class Test_check_security_group:
             port, port, TRANSPORT_PROTOCOL_ALL, [], [IP_V6_ALL_CIDRS]
         )
         assert check_security_group(ingress_rule, TRANSPORT_PROTOCOL_ALL, None, True)
+
+
+class Test_SecurityGroupRulesIndex:
+    INGRESS_RULES = [
+        {
+            "FromPort": 20,
+            "ToPort": 23,
+            "IpProtocol": TRANSPORT_PROTOCOL_TCP,
+            "IpRanges": [{"CidrIp": IP_V4_ALL_CIDRS}],
+            "Ipv6Ranges": [],
+        },
+        {
+            "FromPort": 24,
+            "ToPort": 80,
+            "IpProtocol": TRANSPORT_PROTOCOL_TCP,
+            "IpRanges": [{"CidrIp": IP_V4_PUBLIC_CIDR}],
+            "Ipv6Ranges": [],
+        },
+        {
+            "FromPort": 3306,
+            "ToPort": 3306,
+            "IpProtocol": TRANSPORT_PROTOCOL_TCP,
+            "IpRanges": [{"CidrIp": IP_V4_PRIVATE_CIDR}],
+            "Ipv6Ranges": [{"CidrIpv6": IP_V6_ALL_CIDRS}],
+        },
+        {
+            "FromPort": 5432,
+            "ToPort": 5432,
+            "IpProtocol": TRANSPORT_PROTOCOL_TCP,
+            "IpRanges": [{"CidrIp": IP_V4_PRIVATE_CIDR}],
+            "Ipv6Ranges": [],
+        },
+        {
+            "FromPort": 53,
+            "ToPort": 53,
+            "IpProtocol": "udp",
+            "IpRanges": [{"CidrIp": IP_V4_ALL_CIDRS}],
+            "Ipv6Ranges": [],
+        },
+    ]
+
+    def test_merge_intervals(self):
+        assert _merge_intervals([(24, 80), (20, 23), (22, 30), (100, 200)]) == [
+            (20, 80),
+            (100, 200),
+        ]
+
+    def test_is_exposed(self):
+        index = SecurityGroupRulesIndex.from_rules(self.INGRESS_RULES)
+        assert index.is_exposed(TRANSPORT_PROTOCOL_TCP, [22], any_address=True)
+        assert not index.is_exposed(TRANSPORT_PROTOCOL_TCP, [25], any_address=True)
+        assert index.is_exposed(TRANSPORT_PROTOCOL_TCP, [25])
+        assert index.is_exposed(TRANSPORT_PROTOCOL_TCP, [3306], any_address=True)
+        assert not index.is_exposed(TRANSPORT_PROTOCOL_TCP, [5432])
+        assert not index.is_exposed(TRANSPORT_PROTOCOL_TCP, [53], any_address=True)
+        assert index.is_exposed(TRANSPORT_PROTOCOL_ALL, None, any_address=True)
+        assert not index.is_exposed(TRANSPORT_PROTOCOL_ALL, any_address=True)
+
+    def test_is_exposed_all_traffic(self):
+        index = SecurityGroupRulesIndex.from_rules(
+            [
+                {
+                    "IpProtocol": TRANSPORT_PROTOCOL_ALL,
+                    "IpRanges": [],
+                    "Ipv6Ranges": [{"CidrIpv6": IP_V6_PUBLIC_CIDR}],
+                }
+            ]
+        )
+        assert index.is_exposed(TRANSPORT_PROTOCOL_TCP, [22])
+        assert not index.is_exposed(TRANSPORT_PROTOCOL_TCP, [22], any_address=True)
+
+    def test_is_exposed_invalid_cidr(self):
+        index = SecurityGroupRulesIndex.from_rules(
+            [
+                {
+                    "IpProtocol": TRANSPORT_PROTOCOL_ALL,
+                    "IpRanges": [{"CidrIp": "10.0.0.16/0"}],
+                    "Ipv6Ranges": [],
+                }
+            ]
+        )
+        assert not index.is_exposed(TRANSPORT_PROTOCOL_TCP, [22])
+        assert not index.is_exposed(TRANSPORT_PROTOCOL_TCP, [22], any_address=True)
+
+    @pytest.mark.parametrize("any_address", [True, False])
+    @pytest.mark.parametrize(
+        "protocol, ports",
+        [
+            (TRANSPORT_PROTOCOL_TCP, [19]),
+            (TRANSPORT_PROTOCOL_TCP, [20]),
+            (TRANSPORT_PROTOCOL_TCP, [80, 81]),
+            (TRANSPORT_PROTOCOL_TCP, [3306]),
+            (TRANSPORT_PROTOCOL_TCP, [5432]),
+            (TRANSPORT_PROTOCOL_TCP, []),
+            (TRANSPORT_PROTOCOL_TCP, None),
+            ("udp", [53]),
+            (TRANSPORT_PROTOCOL_ALL, None),
+            (TRANSPORT_PROTOCOL_ALL, []),
+        ],
+    )
+    def test_is_exposed_same_as_check_security_group(
+        self, protocol, ports, any_address
+    ):
+        for ingress_rules in (
+            self.INGRESS_RULES,
+            self.INGRESS_RULES[2:],
+            [
+                {
+                    "FromPort": 0,
+                    "ToPort": 65535,
+                    "IpProtocol": "udp",
+                    "IpRanges": [{"CidrIp": IP_V4_PUBLIC_CIDR}],
+                    "Ipv6Ranges": [],
+                }
+            ],
+        ):
+            index = SecurityGroupRulesIndex.from_rules(ingress_rules)
+            assert index.is_exposed(protocol, ports, any_address) == any(
+                check_security_group(ingress_rule, protocol, ports, any_address)
+                for ingress_rule in ingress_rules
+            )
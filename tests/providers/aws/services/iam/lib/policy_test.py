@@ -1,9 +1,16 @@
+from unittest import mock
+
 import pytest
 
 from prowler.providers.aws.services.iam.lib.policy import (
+    _get_effective_actions,
     _get_patterns_from_standard_value,
     check_admin_access,
     check_full_service_access,
+    expand_action_pattern,
+    expand_action_patterns,
+    get_all_actions,
+    get_canonical_policy,
     get_effective_actions,
     has_codebuild_trusted_principal,
     has_public_principal,
@@ -135,6 +142,39 @@ class Test_Policy:
         assert result == {"s3:GetObject", "s3:ListBucket"}
         assert "s3:PutObject" not in result
 
+    def test_get_canonical_policy(self):
+        assert get_canonical_policy(
+            {"Version": "2012-10-17", "Statement": [{"Effect": "Allow"}]}
+        ) == get_canonical_policy(
+            {"Statement": [{"Effect": "Allow"}], "Version": "2012-10-17"}
+        )
+
+    def test_expand_action_pattern(self):
+        assert expand_action_pattern("s3:GetObject") == {"s3:GetObject"}
+        assert expand_action_pattern("invalid:Action") == set()
+        # The largest expansion is shared by all the NotAction statements
+        assert expand_action_pattern("*") is get_all_actions()
+
+    def test_get_effective_actions_memoised(self):
+        policy = {
+            "Version": "2012-10-17",
+            "Statement": [{"Effect": "Allow", "NotAction": "s3:*"}],
+        }
+        _get_effective_actions.cache_clear()
+        with mock.patch(
+            "prowler.providers.aws.services.iam.lib.policy.expand_action_patterns",
+            wraps=expand_action_patterns,
+        ) as mock_expand_action_patterns:
+            result = get_effective_actions(policy)
+            # The same policy attached to another principal is not evaluated again
+            assert get_effective_actions(dict(reversed(policy.items()))) == result
+            assert mock_expand_action_patterns.call_count == 1
+        assert "ec2:RunInstances" in result
+        assert "s3:GetObject" not in result
+        # The memoised actions cannot be modified by the callers
+        result.clear()
+        assert get_effective_actions(policy)
+
     # Test lowercase context key name --> aws
     def test_condition_parser_string_equals_aws_SourceAccount_list(self):
         condition_statement = {
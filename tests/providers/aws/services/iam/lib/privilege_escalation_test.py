@@ -1,5 +1,9 @@
+from mock import patch
+
 from prowler.providers.aws.services.iam.lib.privilege_escalation import (
+    _check_privilege_escalation,
     check_privilege_escalation,
+    get_privilege_escalation_combinations,
     privilege_escalation_policies_combination,
 )
 
@@ -14,6 +18,37 @@ def parse_result_string(result_str: str) -> set:
 
 
 class Test_PrivilegeEscalation:
+    def test_get_privilege_escalation_combinations(self):
+        combinations = get_privilege_escalation_combinations()
+        assert combinations.keys() == privilege_escalation_policies_combination.keys()
+        assert combinations["iam:PutUserPolicy"] == {"iam:PutUserPolicy"}
+        assert get_privilege_escalation_combinations() is combinations
+
+    def test_check_privilege_escalation_invalid_combination_pattern(self):
+        policy = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Action": ["iam:PassRole"],
+                    "Resource": "*",
+                }
+            ],
+        }
+        get_privilege_escalation_combinations.cache_clear()
+        _check_privilege_escalation.cache_clear()
+        try:
+            # An invalid pattern is not removed from its combination, so it does not match with the rest of it
+            with patch.dict(
+                privilege_escalation_policies_combination,
+                {"PassRole+Invalid": {"iam:PassRole", "invalid-pattern"}},
+            ):
+                assert check_privilege_escalation(policy) == ""
+        finally:
+            get_privilege_escalation_combinations.cache_clear()
+            _check_privilege_escalation.cache_clear()
+        assert check_privilege_escalation(policy) == "'iam:PassRole'"
+
     def test_check_privilege_escalation_no_priv_escalation(self):
         policy = {
             "Version": "2012-10-17",